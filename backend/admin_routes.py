@@ -720,6 +720,38 @@ async def export_evaluations_csv(
         headers={"Content-Disposition": f"attachment; filename=evaluations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
     )
 
+@admin_router.get("/understanding-store/stats")
+async def get_understanding_store_stats(admin: dict = Depends(get_current_admin)):
+    """Brand understanding store stats (prompt version, entry counts, hit rate)"""
+    from understanding_store import get_store_stats
+    return await get_store_stats()
+
+@admin_router.get("/cpu-lane/stats")
+async def get_cpu_lane_stats(admin: dict = Depends(get_current_admin)):
+    """CPU lane (scoring process pool) status and pool/thread call counts for this worker"""
+    from cpu_lane import get_stats
+    return get_stats()
+
+@admin_router.delete("/understanding-store")
+async def invalidate_understanding_store(
+    brand_name: Optional[str] = None,
+    category: Optional[str] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """Invalidate stored brand understandings (all, or filtered by brand name / category)"""
+    from understanding_store import invalidate_understandings
+    deleted = await invalidate_understandings(brand_name=brand_name, category=category)
+    
+    await db.admin_logs.insert_one({
+        "action": "understanding_store_invalidated",
+        "admin_email": admin["email"],
+        "filters": {"brand_name": brand_name, "category": category},
+        "deleted_count": deleted,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    })
+    
+    return {"success": True, "deleted_count": deleted}
+
 # ============ HELPER FUNCTIONS ============
 
 async def get_early_stopping_prompt_default():
@@ -0,0 +1,164 @@
+"""
+App Store Search Cache
+======================
+Caches Play Store / iOS search results per (store, country, normalized query).
+
+Category-only queries ("salon booking", "food delivery") return the same
+competitor lists for every brand in a category, so most app-store lookups in
+visibility.py can be served from here.
+
+Two-tier cache (same layout as domain_service.py):
+1. In-process LRU with per-entry expiry (cachetools.TLRUCache)
+2. MongoDB TTL collection (db.app_store_search_cache) - shared across
+   uvicorn workers and survives restarts
+
+Concurrent misses for the same key share one in-flight fetch.
+"""
+
+import asyncio
+import copy
+import logging
+import os
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from cachetools import TLRUCache
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+APP_STORE_CACHE_TTL = int(os.environ.get("APP_STORE_CACHE_TTL", 24 * 3600))           # 24 hours
+APP_STORE_CACHE_TTL_EMPTY = int(os.environ.get("APP_STORE_CACHE_TTL_EMPTY", 600))      # 10 minutes (may be a failed fetch)
+APP_STORE_CACHE_MAXSIZE = int(os.environ.get("APP_STORE_CACHE_MAXSIZE", 10000))
+
+CACHE_COLLECTION = "app_store_search_cache"
+
+# MongoDB reference (set from main server.py)
+db = None
+
+
+def set_db(database):
+    """Set database reference from main server"""
+    global db
+    db = database
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def cache_key(store: str, country: str, query: str) -> str:
+    return f"{store}:{country.lower()}:{normalize_query(query)}"
+
+
+def get_ttl(results: List[Dict]) -> int:
+    return APP_STORE_CACHE_TTL if results else APP_STORE_CACHE_TTL_EMPTY
+
+
+# ============ CACHE ============
+
+class AppStoreSearchCache:
+    """Cached, deduplicated app store searches."""
+
+    def __init__(self, maxsize: int = APP_STORE_CACHE_MAXSIZE):
+        self._memory = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._indexes_ready = False
+        self.stats = {"memory_hits": 0, "mongo_hits": 0, "fetches": 0, "deduplicated": 0}
+
+    async def get_or_fetch(self, store: str, country: str, query: str,
+                           fetch: Callable[[], Awaitable[List[Dict]]]) -> List[Dict]:
+        """Return cached results for (store, country, query), calling fetch() on a miss."""
+        key = cache_key(store, country, query)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            self.stats["memory_hits"] += 1
+            return copy.deepcopy(entry["results"])
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._resolve(key, store, country, query, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._inflight.pop(k, None) if self._inflight.get(k) is t else None)
+
+        # Callers annotate the app dicts (match_type, source) - hand out copies
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    def invalidate(self, store: str, country: str, query: str):
+        self._memory.pop(cache_key(store, country, query), None)
+
+    async def _resolve(self, key: str, store: str, country: str, query: str,
+                       fetch: Callable[[], Awaitable[List[Dict]]]) -> List[Dict]:
+        results = await self._mongo_get(key)
+        if results is not None:
+            self.stats["mongo_hits"] += 1
+            self._remember(key, results)
+            return results
+
+        self.stats["fetches"] += 1
+        results = await fetch()
+        self._remember(key, results)
+        await self._mongo_put(key, store, country, query, results)
+        return results
+
+    def _remember(self, key: str, results: List[Dict]):
+        self._memory[key] = {"results": results, "ttl": get_ttl(results)}
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready or db is None:
+            return
+        try:
+            collection = db[CACHE_COLLECTION]
+            await collection.create_index("key", unique=True)
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning(f"App store cache index creation failed: {e}")
+        self._indexes_ready = True
+
+    async def _mongo_get(self, key: str) -> Optional[List[Dict]]:
+        if db is None:
+            return None
+        try:
+            await self._ensure_indexes()
+            # TTL monitor only runs every ~60s, so filter on expiry explicitly
+            doc = await db[CACHE_COLLECTION].find_one(
+                {"key": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                {"_id": 0, "results": 1}
+            )
+            return doc.get("results") if doc else None
+        except Exception as e:
+            logger.warning(f"App store cache read failed for {key}: {e}")
+            return None
+
+    async def _mongo_put(self, key: str, store: str, country: str, query: str, results: List[Dict]):
+        if db is None:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            await db[CACHE_COLLECTION].update_one(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "store": store,
+                    "country": country.lower(),
+                    "query": normalize_query(query),
+                    "results": results,
+                    "cached_at": now,
+                    "expires_at": now + timedelta(seconds=get_ttl(results)),
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"App store cache write failed for {key}: {e}")
+
+
+# Process-wide instance used by visibility.py
+app_store_cache = AppStoreSearchCache()
@@ -4,9 +4,7 @@ Enhanced with LLM-powered domain strategy analysis
 """
 import aiohttp
 import asyncio
-import whois
 import logging
-import os
 import json
 import re
 from typing import List, Dict, Optional
@@ -17,14 +15,14 @@ from dotenv import load_dotenv
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Import Emergent LLM
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-except ImportError:
-    logging.warning("emergentintegrations not found for availability module")
-    LlmChat = None
+# Import LLM (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
 
-EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
+# Shared cached WHOIS lookups (also used by server.py for the primary .com check)
+from domain_service import domain_service
+
+# One cached fetch per (platform, handle), shared with the enhanced social scan in server.py
+from social_service import social_service
 
 # Country to TLD mapping
 COUNTRY_TLDS = {
@@ -179,68 +177,16 @@ def get_social_platforms(countries: List[str]) -> List[str]:
 
 
 async def check_domain_availability(domain: str) -> Dict:
-    """Check if a domain is available using whois with timeout protection"""
-    try:
-        # Run WHOIS in executor with timeout to prevent blocking
-        loop = asyncio.get_event_loop()
-        try:
-            w = await asyncio.wait_for(
-                loop.run_in_executor(None, whois.whois, domain),
-                timeout=10.0  # 10 second timeout for WHOIS
-            )
-            if w.domain_name or w.creation_date:
-                return {"domain": domain, "status": "TAKEN", "available": False}
-            else:
-                return {"domain": domain, "status": "AVAILABLE", "available": True}
-        except asyncio.TimeoutError:
-            logging.warning(f"WHOIS timeout for {domain}")
-            return {"domain": domain, "status": "TIMEOUT", "available": None, "error": "WHOIS timeout"}
-    except Exception as e:
-        error_str = str(e).lower()
-        if "no match" in error_str or "not found" in error_str or "no entries" in error_str:
-            return {"domain": domain, "status": "AVAILABLE", "available": True}
-        else:
-            return {"domain": domain, "status": "UNKNOWN", "available": None, "error": str(e)[:50]}
+    """Check if a domain is available (WHOIS, via the shared cached domain service)"""
+    return await domain_service.check(domain)
 
 
 async def check_social_handle(platform: str, handle: str) -> Dict:
-    """Check if a social handle is available"""
+    """Check if a social handle is available (shared cached probe, see social_service.py)"""
     if platform not in SOCIAL_PATTERNS:
         return {"platform": platform, "handle": handle, "status": "UNSUPPORTED", "available": None}
     
-    url = SOCIAL_PATTERNS[platform].format(handle=handle)
-    
-    try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, allow_redirects=True) as response:
-                # Different platforms have different 404 behaviors
-                if response.status == 404:
-                    return {"platform": platform, "handle": handle, "status": "AVAILABLE", "available": True, "url": url}
-                elif response.status == 200:
-                    # Check content for "page not found" patterns
-                    content = await response.text()
-                    not_found_patterns = [
-                        "page isn't available",
-                        "page not found", 
-                        "sorry, this page",
-                        "user not found",
-                        "account suspended",
-                        "doesn't exist",
-                        "this account doesn't exist"
-                    ]
-                    content_lower = content.lower()
-                    for pattern in not_found_patterns:
-                        if pattern in content_lower:
-                            return {"platform": platform, "handle": handle, "status": "LIKELY AVAILABLE", "available": True, "url": url}
-                    return {"platform": platform, "handle": handle, "status": "TAKEN", "available": False, "url": url}
-                else:
-                    return {"platform": platform, "handle": handle, "status": "TAKEN", "available": False, "url": url}
-    except asyncio.TimeoutError:
-        return {"platform": platform, "handle": handle, "status": "TIMEOUT", "available": None}
-    except Exception as e:
-        logging.warning(f"Social check error for {platform}/{handle}: {e}")
-        return {"platform": platform, "handle": handle, "status": "ERROR", "available": None}
+    return await social_service.probe_basic(platform, handle)
 
 
 async def check_multi_domain_availability(brand_name: str, category: str, countries: List[str]) -> Dict:
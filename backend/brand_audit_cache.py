@@ -0,0 +1,203 @@
+"""
+Brand Audit Research Cache
+==========================
+Stores the raw research behind each /api/brand-audit run (website crawl and
+each web-search query) in MongoDB (db.brand_audit_research_cache), so a
+refresh of the same brand can reuse sources that are still recent.
+
+Entries are keyed by source:
+- "crawl:<domain>"   - combined website content + hash of the homepage text
+- "search:<provider>:<query>" - perform_web_search() output for a normalized
+  query; LLM-generated, so keyed by LLM_PROVIDER (fake output is never reused
+  by a real run)
+
+Refresh mode (BrandAuditRequest.refresh) reuses entries younger than
+BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS (or the request's max_research_age_hours).
+A stale crawl entry is only re-crawled when the homepage hash changed.
+
+Every audit writes its fresh sources back, so the next refresh can use them.
+The collection has a TTL index so old research eventually expires.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from llm_provider import LLM_PROVIDER
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS = float(os.environ.get("BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS", 7 * 24))
+BRAND_AUDIT_RESEARCH_RETENTION_DAYS = int(os.environ.get("BRAND_AUDIT_RESEARCH_RETENTION_DAYS", 90))
+
+CACHE_COLLECTION = "brand_audit_research_cache"
+
+# crawl_brand_website() output when no page could be crawled - never cached
+UNCRAWLABLE_MARKER = "[Unable to crawl website"
+
+# MongoDB reference (set from main server.py)
+db = None
+
+
+def set_db(database):
+    """Set database reference from main server"""
+    global db
+    db = database
+
+
+def normalize_domain(website: str) -> str:
+    return website.lower().replace("https://", "").replace("http://", "").replace("www.", "").split("/")[0]
+
+
+def crawl_key(website: str) -> str:
+    return f"crawl:{normalize_domain(website)}"
+
+
+def search_key(query: str) -> str:
+    return f"search:{LLM_PROVIDER}:{' '.join(query.lower().split())}"
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+# ============ CACHE ============
+
+class BrandAuditResearchCache:
+    """Mongo-backed store of brand audit research sources."""
+
+    def __init__(self):
+        self._indexes_ready = False
+        self.stats = {"reused": 0, "unchanged_recrawls_avoided": 0, "stored": 0}
+
+    async def get(self, key: str) -> Optional[Dict]:
+        """Cached entry ({content, content_hash, fetched_at, ...}) or None."""
+        if db is None:
+            return None
+        try:
+            await self._ensure_indexes()
+            return await db[CACHE_COLLECTION].find_one({"key": key}, {"_id": 0})
+        except Exception as e:
+            logger.warning(f"Brand audit research cache read failed for {key}: {e}")
+            return None
+
+    async def get_fresh(self, key: str, max_age_hours: float) -> Optional[Dict]:
+        """Cached entry if it is younger than max_age_hours."""
+        entry = await self.get(key)
+        if entry is not None and is_fresh(entry, max_age_hours):
+            return entry
+        return None
+
+    async def put(self, key: str, content: str, content_hash_value: Optional[str] = None):
+        if db is None or not content:
+            return
+        try:
+            await self._ensure_indexes()
+            now = datetime.now(timezone.utc)
+            await db[CACHE_COLLECTION].update_one(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "content": content,
+                    "content_hash": content_hash_value or content_hash(content),
+                    "fetched_at": now,
+                    "expires_at": now + timedelta(days=BRAND_AUDIT_RESEARCH_RETENTION_DAYS),
+                }},
+                upsert=True
+            )
+            self.stats["stored"] += 1
+        except Exception as e:
+            logger.warning(f"Brand audit research cache write failed for {key}: {e}")
+
+    async def touch(self, key: str):
+        """Mark an entry as re-verified now (content unchanged)."""
+        if db is None:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            await db[CACHE_COLLECTION].update_one(
+                {"key": key},
+                {"$set": {"fetched_at": now,
+                          "expires_at": now + timedelta(days=BRAND_AUDIT_RESEARCH_RETENTION_DAYS)}}
+            )
+        except Exception as e:
+            logger.warning(f"Brand audit research cache touch failed for {key}: {e}")
+
+    async def search(self, query: str, fetch: Callable[[], Awaitable[str]],
+                     refresh: bool = False, max_age_hours: Optional[float] = None) -> Tuple[str, bool]:
+        """
+        Web search result for query -> (content, reused).
+        In refresh mode a cached result younger than max_age_hours is reused.
+        """
+        key = search_key(query)
+        if refresh:
+            entry = await self.get_fresh(key, max_age_hours or BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS)
+            if entry is not None:
+                self.stats["reused"] += 1
+                return entry["content"], True
+
+        content = await fetch()
+        if content and not content.rstrip().endswith("No search results found"):
+            await self.put(key, content)
+        return content, False
+
+    async def crawl(self, website: str, crawl: Callable[[], Awaitable[str]],
+                    fetch_homepage: Callable[[], Awaitable[str]],
+                    refresh: bool = False, max_age_hours: Optional[float] = None) -> Tuple[str, bool]:
+        """
+        Website content for website -> (content, reused).
+        
+        In refresh mode a recent crawl is reused as-is. An older one is reused
+        if the homepage text still hashes the same; only a changed (or
+        unreachable) homepage triggers a full re-crawl.
+        """
+        key = crawl_key(website)
+        entry = await self.get(key) if refresh else None
+        if entry is not None:
+            if is_fresh(entry, max_age_hours or BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS):
+                self.stats["reused"] += 1
+                return entry["content"], True
+            homepage_text = await fetch_homepage()
+            if homepage_text and content_hash(homepage_text) == entry.get("content_hash"):
+                logger.info(f"Brand audit: {website} unchanged since last crawl - reusing content")
+                self.stats["unchanged_recrawls_avoided"] += 1
+                await self.touch(key)
+                return entry["content"], True
+
+        content, homepage_text = await asyncio.gather(crawl(), fetch_homepage())
+        if content and homepage_text and UNCRAWLABLE_MARKER not in content:
+            await self.put(key, content, content_hash(homepage_text))
+        return content, False
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready or db is None:
+            return
+        try:
+            collection = db[CACHE_COLLECTION]
+            await collection.create_index("key", unique=True)
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning(f"Brand audit research cache index creation failed: {e}")
+        self._indexes_ready = True
+
+
+def is_fresh(entry: Dict, max_age_hours: float) -> bool:
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(fetched_at, datetime):
+        return False
+    if fetched_at.tzinfo is None:
+        # Motor returns naive UTC datetimes unless tz_aware=True
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - fetched_at < timedelta(hours=max_age_hours)
+
+
+# Process-wide instance used by server.py
+brand_audit_cache = BrandAuditResearchCache()
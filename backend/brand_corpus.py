@@ -0,0 +1,570 @@
+"""
+Brand / Trademark Corpus
+========================
+Bulk trademark data (names, Nice classes, status, owner, precomputed phonetic
+keys) in a compact, array-backed file format that is memory-mapped read-only.
+
+The hard-coded reference sets (similarity.py KNOWN_BRANDS / GLOBAL_FAMOUS_BRANDS
+/ CATEGORY_KINGS, trademark_research.py KNOWN_TRADEMARK_DATA, server.py
+FAMOUS_BRANDS) stay as they are; this corpus is an optional extra source that
+can hold millions of records without each uvicorn worker building its own copy:
+every worker maps the same files and shares the OS page cache.
+
+Layout - a corpus is a directory of immutable segment files:
+
+    <BRAND_CORPUS_DIR>/segment-000001.brc
+    <BRAND_CORPUS_DIR>/segment-000002.brc    <- appended update
+    ...
+
+Each segment is a small JSON header followed by 64-byte aligned numpy
+columns. Records inside a segment are sorted by normalized name, with sorted
+Soundex / Metaphone / record-key columns for binary-search lookups, so a query
+touches a handful of pages instead of the whole file.
+
+Updates are appended as new segments. A record in a newer segment supersedes
+older records with the same key (application number, or normalized name +
+owner when there is none). compact() merges all segments into one.
+
+Build / update from the command line:
+
+    python brand_corpus.py build  marks.csv --dir /data/brand_corpus
+    python brand_corpus.py append updates.jsonl --dir /data/brand_corpus
+    python brand_corpus.py compact --dir /data/brand_corpus
+    python brand_corpus.py stats --dir /data/brand_corpus
+"""
+
+import bisect
+import csv
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from similarity import normalize_name, phonetic_codes
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+BRAND_CORPUS_DIR = os.environ.get("BRAND_CORPUS_DIR", "")
+BRAND_CORPUS_REFRESH_SECONDS = float(os.environ.get("BRAND_CORPUS_REFRESH_SECONDS", 60))
+
+SEGMENT_MAGIC = b"BRCORP01"
+SEGMENT_PATTERN = re.compile(r"^segment-(\d{6})\.brc$")
+ALIGNMENT = 64
+
+# Status is stored as one byte; raw register statuses are mapped by keyword
+STATUSES = ("unknown", "registered", "pending", "objected", "opposed", "refused",
+            "abandoned", "withdrawn", "cancelled", "expired", "removed")
+DEAD_STATUSES = frozenset({"refused", "abandoned", "withdrawn", "cancelled", "expired", "removed"})
+STATUS_KEYWORDS = [
+    ("regist", "registered"), ("live", "registered"),
+    ("object", "objected"), ("oppos", "opposed"), ("refus", "refused"),
+    ("abandon", "abandoned"), ("dead", "abandoned"), ("withdraw", "withdrawn"),
+    ("cancel", "cancelled"), ("expir", "expired"), ("remov", "removed"),
+    ("pending", "pending"), ("formalit", "pending"), ("exam", "pending"),
+    ("advertis", "pending"), ("accept", "pending"), ("filed", "pending"), ("new application", "pending"),
+]
+
+# Accepted source column names (CSV header / JSONL keys), first match wins
+FIELD_ALIASES = {
+    "name": ("name", "mark", "trademark", "brand", "word_mark"),
+    "serial": ("application_number", "serial", "serial_number", "registration_number", "app_no"),
+    "owner": ("owner", "applicant", "proprietor", "owner_name"),
+    "classes": ("classes", "class_number", "class", "nice_class", "nice_classes"),
+    "status": ("status", "trademark_status", "mark_status"),
+}
+
+
+def status_name(raw: str) -> str:
+    raw = (raw or "").lower()
+    for keyword, status in STATUS_KEYWORDS:
+        if keyword in raw:
+            return status
+    return "unknown"
+
+
+def parse_classes(raw) -> Tuple[int, ...]:
+    """Nice classes from '9', '9, 42', 'Class 35', [9, 42], ... (1-45 only)"""
+    if isinstance(raw, (list, tuple)):
+        raw = " ".join(str(value) for value in raw)
+    classes = {int(number) for number in re.findall(r"\d+", str(raw or ""))}
+    return tuple(sorted(number for number in classes if 1 <= number <= 45))
+
+
+def classes_mask(classes: Iterable[int]) -> int:
+    mask = 0
+    for number in classes:
+        mask |= 1 << number
+    return mask
+
+
+def mask_classes(mask: int) -> Tuple[int, ...]:
+    return tuple(number for number in range(1, 46) if mask >> number & 1)
+
+
+# ============ RECORDS ============
+
+class CorpusRecord(NamedTuple):
+    name: str
+    normalized: str
+    serial: str
+    owner: str
+    classes: Tuple[int, ...]
+    status: str
+    soundex: str
+    metaphone: str
+
+    @property
+    def key(self) -> str:
+        return record_key(self.serial, self.normalized, self.owner)
+
+    @property
+    def is_live(self) -> bool:
+        return self.status not in DEAD_STATUSES
+
+
+def record_key(serial: str, normalized: str, owner: str) -> str:
+    return f"#{serial}" if serial else f"{normalized}|{' '.join(owner.lower().split())}"
+
+
+def make_record(name: str, serial: str = "", owner: str = "", classes=(), status: str = "") -> Optional[CorpusRecord]:
+    """CorpusRecord with normalized name and phonetic keys, or None for an unusable name."""
+    normalized = normalize_name(name or "")
+    if not normalized:
+        return None
+    soundex, metaphone = phonetic_codes(normalized)
+    return CorpusRecord(name.strip(), normalized, str(serial or "").strip(), (owner or "").strip(),
+                        parse_classes(classes), status_name(status), soundex, metaphone)
+
+
+def source_field(row: Dict, field: str, aliases: Dict[str, Tuple[str, ...]] = FIELD_ALIASES):
+    """First non-empty value among a field's accepted column names (row from read_rows())."""
+    for alias in aliases[field]:
+        value = row.get(alias)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _lower_keys(row: Dict) -> Dict:
+    return {str(key).strip().lower(): value for key, value in row.items()}
+
+
+def read_rows(path: str) -> Iterator[Dict]:
+    """Rows of a .csv / .jsonl (.ndjson) export with lower-cased keys; invalid JSON lines are skipped."""
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, 1):
+                if line.strip():
+                    try:
+                        yield _lower_keys(json.loads(line))
+                    except (json.JSONDecodeError, AttributeError) as e:
+                        logger.warning(f"{path}:{line_number}: skipping invalid row ({e})")
+    else:
+        with open(path, encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                yield _lower_keys(row)
+
+
+def read_source(path: str) -> Iterator[CorpusRecord]:
+    """Records from a trademark export; rows without a name are skipped."""
+    for row in read_rows(path):
+        record = make_record(
+            source_field(row, "name") or "",
+            serial=source_field(row, "serial") or "",
+            owner=source_field(row, "owner") or "",
+            classes=source_field(row, "classes") or (),
+            status=source_field(row, "status") or "",
+        )
+        if record is not None:
+            yield record
+
+
+# ============ SEGMENT FILES ============
+
+def _string_column(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    if encoded:
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype="u1")
+
+
+def write_segment(path: str, records: Iterable[CorpusRecord], source: str = ""):
+    """Write records to a new segment file (atomically: temp file + rename)."""
+    records = sorted(records, key=lambda record: (record.normalized.encode("utf-8"), record.key))
+    count = len(records)
+
+    owners = sorted({record.owner for record in records if record.owner})
+    owner_ids = {owner: index for index, owner in enumerate(owners)}
+    keys = [record.key for record in records]
+    metaphones = [record.metaphone for record in records]
+
+    columns: Dict[str, np.ndarray] = {}
+    for column, values in (("name", [record.name for record in records]),
+                           ("normalized", [record.normalized for record in records]),
+                           ("serial", [record.serial for record in records]),
+                           ("metaphone", metaphones),
+                           ("key", keys),
+                           ("owner_table", owners)):
+        columns[f"{column}_offsets"], columns[f"{column}_data"] = _string_column(values)
+    columns["owner"] = np.array([owner_ids.get(record.owner, -1) for record in records], dtype="<i4")
+    columns["classes"] = np.array([classes_mask(record.classes) for record in records], dtype="<u8")
+    columns["status"] = np.array([STATUSES.index(record.status) for record in records], dtype="u1")
+    columns["soundex"] = np.array([record.soundex for record in records], dtype="S4")
+    columns["soundex_order"] = np.argsort(columns["soundex"], kind="stable").astype("<i4")
+    columns["soundex_sorted"] = columns["soundex"][columns["soundex_order"]]
+    columns["metaphone_order"] = np.array(sorted(range(count), key=metaphones.__getitem__), dtype="<i4")
+    columns["key_order"] = np.array(sorted(range(count), key=keys.__getitem__), dtype="<i4")
+
+    layout = {}
+    offset = 0
+    for column, array in columns.items():
+        layout[column] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    header = json.dumps({
+        "count": count,
+        "source": source,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "columns": layout,
+    }).encode("utf-8")
+    data_start = -(-(len(SEGMENT_MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(SEGMENT_MAGIC)
+        handle.write(len(header).to_bytes(8, "little"))
+        handle.write(header)
+        for column, array in columns.items():
+            handle.seek(data_start + layout[column]["offset"])
+            handle.write(array.tobytes())
+        handle.truncate(data_start + offset)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+class _Strings(Sequence):
+    """Read-only view of a string column (offsets + utf-8 blob), optionally permuted."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray, order: Optional[np.ndarray] = None):
+        self._offsets = offsets
+        self._data = data
+        self._order = order
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if self._order is not None:
+            index = int(self._order[index])
+        return self._data[self._offsets[index]:self._offsets[index + 1]].tobytes().decode("utf-8")
+
+
+class CorpusSegment:
+    """One memory-mapped segment file. All columns are views into the shared read-only mapping."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            raise ValueError(f"{path} is not a brand corpus segment")
+        header_length = int.from_bytes(self._mmap[len(SEGMENT_MAGIC):len(SEGMENT_MAGIC) + 8], "little")
+        header_start = len(SEGMENT_MAGIC) + 8
+        self.header = json.loads(self._mmap[header_start:header_start + header_length])
+        data_start = -(-(header_start + header_length) // ALIGNMENT) * ALIGNMENT
+
+        self._columns: Dict[str, np.ndarray] = {}
+        for column, spec in self.header["columns"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"])) if spec["shape"] else 1
+            if not count:
+                self._columns[column] = np.empty(0, dtype=dtype)
+                continue
+            self._columns[column] = np.frombuffer(self._mmap, dtype=dtype, count=count,
+                                                  offset=data_start + spec["offset"])
+
+        column = self._columns
+        self.names = _Strings(column["name_offsets"], column["name_data"])
+        self.normalized = _Strings(column["normalized_offsets"], column["normalized_data"])
+        self.serials = _Strings(column["serial_offsets"], column["serial_data"])
+        self.metaphones = _Strings(column["metaphone_offsets"], column["metaphone_data"])
+        self.keys = _Strings(column["key_offsets"], column["key_data"])
+        self.owners = _Strings(column["owner_table_offsets"], column["owner_table_data"])
+        self._metaphone_sorted = _Strings(column["metaphone_offsets"], column["metaphone_data"],
+                                          column["metaphone_order"])
+        self._keys_sorted = _Strings(column["key_offsets"], column["key_data"], column["key_order"])
+
+    def __len__(self):
+        return self.header["count"]
+
+    def record(self, index: int) -> CorpusRecord:
+        column = self._columns
+        owner_id = int(column["owner"][index])
+        return CorpusRecord(
+            self.names[index],
+            self.normalized[index],
+            self.serials[index],
+            self.owners[owner_id] if owner_id >= 0 else "",
+            mask_classes(int(column["classes"][index])),
+            STATUSES[column["status"][index]] if column["status"][index] < len(STATUSES) else "unknown",
+            column["soundex"][index].decode("ascii"),
+            self.metaphones[index],
+        )
+
+    def records(self) -> Iterator[CorpusRecord]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def exact(self, normalized: str) -> List[int]:
+        start = bisect.bisect_left(self.normalized, normalized)
+        end = bisect.bisect_right(self.normalized, normalized, lo=start)
+        return list(range(start, end))
+
+    def phonetic(self, soundex: str = "", metaphone: str = "") -> List[int]:
+        """Indexes of records sharing the Soundex or the Metaphone key."""
+        found = set()
+        if soundex:
+            key = soundex.encode("ascii")
+            sorted_codes = self._columns["soundex_sorted"]
+            start, end = np.searchsorted(sorted_codes, key, "left"), np.searchsorted(sorted_codes, key, "right")
+            found.update(int(index) for index in self._columns["soundex_order"][start:end])
+        if metaphone:
+            start = bisect.bisect_left(self._metaphone_sorted, metaphone)
+            end = bisect.bisect_right(self._metaphone_sorted, metaphone, lo=start)
+            found.update(int(self._columns["metaphone_order"][position]) for position in range(start, end))
+        return sorted(found)
+
+    def has_key(self, key: str) -> bool:
+        position = bisect.bisect_left(self._keys_sorted, key)
+        return position < len(self) and self._keys_sorted[position] == key
+
+    def close(self):
+        self._columns.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A caller still holds a column view; the mapping is released with it
+            pass
+
+
+# ============ CORPUS ============
+
+def segment_paths(directory: str) -> List[str]:
+    """Segment files of a corpus directory, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if SEGMENT_PATTERN.match(name)]
+
+
+class BrandCorpus:
+    """
+    Read-only view over a corpus directory. Lookups search every segment
+    (newest first) and drop records superseded by a newer segment. New
+    segments appended by another process are picked up on the next lookup
+    after BRAND_CORPUS_REFRESH_SECONDS.
+
+    Safe to share between threads (the similarity scan runs in
+    asyncio.to_thread): refresh() builds a new segment snapshot and swaps it in
+    with one assignment, and lookups work on the snapshot they started with.
+    Segments dropped by a refresh are not closed - a lookup may still be
+    reading them - and are unmapped once garbage-collected.
+    """
+
+    def __init__(self, directory: str, refresh_seconds: float = BRAND_CORPUS_REFRESH_SECONDS):
+        self.directory = directory
+        self.refresh_seconds = refresh_seconds
+        # path -> segment, and the same segments newest first; replaced together, never mutated
+        self._snapshot: Tuple[Dict[str, CorpusSegment], Tuple[CorpusSegment, ...]] = ({}, ())
+        self._refresh_lock = threading.Lock()
+        self._checked_at = 0.0
+        self.refresh()
+
+    def __len__(self):
+        """Stored records, superseded ones included"""
+        return sum(len(segment) for segment in self._snapshot[1])
+
+    def refresh(self):
+        with self._refresh_lock:
+            current = self._snapshot[0]
+            segments: Dict[str, CorpusSegment] = {}
+            for path in segment_paths(self.directory):
+                segment = current.get(path)
+                if segment is None:
+                    try:
+                        segment = CorpusSegment(path)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Brand corpus: cannot open {path}: {e}")
+                        continue
+                segments[path] = segment
+            # Segments removed by compact() stay mapped (and their files readable)
+            # until the last lookup using them lets go
+            self._snapshot = (segments, tuple(segments[path] for path in sorted(segments, reverse=True)))
+            self._checked_at = time.monotonic()
+
+    def _maybe_refresh(self):
+        if time.monotonic() - self._checked_at >= self.refresh_seconds:
+            self.refresh()
+
+    def _newest_first(self) -> Tuple[CorpusSegment, ...]:
+        return self._snapshot[1]
+
+    def _collect(self, matches_by_segment) -> List[CorpusRecord]:
+        segments = self._newest_first()
+        found: Dict[str, CorpusRecord] = {}
+        for position, segment in enumerate(segments):
+            for index in matches_by_segment(segment):
+                record = segment.record(index)
+                key = record.key
+                if key in found:
+                    continue
+                # Superseded by a newer segment whose copy didn't match this lookup
+                if any(newer.has_key(key) for newer in segments[:position]):
+                    continue
+                found[key] = record
+        return list(found.values())
+
+    def exact(self, normalized: str) -> List[CorpusRecord]:
+        self._maybe_refresh()
+        return self._collect(lambda segment: segment.exact(normalized))
+
+    def phonetic(self, soundex: str = "", metaphone: str = "") -> List[CorpusRecord]:
+        self._maybe_refresh()
+        return self._collect(lambda segment: segment.phonetic(soundex, metaphone))
+
+    def candidates(self, normalized: str, soundex: str, metaphone: str, live_only: bool = True) -> List[CorpusRecord]:
+        """Exact and sound-alike records for an already-normalized name (check_brand_similarity)."""
+        self._maybe_refresh()
+        records = self._collect(lambda segment: sorted(set(segment.exact(normalized)) |
+                                                       set(segment.phonetic(soundex, metaphone))))
+        return [record for record in records if record.is_live or not live_only]
+
+    def lookup(self, name: str) -> List[CorpusRecord]:
+        """Exact and sound-alike records for a raw brand name."""
+        normalized = normalize_name(name)
+        return self.candidates(normalized, *phonetic_codes(normalized), live_only=False) if normalized else []
+
+    def records(self) -> Iterator[CorpusRecord]:
+        """Every current (non-superseded) record."""
+        segments = self._newest_first()
+        for position, segment in enumerate(segments):
+            for record in segment.records():
+                if not any(newer.has_key(record.key) for newer in segments[:position]):
+                    yield record
+
+    def get_stats(self) -> Dict:
+        segments = self._snapshot[0]
+        return {
+            "directory": self.directory,
+            "segments": len(segments),
+            "records": sum(len(segment) for segment in segments.values()),
+            "bytes": sum(os.path.getsize(path) for path in segments if os.path.exists(path)),
+        }
+
+    def close(self):
+        """Unmap every segment (shutdown / CLI only - not while lookups may be running)."""
+        segments, self._snapshot = self._snapshot[0], ({}, ())
+        for segment in segments.values():
+            segment.close()
+
+
+def open_brand_corpus(directory: str = BRAND_CORPUS_DIR) -> Optional[BrandCorpus]:
+    """BrandCorpus for BRAND_CORPUS_DIR, or None if unset / empty."""
+    if not directory:
+        return None
+    corpus = BrandCorpus(directory)
+    if not len(corpus):
+        logger.warning(f"Brand corpus: no segments in {directory}")
+        return None
+    logger.info(f"📚 Brand corpus loaded: {len(corpus)} records in {corpus.get_stats()['segments']} segment(s)")
+    return corpus
+
+
+# ============ BUILD / UPDATE ============
+
+def _next_segment_path(directory: str) -> str:
+    numbers = [int(SEGMENT_PATTERN.match(os.path.basename(path)).group(1)) for path in segment_paths(directory)]
+    return os.path.join(directory, f"segment-{max(numbers, default=0) + 1:06d}.brc")
+
+
+def _dedupe(records: Iterable[CorpusRecord]) -> List[CorpusRecord]:
+    """Last record per key wins (later rows in a source file are treated as updates)."""
+    return list({record.key: record for record in records}.values())
+
+
+def append_records(directory: str, records: Iterable[CorpusRecord], source: str = "") -> Optional[str]:
+    """Append records as a new segment (superseding older records with the same key)."""
+    records = _dedupe(records)
+    if not records:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    path = _next_segment_path(directory)
+    write_segment(path, records, source=source)
+    logger.info(f"Brand corpus: wrote {len(records)} records to {path}")
+    return path
+
+
+def build_corpus(directory: str, sources: Iterable[str]) -> Optional[str]:
+    """
+    Replace the corpus in directory with the records from source files.
+    The old segments are only removed once a new one was written, so an
+    empty or unusable dump leaves the corpus as it was.
+    """
+    sources = list(sources)
+    records = [record for source in sources for record in read_source(source)]
+    old_paths = segment_paths(directory)
+    path = append_records(directory, records, source=",".join(os.path.basename(s) for s in sources))
+    if path is None:
+        logger.warning(f"Brand corpus: no usable records in {', '.join(sources)} - keeping existing segments")
+        return None
+    for old_path in old_paths:
+        os.remove(old_path)
+    return path
+
+
+def compact(directory: str) -> Optional[str]:
+    """Merge all segments into one, dropping superseded records."""
+    old_paths = segment_paths(directory)
+    if len(old_paths) < 2:
+        return old_paths[0] if old_paths else None
+    corpus = BrandCorpus(directory, refresh_seconds=float("inf"))
+    try:
+        path = append_records(directory, list(corpus.records()), source="compact")
+    finally:
+        corpus.close()
+    if path is None:
+        return None
+    for old_path in old_paths:
+        os.remove(old_path)
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Build and update the memory-mapped brand corpus")
+    parser.add_argument("command", choices=["build", "append", "compact", "stats"])
+    parser.add_argument("sources", nargs="*", help="CSV / JSONL trademark exports")
+    parser.add_argument("--dir", default=BRAND_CORPUS_DIR, required=not BRAND_CORPUS_DIR,
+                        help="corpus directory (default: $BRAND_CORPUS_DIR)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_corpus(args.dir, args.sources)
+    elif args.command == "append":
+        append_records(args.dir, (record for source in args.sources for record in read_source(source)),
+                       source=",".join(os.path.basename(s) for s in args.sources))
+    elif args.command == "compact":
+        compact(args.dir)
+    corpus = BrandCorpus(args.dir)
+    print(json.dumps(corpus.get_stats(), indent=2))
@@ -0,0 +1,353 @@
+"""
+Brand Lookup Indexes
+====================
+Read-only lookup structures over the brand corpora (similarity.py's
+KNOWN_BRANDS / GLOBAL_FAMOUS_BRANDS / CATEGORY_KINGS and server.py's
+FAMOUS_BRANDS), built once so checks don't rescan every brand per call.
+
+PhoneticIndex - inverted index from phonetic keys (Soundex, Metaphone, a
+double-metaphone-style alternate key and the sound-substituted spelling) to
+brands. Sound-alike candidates are a few dict lookups regardless of corpus size.
+
+TrigramIndex - trigram inverted index with candidate verification: all names
+within edit distance k / above a similarity floor, and substring containment,
+without scanning the whole corpus.
+
+PatternMatcher - Aho-Corasick automaton over a fixed pattern table (suffix
+tiers, offensive words, sacred terms, ...): every pattern occurring in a name
+is found in one pass over the name, however large the table.
+"""
+
+import re
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+import jellyfish
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+
+# ============ PHONETIC KEYS ============
+
+# Common sound substitutions (q->k, ph->f, ...) applied in order.
+# Also used by server.check_famous_brand for its sound-alike spelling check.
+SOUND_SUBSTITUTIONS = [
+    ('q', 'k'),      # q sounds like k
+    ('ck', 'k'),     # ck sounds like k
+    ('ph', 'f'),     # ph sounds like f
+    ('gh', 'g'),     # gh often sounds like g
+    ('wh', 'w'),     # wh sounds like w
+    ('wr', 'r'),     # wr sounds like r
+    ('kn', 'n'),     # kn sounds like n
+    ('gn', 'n'),     # gn sounds like n
+    ('mb', 'm'),     # mb at end sounds like m
+    ('mn', 'n'),     # mn sounds like n
+    ('sc', 's'),     # sc can sound like s
+    ('ce', 'se'),    # ce sounds like se
+    ('ci', 'si'),    # ci sounds like si
+    ('cy', 'sy'),    # cy sounds like sy
+    ('ee', 'i'),     # ee sounds like i
+    ('ea', 'i'),     # ea can sound like i
+    ('oo', 'u'),     # oo sounds like u
+    ('ou', 'u'),     # ou can sound like u
+    ('x', 'ks'),     # x sounds like ks
+    ('z', 's'),      # z sounds like s
+    ('v', 'w'),      # v can sound like w in some accents
+    ('y', 'i'),      # y often sounds like i
+]
+
+
+def phonetic_normalize(text: str) -> str:
+    """Convert text to phonetic representation for matching similar sounds"""
+    text = text.lower()
+    for old, new in SOUND_SUBSTITUTIONS:
+        text = text.replace(old, new)
+    return text
+
+
+def alternate_phonetic_key(compact: str) -> str:
+    """
+    Double-metaphone-style secondary key: Metaphone of the sound-substituted,
+    de-doubled spelling. Catches pairs the primary Metaphone splits
+    (mobiqwik / mobikwik, fone / phone, kwik / quick).
+    """
+    letters = re.sub(r'[^a-z]', '', phonetic_normalize(compact))
+    return jellyfish.metaphone(re.sub(r'(.)\1+', r'\1', letters)) if letters else ""
+
+
+# ============ PHONETIC INDEX ============
+
+class PhoneticEntry(NamedTuple):
+    name: str                   # display name (first spelling seen)
+    keys: Mapping[str, str]     # key kind -> phonetic key
+    corpora: FrozenSet[str]     # corpora the brand appears in
+    spellings: Tuple[str, ...]  # every original spelling ("Coca-Cola", "Coca Cola", "coca cola")
+    identity: str               # identity(name), the brand ID
+
+
+class PhoneticIndex:
+    """
+    Immutable inverted index: (key kind, phonetic key) -> brands.
+
+    encoder(name) returns {kind: key} for a brand name, e.g.
+    {"soundex": "N200", "metaphone": "NK", "alternate": "NK"}. Brands are
+    deduplicated by identity(name) across corpora.
+    """
+
+    def __init__(self, corpora: Mapping[str, Iterable[str]],
+                 encoder: Callable[[str], Dict[str, str]],
+                 identity: Callable[[str], str]):
+        self._encoder = encoder
+        self._identity = identity
+        self._corpora = {corpus: tuple(names) for corpus, names in corpora.items()}
+
+        entries: Dict[str, dict] = {}
+        for corpus, names in self._corpora.items():
+            for name in names:
+                ident = identity(name)
+                if not ident:
+                    continue
+                entry = entries.setdefault(ident, {"name": name, "corpora": set(), "spellings": {}})
+                entry["corpora"].add(corpus)
+                entry["spellings"][name] = None
+
+        buckets: Dict[Tuple[str, str], List[str]] = {}
+        frozen = {}
+        for ident, entry in entries.items():
+            keys = self.encode(entry["name"])
+            frozen[ident] = PhoneticEntry(entry["name"], MappingProxyType(keys),
+                                          frozenset(entry["corpora"]), tuple(entry["spellings"]), ident)
+            # Every spelling is bucketed, so "Levi's" and "levis" are both reachable
+            bucket_keys = set(keys.items())
+            for spelling in entry["spellings"]:
+                bucket_keys.update(self.encode(spelling).items())
+            for bucket in bucket_keys:
+                buckets.setdefault(bucket, []).append(ident)
+
+        self._entries: Mapping[str, PhoneticEntry] = MappingProxyType(frozen)
+        self._buckets: Mapping[Tuple[str, str], Tuple[str, ...]] = MappingProxyType(
+            {bucket: tuple(idents) for bucket, idents in buckets.items()}
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return self._identity(name) in self._entries
+
+    def with_corpus(self, corpus: str, names: Iterable[str]) -> "PhoneticIndex":
+        """New index over the existing corpora plus one more (this one is unchanged)."""
+        return PhoneticIndex({**self._corpora, corpus: tuple(names)}, self._encoder, self._identity)
+
+    def encode(self, name: str) -> Dict[str, str]:
+        return {kind: key for kind, key in self._encoder(name).items() if key}
+
+    def entry(self, name: str) -> Optional[PhoneticEntry]:
+        return self._entries.get(self._identity(name))
+
+    def lookup_keys(self, keys: Mapping[str, str], corpus: Optional[str] = None) -> List[PhoneticEntry]:
+        """Entries sharing at least one of the given {kind: key} codes (optionally from one corpus)."""
+        seen = {}
+        for kind, key in keys.items():
+            if not key:
+                continue
+            for ident in self._buckets.get((kind, key), ()):
+                entry = self._entries[ident]
+                if corpus is None or corpus in entry.corpora:
+                    seen.setdefault(ident, entry)
+        return list(seen.values())
+
+    def corpora(self) -> FrozenSet[str]:
+        return frozenset(self._corpora)
+
+
+# ============ TRIGRAM INDEX ============
+
+def padded_trigrams(text: str) -> FrozenSet[str]:
+    """Distinct trigrams of text padded with two '$' on each side"""
+    padded = f"$${text}$$"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """
+    Immutable trigram inverted index over normalized strings, for approximate
+    matching against large corpora (100k+ names) without a linear scan.
+
+    within_distance(query, k) returns every string within Levenshtein distance
+    k (exact: candidates come from the q-gram count filter - an edit destroys
+    at most 3 of a string's distinct padded trigrams - and are verified with
+    rapidfuzz). similar() converts a 0-100 similarity floor into the matching
+    k. substrings_of() / superstrings_of() answer containment queries.
+
+    Strings are identified by position (id) in the sequence given to the
+    constructor; callers map ids back to their own records.
+    """
+
+    def __init__(self, strings: Iterable[str]):
+        self.strings: Tuple[str, ...] = tuple(strings)
+        postings: Dict[str, List[int]] = {}
+        gram_counts = []
+        interior_counts = []
+        by_length: Dict[int, List[int]] = {}
+        for string_id, text in enumerate(self.strings):
+            grams = padded_trigrams(text)
+            gram_counts.append(len(grams))
+            interior_counts.append(sum(1 for gram in grams if "$" not in gram))
+            by_length.setdefault(len(text), []).append(string_id)
+            for gram in grams:
+                postings.setdefault(gram, []).append(string_id)
+        self._postings: Mapping[str, Tuple[int, ...]] = MappingProxyType(
+            {gram: tuple(ids) for gram, ids in postings.items()}
+        )
+        self._gram_counts = tuple(gram_counts)
+        self._interior_counts = tuple(interior_counts)
+        self._by_length: Mapping[int, Tuple[int, ...]] = MappingProxyType(
+            {length: tuple(ids) for length, ids in by_length.items()}
+        )
+
+    def __len__(self):
+        return len(self.strings)
+
+    def _shared_counts(self, grams: Iterable[str], interior_only: bool = False) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for gram in grams:
+            if interior_only and "$" in gram:
+                continue
+            for string_id in self._postings.get(gram, ()):
+                counts[string_id] = counts.get(string_id, 0) + 1
+        return counts
+
+    def within_distance(self, query: str, k: int) -> List[Tuple[int, int]]:
+        """(id, distance) for every string within Levenshtein distance k of query, by id."""
+        query_grams = sorted(padded_trigrams(query), key=lambda gram: len(self._postings.get(gram, ())))
+        query_len = len(query)
+        required = len(query_grams) - 3 * k
+        candidates = set()
+        if required > 0:
+            # Prefix filter: a match shares >= required grams with the query, so it
+            # must appear in the postings of the (3k + 1) rarest query grams
+            for gram in query_grams[:3 * k + 1]:
+                candidates.update(self._postings.get(gram, ()))
+        else:
+            # Short query: a match only has to share a gram if it has more than 3k itself
+            for gram in query_grams:
+                candidates.update(self._postings.get(gram, ()))
+            for length in range(max(0, query_len - k), min(query_len + k, 3 * k - 2) + 1):
+                candidates.update(self._by_length.get(length, ()))
+
+        ids = [string_id for string_id in candidates if abs(len(self.strings[string_id]) - query_len) <= k]
+        matches = process.extract(
+            query, [self.strings[string_id] for string_id in ids],
+            scorer=Levenshtein.distance, processor=None, score_cutoff=k, limit=None
+        )
+        return sorted((ids[position], int(distance)) for _, distance, position in matches)
+
+    def similar(self, query: str, min_similarity: float) -> List[Tuple[int, float]]:
+        """
+        (id, similarity) for strings whose Levenshtein similarity to query
+        (0-100, normalized by the longer length) is at least min_similarity.
+        """
+        if not query:
+            return []
+        floor = max(min_similarity, 1.0) / 100
+        # sim >= s  <=>  d <= (1 - s) * max_len, and max_len <= len(query) + d
+        k = int((1 - floor) * len(query) / floor)
+        matches = []
+        for string_id, distance in self.within_distance(query, k):
+            longest = max(len(query), len(self.strings[string_id]))
+            similarity = (1 - distance / longest) * 100 if longest else 100.0
+            if similarity >= min_similarity:
+                matches.append((string_id, round(similarity, 2)))
+        return matches
+
+    def substrings_of(self, query: str, min_length: int = 1) -> List[int]:
+        """Ids of indexed strings (len >= min_length) that occur inside query."""
+        counts = self._shared_counts(padded_trigrams(query), interior_only=True)
+        found = []
+        for string_id, shared in counts.items():
+            text = self.strings[string_id]
+            if len(text) >= min_length and shared == self._interior_counts[string_id] and text in query:
+                found.append(string_id)
+        # Strings shorter than 3 chars have no interior trigram
+        for length in range(max(1, min_length), 3):
+            found.extend(string_id for string_id in self._by_length.get(length, ()) if self.strings[string_id] in query)
+        return sorted(set(found))
+
+    def superstrings_of(self, query: str) -> List[int]:
+        """Ids of indexed strings that contain query."""
+        interior = [gram for gram in padded_trigrams(query) if "$" not in gram]
+        if not interior:
+            return [string_id for string_id, text in enumerate(self.strings) if query in text]
+        rarest = min(interior, key=lambda gram: len(self._postings.get(gram, ())))
+        return [string_id for string_id in self._postings.get(rarest, ()) if query in self.strings[string_id]]
+
+
+# ============ MULTI-PATTERN MATCHER ============
+
+class PatternMatcher:
+    """
+    Immutable Aho-Corasick automaton over a pattern table.
+
+    Patterns are identified by position (id) in the sequence given to the
+    constructor, so callers keep their table order and map ids back to their
+    own records; duplicate patterns get one id each. Matching is case-sensitive
+    - normalize patterns and text the same way.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Breadth-first failure links; each state also reports the patterns
+        # of its failure chain (the suffixes of its prefix)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto: Tuple[Mapping[str, int], ...] = tuple(MappingProxyType(edges) for edges in goto)
+        self._fail: Tuple[int, ...] = tuple(fail)
+        self._outputs: Tuple[Tuple[int, ...], ...] = tuple(tuple(ids) for ids in outputs)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start, id) for every occurrence of every pattern in text, by end position."""
+        goto, fail, outputs, patterns = self._goto, self._fail, self._outputs, self.patterns
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in outputs[state]:
+                yield end - len(patterns[pattern_id]), pattern_id
+
+    def find(self, text: str) -> List[int]:
+        """Ids of the patterns occurring in text, in table order."""
+        return sorted({pattern_id for _, pattern_id in self.iter_matches(text)})
+
+    def first(self, text: str) -> Optional[int]:
+        """Lowest id among the patterns occurring in text, or None."""
+        found = self.find(text)
+        return found[0] if found else None
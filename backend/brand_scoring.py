@@ -0,0 +1,993 @@
+"""
+Brand Scoring Stages
+====================
+Deterministic, CPU-only scoring used by /api/evaluate: the master
+classification (5-step spectrum of distinctiveness), the pronounceability
+gate and the DuPont 13-factor likelihood-of-confusion test.
+
+No I/O, no LLM, no app state: server.py imports these, and CPU lane workers
+(cpu_lane.py) import this module without loading the FastAPI app.
+"""
+
+import logging
+import re
+
+# ============ MASTER CLASSIFICATION SYSTEM ============
+# Single classification called ONCE, result passed to all sections
+# Implements 5-Step Spectrum of Distinctiveness
+
+# CACHE to avoid duplicate classification calls
+_CLASSIFICATION_CACHE = {}
+
+COMMON_DICTIONARY_WORDS = {
+    # Common English words that indicate DESCRIPTIVE names
+    "check", "my", "meal", "quick", "fast", "health", "care", "med", "doc", "doctor",
+    "pay", "flow", "cash", "money", "bank", "fin", "tech", "app", "book", "shop",
+    "buy", "sell", "trade", "market", "store", "home", "house", "real", "estate",
+    "food", "eat", "dine", "cook", "chef", "kitchen", "taste", "fresh", "organic",
+    "fit", "gym", "work", "out", "body", "mind", "soul", "life", "live", "well",
+    "travel", "trip", "tour", "fly", "drive", "ride", "go", "move", "run", "walk",
+    "learn", "teach", "study", "class", "school", "edu", "smart", "brain", "think",
+    "cloud", "data", "sync", "link", "connect", "net", "web", "site", "page", "hub",
+    "social", "chat", "talk", "speak", "call", "meet", "date", "love", "match",
+    "news", "feed", "post", "share", "like", "view", "watch", "play", "game", "fun",
+    "style", "fashion", "wear", "dress", "look", "beauty", "glow", "skin", "hair",
+    "auto", "car", "bike", "wheel", "park", "fix", "repair", "service", "clean",
+    "pet", "dog", "cat", "vet", "kid", "baby", "family", "parent", "mom", "dad",
+    "green", "eco", "solar", "power", "energy", "save", "easy", "simple",
+    "pro", "plus", "max", "prime", "elite", "premium", "super", "mega", "ultra",
+    "one", "first", "best", "top", "next", "new", "now", "today", "daily", "weekly",
+    "local", "global", "world", "city", "urban", "rural", "metro", "zone", "area",
+    "true", "real", "pure", "free", "open", "clear", "bright", "light", "dark",
+    "blue", "red", "gold", "silver", "black", "white", "color", "colour",
+    # Medical/Healthcare
+    "steth", "scope", "pulse", "heart", "blood", "test", "lab", "scan", "ray",
+    "heal", "cure", "therapy", "clinic", "hospital", "pharma", "drug", "pill",
+    # Finance
+    "wallet", "coin", "credit", "debit", "loan", "invest", "fund", "stock",
+    # Tech
+    "code", "dev", "build", "make", "create", "design", "pixel", "byte", "bit",
+    # Common suffixes that indicate descriptive
+    "ly", "er", "ist", "ify", "ize", "able", "ible", "ful", "less", "ment", "ness",
+    "works", "hub", "spot", "base", "point", "space", "place", "land",
+    # Additional common words
+    "air", "bus", "face", "sound", "snap", "insta", "gram", "tube", "flix",
+    "drop", "box", "door", "dash", "uber", "grab", "bolt", "zoom", "slack",
+}
+
+# Industry keywords for semantic matching
+INDUSTRY_KEYWORDS = {
+    "food": ["meal", "eat", "dine", "food", "cook", "chef", "taste", "recipe", "kitchen", "restaurant", "cafe", "dish", "menu"],
+    "healthcare": ["health", "med", "doctor", "clinic", "care", "patient", "therapy", "heal", "cure", "hospital", "pharma", "steth", "pulse"],
+    "finance": ["pay", "money", "bank", "cash", "fund", "loan", "credit", "invest", "wallet", "coin", "finance", "fintech"],
+    "technology": ["tech", "code", "dev", "app", "software", "cloud", "data", "digital", "cyber", "ai", "ml"],
+    "travel": ["travel", "trip", "tour", "fly", "flight", "hotel", "stay", "vacation", "journey", "voyage"],
+    "fitness": ["fit", "gym", "workout", "health", "body", "exercise", "train", "muscle", "yoga"],
+    "education": ["learn", "teach", "study", "edu", "school", "class", "course", "academy", "tutor"],
+    "ecommerce": ["shop", "buy", "sell", "store", "cart", "order", "delivery", "market", "retail"],
+    "social": ["social", "connect", "chat", "friend", "share", "post", "network", "community"],
+    "entertainment": ["play", "game", "fun", "watch", "stream", "video", "music", "media"],
+}
+
+MODIFIED_SPELLING_PATTERNS = [
+    # Words with letters removed (Lyft, Flickr, Tumblr style)
+    ("lyft", "lift"), ("flickr", "flicker"), ("tumblr", "tumbler"),
+    ("grindr", "grinder"), ("fiverr", "fiver"), ("scribd", "scribed"),
+    ("bettr", "better"), ("fastr", "faster"), ("hungr", "hungry"),
+    ("dribbble", "dribble"), ("reddit", "read it"),
+]
+
+# Heritage language roots
+HERITAGE_ORIGINS = ["Sanskrit", "Latin", "Greek", "Japanese", "Chinese", "Arabic", "Hebrew", "Persian"]
+
+
+def tokenize_brand_name(brand_name: str) -> list:
+    """
+    STEP 1: DE-COMPOUND - Split brand name into tokens
+    
+    "CheckMyMeal" → ["check", "my", "meal"]
+    "FaceBook" → ["face", "book"]
+    "Xerox" → ["xerox"]
+    "LUMINARA" → ["luminara"] (all-caps treated as single word)
+    """
+    # Normalize: If ALL CAPS, convert to title case first to avoid splitting each letter
+    if brand_name.isupper() and len(brand_name) > 1:
+        brand_name = brand_name.title()  # LUMINARA → Luminara
+    
+    brand_lower = brand_name.lower()
+    
+    # Method 1: Split by common separators
+    tokens = []
+    
+    # Split camelCase: "CheckMyMeal" → ["Check", "My", "Meal"]
+    camel_split = re.sub('([A-Z])', r' \1', brand_name).split()
+    if len(camel_split) > 1:
+        tokens = [t.lower() for t in camel_split if t]
+    
+    # If no camelCase, try to find dictionary words within the string
+    if len(tokens) <= 1:
+        tokens = []
+        remaining = brand_lower
+        
+        # Sort dictionary words by length (longest first) to match greedily
+        sorted_words = sorted(COMMON_DICTIONARY_WORDS, key=len, reverse=True)
+        
+        while remaining:
+            found = False
+            for word in sorted_words:
+                if remaining.startswith(word) and len(word) >= 3:
+                    tokens.append(word)
+                    remaining = remaining[len(word):]
+                    found = True
+                    break
+            
+            if not found:
+                # No dictionary word found at start, take one character and continue
+                if remaining:
+                    # Check if remaining is itself a token
+                    if remaining in COMMON_DICTIONARY_WORDS:
+                        tokens.append(remaining)
+                        break
+                    remaining = remaining[1:]  # Skip one character
+    
+    # If still no tokens, the whole name is one token
+    if not tokens:
+        tokens = [brand_lower]
+    
+    return tokens
+
+
+def get_industry_domain(industry: str) -> tuple:
+    """Get the primary domain of an industry"""
+    industry_lower = industry.lower()
+    
+    for domain, keywords in INDUSTRY_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in industry_lower:
+                return domain, keywords
+    
+    return "general", []
+
+
+def classify_brand_with_industry(brand_name: str, industry: str) -> dict:
+    """
+    MASTER CLASSIFICATION FUNCTION
+    
+    Called ONCE at start, result passed to all sections.
+    Implements 5-Step Spectrum of Distinctiveness:
+    
+    1. GENERIC - Names the category itself (unprotectable)
+    2. DESCRIPTIVE - Directly describes product (weak protection)
+    3. SUGGESTIVE - Hints at product, needs imagination (moderate)
+    4. ARBITRARY - Real word, unrelated context (strong)
+    5. FANCIFUL - Completely invented (strongest)
+    
+    HARD RULES:
+    - Compound Rule: FaceBook = Face + Book = NOT Coined
+    - Conservative Rule: If borderline, default to weaker category
+    - No Fluff Rule: Legal accuracy > Marketing appeal
+    
+    CACHING: Results are cached to avoid duplicate calculations.
+    """
+    global _CLASSIFICATION_CACHE
+    
+    # Check cache first
+    cache_key = f"{brand_name.lower()}|{industry.lower()}"
+    if cache_key in _CLASSIFICATION_CACHE:
+        logging.info(f"🏷️ CLASSIFICATION (CACHED): '{brand_name}' → {_CLASSIFICATION_CACHE[cache_key]['category']}")
+        return _CLASSIFICATION_CACHE[cache_key]
+    
+    # Helper to store in cache before returning
+    def cache_and_return(result, log_msg):
+        _CLASSIFICATION_CACHE[cache_key] = result
+        logging.info(log_msg)
+        return result
+    
+    brand_lower = brand_name.lower()
+    industry_lower = industry.lower()
+    
+    # ========== STEP 1: DE-COMPOUND & DICTIONARY CHECK ==========
+    tokens = tokenize_brand_name(brand_name)
+    
+    # Check which tokens are dictionary words
+    dictionary_tokens = []
+    invented_tokens = []
+    
+    for token in tokens:
+        if token in COMMON_DICTIONARY_WORDS or len(token) <= 2:
+            dictionary_tokens.append(token)
+        else:
+            # Check if it's a partial match
+            is_dict_word = False
+            for dict_word in COMMON_DICTIONARY_WORDS:
+                if dict_word in token or token in dict_word:
+                    dictionary_tokens.append(token)
+                    is_dict_word = True
+                    break
+            if not is_dict_word:
+                invented_tokens.append(token)
+    
+    # Get industry domain
+    industry_domain, industry_keywords = get_industry_domain(industry)
+    
+    # Check for modified spelling
+    is_modified_spelling = False
+    original_word = None
+    for modified, original in MODIFIED_SPELLING_PATTERNS:
+        if modified in brand_lower:
+            is_modified_spelling = True
+            original_word = original
+            break
+    
+    # ========== CLASSIFICATION DECISION TREE ==========
+    
+    # Initialize result
+    result = {
+        "brand_name": brand_name,
+        "industry": industry,
+        "tokens": tokens,
+        "dictionary_tokens": dictionary_tokens,
+        "invented_tokens": invented_tokens,
+        "category": None,
+        "distinctiveness": None,
+        "protectability": None,
+        "dictionary_status": None,
+        "semantic_link": None,
+        "imagination_required": None,
+        "warning": None,
+        "reasoning": None
+    }
+    
+    # ========== STEP 2: GENERIC CHECK ==========
+    # Does the name literally name the category?
+    is_generic = False
+    if brand_lower in industry_keywords or brand_lower == industry_domain:
+        is_generic = True
+    
+    # Check if ALL tokens are industry keywords
+    if len(dictionary_tokens) > 0:
+        all_industry_match = all(
+            any(token in kw or kw in token for kw in industry_keywords)
+            for token in dictionary_tokens
+        )
+        if all_industry_match and len(dictionary_tokens) >= 2:
+            is_generic = True
+    
+    if is_generic:
+        result["category"] = "GENERIC"
+        result["distinctiveness"] = "NONE"
+        result["protectability"] = "UNPROTECTABLE"
+        result["dictionary_status"] = f"All tokens are common words: {dictionary_tokens}"
+        result["semantic_link"] = f"Name directly names the product category '{industry}'"
+        result["imagination_required"] = False
+        result["warning"] = "⛔ Generic terms CANNOT be trademarked. Choose a different name."
+        result["reasoning"] = f"'{brand_name}' literally describes or names the '{industry}' category. Generic terms are free for all to use."
+        
+        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → GENERIC (names the category)")
+    
+    # ========== STEP 3: DESCRIPTIVE CHECK ==========
+    # Do the dictionary words DIRECTLY describe the product?
+    is_descriptive = False
+    matching_industry_tokens = []
+    
+    for token in dictionary_tokens:
+        for keyword in industry_keywords:
+            if token == keyword or token in keyword or keyword in token:
+                matching_industry_tokens.append(token)
+                break
+    
+    # If 50%+ of tokens match industry keywords → DESCRIPTIVE
+    if len(dictionary_tokens) > 0:
+        match_ratio = len(matching_industry_tokens) / len(dictionary_tokens)
+        if match_ratio >= 0.5 and len(dictionary_tokens) >= 2:
+            is_descriptive = True
+    
+    # If ALL tokens are dictionary words and describe function → DESCRIPTIVE
+    if len(dictionary_tokens) >= 2 and len(invented_tokens) == 0:
+        is_descriptive = True
+    
+    if is_descriptive:
+        result["category"] = "DESCRIPTIVE"
+        result["distinctiveness"] = "LOW"
+        result["protectability"] = "WEAK"
+        result["dictionary_status"] = f"Contains dictionary words: {dictionary_tokens}"
+        result["semantic_link"] = f"Words directly describe the {industry} - {', '.join(matching_industry_tokens) if matching_industry_tokens else 'composite description'}"
+        result["imagination_required"] = False
+        result["warning"] = "⚠️ Descriptive marks require proof of 'Secondary Meaning' (acquired distinctiveness) for trademark protection. This typically requires 5+ years of exclusive use and significant marketing investment."
+        result["reasoning"] = f"'{brand_name}' is composed of dictionary words ({', '.join(dictionary_tokens)}) that describe the product/service. Under trademark law, descriptive marks receive weak protection."
+        
+        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → DESCRIPTIVE (describes the product)")
+    
+    # ========== STEP 4: SUGGESTIVE CHECK ==========
+    # Does consumer need imagination to connect name to product?
+    is_suggestive = False
+    
+    # Has dictionary words but doesn't directly describe
+    if len(dictionary_tokens) >= 1 and not is_descriptive:
+        is_suggestive = True
+    
+    # Modified spelling of real words → Suggestive
+    if is_modified_spelling:
+        is_suggestive = True
+    
+    # Compound of real words that hints but doesn't describe
+    # e.g., "Netflix" (Net + Flicks), "Airbus" (Air + Bus)
+    if len(dictionary_tokens) >= 2 and len(matching_industry_tokens) == 0:
+        is_suggestive = True
+    
+    if is_suggestive:
+        result["category"] = "SUGGESTIVE"
+        result["distinctiveness"] = "MODERATE"
+        result["protectability"] = "MODERATE"
+        result["dictionary_status"] = f"Contains words: {dictionary_tokens}" + (f" (modified from '{original_word}')" if is_modified_spelling else "")
+        result["semantic_link"] = f"Hints at {industry} but requires imagination to connect"
+        result["imagination_required"] = True
+        result["warning"] = "Suggestive marks are protectable but may face challenges from similar suggestive marks in the same industry."
+        result["reasoning"] = f"'{brand_name}' suggests qualities of the product but requires consumer imagination to make the connection. This places it in the SUGGESTIVE category with moderate trademark protection."
+        
+        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → SUGGESTIVE (hints at product)")
+    
+    # ========== STEP 5: ARBITRARY CHECK ==========
+    # Is it a real word in UNRELATED context?
+    is_arbitrary = False
+    
+    # Has one dictionary word that's completely unrelated to industry
+    if len(dictionary_tokens) == 1 and len(matching_industry_tokens) == 0:
+        is_arbitrary = True
+    
+    if is_arbitrary:
+        result["category"] = "ARBITRARY"
+        result["distinctiveness"] = "HIGH"
+        result["protectability"] = "STRONG"
+        result["dictionary_status"] = f"Common word '{dictionary_tokens[0]}' used in unrelated context"
+        result["semantic_link"] = f"No semantic connection to {industry}"
+        result["imagination_required"] = False
+        result["warning"] = None
+        result["reasoning"] = f"'{brand_name}' is a common word used in a completely unrelated context ({industry}). Like 'Apple' for computers, arbitrary marks receive strong trademark protection."
+        
+        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → ARBITRARY (unrelated context)")
+    
+    # ========== STEP 6: FANCIFUL/COINED CHECK ==========
+    # Is the word completely made up?
+    if len(dictionary_tokens) == 0 and len(invented_tokens) > 0:
+        result["category"] = "FANCIFUL"
+        result["distinctiveness"] = "HIGHEST"
+        result["protectability"] = "STRONGEST"
+        result["dictionary_status"] = f"Invented term with no dictionary origin: {invented_tokens}"
+        result["semantic_link"] = "No pre-existing meaning"
+        result["imagination_required"] = False
+        result["warning"] = None
+        result["reasoning"] = f"'{brand_name}' is a completely invented word with no prior dictionary meaning. Like 'Xerox' or 'Kodak', fanciful marks receive the strongest trademark protection."
+        
+        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → FANCIFUL/COINED (invented word)")
+    
+    # ========== DEFAULT: CONSERVATIVE RULE ==========
+    # If we can't clearly classify, default to DESCRIPTIVE (safer for user)
+    result["category"] = "DESCRIPTIVE"
+    result["distinctiveness"] = "LOW"
+    result["protectability"] = "WEAK"
+    result["dictionary_status"] = f"Tokens: {tokens}"
+    result["semantic_link"] = f"Unclear relationship to {industry}"
+    result["imagination_required"] = False
+    result["warning"] = "⚠️ Classification unclear - defaulting to DESCRIPTIVE (conservative approach). Consult a trademark attorney."
+    result["reasoning"] = f"'{brand_name}' could not be clearly classified. Following the Conservative Rule, we default to DESCRIPTIVE to protect against legal risk."
+    
+    return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → DESCRIPTIVE (conservative default)")
+
+
+def classify_brand_with_linguistic_override(
+    brand_name: str, 
+    industry: str, 
+    linguistic_analysis: dict = None
+) -> dict:
+    """
+    ENHANCED MASTER CLASSIFICATION FUNCTION
+    
+    Runs standard classification FIRST, then OVERRIDES based on linguistic analysis.
+    
+    Override Rules:
+    - If linguistic says "has_meaning=True" + "name_type=Mythological" → Cannot be FANCIFUL
+    - If linguistic says "has_meaning=True" + "name_type=Foreign-Language" → Check alignment
+    - If meaning aligns with business → SUGGESTIVE (hints at product via foreign meaning)
+    - If meaning unrelated to business → ARBITRARY (real word in unrelated context)
+    - If no meaning found → Trust original classification
+    
+    Args:
+        brand_name: The brand name to classify
+        industry: The industry/category
+        linguistic_analysis: Results from analyze_brand_linguistics()
+        
+    Returns:
+        dict with classification results (potentially overridden)
+    """
+    # Step 1: Run standard English-based classification
+    base_result = classify_brand_with_industry(brand_name, industry)
+    
+    # Step 2: Check if we have linguistic analysis with meaning
+    if not linguistic_analysis:
+        logging.info(f"🏷️ CLASSIFICATION (NO LINGUISTIC DATA): '{brand_name}' → {base_result['category']}")
+        return base_result
+    
+    has_meaning = linguistic_analysis.get("has_linguistic_meaning", False)
+    confidence = linguistic_analysis.get("confidence_assessment", {}).get("overall_confidence", "Low")
+    meaning_certainty = linguistic_analysis.get("confidence_assessment", {}).get("meaning_certainty", "None")
+    
+    # Only override if we have HIGH/MEDIUM confidence
+    if not has_meaning or confidence == "Low" or meaning_certainty in ["None", "Speculative"]:
+        logging.info(f"🏷️ CLASSIFICATION (LOW CONFIDENCE): '{brand_name}' → {base_result['category']} (linguistic: {has_meaning}, confidence: {confidence})")
+        # Still attach linguistic data for reference
+        base_result["linguistic_override"] = False
+        base_result["linguistic_data"] = {
+            "has_meaning": has_meaning,
+            "confidence": confidence
+        }
+        return base_result
+    
+    # Step 3: Extract linguistic classification
+    name_type = linguistic_analysis.get("classification", {}).get("name_type", "Unknown")
+    alignment_score = linguistic_analysis.get("business_alignment", {}).get("alignment_score", 5)
+    languages = linguistic_analysis.get("linguistic_analysis", {}).get("languages_detected", [])
+    combined_meaning = linguistic_analysis.get("linguistic_analysis", {}).get("decomposition", {}).get("combined_meaning", "")
+    cultural_ref = linguistic_analysis.get("cultural_significance", {}).get("has_cultural_reference", False)
+    
+    # Step 4: Determine override
+    original_category = base_result["category"]
+    new_category = original_category  # Default: no change
+    override_reason = None
+    
+    # RULE 1: Mythological/Heritage names → SUGGESTIVE (always)
+    # These suggest qualities through cultural/mythological association
+    if name_type in ["Mythological", "Heritage"]:
+        if original_category == "FANCIFUL":
+            new_category = "SUGGESTIVE"
+            override_reason = f"Name has {name_type} origin ({', '.join(languages)}): '{combined_meaning}'. Cannot be FANCIFUL."
+    
+    # RULE 2: Foreign-Language names → Check business alignment
+    elif name_type == "Foreign-Language":
+        if alignment_score >= 7:
+            # High alignment = meaning describes/relates to business → SUGGESTIVE
+            if original_category == "FANCIFUL":
+                new_category = "SUGGESTIVE"
+                override_reason = f"Foreign word meaning '{combined_meaning}' aligns with business (score: {alignment_score}/10)"
+        else:
+            # Low alignment = meaning unrelated to business → ARBITRARY
+            if original_category == "FANCIFUL":
+                new_category = "ARBITRARY"
+                override_reason = f"Foreign word meaning '{combined_meaning}' is unrelated to business (score: {alignment_score}/10)"
+    
+    # RULE 3: Compound/Portmanteau with meaning → SUGGESTIVE
+    elif name_type in ["Compound", "Portmanteau"]:
+        if original_category == "FANCIFUL":
+            new_category = "SUGGESTIVE"
+            override_reason = f"Compound name with meaningful parts: '{combined_meaning}'"
+    
+    # RULE 4: Evocative names → SUGGESTIVE
+    elif name_type == "Evocative":
+        if original_category in ["FANCIFUL", "ARBITRARY"]:
+            new_category = "SUGGESTIVE"
+            override_reason = f"Name evokes qualities: '{combined_meaning}'"
+    
+    # RULE 5: True-Coined → Keep FANCIFUL
+    elif name_type == "True-Coined":
+        # Linguistic analysis confirms it's truly invented
+        pass  # Keep original
+    
+    # RULE 6: CATCH-ALL - ANY name with verified meaning cannot be FANCIFUL
+    # This handles cases where name_type is "Descriptive", "Phonetic-Adaptation", "Unknown", etc.
+    # If has_meaning=True and we reached this point, the name has meaning in some language
+    if original_category == "FANCIFUL" and new_category == "FANCIFUL" and has_meaning and combined_meaning:
+        # If we still have FANCIFUL after all rules, but meaning exists - override based on alignment
+        if alignment_score >= 6:
+            new_category = "SUGGESTIVE"
+            override_reason = f"Name has clear linguistic meaning ({', '.join(languages) if languages else 'detected languages'}): '{combined_meaning}'. High business alignment ({alignment_score}/10) suggests product/service."
+        else:
+            new_category = "ARBITRARY"
+            override_reason = f"Name has linguistic meaning ({', '.join(languages) if languages else 'detected languages'}): '{combined_meaning}'. Used in unrelated business context."
+        logging.info(f"🏷️ CATCH-ALL OVERRIDE: '{brand_name}' has meaning but no specific rule matched → {new_category}")
+    
+    # Step 5: Apply override if needed
+    if new_category != original_category:
+        logging.info(f"🏷️ CLASSIFICATION OVERRIDE: '{brand_name}' → {original_category} → {new_category}")
+        logging.info(f"   Reason: {override_reason}")
+        
+        # Update result
+        base_result["category"] = new_category
+        base_result["linguistic_override"] = True
+        base_result["original_category"] = original_category
+        base_result["override_reason"] = override_reason
+        
+        # Update distinctiveness and protectability based on new category
+        category_attributes = {
+            "GENERIC": ("NONE", "UNPROTECTABLE"),
+            "DESCRIPTIVE": ("LOW", "WEAK"),
+            "SUGGESTIVE": ("MODERATE", "MODERATE"),
+            "ARBITRARY": ("HIGH", "STRONG"),
+            "FANCIFUL": ("HIGHEST", "STRONGEST")
+        }
+        
+        if new_category in category_attributes:
+            base_result["distinctiveness"], base_result["protectability"] = category_attributes[new_category]
+        
+        # Update reasoning
+        base_result["reasoning"] = f"'{brand_name}' was linguistically analyzed and found to have meaning in {', '.join(languages)}: '{combined_meaning}'. {override_reason}. Classification changed from {original_category} to {new_category}."
+        
+        # Add warning for SUGGESTIVE
+        if new_category == "SUGGESTIVE":
+            base_result["warning"] = "Suggestive marks (names that hint at the product through foreign/cultural meaning) are protectable but may face challenges from similar marks."
+    else:
+        base_result["linguistic_override"] = False
+        base_result["linguistic_data"] = {
+            "has_meaning": has_meaning,
+            "name_type": name_type,
+            "languages": languages,
+            "alignment_score": alignment_score
+        }
+        logging.info(f"🏷️ CLASSIFICATION (NO OVERRIDE NEEDED): '{brand_name}' → {original_category}")
+    
+    # Always attach linguistic insights for downstream use
+    base_result["linguistic_insights"] = {
+        "has_meaning": has_meaning,
+        "name_type": name_type,
+        "languages": languages,
+        "combined_meaning": combined_meaning,
+        "alignment_score": alignment_score,
+        "cultural_reference": cultural_ref,
+        "confidence": confidence
+    }
+    
+    return base_result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PRONOUNCEABILITY CHECK - Early Gate for Gibberish Detection
+# ═══════════════════════════════════════════════════════════════════════════════
+# This check runs BEFORE expensive LLM calls to catch unpronounceable names
+# like "rcnvkjznvvjajf" that should not receive high scores.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def check_pronounceability(brand_name: str) -> dict:
+    """
+    Check if a brand name is pronounceable and readable.
+    
+    This catches gibberish/random character strings that:
+    - Have too few vowels
+    - Have long consonant clusters
+    - Cannot be broken into syllables
+    - Are essentially unpronounceable
+    
+    Returns:
+        dict with:
+        - is_pronounceable: bool
+        - score: 0-100 pronounceability score
+        - issues: list of specific problems
+        - verdict: PASS, CAUTION, or FAIL
+        - score_cap: maximum score this name should receive (if failing)
+    """
+    if not brand_name or len(brand_name) < 2:
+        return {
+            "is_pronounceable": False,
+            "score": 0,
+            "issues": ["Brand name too short"],
+            "verdict": "FAIL",
+            "score_cap": 10
+        }
+    
+    name_lower = brand_name.lower().strip()
+    
+    # Remove spaces, hyphens for analysis of core pronounceability
+    clean_name = ''.join(c for c in name_lower if c.isalpha())
+    
+    if len(clean_name) < 2:
+        return {
+            "is_pronounceable": False,
+            "score": 0,
+            "issues": ["No alphabetic characters"],
+            "verdict": "FAIL",
+            "score_cap": 10
+        }
+    
+    issues = []
+    score = 100  # Start with perfect score and deduct
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 1: VOWEL RATIO (Should be 25-55% for pronounceability)
+    # ═══════════════════════════════════════════════════════════════════════════
+    vowels = set('aeiou')
+    vowel_count = sum(1 for c in clean_name if c in vowels)
+    vowel_ratio = vowel_count / len(clean_name)
+    
+    if vowel_ratio < 0.10:  # Less than 10% vowels = gibberish
+        penalty = 60
+        score -= penalty
+        issues.append(f"CRITICAL: Only {vowel_ratio:.0%} vowels ({vowel_count}/{len(clean_name)}) - virtually unpronounceable")
+    elif vowel_ratio < 0.20:  # Less than 20% vowels = very hard
+        penalty = 40
+        score -= penalty
+        issues.append(f"SEVERE: Only {vowel_ratio:.0%} vowels ({vowel_count}/{len(clean_name)}) - extremely difficult to pronounce")
+    elif vowel_ratio < 0.25:  # Less than 25% vowels = hard
+        penalty = 25
+        score -= penalty
+        issues.append(f"LOW: Only {vowel_ratio:.0%} vowels - hard to pronounce")
+    elif vowel_ratio > 0.70:  # More than 70% vowels = odd sounding
+        penalty = 15
+        score -= penalty
+        issues.append(f"HIGH: {vowel_ratio:.0%} vowels - may sound odd")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 2: CONSONANT CLUSTERS (More than 3 consecutive = hard to say)
+    # ═══════════════════════════════════════════════════════════════════════════
+    consonants = 'bcdfghjklmnpqrstvwxyz'
+    
+    # Find all consonant clusters
+    consonant_pattern = f'[{consonants}]+'
+    clusters = re.findall(consonant_pattern, clean_name)
+    
+    max_cluster_length = max(len(c) for c in clusters) if clusters else 0
+    long_clusters = [c for c in clusters if len(c) >= 4]
+    very_long_clusters = [c for c in clusters if len(c) >= 6]
+    
+    if very_long_clusters:  # 6+ consonants in a row = gibberish
+        penalty = 50
+        score -= penalty
+        issues.append(f"CRITICAL: Consonant cluster '{very_long_clusters[0]}' ({len(very_long_clusters[0])} consonants) - unpronounceable")
+    elif long_clusters:  # 4-5 consonants in a row = difficult
+        penalty = 25
+        score -= penalty
+        issues.append(f"DIFFICULT: Consonant cluster '{long_clusters[0]}' ({len(long_clusters[0])} consonants)")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 3: SYLLABLE STRUCTURE (Need vowels to form syllables)
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Estimate syllables by counting vowel groups
+    vowel_groups = re.findall(f'[{vowels}]+', clean_name)
+    estimated_syllables = len(vowel_groups)
+    
+    if estimated_syllables == 0:  # No syllables possible
+        penalty = 50
+        score -= penalty
+        issues.append("CRITICAL: No syllables can be formed - no vowel groups")
+    elif estimated_syllables == 1 and len(clean_name) > 8:  # Long name with only 1 syllable
+        penalty = 20
+        score -= penalty
+        issues.append(f"UNBALANCED: {len(clean_name)} characters but only ~1 syllable")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 4: REPEATED CHARACTERS (Signs of keyboard mashing)
+    # ═══════════════════════════════════════════════════════════════════════════
+    repeated_pattern = r'(.)\1{2,}'  # Same character 3+ times
+    repeated = re.findall(repeated_pattern, clean_name)
+    if repeated:
+        penalty = 20
+        score -= penalty
+        issues.append(f"REPETITION: Character '{repeated[0]}' repeated excessively")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 5: COMMON LETTER PATTERNS (Real words have common bigrams)
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Common English bigrams that appear in real words
+    common_bigrams = {'th', 'he', 'in', 'er', 'an', 'on', 'at', 'en', 'es', 'ed', 
+                      'or', 'te', 'of', 'to', 're', 'it', 'is', 'al', 'ar', 'st',
+                      'le', 'se', 'ea', 'ou', 'io', 'co', 'ca', 'ma', 'me', 'mo',
+                      'ta', 'ti', 'tr', 'pr', 'sp', 'ch', 'sh', 'wh', 'qu', 'br',
+                      'bl', 'cl', 'cr', 'dr', 'fl', 'fr', 'gl', 'gr', 'pl', 'sc',
+                      'sk', 'sl', 'sm', 'sn', 'sw', 'tw', 'wr', 'ai', 'au', 'aw',
+                      'ay', 'ee', 'ei', 'ey', 'ie', 'oa', 'oo', 'ow', 'oy', 'ue'}
+    
+    # Count how many bigrams in the name are common
+    name_bigrams = [clean_name[i:i+2] for i in range(len(clean_name)-1)]
+    common_count = sum(1 for bg in name_bigrams if bg in common_bigrams)
+    
+    if len(name_bigrams) > 0:
+        common_ratio = common_count / len(name_bigrams)
+        if common_ratio < 0.1 and len(clean_name) > 5:  # Less than 10% common bigrams
+            penalty = 30
+            score -= penalty
+            issues.append(f"UNUSUAL: Only {common_ratio:.0%} common letter patterns - looks like random characters")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHECK 6: LENGTH vs COMPLEXITY
+    # ═══════════════════════════════════════════════════════════════════════════
+    if len(clean_name) > 12 and estimated_syllables <= 2:
+        penalty = 15
+        score -= penalty
+        issues.append(f"IMBALANCED: {len(clean_name)} characters with only ~{estimated_syllables} syllables")
+    
+    # Ensure score stays within bounds
+    score = max(0, min(100, score))
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # DETERMINE VERDICT AND SCORE CAP
+    # ═══════════════════════════════════════════════════════════════════════════
+    if score >= 70:
+        verdict = "PASS"
+        score_cap = None  # No cap for pronounceable names
+        is_pronounceable = True
+    elif score >= 40:
+        verdict = "CAUTION"
+        score_cap = 50  # Cap at 50 for difficult names
+        is_pronounceable = True
+    elif score >= 20:
+        verdict = "POOR"
+        score_cap = 35  # Cap at 35 for poor names
+        is_pronounceable = False
+    else:
+        verdict = "FAIL"
+        score_cap = 25  # Cap at 25 for gibberish
+        is_pronounceable = False
+    
+    return {
+        "is_pronounceable": is_pronounceable,
+        "score": score,
+        "vowel_ratio": vowel_ratio,
+        "max_consonant_cluster": max_cluster_length,
+        "estimated_syllables": estimated_syllables,
+        "issues": issues,
+        "verdict": verdict,
+        "score_cap": score_cap,
+        "analysis": {
+            "vowel_count": vowel_count,
+            "consonant_count": len(clean_name) - vowel_count,
+            "total_length": len(clean_name),
+            "vowel_percentage": f"{vowel_ratio:.0%}",
+            "syllable_estimate": estimated_syllables,
+            "longest_consonant_cluster": max_cluster_length
+        }
+    }
+
+
+# ============================================================================
+# 🆕 FEATURE 3: DUPONT 13-FACTOR LIKELIHOOD OF CONFUSION TEST
+# ============================================================================
+# Legal standard from In re E.I. DuPont de Nemours & Co., 476 F.2d 1357 (CCPA 1973)
+
+def calculate_dupont_score(
+    brand_name: str,
+    conflict_name: str,
+    same_category: bool,
+    conflict_data: dict = None
+) -> dict:
+    """
+    Calculate DuPont 13-Factor likelihood of confusion score.
+    
+    Returns weighted score (0-10) with legal verdict:
+    - 9.0-10.0 = REJECT (>90% confusion likelihood)
+    - 7.0-8.9 = REJECT (High confusion - likely USPTO refusal)
+    - 5.0-6.9 = NO-GO (Moderate confusion - risky)
+    - 3.0-4.9 = CONDITIONAL GO (Low-moderate confusion)
+    - 0.0-2.9 = GO (Minimal confusion)
+    """
+    from difflib import SequenceMatcher
+    import jellyfish
+    
+    # Helper functions
+    def visual_similarity(a: str, b: str) -> float:
+        """Visual/spelling similarity (0-10)"""
+        ratio = SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        return ratio * 10
+    
+    def phonetic_similarity(a: str, b: str) -> float:
+        """Phonetic similarity using Soundex/Metaphone (0-10)"""
+        try:
+            # Soundex comparison
+            soundex_a = jellyfish.soundex(a)
+            soundex_b = jellyfish.soundex(b)
+            soundex_match = 10 if soundex_a == soundex_b else 5 if soundex_a[:2] == soundex_b[:2] else 2
+            
+            # Metaphone comparison
+            meta_a = jellyfish.metaphone(a)
+            meta_b = jellyfish.metaphone(b)
+            meta_ratio = SequenceMatcher(None, meta_a, meta_b).ratio()
+            
+            return (soundex_match + (meta_ratio * 10)) / 2
+        except:
+            return visual_similarity(a, b)
+    
+    # Factor calculations
+    factors = {}
+    
+    # Factor 1: Similarity of Marks (HIGH WEIGHT)
+    visual = visual_similarity(brand_name, conflict_name)
+    phonetic = phonetic_similarity(brand_name, conflict_name)
+    factors["factor_1_mark_similarity"] = {
+        "score": round((visual + phonetic) / 2, 1),
+        "weight": "HIGH",
+        "analysis": f"Visual similarity: {visual:.1f}/10, Phonetic similarity: {phonetic:.1f}/10"
+    }
+    
+    # Factor 2: Similarity of Goods/Services (HIGH WEIGHT)
+    # Get class info for better analysis
+    conflict_class = conflict_data.get("conflict_class") if conflict_data else None
+    user_class = conflict_data.get("user_class") if conflict_data else None
+    
+    if same_category:
+        goods_score = 9  # Same category = high similarity
+        class_analysis = f"Same NICE class ({user_class}). Direct competition likely."
+    elif conflict_data and conflict_data.get("related_category"):
+        goods_score = 6  # Related category
+        class_analysis = f"Related categories (User: Class {user_class}, Conflict: Class {conflict_class}). Some overlap possible."
+    else:
+        goods_score = 2  # Different category
+        class_analysis = f"Different NICE classes (User: Class {user_class}, Conflict: Class {conflict_class}). Different market segments - LOW confusion risk."
+    
+    factors["factor_2_goods_similarity"] = {
+        "score": goods_score,
+        "weight": "HIGH",
+        "analysis": class_analysis
+    }
+    
+    # Factor 3: Trade Channel Overlap (MEDIUM WEIGHT)
+    channel_score = 7 if same_category else 3
+    factors["factor_3_trade_channels"] = {
+        "score": channel_score,
+        "weight": "MEDIUM",
+        "analysis": f"Trade channels {'likely overlap (same industry)' if same_category else 'unlikely to overlap (different industries)'}"
+    }
+    
+    # Factor 4: Purchaser Sophistication (MEDIUM WEIGHT)
+    # Default to moderate sophistication; can be adjusted based on category
+    sophistication_score = 5  # Moderate sophistication
+    factors["factor_4_purchaser_sophistication"] = {
+        "score": sophistication_score,
+        "weight": "MEDIUM",
+        "analysis": "Moderate purchaser sophistication assumed for consumer goods"
+    }
+    
+    # Factor 5: Prior Mark Fame (MEDIUM WEIGHT)
+    fame_score = conflict_data.get("fame_score", 5) if conflict_data else 5
+    factors["factor_5_prior_mark_fame"] = {
+        "score": fame_score,
+        "weight": "MEDIUM",
+        "analysis": f"Prior mark fame level: {'High' if fame_score >= 7 else 'Moderate' if fame_score >= 4 else 'Low'}"
+    }
+    
+    # Factor 6: Number of Similar Marks (LOW WEIGHT)
+    similar_count = conflict_data.get("similar_marks_count", 3) if conflict_data else 3
+    crowded_score = 3 if similar_count > 10 else 6 if similar_count > 5 else 8
+    factors["factor_6_number_similar_marks"] = {
+        "score": crowded_score,
+        "weight": "LOW",
+        "analysis": f"{'Crowded' if similar_count > 10 else 'Moderately crowded' if similar_count > 5 else 'Relatively unique'} namespace with {similar_count} similar marks"
+    }
+    
+    # Factor 7: Actual Confusion Evidence (HIGH WEIGHT)
+    # Default to no evidence unless provided
+    confusion_evidence = conflict_data.get("actual_confusion", False) if conflict_data else False
+    factors["factor_7_actual_confusion"] = {
+        "score": 8 if confusion_evidence else 2,
+        "weight": "HIGH",
+        "analysis": f"Actual confusion evidence: {'Found' if confusion_evidence else 'Not found'}"
+    }
+    
+    # Factor 8: Length of Concurrent Use (LOW WEIGHT)
+    factors["factor_8_concurrent_use_length"] = {
+        "score": 5,
+        "weight": "LOW",
+        "analysis": "No concurrent use history (new application)"
+    }
+    
+    # Factor 9: Variety of Goods (LOW WEIGHT)
+    factors["factor_9_variety_of_goods"] = {
+        "score": 5,
+        "weight": "LOW",
+        "analysis": "Standard product line assumed"
+    }
+    
+    # Factor 10: Market Interface (MEDIUM WEIGHT)
+    interface_score = 8 if same_category else 3
+    factors["factor_10_market_interface"] = {
+        "score": interface_score,
+        "weight": "MEDIUM",
+        "analysis": f"{'Direct market interface' if same_category else 'Minimal market interface'}"
+    }
+    
+    # Factor 11: Junior User's Intent (MEDIUM WEIGHT)
+    factors["factor_11_intent"] = {
+        "score": 3,  # Assume good faith unless evidence suggests otherwise
+        "weight": "MEDIUM",
+        "analysis": "No evidence of intentional copying"
+    }
+    
+    # Factor 12: Bad Faith Registration (MEDIUM WEIGHT)
+    factors["factor_12_bad_faith"] = {
+        "score": 2,
+        "weight": "MEDIUM",
+        "analysis": "No indicators of bad faith registration"
+    }
+    
+    # Factor 13: Extent of Exclusive Rights (LOW WEIGHT)
+    factors["factor_13_extent_exclusive_rights"] = {
+        "score": 5,
+        "weight": "LOW",
+        "analysis": "Standard trademark scope"
+    }
+    
+    # Calculate weighted score
+    weights = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+    total_weighted = 0
+    total_weights = 0
+    
+    for factor_key, factor_data in factors.items():
+        weight_value = weights[factor_data["weight"]]
+        total_weighted += factor_data["score"] * weight_value
+        total_weights += weight_value
+    
+    weighted_score = round(total_weighted / total_weights, 2)
+    
+    # Determine verdict
+    if weighted_score >= 9.0:
+        verdict = "REJECT"
+        conclusion = "CRITICAL - >90% likelihood of confusion. Litigation certain."
+    elif weighted_score >= 7.0:
+        verdict = "REJECT"
+        conclusion = "HIGH - Likely USPTO refusal or opposition. Strong conflict."
+    elif weighted_score >= 5.0:
+        verdict = "NO-GO"
+        conclusion = "MODERATE - Risky, expensive to defend. Consider alternatives."
+    elif weighted_score >= 3.0:
+        verdict = "CONDITIONAL GO"
+        conclusion = "LOW-MODERATE - Monitor closely. Proceed with caution."
+    else:
+        verdict = "GO"
+        conclusion = "MINIMAL - Safe to proceed. Low confusion risk."
+    
+    return {
+        "brand_name": brand_name,
+        "conflict_name": conflict_name,
+        "dupont_factors": factors,
+        "weighted_likelihood_score": weighted_score,
+        "legal_conclusion": conclusion,
+        "verdict_impact": verdict
+    }
+
+
+def apply_dupont_analysis_to_conflicts(brand_name: str, category: str, conflicts: list) -> dict:
+    """
+    Apply DuPont 13-factor analysis to all conflicts found.
+    Returns the highest-risk conflict with full analysis.
+    """
+    if not conflicts:
+        return {
+            "has_analysis": False,
+            "highest_risk_conflict": None,
+            "overall_dupont_verdict": "GO",
+            "analysis_summary": "No conflicts found requiring DuPont analysis"
+        }
+    
+    highest_score = 0
+    highest_risk_analysis = None
+    all_analyses = []
+    
+    for conflict in conflicts:
+        conflict_name = conflict.get("name", conflict.get("matched_brand", "Unknown"))
+        same_category = conflict.get("same_class_conflict", False) or conflict.get("category") == category
+        
+        # Calculate DuPont score
+        analysis = calculate_dupont_score(
+            brand_name=brand_name,
+            conflict_name=conflict_name,
+            same_category=same_category,
+            conflict_data=conflict
+        )
+        all_analyses.append(analysis)
+        
+        if analysis["weighted_likelihood_score"] > highest_score:
+            highest_score = analysis["weighted_likelihood_score"]
+            highest_risk_analysis = analysis
+    
+    # Determine overall verdict based on highest risk
+    if highest_score >= 7.0:
+        overall_verdict = "REJECT"
+    elif highest_score >= 5.0:
+        overall_verdict = "NO-GO"
+    elif highest_score >= 3.0:
+        overall_verdict = "CONDITIONAL GO"
+    else:
+        overall_verdict = "GO"
+    
+    return {
+        "has_analysis": True,
+        "highest_risk_conflict": highest_risk_analysis,
+        "overall_dupont_verdict": overall_verdict,
+        "all_conflict_analyses": all_analyses,
+        "analysis_summary": f"Analyzed {len(conflicts)} conflict(s). Highest risk score: {highest_score}/10 ({overall_verdict})"
+    }
@@ -16,21 +16,14 @@ Created: July 2025
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-import os
 import json
 import asyncio
 import logging
 from typing import List, Dict, Any
 from datetime import datetime, timezone
 
-# LLM Integration
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
-except ImportError:
-    LlmChat = None
-    UserMessage = None
-    EMERGENT_KEY = None
+# LLM Integration (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -0,0 +1,178 @@
+"""
+CPU Lane
+========
+Optional process pool for the deterministic, CPU-bound scoring stages
+(deep-trace, similarity scan, pronounceability, classification, DuPont).
+
+In a thread (asyncio.to_thread) these stages still hold the GIL, so several
+names scored at once run one after another and a long scan stalls the event
+loop's I/O for every other request. With CPU_LANE_WORKERS > 0 they run in
+worker processes instead:
+
+- Workers are started and warmed at app startup. Each one imports only the
+  stage modules (similarity.py, brand_scoring.py - never server.py, so no
+  Mongo client, FastAPI app or service singletons), attaches the same
+  memory-mapped trademark corpus as the server (set_brand_corpus), then runs
+  every stage on a sample name so the first real request pays no import or
+  cache-fill cost
+- run_cpu() / map_cpu() submit to the pool and fall back to a thread when the
+  lane is disabled or the pool broke (a crashed worker disables the lane for
+  this process; requests keep working)
+- Stage functions and their arguments must be picklable, i.e. module-level
+  functions called with plain data, and must live in modules that are safe to
+  import in a worker (not server.py)
+
+Off by default: each worker holds its own copy of the indexes, which is only
+worth it for batch and bulk workloads.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+CPU_LANE_WORKERS = int(os.environ.get("CPU_LANE_WORKERS", 0))
+# "spawn" workers import the stage modules fresh; "fork" would copy the
+# server's Mongo client threads and locks into every worker
+CPU_LANE_START_METHOD = os.environ.get("CPU_LANE_START_METHOD", "spawn")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+stats = {"pool_calls": 0, "thread_calls": 0, "pool_failures": 0}
+
+
+# ============ WORKER SIDE ============
+
+def _load_worker_state():
+    """
+    Module state the server sets up at import time that stages depend on.
+    similarity.brand_corpus is set from server.py, which workers never import -
+    without this, live corpus marks would be missed on the lane path only.
+    """
+    from brand_corpus import open_brand_corpus
+    from similarity import set_brand_corpus
+    set_brand_corpus(open_brand_corpus())
+
+
+def _warm_worker(warmups: Sequence[Tuple[Callable, tuple]]):
+    """Pool initializer: load shared state, then run each stage once so imports and caches are loaded."""
+    # Not guarded: a worker that can't see the corpus would score differently
+    # from the thread path, so a failure here breaks the pool (-> threads)
+    _load_worker_state()
+    for func, args in warmups:
+        try:
+            func(*args)
+        except Exception as e:
+            logger.warning(f"CPU lane warm-up of {getattr(func, '__name__', func)} failed: {e}")
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+# ============ LANE ============
+
+def cpu_lane_enabled() -> bool:
+    return _executor is not None
+
+
+async def start_cpu_lane(warmups: Sequence[Tuple[Callable, tuple]] = ()):
+    """
+    Start CPU_LANE_WORKERS warmed workers (no-op when CPU_LANE_WORKERS is 0).
+    warmups is a list of (stage function, sample args) run once per worker.
+    """
+    global _executor
+    if CPU_LANE_WORKERS <= 0 or _executor is not None:
+        return
+    try:
+        _executor = ProcessPoolExecutor(
+            max_workers=CPU_LANE_WORKERS,
+            mp_context=multiprocessing.get_context(CPU_LANE_START_METHOD),
+            initializer=_warm_worker,
+            initargs=(list(warmups),)
+        )
+        # One concurrent ping per worker makes the pool start all of them now
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(_executor, _worker_ready) for _ in range(CPU_LANE_WORKERS)))
+        logger.info(f"⚙️ CPU lane ready: {CPU_LANE_WORKERS} {CPU_LANE_START_METHOD} workers")
+    except Exception as e:
+        logger.warning(f"⚠️ CPU lane startup failed - scoring stays in threads: {e}")
+        _shutdown_executor()
+
+
+def stop_cpu_lane():
+    _shutdown_executor()
+
+
+def _shutdown_executor():
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_cpu(func: Callable, *args, **kwargs) -> Any:
+    """func(*args, **kwargs) in a lane worker, or in a thread when the lane is off."""
+    executor = _executor
+    if executor is not None:
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, functools.partial(func, *args, **kwargs)
+            )
+            stats["pool_calls"] += 1
+            return result
+        except BrokenProcessPool as e:
+            stats["pool_failures"] += 1
+            logger.warning(f"⚠️ CPU lane pool broke during {getattr(func, '__name__', func)} - falling back to threads: {e}")
+            if _executor is executor:
+                _shutdown_executor()
+    stats["thread_calls"] += 1
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def _run_batch(func: Callable, calls: Sequence[tuple], return_exceptions: bool) -> List[Any]:
+    results = []
+    for args in calls:
+        try:
+            results.append(func(*args))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+async def map_cpu(func: Callable, calls: Iterable[tuple], return_exceptions: bool = False) -> List[Any]:
+    """
+    [func(*args) for args in calls], split into one chunk per lane worker (a
+    single thread hop when the lane is off). With return_exceptions=True a
+    failing call yields its exception instead of failing the batch, like
+    asyncio.gather.
+    """
+    calls = [tuple(args) for args in calls]
+    if not calls:
+        return []
+    chunk_count = CPU_LANE_WORKERS if _executor is not None else 1
+    chunk_size = -(-len(calls) // chunk_count)
+    chunks = await asyncio.gather(*(
+        run_cpu(_run_batch, func, calls[start:start + chunk_size], return_exceptions)
+        for start in range(0, len(calls), chunk_size)
+    ))
+    return [result for chunk in chunks for result in chunk]
+
+
+def get_stats() -> Dict[str, Any]:
+    return {
+        "enabled": cpu_lane_enabled(),
+        "workers": CPU_LANE_WORKERS,
+        "start_method": CPU_LANE_START_METHOD,
+        **stats,
+    }
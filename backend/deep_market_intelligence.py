@@ -29,14 +29,11 @@ from datetime import datetime, timezone
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.environ.get("GOOGLE_CSE_ID") or os.environ.get("GOOGLE_SEARCH_ENGINE_ID")
 
-# LLM Integration
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
-except ImportError:
-    LlmChat = None
-    UserMessage = None
-    EMERGENT_KEY = None
+# LLM Integration (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
+
+# Shared web search (cached, provider fallback chain)
+from search_service import search_service
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,44 +45,22 @@ logger = logging.getLogger(__name__)
 
 async def google_search(query: str, num_results: int = 10) -> List[Dict[str, str]]:
     """
-    Perform Google Custom Search and return results.
+    Perform Google Custom Search and return results (shared search service cache).
     """
     if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
         logger.warning("Google Custom Search not configured")
         return []
     
     try:
-        import aiohttp
-        
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            "key": GOOGLE_API_KEY,
-            "cx": GOOGLE_CSE_ID,
-            "q": query,
-            "num": min(num_results, 10)  # Max 10 per request
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=15) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    items = data.get("items", [])
-                    
-                    results = []
-                    for item in items:
-                        results.append({
-                            "title": item.get("title", ""),
-                            "link": item.get("link", ""),
-                            "snippet": item.get("snippet", ""),
-                            "display_link": item.get("displayLink", "")
-                        })
-                    
-                    logger.info(f"🔍 Google Search '{query[:50]}...' returned {len(results)} results")
-                    return results
-                else:
-                    logger.error(f"Google Search failed: {response.status}")
-                    return []
-                    
+        response = await search_service.search(query, num_results=min(num_results, 10), providers=["google"])
+        if response["errors"].get("google"):
+            logger.error(f"Google Search failed: {response['errors']['google']}")
+        results = [
+            {"title": r["title"], "link": r["url"], "snippet": r["snippet"], "display_link": r["display_link"]}
+            for r in response["results"]
+        ]
+        logger.info(f"🔍 Google Search '{query[:50]}...' returned {len(results)} results")
+        return results
     except Exception as e:
         logger.error(f"Google Search error: {e}")
         return []
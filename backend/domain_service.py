@@ -0,0 +1,374 @@
+"""
+Domain Availability Service
+===========================
+Single entry point for every domain availability lookup.
+server.py (primary .com check) and availability.py (multi-TLD checks) both go
+through here, so brand.com is looked up once per evaluation instead of twice.
+
+Two-tier cache:
+1. In-process LRU with per-entry expiry (cachetools.TLRUCache)
+2. MongoDB TTL collection (db.domain_availability_cache) - shared across
+   uvicorn workers and survives restarts
+
+TTLs depend on the result: TAKEN results are stable for days, AVAILABLE ones
+can flip when someone registers the name, and errors/timeouts are only
+negatively cached for a few minutes. TLD_TTL_OVERRIDES adjusts this per TLD.
+
+Concurrent lookups of the same domain share one in-flight task, so each
+domain hits WHOIS at most once per cache window.
+
+check_stream() runs many names x TLDs with bounded concurrency and yields
+results as they finish (used by the /api/domains/bulk-check endpoint).
+
+Cache misses go through a DNS-first probe: registered domains almost always
+publish NS records, so an NS (or apex SOA) answer settles TAKEN in a few ms.
+Only NXDOMAIN / no-answer / resolver failures escalate to the slow WHOIS call.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import whois
+from datetime import datetime, timezone, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from cachetools import TLRUCache
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+    DNS_AVAILABLE = True
+except ImportError:
+    DNS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+DOMAIN_CACHE_TTL_TAKEN = int(os.environ.get("DOMAIN_CACHE_TTL_TAKEN", 7 * 24 * 3600))      # 7 days
+DOMAIN_CACHE_TTL_AVAILABLE = int(os.environ.get("DOMAIN_CACHE_TTL_AVAILABLE", 6 * 3600))   # 6 hours
+DOMAIN_CACHE_TTL_ERROR = int(os.environ.get("DOMAIN_CACHE_TTL_ERROR", 300))                # 5 minutes
+DOMAIN_CACHE_MAXSIZE = int(os.environ.get("DOMAIN_CACHE_MAXSIZE", 10000))
+
+WHOIS_TIMEOUT_SECONDS = 10.0
+
+DOMAIN_BULK_CONCURRENCY = int(os.environ.get("DOMAIN_BULK_CONCURRENCY", 20))
+DOMAIN_BULK_MAX = int(os.environ.get("DOMAIN_BULK_MAX", 500))
+
+DOMAIN_DNS_FIRST = os.environ.get("DOMAIN_DNS_FIRST", "true").lower() in ("1", "true", "yes")
+DOMAIN_DNS_TIMEOUT = float(os.environ.get("DOMAIN_DNS_TIMEOUT", 3.0))
+
+# Per-TLD TTL overrides (seconds), keyed by result bucket.
+# ccTLD WHOIS servers rate-limit aggressively - back off longer after an error.
+TLD_TTL_OVERRIDES = {
+    ".in": {"ERROR": 1800},
+    ".co.in": {"ERROR": 1800},
+    ".cn": {"ERROR": 1800},
+    ".com.cn": {"ERROR": 1800},
+    ".jp": {"ERROR": 1800},
+    ".co.jp": {"ERROR": 1800},
+    ".de": {"ERROR": 1800},
+}
+
+DEFAULT_TTLS = {
+    "TAKEN": DOMAIN_CACHE_TTL_TAKEN,
+    "AVAILABLE": DOMAIN_CACHE_TTL_AVAILABLE,
+    "ERROR": DOMAIN_CACHE_TTL_ERROR,
+}
+
+CACHE_COLLECTION = "domain_availability_cache"
+
+# MongoDB reference (set from main server.py)
+db = None
+
+
+def set_db(database):
+    """Set database reference from main server"""
+    global db
+    db = database
+
+
+# ============ HELPERS ============
+
+def normalize_domain(domain: str) -> str:
+    return domain.strip().lower().rstrip(".")
+
+
+def build_candidate_domains(names: List[str], tlds: List[str]) -> List[str]:
+    """names x tlds, cleaned the same way as check_multi_domain_availability, order-preserving and deduplicated."""
+    domains = []
+    for name in names:
+        clean_name = re.sub(r"[^a-z0-9-]", "", name.lower().replace(" ", "")).strip("-")
+        if not clean_name:
+            continue
+        for tld in tlds:
+            tld = tld.strip().lower()
+            if not tld:
+                continue
+            if not tld.startswith("."):
+                tld = "." + tld
+            domains.append(f"{clean_name}{tld}")
+    return list(dict.fromkeys(domains))
+
+
+def get_tld(domain: str) -> str:
+    """Longest known suffix wins (.co.in before .in), else the last label."""
+    domain = normalize_domain(domain)
+    for tld in sorted(TLD_TTL_OVERRIDES, key=len, reverse=True):
+        if domain.endswith(tld):
+            return tld
+    return "." + domain.rsplit(".", 1)[-1]
+
+
+def result_bucket(result: Dict) -> str:
+    status = result.get("status")
+    if status in ("TAKEN", "AVAILABLE"):
+        return status
+    return "ERROR"
+
+
+def get_ttl(domain: str, result: Dict) -> int:
+    bucket = result_bucket(result)
+    override = TLD_TTL_OVERRIDES.get(get_tld(domain), {})
+    return override.get(bucket, DEFAULT_TTLS[bucket])
+
+
+async def whois_lookup(domain: str) -> Dict:
+    """Check if a domain is available using whois with timeout protection"""
+    try:
+        # Run WHOIS in executor with timeout to prevent blocking
+        loop = asyncio.get_event_loop()
+        try:
+            w = await asyncio.wait_for(
+                loop.run_in_executor(None, whois.whois, domain),
+                timeout=WHOIS_TIMEOUT_SECONDS
+            )
+            if w.domain_name or w.creation_date:
+                return {"domain": domain, "status": "TAKEN", "available": False}
+            else:
+                return {"domain": domain, "status": "AVAILABLE", "available": True}
+        except asyncio.TimeoutError:
+            logger.warning(f"WHOIS timeout for {domain}")
+            return {"domain": domain, "status": "TIMEOUT", "available": None, "error": "WHOIS timeout"}
+    except Exception as e:
+        error_str = str(e).lower()
+        if "no match" in error_str or "not found" in error_str or "no entries" in error_str:
+            return {"domain": domain, "status": "AVAILABLE", "available": True}
+        else:
+            return {"domain": domain, "status": "UNKNOWN", "available": None, "error": str(e)[:50]}
+
+
+# ============ DNS-FIRST PROBE ============
+
+class DnsFirstLookup:
+    """
+    Resolve NS (then apex SOA) before falling back to WHOIS.
+
+    resolver: any object with `async resolve(name, rdtype, lifetime=...)` -
+    defaults to dnspython's async resolver; tests can inject a local stub.
+    Returns True-ish answers as TAKEN without touching WHOIS.
+    """
+
+    def __init__(self, resolver=None, fallback: Callable[[str], Awaitable[Dict]] = whois_lookup,
+                 timeout: float = DOMAIN_DNS_TIMEOUT):
+        self._resolver = resolver
+        self._fallback = fallback
+        self._timeout = timeout
+        self.stats = {"dns_taken": 0, "whois_calls": 0, "whois_avoided": 0}
+
+    @property
+    def resolver(self):
+        if self._resolver is None and DNS_AVAILABLE:
+            self._resolver = dns.asyncresolver.Resolver()
+        return self._resolver
+
+    async def probe(self, domain: str) -> Optional[bool]:
+        """True = delegated in DNS (registered); None = ambiguous, needs WHOIS."""
+        resolver = self.resolver
+        if resolver is None:
+            return None
+        try:
+            answer = await resolver.resolve(domain, "NS", lifetime=self._timeout)
+            if len(answer):
+                return True
+        except Exception as e:
+            # NXDOMAIN, timeouts, SERVFAIL, no nameservers - WHOIS decides
+            # (a registered but undelegated domain also returns NXDOMAIN)
+            if not (DNS_AVAILABLE and isinstance(e, dns.resolver.NoAnswer)):
+                return None
+
+        # Name exists without an NS set at this label - an apex SOA still proves registration
+        try:
+            answer = await resolver.resolve(domain, "SOA", lifetime=self._timeout)
+            if str(answer.rrset.name).rstrip(".").lower() == domain:
+                return True
+        except Exception:
+            pass
+        return None
+
+    async def __call__(self, domain: str) -> Dict:
+        if await self.probe(domain):
+            self.stats["dns_taken"] += 1
+            self.stats["whois_avoided"] += 1
+            return {"domain": domain, "status": "TAKEN", "available": False, "method": "dns"}
+
+        self.stats["whois_calls"] += 1
+        result = await self._fallback(domain)
+        result.setdefault("method", "whois")
+        return result
+
+
+def default_lookup() -> Callable[[str], Awaitable[Dict]]:
+    if DOMAIN_DNS_FIRST and DNS_AVAILABLE:
+        return DnsFirstLookup()
+    return whois_lookup
+
+
+# ============ SERVICE ============
+
+class DomainAvailabilityService:
+    """Cached, deduplicated domain availability lookups."""
+
+    def __init__(self, lookup: Optional[Callable[[str], Awaitable[Dict]]] = None, maxsize: int = DOMAIN_CACHE_MAXSIZE):
+        self._lookup = lookup or default_lookup()
+        self._memory = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._indexes_ready = False
+        self.stats = {"memory_hits": 0, "mongo_hits": 0, "lookups": 0, "deduplicated": 0}
+
+    async def check(self, domain: str) -> Dict:
+        """Return availability for one domain (same dict shape as the WHOIS lookup)."""
+        domain = normalize_domain(domain)
+
+        cached = self._cached(domain)
+        if cached is not None:
+            return cached
+
+        # Dedup concurrent lookups on the same event loop
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(domain)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._resolve(domain))
+            self._inflight[domain] = task
+            task.add_done_callback(lambda t, d=domain: self._inflight.pop(d, None) if self._inflight.get(d) is t else None)
+
+        # Shield so one caller's cancellation/timeout does not cancel the lookup for the others
+        return dict(await asyncio.shield(task))
+
+    async def check_many(self, domains: List[str]) -> List[Dict]:
+        return list(await asyncio.gather(*[self.check(d) for d in domains]))
+
+    async def check_stream(self, domains: List[str], concurrency: int = DOMAIN_BULK_CONCURRENCY) -> AsyncIterator[Dict]:
+        """
+        Yield results as they complete, with at most `concurrency` lookups in flight.
+        Cached domains come back immediately; only misses wait on a slot.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(domain: str) -> Dict:
+            cached = self._cached(domain)
+            if cached is not None:
+                return cached
+            async with semaphore:
+                try:
+                    return await self.check(domain)
+                except Exception as e:
+                    logger.warning(f"Bulk domain check failed for {domain}: {e}")
+                    return {"domain": domain, "status": "UNKNOWN", "available": None, "error": str(e)[:50]}
+
+        tasks = [asyncio.ensure_future(bounded(d)) for d in dict.fromkeys(map(normalize_domain, domains))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client disconnected mid-stream - drop the queued lookups
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache counters merged with DNS-probe counters (whois_calls / whois_avoided)."""
+        stats = dict(self.stats)
+        stats.update(getattr(self._lookup, "stats", {}))
+        return stats
+
+    def _cached(self, domain: str) -> Optional[Dict]:
+        """In-memory result for an already-normalized domain, or None."""
+        entry = self._memory.get(domain)
+        if entry is None:
+            return None
+        self.stats["memory_hits"] += 1
+        return dict(entry["result"])
+
+    def invalidate(self, domain: str):
+        self._memory.pop(normalize_domain(domain), None)
+
+    async def _resolve(self, domain: str) -> Dict:
+        result = await self._mongo_get(domain)
+        if result is not None:
+            self.stats["mongo_hits"] += 1
+            self._remember(domain, result)
+            return result
+
+        self.stats["lookups"] += 1
+        result = await self._lookup(domain)
+        self._remember(domain, result)
+        await self._mongo_put(domain, result)
+        return result
+
+    def _remember(self, domain: str, result: Dict, ttl: Optional[int] = None):
+        self._memory[domain] = {"result": result, "ttl": ttl if ttl is not None else get_ttl(domain, result)}
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready or db is None:
+            return
+        try:
+            collection = db[CACHE_COLLECTION]
+            await collection.create_index("domain", unique=True)
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning(f"Domain cache index creation failed: {e}")
+        self._indexes_ready = True
+
+    async def _mongo_get(self, domain: str) -> Optional[Dict]:
+        if db is None:
+            return None
+        try:
+            await self._ensure_indexes()
+            # TTL monitor only runs every ~60s, so filter on expiry explicitly
+            doc = await db[CACHE_COLLECTION].find_one(
+                {"domain": domain, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                {"_id": 0, "result": 1}
+            )
+            return doc.get("result") if doc else None
+        except Exception as e:
+            logger.warning(f"Domain cache read failed for {domain}: {e}")
+            return None
+
+    async def _mongo_put(self, domain: str, result: Dict):
+        if db is None:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            await db[CACHE_COLLECTION].update_one(
+                {"domain": domain},
+                {"$set": {
+                    "domain": domain,
+                    "result": result,
+                    "status": result.get("status"),
+                    "cached_at": now,
+                    "expires_at": now + timedelta(seconds=get_ttl(domain, result)),
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Domain cache write failed for {domain}: {e}")
+
+
+# Process-wide instance used by server.py and availability.py
+domain_service = DomainAvailabilityService()
+
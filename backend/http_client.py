@@ -0,0 +1,195 @@
+"""
+Shared HTTP Client
+==================
+One pooled aiohttp session per event loop for all outbound
+scraping: social handle checks, Bing scraping, Google CSE and website crawls.
+
+- Keep-alive connection pool, so repeat hosts skip TCP/TLS handshakes
+- DNS cache on the connector
+- Shared default timeouts and browser User-Agent
+- Per-host concurrency caps for platforms that rate-limit hard
+  (Instagram, X/Twitter, TikTok, ...), on top of aiohttp's uniform limit_per_host
+
+Usage (drop-in for `async with aiohttp.ClientSession() as session:`):
+
+    async with pooled_session() as session:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=8)) as response:
+            ...
+
+The session is NOT closed when the block exits; close_http_session() is
+called from the FastAPI lifespan on shutdown.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+HTTP_POOL_LIMIT = int(os.environ.get("HTTP_POOL_LIMIT", 100))
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", 10))
+HTTP_DNS_CACHE_TTL = int(os.environ.get("HTTP_DNS_CACHE_TTL", 300))
+HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get("HTTP_KEEPALIVE_TIMEOUT", 30))
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Max concurrent requests per host (suffix match). Hosts not listed use HTTP_POOL_LIMIT_PER_HOST.
+HOST_CONCURRENCY_LIMITS = {
+    "instagram.com": 2,
+    "threads.net": 2,
+    "twitter.com": 2,
+    "x.com": 2,
+    "tiktok.com": 2,
+    "facebook.com": 3,
+    "linkedin.com": 2,
+    "pinterest.com": 3,
+    "youtube.com": 4,
+    "bing.com": 4,
+}
+
+
+def get_host_limit(host: str) -> int:
+    host = (host or "").lower()
+    for suffix, limit in HOST_CONCURRENCY_LIMITS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return limit
+    return HTTP_POOL_LIMIT_PER_HOST
+
+
+# ============ SESSION ============
+
+class _HostLimitedRequest:
+    """Wraps session.request(...) so the host slot is held for the whole response."""
+
+    def __init__(self, semaphore: asyncio.Semaphore, request_cm):
+        self._semaphore = semaphore
+        self._request_cm = request_cm
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            return await self._request_cm.__aenter__()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            return await self._request_cm.__aexit__(exc_type, exc, tb)
+        finally:
+            self._semaphore.release()
+
+
+class PooledSession:
+    """Thin facade over the shared aiohttp.ClientSession with per-host caps."""
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self._session = session
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {"requests": 0}
+
+    def _semaphore_for(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(str(url)).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(get_host_limit(host))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def request(self, method: str, url: str, **kwargs) -> _HostLimitedRequest:
+        self.stats["requests"] += 1
+        return _HostLimitedRequest(self._semaphore_for(url), self._session.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> _HostLimitedRequest:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> _HostLimitedRequest:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _HostLimitedRequest:
+        return self.request("POST", url, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def close(self):
+        await self._session.close()
+
+
+# One session per event loop: a ClientSession is bound to the loop that created it,
+# and worker threads running their own loop (asyncio.run) must not reuse the main one.
+_sessions: Dict[asyncio.AbstractEventLoop, PooledSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session() -> PooledSession:
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return PooledSession(aiohttp.ClientSession(
+        connector=connector,
+        timeout=DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+    ))
+
+
+def get_session() -> PooledSession:
+    """Return the pooled session for the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        session = _sessions.get(loop)
+        if session is None or session.closed:
+            # Forget sessions whose loop has finished; their transports went down with it
+            for finished in [owner for owner in _sessions if owner.is_closed()]:
+                del _sessions[finished]
+            session = _new_session()
+            _sessions[loop] = session
+            logger.info(f"HTTP pool created (limit={HTTP_POOL_LIMIT}, per_host={HTTP_POOL_LIMIT_PER_HOST})")
+    return session
+
+
+@asynccontextmanager
+async def pooled_session():
+    """`async with` form of get_session() - the shared session stays open afterwards."""
+    yield get_session()
+
+
+async def close_http_session():
+    """Close every pooled session (FastAPI shutdown), each on the loop that owns it."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        sessions = list(_sessions.items())
+        _sessions.clear()
+    closed = 0
+    for owner, session in sessions:
+        if session.closed:
+            continue
+        try:
+            if owner is loop:
+                await session.close()
+            elif owner.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), owner))
+            else:
+                continue
+            closed += 1
+        except Exception as e:
+            logger.warning(f"HTTP pool close failed: {e}")
+    if closed:
+        logger.info(f"HTTP pool closed ({closed} session(s))")
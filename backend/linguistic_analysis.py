@@ -5,19 +5,11 @@ Analyzes brand names for meaning in ANY world language using LLM
 
 import json
 import logging
-import os
 from typing import Optional, Dict, Any
 
-# Import Emergent Integration
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    LLM_AVAILABLE = True
-except ImportError:
-    logging.error("emergentintegrations not found for linguistic analysis")
-    LLM_AVAILABLE = False
-    UserMessage = None
-
-EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
+# Import LLM (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
+LLM_AVAILABLE = LlmChat is not None
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CATEGORY-SPECIFIC SUCCESSFUL BRAND EXAMPLES
@@ -0,0 +1,499 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+LLM PROVIDER - Single import point for LlmChat / UserMessage
+═══════════════════════════════════════════════════════════════════════════════
+
+Every module imports LlmChat, UserMessage and EMERGENT_KEY from here instead of
+importing emergentintegrations directly, so the provider can be switched by config.
+
+LLM_PROVIDER=emergent (default) → emergentintegrations LlmChat (real tokens)
+LLM_PROVIDER=fake               → offline deterministic stand-in (no network)
+
+The fake provider is meant for load and latency testing of the orchestration.
+It returns schema-valid canned/templated JSON for each prompt type:
+main report, understanding, linguistic, suffix detection, competitor
+classification, white space, brand audit (plus plain-text web research).
+
+Fake provider knobs (all optional):
+- FAKE_LLM_LATENCY_MS            mean latency per call in ms (default 0)
+- FAKE_LLM_LATENCY_JITTER_MS     spread around the mean in ms (default 0)
+- FAKE_LLM_LATENCY_DISTRIBUTION  fixed | uniform | normal | lognormal (default fixed)
+- FAKE_LLM_ERROR_RATE            0.0-1.0 fraction of calls that raise (default 0)
+- FAKE_LLM_SEED                  RNG seed for latency/error sampling (default 42)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import os
+import re
+import ast
+import json
+import math
+import random
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import List, Dict, Any
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+logger = logging.getLogger(__name__)
+
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "emergent").strip().lower()
+
+FAKE_LLM_LATENCY_MS = float(os.environ.get("FAKE_LLM_LATENCY_MS", "0"))
+FAKE_LLM_LATENCY_JITTER_MS = float(os.environ.get("FAKE_LLM_LATENCY_JITTER_MS", "0"))
+FAKE_LLM_LATENCY_DISTRIBUTION = os.environ.get("FAKE_LLM_LATENCY_DISTRIBUTION", "fixed").strip().lower()
+FAKE_LLM_ERROR_RATE = float(os.environ.get("FAKE_LLM_ERROR_RATE", "0"))
+FAKE_LLM_SEED = int(os.environ.get("FAKE_LLM_SEED", "42"))
+
+
+class FakeLlmError(Exception):
+    """Injected failure raised by the fake provider (simulates a 502 from the gateway)"""
+
+
+class FakeUserMessage:
+    """Drop-in for emergentintegrations UserMessage"""
+
+    def __init__(self, text: str = "", **kwargs):
+        self.text = text
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROMPT TYPE DETECTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def detect_prompt_type(prompt: str, system_message: str = "") -> str:
+    """Classify a prompt by the distinctive phrases of each prompt template."""
+    low = (prompt or "").lower()
+    system_low = (system_message or "").lower()
+
+    if "brand audit" in system_low:
+        return "brand_audit"
+    if "evaluate the following brands" in low:
+        return "main_report"
+    if "understand what the user is building" in low:
+        return "understanding"
+    if "multilingual linguist" in low:
+        return "linguistic"
+    if "suffix/naming pattern" in low:
+        return "suffix_detection"
+    if "white space" in low or "white_space" in low:
+        return "white_space"
+    if "competitor" in low:
+        return "competitor_classification"
+    if low.startswith("search the web for:"):
+        return "web_research"
+    return "generic"
+
+
+def _stable_int(text: str, modulo: int) -> int:
+    """Deterministic small integer derived from text (same input → same output)."""
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16) % modulo
+
+
+def _extract_field(prompt: str, label: str, default: str = "") -> str:
+    """Pull 'LABEL: value' out of a prompt (first match, single line)."""
+    match = re.search(rf"{re.escape(label)}\s*:\s*(.+)", prompt, re.IGNORECASE)
+    return match.group(1).strip().strip('"') if match else default
+
+
+def _extract_list(prompt: str, label: str) -> List[str]:
+    """Pull a python-literal list ('Brands: ['A', 'B']') out of a prompt."""
+    raw = _extract_field(prompt, label)
+    try:
+        value = ast.literal_eval(raw)
+        return [str(v) for v in value] if isinstance(value, (list, tuple)) else [str(value)]
+    except (ValueError, SyntaxError):
+        return [v.strip() for v in raw.strip("[]").split(",") if v.strip()]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESPONSE TEMPLATES (one per prompt type)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+MAIN_REPORT_DIMENSIONS = [
+    "Brand Distinctiveness & Memorability",
+    "Cultural & Linguistic Resonance",
+    "Premiumisation & Trust Curve",
+    "Scalability & Brand Architecture",
+    "Trademark & Legal Sensitivity",
+    "Consumer Perception Mapping",
+]
+
+BRAND_AUDIT_DIMENSIONS = [
+    "Heritage & Authenticity", "Customer Satisfaction", "Market Positioning",
+    "Growth Trajectory", "Operational Excellence", "Brand Awareness",
+    "Financial Viability", "Digital Presence",
+]
+
+
+def _main_report_response(prompt: str) -> Any:
+    brands = _extract_list(prompt, "Brands") or ["Brand"]
+    countries = _extract_list(prompt, "Target Countries") or ["USA"]
+    category = _extract_field(prompt, "Category", "Business")
+
+    brand_scores = []
+    for brand in brands:
+        namescore = 55 + _stable_int(brand, 35)
+        verdict = "GO" if namescore >= 75 else "CONDITIONAL GO"
+        brand_scores.append({
+            "brand_name": brand,
+            "namescore": namescore,
+            "verdict": verdict,
+            "summary": f"{brand} is a workable {category} name with moderate distinctiveness.",
+            "strategic_classification": "SUGGESTIVE - moderate protectability",
+            "pros": [f"{brand} is short and easy to pronounce", "No fatal conflicts in pre-computed data"],
+            "cons": ["Some descriptive overlap with category terms"],
+            "dimensions": [
+                {"name": dim, "score": round(5 + _stable_int(brand + dim, 45) / 10, 1), "reasoning": f"{dim} assessed for {brand}."}
+                for dim in MAIN_REPORT_DIMENSIONS
+            ],
+            "trademark_risk": {"overall_risk": "MEDIUM", "score": 5},
+            "cultural_analysis": [
+                {"country": c, "cultural_resonance_score": 7.0, "cultural_notes": f"Neutral connotations in {c}.", "linguistic_check": "PASS"}
+                for c in countries
+            ],
+            "country_competitor_analysis": [],
+            "positioning_fit": f"{brand} fits the requested positioning.",
+        })
+
+    return {
+        "executive_summary": f"Evaluated {len(brands)} brand name(s) for {category}.",
+        "brand_scores": brand_scores,
+        "comparison_verdict": brand_scores[0]["brand_name"] if len(brand_scores) > 1 else "",
+    }
+
+
+def _understanding_response(prompt: str) -> Any:
+    brand_name = _extract_field(prompt, "- Brand Name", "Brand")
+    category = _extract_field(prompt, "- Category", "Business")
+    tokens = re.findall(r"[A-Z][a-z]*|[a-z]+|\d+", brand_name) or [brand_name]
+    return {
+        "brand_analysis": {
+            "original": brand_name,
+            "tokenized": tokens,
+            "token_count": len(tokens),
+            "word_analysis": [
+                {"word": t, "is_dictionary_word": False, "language": "English", "part_of_speech": "noun",
+                 "meaning": "coined element", "sentiment": "neutral", "commonality": "rare"}
+                for t in tokens
+            ],
+            "combined_meaning": f"Coined name '{brand_name}'",
+            "has_dictionary_words": False,
+            "all_words_are_dictionary": False,
+            "contains_invented_elements": True,
+            "linguistic_classification": {"type": "FANCIFUL", "confidence": 0.8, "reasoning": "No dictionary words detected"},
+        },
+        "business_understanding": {
+            "business_type": "product",
+            "business_model": "transaction",
+            "what_they_offer": f"{category} offering",
+            "core_value_proposition": f"Better {category}",
+            "target_audience": {"primary": "consumers", "secondary": "small businesses", "demographics": "25-45"},
+            "industry_sector": category.lower().replace(" ", "_"),
+            "sub_sector": "general",
+        },
+        "trademark_context": {
+            "primary_nice_class": {"class_number": 35, "class_name": "Advertising & Business",
+                                   "class_description": "Advertising, business management", "specific_terms": category},
+            "secondary_nice_classes": [],
+            "registration_risk": {"level": "LOW", "reason": "Coined term", "strategy_hint": "File word mark early"},
+        },
+        "competitive_context": {
+            "search_in_category": category,
+            "NOT_in_category": "",
+            "comparable_brands": [{"name": f"{category} Leader", "type": "incumbent", "relevance": "category leader"}],
+            "direct_competitor_search_queries": [f"best {category}", f"top {category} brands"],
+        },
+        "digital_context": {
+            "recommended_tlds": [".com", ".co"],
+            "avoid_tlds": [],
+            "tld_reasoning": "Standard commercial TLDs",
+            "social_platforms_priority": ["instagram", "linkedin"],
+            "social_platforms_secondary": ["facebook"],
+            "social_platforms_irrelevant": [],
+        },
+        "cultural_context": {"name_sentiment_check": {}, "brand_tone": "neutral", "audience_expectation": "reliability"},
+        "semantic_safety": {"category_conflict": False, "conflict_reason": None, "severity": "LOW", "industry_fit_score": 7.5},
+    }
+
+
+def _linguistic_response(prompt: str) -> Any:
+    brand_name = _extract_field(prompt, "BRAND NAME TO ANALYZE", "Brand")
+    category = _extract_field(prompt, "BUSINESS CATEGORY", "Business")
+    return {
+        "brand_name": brand_name,
+        "business_category": category,
+        "has_linguistic_meaning": False,
+        "is_truly_coined": True,
+        "linguistic_analysis": {
+            "languages_detected": [],
+            "primary_language": None,
+            "decomposition": {"can_be_decomposed": False, "parts": [brand_name], "part_meanings": {}, "combined_meaning": ""},
+            "direct_meaning": {"exists": False, "meaning": "", "language": ""},
+            "phonetic_similarity": {"has_similar_sounding_words": False, "similar_words": []},
+        },
+        "cultural_significance": {
+            "has_cultural_reference": False,
+            "reference_type": "None",
+            "details": "",
+            "source_text_or_origin": "",
+            "regions_of_recognition": [],
+            "sentiment": "Neutral",
+            "religious_sensitivity": {"is_sensitive": False, "religion": "", "sensitivity_level": "None"},
+        },
+        "confidence_assessment": {"overall_confidence": "Medium", "meaning_certainty": "None", "reasoning": "Fake provider"},
+        "business_alignment": {
+            "alignment_score": 6,
+            "alignment_level": "Moderate",
+            "explanation": "Coined name with no inherent category meaning",
+            "thematic_connection": "",
+            "customer_understanding": {"instant_recognition_regions": [], "needs_explanation_regions": [], "universal_appeal": True},
+        },
+        "classification": {"name_type": "True-Coined", "distinctiveness_level": "High", "reasoning": "No meaning detected"},
+        "similar_successful_brands": [],
+        "potential_concerns": [],
+        "executive_summary": f"'{brand_name}' appears to be a coined name with no meaning in major languages.",
+    }
+
+
+def _suffix_detection_response(prompt: str) -> Any:
+    return {
+        "has_conflict": False,
+        "conflicts": [],
+        "recommendation": "PROCEED",
+        "summary": "No suffix conflicts detected with major brands",
+    }
+
+
+def _competitor_response(prompt: str) -> Any:
+    category = _extract_field(prompt, "Category", "") or _extract_field(prompt, "CATEGORY", "Business")
+    country = _extract_field(prompt, "COUNTRY", "") or _extract_field(prompt, "Region", "GLOBAL")
+
+    # Classification prompts list the competitors as "- Name: description"
+    names = re.findall(r"^- ([^:\n]{1,60}):", prompt, re.MULTILINE)
+    if not names or len(names) < 2:
+        names = [f"{category} Competitor {i}" for i in range(1, 6)]
+
+    competitors = []
+    for i, name in enumerate(names):
+        x = 2 + _stable_int(name + "x", 8)
+        y = 3 + _stable_int(name + "y", 7)
+        competitors.append({
+            "name": name,
+            "description": f"{name} operates in {category}",
+            "audience_size": "Medium",
+            "type": "DIRECT" if i % 2 == 0 else "INDIRECT",
+            "x": x,
+            "y": y,
+            "x_coordinate": x * 10,
+            "y_coordinate": y * 10,
+            "quadrant": "Mid-Market",
+            "market_share": "Challenger",
+            "key_strength": "Established distribution",
+            "origin": "LOCAL",
+            "reasoning": "Templated by fake LLM provider",
+        })
+
+    if "json array" in prompt.lower():
+        return competitors
+
+    return {
+        "category_understood": category,
+        "country": country,
+        "competitors": competitors,
+        "direct_competitors": [c for c in competitors if c["type"] == "DIRECT"],
+        "market_leaders": [c for c in competitors if c["type"] == "INDIRECT"][:3],
+        "market_size": "Data not available",
+        "growth_rate": "Data not available",
+        "x_axis_label": "Price: Budget → Premium",
+        "y_axis_label": "Experience: Basic → Premium",
+        "key_trends": ["Digital adoption", "Premiumisation", "D2C growth"],
+        "confidence": "MEDIUM",
+        "data_source": "Fake LLM",
+    }
+
+
+def _white_space_response(prompt: str) -> Any:
+    country = _extract_field(prompt, "COUNTRY", "") or "India"
+    # Superset of the keys read by every white-space prompt in the codebase
+    return {
+        "white_space_analysis": f"Gap in mid-premium segment in {country}.",
+        "strategic_advantage": "Differentiate on experience and trust.",
+        "market_entry_recommendation": "Phase 1: validate online. Phase 2: scale channels. Phase 3: expand regions.",
+        "entry_recommendation": "Phase 1: validate online. Phase 2: scale channels. Phase 3: expand regions.",
+        "user_brand_position": {"x_coordinate": 60, "y_coordinate": 70, "quadrant": "Accessible Premium",
+                                "rationale": "Underserved segment"},
+        "white_space": f"Underserved mid-premium segment in {country}.",
+        "positioning_opportunity": "Accessible Premium",
+        "format_gap": "Short-form, mobile-first format",
+        "audience_gap": "Young urban professionals",
+        "global_white_space": "• Gap: mid-premium, experience-led offering",
+        "country_opportunities": {country: "• Moderate competition, clear premium gap"},
+        "positioning_recommendation": "• Accessible premium with strong trust signals",
+        "unmet_needs": "• Transparent pricing and fast service",
+        "differentiation_strategy": "• Experience-led brand with local relevance",
+        "overall_verdict": "GREEN",
+    }
+
+
+def _brand_audit_response(prompt: str) -> Any:
+    brand_name = _extract_field(prompt, "Brand", "Brand")
+    score = 55 + _stable_int(brand_name, 30)
+    swot_item = lambda text: [{"point": text, "source": "[1]", "confidence": "MEDIUM"}]
+    return {
+        "overall_score": score,
+        "rating": "B",
+        "verdict": "MODERATE",
+        "executive_summary": f"{brand_name} shows moderate brand health with room to grow.",
+        "brand_overview": {"founded": "Unknown", "founders": "Unknown", "headquarters": "Unknown",
+                           "outlets_count": "Unknown", "estimated_revenue": "Unknown", "rating": None,
+                           "key_products": [], "positioning_statement": "Data not available"},
+        "dimensions": [
+            {"name": dim, "score": round(4 + _stable_int(brand_name + dim, 50) / 10, 1),
+             "reasoning": f"{dim} assessed from available research.", "confidence": "MEDIUM"}
+            for dim in BRAND_AUDIT_DIMENSIONS
+        ],
+        "swot": {
+            "strengths": swot_item("Recognisable name"),
+            "weaknesses": swot_item("Limited digital presence"),
+            "opportunities": swot_item("Category growth"),
+            "threats": swot_item("Well-funded competitors"),
+        },
+        "recommendations": {
+            "immediate": [{"title": "Audit digital channels", "priority": "HIGH", "timeline": "0-3 months"}],
+            "medium_term": [{"title": "Expand distribution", "priority": "MEDIUM", "timeline": "12-18 months"}],
+            "long_term": [{"title": "Build brand equity", "priority": "MEDIUM", "timeline": "3-5 years"}],
+        },
+        "competitors": [],
+        "market_data": {"market_size": "Data not available", "cagr": "Data not available", "growth_drivers": [], "key_trends": []},
+        "risks": [{"risk": "Competitive pressure", "probability": "Medium", "impact": "Medium", "mitigation": "Differentiate"}],
+        "conclusion": {"summary": "Moderate position", "final_rating": "B", "recommendation": "HOLD"},
+        "sources": [],
+        "data_confidence": "LOW",
+    }
+
+
+def _web_research_response(prompt: str) -> str:
+    query = _extract_field(prompt, "Search the web for", "")
+    return f"Not found in search (fake LLM provider) for: {query}"
+
+
+RESPONSE_BUILDERS = {
+    "main_report": _main_report_response,
+    "understanding": _understanding_response,
+    "linguistic": _linguistic_response,
+    "suffix_detection": _suffix_detection_response,
+    "competitor_classification": _competitor_response,
+    "white_space": _white_space_response,
+    "brand_audit": _brand_audit_response,
+    "web_research": _web_research_response,
+    "generic": lambda prompt: {},
+}
+
+
+def build_fake_response(prompt: str, system_message: str = "") -> str:
+    """Build the deterministic response text for a prompt (no latency, no errors)."""
+    prompt_type = detect_prompt_type(prompt, system_message)
+    payload = RESPONSE_BUILDERS[prompt_type](prompt)
+    return payload if isinstance(payload, str) else json.dumps(payload)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FAKE LlmChat
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_fake_rng = random.Random(FAKE_LLM_SEED)
+_fake_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _sample_latency_seconds() -> float:
+    mean = FAKE_LLM_LATENCY_MS
+    jitter = FAKE_LLM_LATENCY_JITTER_MS
+    if mean <= 0 and jitter <= 0:
+        return 0.0
+    if FAKE_LLM_LATENCY_DISTRIBUTION == "uniform":
+        value = _fake_rng.uniform(mean - jitter, mean + jitter)
+    elif FAKE_LLM_LATENCY_DISTRIBUTION == "normal":
+        value = _fake_rng.gauss(mean, jitter)
+    elif FAKE_LLM_LATENCY_DISTRIBUTION == "lognormal" and mean > 0:
+        # Parameterised so the distribution mean is FAKE_LLM_LATENCY_MS
+        sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if jitter > 0 else 0.0
+        value = _fake_rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+    else:
+        value = mean
+    return max(0.0, value) / 1000.0
+
+
+def get_fake_llm_stats() -> Dict[str, Dict[str, int]]:
+    """Per-prompt-type call/error counters (for benchmark reports)."""
+    return {k: dict(v) for k, v in _fake_stats.items()}
+
+
+def reset_fake_llm_stats():
+    _fake_stats.clear()
+
+
+class FakeLlmChat:
+    """
+    Offline stand-in for emergentintegrations LlmChat.
+    Accepts every constructor form used in the codebase:
+    LlmChat(key, provider, model) and LlmChat(api_key=, session_id=, system_message=).with_model(p, m)
+    """
+
+    def __init__(self, *args, api_key: str = None, session_id: str = None, system_message: str = None, **kwargs):
+        # Positional form is (api_key, provider, model)
+        self.api_key = api_key or (args[0] if args else None)
+        self.session_id = session_id
+        self.system_message = system_message or ""
+        self.provider = args[1] if len(args) > 1 else None
+        self.model = args[2] if len(args) > 2 else None
+
+    def with_model(self, provider: str, model: str) -> "FakeLlmChat":
+        self.provider = provider
+        self.model = model
+        return self
+
+    async def send_message(self, message: Any) -> str:
+        prompt = getattr(message, "text", message)
+        prompt = prompt if isinstance(prompt, str) else str(prompt)
+        prompt_type = detect_prompt_type(prompt, self.system_message)
+        stats = _fake_stats.setdefault(prompt_type, {"calls": 0, "errors": 0})
+        stats["calls"] += 1
+
+        delay = _sample_latency_seconds()
+        if delay:
+            await asyncio.sleep(delay)
+
+        if FAKE_LLM_ERROR_RATE > 0 and _fake_rng.random() < FAKE_LLM_ERROR_RATE:
+            stats["errors"] += 1
+            raise FakeLlmError(f"502 BadGateway (injected by fake LLM provider for {prompt_type})")
+
+        return build_fake_response(prompt, self.system_message)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROVIDER SELECTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+if LLM_PROVIDER == "fake":
+    LlmChat = FakeLlmChat
+    UserMessage = FakeUserMessage
+    EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY") or "fake-llm-key"
+    logger.warning(
+        f"🧪 LLM_PROVIDER=fake - offline deterministic responses "
+        f"(latency={FAKE_LLM_LATENCY_MS}±{FAKE_LLM_LATENCY_JITTER_MS}ms {FAKE_LLM_LATENCY_DISTRIBUTION}, "
+        f"error_rate={FAKE_LLM_ERROR_RATE})"
+    )
+else:
+    try:
+        from emergentintegrations.llm.chat import LlmChat, UserMessage
+    except ImportError:
+        logger.error("emergentintegrations not found. Ensure it is installed.")
+        LlmChat = None
+        UserMessage = None
+    EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
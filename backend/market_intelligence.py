@@ -17,7 +17,6 @@ import logging
 import asyncio
 import json
 import re
-import os
 import httpx
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -33,14 +32,12 @@ load_dotenv(ROOT_DIR / '.env')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import Emergent LLM
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-except ImportError:
-    logger.error("emergentintegrations not found")
-    LlmChat = None
+# Import LLM (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
+
+# Shared web search (cached, provider fallback chain)
+from search_service import search_service
 
-EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
 logger.info(f"🔑 Market Intelligence: EMERGENT_KEY present = {bool(EMERGENT_KEY)}, LlmChat available = {LlmChat is not None}")
 
 
@@ -124,40 +121,14 @@ class CulturalIntelligence:
 # ============ WEB SEARCH FUNCTIONS ============
 
 async def web_search(query: str, num_results: int = 5) -> List[Dict[str, str]]:
-    """Perform web search using DuckDuckGo (free, no API key needed)"""
+    """Perform web search via the shared search service (DuckDuckGo and friends, cached)"""
     try:
-        from ddgs import DDGS
-        
-        results = []
-        with DDGS() as ddgs:
-            for r in ddgs.text(query, max_results=num_results):
-                results.append({
-                    "title": r.get("title", ""),
-                    "body": r.get("body", ""),
-                    "href": r.get("href", "")
-                })
-        
+        results = [
+            {"title": r["title"], "body": r["snippet"], "href": r["url"]}
+            for r in await search_service.results(query, num_results=num_results)
+        ]
         logger.info(f"🔍 Web search for '{query[:50]}...' returned {len(results)} results")
         return results
-    except ImportError:
-        # Try older package name
-        try:
-            from duckduckgo_search import DDGS
-            
-            results = []
-            with DDGS() as ddgs:
-                for r in ddgs.text(query, max_results=num_results):
-                    results.append({
-                        "title": r.get("title", ""),
-                        "body": r.get("body", ""),
-                        "href": r.get("href", "")
-                    })
-            
-            logger.info(f"🔍 Web search for '{query[:50]}...' returned {len(results)} results")
-            return results
-        except Exception as e:
-            logger.error(f"Web search failed: {e}")
-            return []
     except Exception as e:
         logger.error(f"Web search failed: {e}")
         return []
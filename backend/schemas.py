@@ -107,6 +107,15 @@ class MultiDomainAvailability(BaseModel):
     recommended_domain: Optional[str] = None
     acquisition_strategy: Optional[str] = None
 
+class BulkDomainCheckRequest(BaseModel):
+    """Request model for bulk names x TLDs availability checks"""
+    names: List[str] = Field(description="Candidate brand names (cleaned to domain labels)")
+    tlds: Optional[List[str]] = Field(default=[], description="Explicit TLDs, e.g. .com, .io")
+    category: Optional[str] = Field(default=None, description="Adds category TLDs (.health, .tech, ...)")
+    countries: Optional[List[str]] = Field(default=[], description="Adds country TLDs (.in, .co.uk, ...)")
+    include_com: bool = Field(default=True, description="Always include .com")
+    concurrency: Optional[int] = Field(default=None, ge=1, le=50, description="Max lookups in flight")
+
 class SocialHandleResult(BaseModel):
     platform: str
     handle: str
@@ -586,6 +595,8 @@ class BrandAuditRequest(BaseModel):
     competitor_2: str = Field(description="Second competitor's website URL")
     category: str = Field(description="Business category/industry")
     geography: str = Field(description="Primary geography/market")
+    refresh: bool = Field(default=False, description="Reuse cached crawl/search results that are still recent")
+    max_research_age_hours: Optional[float] = Field(default=None, gt=0, description="Max age of reused research (default: BRAND_AUDIT_RESEARCH_MAX_AGE_HOURS)")
 
 class SWOTItem(BaseModel):
     """Single SWOT item with source"""
@@ -0,0 +1,422 @@
+"""
+Search Service
+==============
+One async web-search layer for every module that used to roll its own:
+- server.google_search / dynamic_brand_search / verify_brand_conflict (Google CSE, Bing HTML)
+- trademark_research.execute_web_search (DDG)
+- visibility.get_web_search_results (DDG, sync)
+- market_intelligence.web_search (ddgs)
+- deep_market_intelligence.google_search (Google CSE)
+
+Pluggable providers (google, bing, ddg, stub) are tried in SEARCH_PROVIDER_ORDER
+until one returns results. The default order is "ddg,bing": the modules that
+used DuckDuckGo keep using the free providers, and paid Google CSE queries only
+come from callers that ask for it (providers=["google"]) or from an explicit
+SEARCH_PROVIDER_ORDER such as "ddg,bing,google". Every provider returns the same normalized shape:
+
+    {"title": str, "url": str, "snippet": str, "display_link": str, "source": str}
+
+Responses are cached per (providers, query, num_results) with a TTL (raw Bing
+pages for search_html in a separate, smaller cache), and each provider has its
+own token-bucket rate limit. Set SEARCH_PROVIDER_ORDER=stub
+(together with LLM_PROVIDER=fake) for fully offline runs.
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlparse
+
+import aiohttp
+from cachetools import TLRUCache
+from dotenv import load_dotenv
+
+from http_client import pooled_session
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables (API keys may be imported before server.py loads .env)
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# ============ CONFIG ============
+
+SEARCH_PROVIDER_ORDER = [p.strip() for p in os.environ.get("SEARCH_PROVIDER_ORDER", "ddg,bing").split(",") if p.strip()]
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", 6 * 3600))            # 6 hours
+SEARCH_CACHE_TTL_EMPTY = int(os.environ.get("SEARCH_CACHE_TTL_EMPTY", 300))     # 5 minutes
+SEARCH_CACHE_MAXSIZE = int(os.environ.get("SEARCH_CACHE_MAXSIZE", 5000))
+# Raw Bing result pages (search_html) are 100-300 KB each, so they get their own small cache
+SEARCH_HTML_CACHE_MAXSIZE = int(os.environ.get("SEARCH_HTML_CACHE_MAXSIZE", 100))
+SEARCH_TIMEOUT = float(os.environ.get("SEARCH_TIMEOUT", 10))
+
+GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+GOOGLE_CSE_ID = os.environ.get("GOOGLE_CSE_ID") or os.environ.get("GOOGLE_SEARCH_ENGINE_ID")
+
+# Requests per second / burst per provider
+PROVIDER_RATE_LIMITS = {
+    "google": (float(os.environ.get("SEARCH_RATE_GOOGLE", 5)), 10),
+    "bing": (float(os.environ.get("SEARCH_RATE_BING", 1)), 3),
+    "ddg": (float(os.environ.get("SEARCH_RATE_DDG", 1)), 3),
+    "stub": (1000.0, 1000),
+}
+
+# Display names for the "source" field some callers surface in reports
+SEARCH_SOURCE_NAMES = {
+    "google": "Google",
+    "bing": "Bing",
+    "ddg": "DuckDuckGo",
+    "stub": "Stub",
+}
+
+BING_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+# ============ RATE LIMITING ============
+
+class TokenBucket:
+    """Token bucket usable from async code (acquire) and worker threads (acquire_blocking)."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self):
+        wait = self._reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._reserve()
+
+    def acquire_blocking(self):
+        wait = self._reserve()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._reserve()
+
+
+# ============ PROVIDERS ============
+
+def normalize_result(title: str, url: str, snippet: str, source: str, display_link: str = "") -> Dict[str, str]:
+    return {
+        "title": title or "",
+        "url": url or "",
+        "snippet": snippet or "",
+        "display_link": display_link or (urlparse(url).netloc if url else ""),
+        "source": source,
+    }
+
+
+class SearchProvider:
+    """Base provider. Subclasses implement search(); sync-capable ones also search_blocking()."""
+
+    name = "base"
+    supports_sync = False
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    async def search(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        """Return (normalized results, total result estimate or None)."""
+        raise NotImplementedError
+
+    def search_blocking(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        raise NotImplementedError
+
+
+class GoogleCSEProvider(SearchProvider):
+    name = "google"
+
+    @property
+    def available(self) -> bool:
+        return bool(GOOGLE_API_KEY and GOOGLE_CSE_ID)
+
+    async def search(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        async with pooled_session() as session:
+            async with session.get(
+                "https://www.googleapis.com/customsearch/v1",
+                params={
+                    "q": query,
+                    "cx": GOOGLE_CSE_ID,
+                    "key": GOOGLE_API_KEY,
+                    "num": min(num_results, 10)  # Google limits to 10 per request
+                },
+                timeout=aiohttp.ClientTimeout(total=SEARCH_TIMEOUT)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Google API error {response.status}: {error_text[:200]}")
+                data = await response.json()
+        total = data.get("searchInformation", {}).get("totalResults")
+        results = [
+            normalize_result(item.get("title"), item.get("link"), item.get("snippet"), self.name, item.get("displayLink"))
+            for item in data.get("items", [])
+        ]
+        return results, int(total) if total and str(total).isdigit() else None
+
+
+class BingProvider(SearchProvider):
+    name = "bing"
+
+    async def fetch_html(self, query: str) -> str:
+        search_url = f"https://www.bing.com/search?q={quote_plus(query)}"
+        async with pooled_session() as session:
+            async with session.get(search_url, headers=BING_HEADERS,
+                                   timeout=aiohttp.ClientTimeout(total=SEARCH_TIMEOUT)) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Bing returned {response.status}")
+                return await response.text()
+
+    @staticmethod
+    def parse_html(html: str, num_results: int) -> List[Dict]:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        results = []
+        for item in soup.select("li.b_algo"):
+            link = item.select_one("h2 a")
+            if not link:
+                continue
+            snippet = item.select_one(".b_caption p") or item.select_one("p")
+            results.append(normalize_result(
+                link.get_text(" ", strip=True),
+                link.get("href", ""),
+                snippet.get_text(" ", strip=True) if snippet else "",
+                "bing"
+            ))
+            if len(results) >= num_results:
+                break
+        return results
+
+    async def search(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        html = await self.fetch_html(query)
+        return self.parse_html(html, num_results), None
+
+
+class DuckDuckGoProvider(SearchProvider):
+    name = "ddg"
+    supports_sync = True
+
+    def search_blocking(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        try:
+            from ddgs import DDGS
+        except ImportError:
+            from duckduckgo_search import DDGS
+
+        results = []
+        with DDGS() as ddgs:
+            for r in ddgs.text(query, max_results=num_results) or []:
+                results.append(normalize_result(
+                    r.get("title"), r.get("href", r.get("link", "")), r.get("body", r.get("snippet", "")), self.name
+                ))
+        return results, None
+
+    async def search(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        # DDGS is synchronous - keep it off the event loop
+        return await asyncio.wait_for(
+            asyncio.to_thread(self.search_blocking, query, num_results),
+            timeout=SEARCH_TIMEOUT
+        )
+
+
+class StubProvider(SearchProvider):
+    """Deterministic local results for offline/load testing - no network."""
+
+    name = "stub"
+    supports_sync = True
+
+    def search_blocking(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        slug = "-".join(query.lower().replace('"', "").split())[:60] or "query"
+        results = [
+            normalize_result(
+                f"{query.replace(chr(34), '')} - result {i + 1}",
+                f"https://example.com/{slug}/{i + 1}",
+                f"Stub search result {i + 1} for {query}.",
+                self.name
+            )
+            for i in range(min(num_results, 5))
+        ]
+        return results, len(results)
+
+    async def search(self, query: str, num_results: int) -> Tuple[List[Dict], Optional[int]]:
+        return self.search_blocking(query, num_results)
+
+
+DEFAULT_PROVIDERS = {
+    "google": GoogleCSEProvider(),
+    "bing": BingProvider(),
+    "ddg": DuckDuckGoProvider(),
+    "stub": StubProvider(),
+}
+
+
+# ============ SERVICE ============
+
+class SearchService:
+    """Cached, rate-limited search with a provider fallback chain."""
+
+    def __init__(self, providers: Optional[Dict[str, SearchProvider]] = None,
+                 order: Optional[List[str]] = None, maxsize: int = SEARCH_CACHE_MAXSIZE,
+                 html_maxsize: int = SEARCH_HTML_CACHE_MAXSIZE):
+        self.providers = dict(providers or DEFAULT_PROVIDERS)
+        self.order = list(order or SEARCH_PROVIDER_ORDER)
+        self._limiters = {
+            name: TokenBucket(*PROVIDER_RATE_LIMITS.get(name, (1.0, 3)))
+            for name in self.providers
+        }
+        self._memory = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._html_memory = TLRUCache(maxsize=html_maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._memory_lock = threading.Lock()
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self.stats = {"hits": 0, "misses": 0, "deduplicated": 0, "provider_errors": 0}
+
+    # ---- public API ----
+
+    async def search(self, query: str, num_results: int = 10, providers: Optional[List[str]] = None) -> Dict:
+        """
+        Returns {"query", "results", "provider", "total_results", "cached", "errors"}.
+        `providers` overrides the fallback order for this call (e.g. ["google"]).
+        """
+        order = self._resolve_order(providers)
+        key = ("search", tuple(order), " ".join(query.lower().split()), num_results)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._search_chain(key, query, num_results, order))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._inflight.pop(k, None) if self._inflight.get(k) is t else None)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def results(self, query: str, num_results: int = 10, providers: Optional[List[str]] = None) -> List[Dict]:
+        """Just the normalized result list."""
+        return (await self.search(query, num_results, providers))["results"]
+
+    def search_sync(self, query: str, num_results: int = 10, providers: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Blocking variant for sync callers running in worker threads (visibility.py).
+        Only sync-capable providers (ddg, stub) are used. Entries are keyed by that
+        reduced provider order, so they are separate from the async path's.
+        """
+        order = [p for p in self._resolve_order(providers) if self.providers[p].supports_sync]
+        key = ("search", tuple(order), " ".join(query.lower().split()), num_results)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached["results"]
+
+        self.stats["misses"] += 1
+        response = self._empty_response(query)
+        for name in order:
+            try:
+                self._limiters[name].acquire_blocking()
+                results, total = self.providers[name].search_blocking(query, num_results)
+            except Exception as e:
+                self.stats["provider_errors"] += 1
+                response["errors"][name] = str(e)[:100]
+                logger.warning(f"Search provider '{name}' failed for '{query[:50]}': {e}")
+                continue
+            if results:
+                response.update(results=results, provider=name, total_results=total)
+                break
+        self._cache_put(key, response)
+        return copy.deepcopy(response["results"])
+
+    async def search_html(self, query: str) -> str:
+        """Raw Bing results page (cached, rate-limited) for callers that scan the HTML directly."""
+        key = ("html", "bing", " ".join(query.lower().split()))
+        with self._memory_lock:
+            entry = self._html_memory.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry["html"]
+
+        self.stats["misses"] += 1
+        bing = self.providers.get("bing")
+        html = ""
+        try:
+            await self._limiters["bing"].acquire()
+            html = await bing.fetch_html(query)
+        except Exception as e:
+            self.stats["provider_errors"] += 1
+            logger.warning(f"Bing HTML fetch failed for '{query[:50]}': {e}")
+        with self._memory_lock:
+            self._html_memory[key] = {"html": html, "ttl": SEARCH_CACHE_TTL if html else SEARCH_CACHE_TTL_EMPTY}
+        return html
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    # ---- internals ----
+
+    def _resolve_order(self, providers: Optional[List[str]]) -> List[str]:
+        order = providers or self.order
+        return [p for p in order if p in self.providers and self.providers[p].available]
+
+    @staticmethod
+    def _empty_response(query: str) -> Dict:
+        return {"query": query, "results": [], "provider": None, "total_results": 0, "cached": False, "errors": {}}
+
+    async def _search_chain(self, key: tuple, query: str, num_results: int, order: List[str]) -> Dict:
+        self.stats["misses"] += 1
+        response = self._empty_response(query)
+        for name in order:
+            try:
+                await self._limiters[name].acquire()
+                results, total = await self.providers[name].search(query, num_results)
+            except Exception as e:
+                self.stats["provider_errors"] += 1
+                response["errors"][name] = str(e)[:100]
+                logger.warning(f"Search provider '{name}' failed for '{query[:50]}': {e}")
+                continue
+            if results:
+                response.update(results=results, provider=name, total_results=total if total is not None else len(results))
+                logger.info(f"🔍 Search [{name}] '{query[:50]}': {len(results)} results")
+                break
+        self._cache_put(key, response)
+        return response
+
+    def _cache_get(self, key: tuple) -> Optional[Dict]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            return None
+        self.stats["hits"] += 1
+        response = copy.deepcopy(entry["value"])
+        response["cached"] = True
+        return response
+
+    def _cache_put(self, key: tuple, value: Dict):
+        ttl = SEARCH_CACHE_TTL if value.get("results") else SEARCH_CACHE_TTL_EMPTY
+        with self._memory_lock:
+            self._memory[key] = {"value": copy.deepcopy(value), "ttl": ttl}
+
+
+# Process-wide instance
+search_service = SearchService()
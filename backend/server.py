@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -12,12 +12,10 @@ from typing import List, Optional
 import uuid
 from datetime import datetime, timezone, timedelta
 import json
-import whois
 import asyncio
 import random
 import re
 import httpx
-import aiohttp
 from passlib.context import CryptContext
 from contextlib import asynccontextmanager
 
@@ -25,15 +23,30 @@ from contextlib import asynccontextmanager
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Import custom modules
-from schemas import BrandEvaluationRequest, BrandEvaluationResponse, StatusCheck, StatusCheckCreate, DimensionScore, BrandScore, BrandAuditRequest, BrandAuditResponse, BrandAuditDimension, SWOTAnalysis, SWOTItem, CompetitorData, MarketData, StrategicRecommendation, CompetitivePosition
+from schemas import BrandEvaluationRequest, BrandEvaluationResponse, StatusCheck, StatusCheckCreate, DimensionScore, BrandScore, BrandAuditRequest, BrandAuditResponse, BulkDomainCheckRequest, BrandAuditDimension, SWOTAnalysis, SWOTItem, CompetitorData, MarketData, StrategicRecommendation, CompetitivePosition
 from prompts import SYSTEM_PROMPT
 from prompts_v2 import SYSTEM_PROMPT_V2  # New optimized prompt
 from brand_audit_prompt import BRAND_AUDIT_SYSTEM_PROMPT, build_brand_audit_prompt
 from brand_audit_prompt_compact import BRAND_AUDIT_SYSTEM_PROMPT_COMPACT, build_brand_audit_prompt_compact
-from visibility import check_visibility
+from visibility import check_visibility_async, warm_app_store_cache, APP_STORE_WARMUP
+from app_store_cache import set_db as set_app_store_cache_db
 from availability import check_full_availability, check_multi_domain_availability, check_social_availability, check_full_availability_with_llm, llm_analyze_domain_strategy
-from similarity import check_brand_similarity, format_similarity_report, deep_trace_analysis, format_deep_trace_report
+from availability import get_category_tlds as get_availability_category_tlds, get_country_tlds as get_availability_country_tlds
+from http_client import close_http_session
+from web_crawler import website_crawler
+from brand_audit_cache import brand_audit_cache, set_db as set_brand_audit_cache_db
+from search_service import search_service
+from social_service import social_service
+from domain_service import domain_service, set_db as set_domain_cache_db, build_candidate_domains, DOMAIN_BULK_CONCURRENCY, DOMAIN_BULK_MAX
+from similarity import check_brand_similarity_async, scan_brand_similarity, format_similarity_report, deep_trace_analysis, format_deep_trace_report, PHONETIC_INDEX, set_brand_corpus
+from brand_corpus import open_brand_corpus
+from brand_scoring import (
+    classify_brand_with_industry, classify_brand_with_linguistic_override,
+    check_pronounceability, calculate_dupont_score, apply_dupont_analysis_to_conflicts
+)
+from brand_index import PatternMatcher, TrigramIndex, phonetic_normalize
 from trademark_research import conduct_trademark_research, format_research_for_prompt
+from cpu_lane import start_cpu_lane, stop_cpu_lane, run_cpu, map_cpu
 
 # Import LLM-First Market Intelligence Research Module
 from market_intelligence import (
@@ -54,12 +67,12 @@ from linguistic_analysis import (
 
 # Import Understanding Module - THE BRAIN of RIGHTNAME.AI
 from understanding_module import (
-    generate_brand_understanding,
     get_nice_class_from_understanding,
     get_classification_from_understanding,
     get_business_type_from_understanding,
     should_use_understanding_classification
 )
+from understanding_store import get_brand_understanding, set_db as set_understanding_store_db
 
 # Import Deep Market Intelligence Agent
 from deep_market_intelligence import (
@@ -81,12 +94,8 @@ from payment_routes import payment_router, set_db as set_payment_db
 # Import Google OAuth Routes
 from google_oauth import google_oauth_router, set_google_oauth_db
 
-# Import Emergent Integration
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-except ImportError:
-    logging.error("emergentintegrations not found. Ensure it is installed.")
-    LlmChat = None
+# Import LLM (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -103,8 +112,7 @@ client = AsyncIOMotorClient(
 )
 db = client[os.environ.get('DB_NAME', 'rightname_db')]
 
-# Initialize LLM Chat
-EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
+# Initialize LLM Chat (EMERGENT_KEY comes from llm_provider)
 if not EMERGENT_KEY:
     logging.warning("EMERGENT_LLM_KEY not found in .env")
 
@@ -134,8 +142,35 @@ async def lifespan(app: FastAPI):
         # Don't fail startup - admin panel is not critical for health checks
         logging.warning(f"⚠️ Admin initialization warning (app still functional): {e}")
     
+    # Pre-warm app store category searches in the background (never blocks startup)
+    warmup_task = None
+    if APP_STORE_WARMUP:
+        async def _warm_app_store_cache():
+            try:
+                await warm_app_store_cache()
+            except Exception as e:
+                logging.warning(f"⚠️ App store cache warm-up failed: {e}")
+        warmup_task = asyncio.create_task(_warm_app_store_cache())
+    
+    # Optional process pool for deterministic scoring (CPU_LANE_WORKERS, off by default).
+    # Workers start in the background, import only similarity / brand_scoring (not this
+    # module), attach the brand corpus and run every stage once on a sample name.
+    cpu_lane_task = asyncio.create_task(start_cpu_lane([
+        (deep_trace_analysis, ("Rapidoy", "Technology", "Ride sharing")),
+        (scan_brand_similarity, ("Rapidoy", "Technology", "Ride sharing")),
+        (check_pronounceability, ("Rapidoy",)),
+        (classify_brand_with_industry, ("Rapidoy", "Ride sharing")),
+        (calculate_dupont_score, ("Rapidoy", "Rapido", True)),
+    ]))
+    
     yield
     # Shutdown - cleanup connections
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if not cpu_lane_task.done():
+        cpu_lane_task.cancel()
+    stop_cpu_lane()
+    await close_http_session()
     if client:
         client.close()
         logging.info("MongoDB connection closed")
@@ -464,6 +499,13 @@ SACRED_ROYAL_NAMES = {
     }
 }
 
+# One automaton per country over all of its term lists
+SACRED_ROYAL_TERMS = {
+    country: [term for key, value in data.items() if key != "warning" and isinstance(value, list) for term in value]
+    for country, data in SACRED_ROYAL_NAMES.items()
+}
+SACRED_ROYAL_MATCHERS = {country: PatternMatcher(terms) for country, terms in SACRED_ROYAL_TERMS.items()}
+
 # ============ LINGUISTIC DECOMPOSITION DATABASE ============
 # Morpheme database for brand name analysis
 
@@ -672,6 +714,7 @@ PHONETIC_RISKS = {
         "fica": {"risk": "HIGH", "reason": "Vulgar term"}
     }
 }
+PHONETIC_RISK_MATCHERS = {country: PatternMatcher(sounds) for country, sounds in PHONETIC_RISKS.items()}
 
 def decompose_brand_name(brand_name: str) -> dict:
     """
@@ -828,15 +871,18 @@ def check_phonetic_risks(brand_name: str, countries: list) -> list:
         country_name = country.get('name') if isinstance(country, dict) else str(country)
         country_title = country_name.title()
         
-        country_risks = PHONETIC_RISKS.get(country_title, {})
-        for sound, risk_data in country_risks.items():
-            if sound in name_lower:
-                risks.append({
-                    "country": country_title,
-                    "sound": sound,
-                    "risk_level": risk_data["risk"],
-                    "reason": risk_data["reason"]
-                })
+        matcher = PHONETIC_RISK_MATCHERS.get(country_title)
+        if matcher is None:
+            continue
+        for sound_id in matcher.find(name_lower):
+            sound = matcher.patterns[sound_id]
+            risk_data = PHONETIC_RISKS[country_title][sound]
+            risks.append({
+                "country": country_title,
+                "sound": sound,
+                "risk_level": risk_data["risk"],
+                "reason": risk_data["reason"]
+            })
     
     return risks
 
@@ -1020,370 +1066,6 @@ def format_linguistic_analysis_for_output(analysis: dict, country: str) -> str:
     return "\n".join(output_parts)
 
 
-# ============ MASTER CLASSIFICATION SYSTEM ============
-# Single classification called ONCE, result passed to all sections
-# Implements 5-Step Spectrum of Distinctiveness
-
-# CACHE to avoid duplicate classification calls
-_CLASSIFICATION_CACHE = {}
-
-COMMON_DICTIONARY_WORDS = {
-    # Common English words that indicate DESCRIPTIVE names
-    "check", "my", "meal", "quick", "fast", "health", "care", "med", "doc", "doctor",
-    "pay", "flow", "cash", "money", "bank", "fin", "tech", "app", "book", "shop",
-    "buy", "sell", "trade", "market", "store", "home", "house", "real", "estate",
-    "food", "eat", "dine", "cook", "chef", "kitchen", "taste", "fresh", "organic",
-    "fit", "gym", "work", "out", "body", "mind", "soul", "life", "live", "well",
-    "travel", "trip", "tour", "fly", "drive", "ride", "go", "move", "run", "walk",
-    "learn", "teach", "study", "class", "school", "edu", "smart", "brain", "think",
-    "cloud", "data", "sync", "link", "connect", "net", "web", "site", "page", "hub",
-    "social", "chat", "talk", "speak", "call", "meet", "date", "love", "match",
-    "news", "feed", "post", "share", "like", "view", "watch", "play", "game", "fun",
-    "style", "fashion", "wear", "dress", "look", "beauty", "glow", "skin", "hair",
-    "auto", "car", "bike", "wheel", "park", "fix", "repair", "service", "clean",
-    "pet", "dog", "cat", "vet", "kid", "baby", "family", "parent", "mom", "dad",
-    "green", "eco", "solar", "power", "energy", "save", "easy", "simple",
-    "pro", "plus", "max", "prime", "elite", "premium", "super", "mega", "ultra",
-    "one", "first", "best", "top", "next", "new", "now", "today", "daily", "weekly",
-    "local", "global", "world", "city", "urban", "rural", "metro", "zone", "area",
-    "true", "real", "pure", "free", "open", "clear", "bright", "light", "dark",
-    "blue", "red", "gold", "silver", "black", "white", "color", "colour",
-    # Medical/Healthcare
-    "steth", "scope", "pulse", "heart", "blood", "test", "lab", "scan", "ray",
-    "heal", "cure", "therapy", "clinic", "hospital", "pharma", "drug", "pill",
-    # Finance
-    "wallet", "coin", "credit", "debit", "loan", "invest", "fund", "stock",
-    # Tech
-    "code", "dev", "build", "make", "create", "design", "pixel", "byte", "bit",
-    # Common suffixes that indicate descriptive
-    "ly", "er", "ist", "ify", "ize", "able", "ible", "ful", "less", "ment", "ness",
-    "works", "hub", "spot", "base", "point", "space", "place", "land",
-    # Additional common words
-    "air", "bus", "face", "sound", "snap", "insta", "gram", "tube", "flix",
-    "drop", "box", "door", "dash", "uber", "grab", "bolt", "zoom", "slack",
-}
-
-# Industry keywords for semantic matching
-INDUSTRY_KEYWORDS = {
-    "food": ["meal", "eat", "dine", "food", "cook", "chef", "taste", "recipe", "kitchen", "restaurant", "cafe", "dish", "menu"],
-    "healthcare": ["health", "med", "doctor", "clinic", "care", "patient", "therapy", "heal", "cure", "hospital", "pharma", "steth", "pulse"],
-    "finance": ["pay", "money", "bank", "cash", "fund", "loan", "credit", "invest", "wallet", "coin", "finance", "fintech"],
-    "technology": ["tech", "code", "dev", "app", "software", "cloud", "data", "digital", "cyber", "ai", "ml"],
-    "travel": ["travel", "trip", "tour", "fly", "flight", "hotel", "stay", "vacation", "journey", "voyage"],
-    "fitness": ["fit", "gym", "workout", "health", "body", "exercise", "train", "muscle", "yoga"],
-    "education": ["learn", "teach", "study", "edu", "school", "class", "course", "academy", "tutor"],
-    "ecommerce": ["shop", "buy", "sell", "store", "cart", "order", "delivery", "market", "retail"],
-    "social": ["social", "connect", "chat", "friend", "share", "post", "network", "community"],
-    "entertainment": ["play", "game", "fun", "watch", "stream", "video", "music", "media"],
-}
-
-MODIFIED_SPELLING_PATTERNS = [
-    # Words with letters removed (Lyft, Flickr, Tumblr style)
-    ("lyft", "lift"), ("flickr", "flicker"), ("tumblr", "tumbler"),
-    ("grindr", "grinder"), ("fiverr", "fiver"), ("scribd", "scribed"),
-    ("bettr", "better"), ("fastr", "faster"), ("hungr", "hungry"),
-    ("dribbble", "dribble"), ("reddit", "read it"),
-]
-
-# Heritage language roots
-HERITAGE_ORIGINS = ["Sanskrit", "Latin", "Greek", "Japanese", "Chinese", "Arabic", "Hebrew", "Persian"]
-
-
-def tokenize_brand_name(brand_name: str) -> list:
-    """
-    STEP 1: DE-COMPOUND - Split brand name into tokens
-    
-    "CheckMyMeal" → ["check", "my", "meal"]
-    "FaceBook" → ["face", "book"]
-    "Xerox" → ["xerox"]
-    "LUMINARA" → ["luminara"] (all-caps treated as single word)
-    """
-    # Normalize: If ALL CAPS, convert to title case first to avoid splitting each letter
-    if brand_name.isupper() and len(brand_name) > 1:
-        brand_name = brand_name.title()  # LUMINARA → Luminara
-    
-    brand_lower = brand_name.lower()
-    
-    # Method 1: Split by common separators
-    tokens = []
-    
-    # Split camelCase: "CheckMyMeal" → ["Check", "My", "Meal"]
-    import re
-    camel_split = re.sub('([A-Z])', r' \1', brand_name).split()
-    if len(camel_split) > 1:
-        tokens = [t.lower() for t in camel_split if t]
-    
-    # If no camelCase, try to find dictionary words within the string
-    if len(tokens) <= 1:
-        tokens = []
-        remaining = brand_lower
-        
-        # Sort dictionary words by length (longest first) to match greedily
-        sorted_words = sorted(COMMON_DICTIONARY_WORDS, key=len, reverse=True)
-        
-        while remaining:
-            found = False
-            for word in sorted_words:
-                if remaining.startswith(word) and len(word) >= 3:
-                    tokens.append(word)
-                    remaining = remaining[len(word):]
-                    found = True
-                    break
-            
-            if not found:
-                # No dictionary word found at start, take one character and continue
-                if remaining:
-                    # Check if remaining is itself a token
-                    if remaining in COMMON_DICTIONARY_WORDS:
-                        tokens.append(remaining)
-                        break
-                    remaining = remaining[1:]  # Skip one character
-    
-    # If still no tokens, the whole name is one token
-    if not tokens:
-        tokens = [brand_lower]
-    
-    return tokens
-
-
-def get_industry_domain(industry: str) -> tuple:
-    """Get the primary domain of an industry"""
-    industry_lower = industry.lower()
-    
-    for domain, keywords in INDUSTRY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in industry_lower:
-                return domain, keywords
-    
-    return "general", []
-
-
-def classify_brand_with_industry(brand_name: str, industry: str) -> dict:
-    """
-    MASTER CLASSIFICATION FUNCTION
-    
-    Called ONCE at start, result passed to all sections.
-    Implements 5-Step Spectrum of Distinctiveness:
-    
-    1. GENERIC - Names the category itself (unprotectable)
-    2. DESCRIPTIVE - Directly describes product (weak protection)
-    3. SUGGESTIVE - Hints at product, needs imagination (moderate)
-    4. ARBITRARY - Real word, unrelated context (strong)
-    5. FANCIFUL - Completely invented (strongest)
-    
-    HARD RULES:
-    - Compound Rule: FaceBook = Face + Book = NOT Coined
-    - Conservative Rule: If borderline, default to weaker category
-    - No Fluff Rule: Legal accuracy > Marketing appeal
-    
-    CACHING: Results are cached to avoid duplicate calculations.
-    """
-    global _CLASSIFICATION_CACHE
-    
-    # Check cache first
-    cache_key = f"{brand_name.lower()}|{industry.lower()}"
-    if cache_key in _CLASSIFICATION_CACHE:
-        logging.info(f"🏷️ CLASSIFICATION (CACHED): '{brand_name}' → {_CLASSIFICATION_CACHE[cache_key]['category']}")
-        return _CLASSIFICATION_CACHE[cache_key]
-    
-    # Helper to store in cache before returning
-    def cache_and_return(result, log_msg):
-        _CLASSIFICATION_CACHE[cache_key] = result
-        logging.info(log_msg)
-        return result
-    
-    brand_lower = brand_name.lower()
-    industry_lower = industry.lower()
-    
-    # ========== STEP 1: DE-COMPOUND & DICTIONARY CHECK ==========
-    tokens = tokenize_brand_name(brand_name)
-    
-    # Check which tokens are dictionary words
-    dictionary_tokens = []
-    invented_tokens = []
-    
-    for token in tokens:
-        if token in COMMON_DICTIONARY_WORDS or len(token) <= 2:
-            dictionary_tokens.append(token)
-        else:
-            # Check if it's a partial match
-            is_dict_word = False
-            for dict_word in COMMON_DICTIONARY_WORDS:
-                if dict_word in token or token in dict_word:
-                    dictionary_tokens.append(token)
-                    is_dict_word = True
-                    break
-            if not is_dict_word:
-                invented_tokens.append(token)
-    
-    # Get industry domain
-    industry_domain, industry_keywords = get_industry_domain(industry)
-    
-    # Check for modified spelling
-    is_modified_spelling = False
-    original_word = None
-    for modified, original in MODIFIED_SPELLING_PATTERNS:
-        if modified in brand_lower:
-            is_modified_spelling = True
-            original_word = original
-            break
-    
-    # ========== CLASSIFICATION DECISION TREE ==========
-    
-    # Initialize result
-    result = {
-        "brand_name": brand_name,
-        "industry": industry,
-        "tokens": tokens,
-        "dictionary_tokens": dictionary_tokens,
-        "invented_tokens": invented_tokens,
-        "category": None,
-        "distinctiveness": None,
-        "protectability": None,
-        "dictionary_status": None,
-        "semantic_link": None,
-        "imagination_required": None,
-        "warning": None,
-        "reasoning": None
-    }
-    
-    # ========== STEP 2: GENERIC CHECK ==========
-    # Does the name literally name the category?
-    is_generic = False
-    if brand_lower in industry_keywords or brand_lower == industry_domain:
-        is_generic = True
-    
-    # Check if ALL tokens are industry keywords
-    if len(dictionary_tokens) > 0:
-        all_industry_match = all(
-            any(token in kw or kw in token for kw in industry_keywords)
-            for token in dictionary_tokens
-        )
-        if all_industry_match and len(dictionary_tokens) >= 2:
-            is_generic = True
-    
-    if is_generic:
-        result["category"] = "GENERIC"
-        result["distinctiveness"] = "NONE"
-        result["protectability"] = "UNPROTECTABLE"
-        result["dictionary_status"] = f"All tokens are common words: {dictionary_tokens}"
-        result["semantic_link"] = f"Name directly names the product category '{industry}'"
-        result["imagination_required"] = False
-        result["warning"] = "⛔ Generic terms CANNOT be trademarked. Choose a different name."
-        result["reasoning"] = f"'{brand_name}' literally describes or names the '{industry}' category. Generic terms are free for all to use."
-        
-        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → GENERIC (names the category)")
-    
-    # ========== STEP 3: DESCRIPTIVE CHECK ==========
-    # Do the dictionary words DIRECTLY describe the product?
-    is_descriptive = False
-    matching_industry_tokens = []
-    
-    for token in dictionary_tokens:
-        for keyword in industry_keywords:
-            if token == keyword or token in keyword or keyword in token:
-                matching_industry_tokens.append(token)
-                break
-    
-    # If 50%+ of tokens match industry keywords → DESCRIPTIVE
-    if len(dictionary_tokens) > 0:
-        match_ratio = len(matching_industry_tokens) / len(dictionary_tokens)
-        if match_ratio >= 0.5 and len(dictionary_tokens) >= 2:
-            is_descriptive = True
-    
-    # If ALL tokens are dictionary words and describe function → DESCRIPTIVE
-    if len(dictionary_tokens) >= 2 and len(invented_tokens) == 0:
-        is_descriptive = True
-    
-    if is_descriptive:
-        result["category"] = "DESCRIPTIVE"
-        result["distinctiveness"] = "LOW"
-        result["protectability"] = "WEAK"
-        result["dictionary_status"] = f"Contains dictionary words: {dictionary_tokens}"
-        result["semantic_link"] = f"Words directly describe the {industry} - {', '.join(matching_industry_tokens) if matching_industry_tokens else 'composite description'}"
-        result["imagination_required"] = False
-        result["warning"] = "⚠️ Descriptive marks require proof of 'Secondary Meaning' (acquired distinctiveness) for trademark protection. This typically requires 5+ years of exclusive use and significant marketing investment."
-        result["reasoning"] = f"'{brand_name}' is composed of dictionary words ({', '.join(dictionary_tokens)}) that describe the product/service. Under trademark law, descriptive marks receive weak protection."
-        
-        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → DESCRIPTIVE (describes the product)")
-    
-    # ========== STEP 4: SUGGESTIVE CHECK ==========
-    # Does consumer need imagination to connect name to product?
-    is_suggestive = False
-    
-    # Has dictionary words but doesn't directly describe
-    if len(dictionary_tokens) >= 1 and not is_descriptive:
-        is_suggestive = True
-    
-    # Modified spelling of real words → Suggestive
-    if is_modified_spelling:
-        is_suggestive = True
-    
-    # Compound of real words that hints but doesn't describe
-    # e.g., "Netflix" (Net + Flicks), "Airbus" (Air + Bus)
-    if len(dictionary_tokens) >= 2 and len(matching_industry_tokens) == 0:
-        is_suggestive = True
-    
-    if is_suggestive:
-        result["category"] = "SUGGESTIVE"
-        result["distinctiveness"] = "MODERATE"
-        result["protectability"] = "MODERATE"
-        result["dictionary_status"] = f"Contains words: {dictionary_tokens}" + (f" (modified from '{original_word}')" if is_modified_spelling else "")
-        result["semantic_link"] = f"Hints at {industry} but requires imagination to connect"
-        result["imagination_required"] = True
-        result["warning"] = "Suggestive marks are protectable but may face challenges from similar suggestive marks in the same industry."
-        result["reasoning"] = f"'{brand_name}' suggests qualities of the product but requires consumer imagination to make the connection. This places it in the SUGGESTIVE category with moderate trademark protection."
-        
-        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → SUGGESTIVE (hints at product)")
-    
-    # ========== STEP 5: ARBITRARY CHECK ==========
-    # Is it a real word in UNRELATED context?
-    is_arbitrary = False
-    
-    # Has one dictionary word that's completely unrelated to industry
-    if len(dictionary_tokens) == 1 and len(matching_industry_tokens) == 0:
-        is_arbitrary = True
-    
-    if is_arbitrary:
-        result["category"] = "ARBITRARY"
-        result["distinctiveness"] = "HIGH"
-        result["protectability"] = "STRONG"
-        result["dictionary_status"] = f"Common word '{dictionary_tokens[0]}' used in unrelated context"
-        result["semantic_link"] = f"No semantic connection to {industry}"
-        result["imagination_required"] = False
-        result["warning"] = None
-        result["reasoning"] = f"'{brand_name}' is a common word used in a completely unrelated context ({industry}). Like 'Apple' for computers, arbitrary marks receive strong trademark protection."
-        
-        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → ARBITRARY (unrelated context)")
-    
-    # ========== STEP 6: FANCIFUL/COINED CHECK ==========
-    # Is the word completely made up?
-    if len(dictionary_tokens) == 0 and len(invented_tokens) > 0:
-        result["category"] = "FANCIFUL"
-        result["distinctiveness"] = "HIGHEST"
-        result["protectability"] = "STRONGEST"
-        result["dictionary_status"] = f"Invented term with no dictionary origin: {invented_tokens}"
-        result["semantic_link"] = "No pre-existing meaning"
-        result["imagination_required"] = False
-        result["warning"] = None
-        result["reasoning"] = f"'{brand_name}' is a completely invented word with no prior dictionary meaning. Like 'Xerox' or 'Kodak', fanciful marks receive the strongest trademark protection."
-        
-        return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → FANCIFUL/COINED (invented word)")
-    
-    # ========== DEFAULT: CONSERVATIVE RULE ==========
-    # If we can't clearly classify, default to DESCRIPTIVE (safer for user)
-    result["category"] = "DESCRIPTIVE"
-    result["distinctiveness"] = "LOW"
-    result["protectability"] = "WEAK"
-    result["dictionary_status"] = f"Tokens: {tokens}"
-    result["semantic_link"] = f"Unclear relationship to {industry}"
-    result["imagination_required"] = False
-    result["warning"] = "⚠️ Classification unclear - defaulting to DESCRIPTIVE (conservative approach). Consult a trademark attorney."
-    result["reasoning"] = f"'{brand_name}' could not be clearly classified. Following the Conservative Rule, we default to DESCRIPTIVE to protect against legal risk."
-    
-    return cache_and_return(result, f"🏷️ CLASSIFICATION: '{brand_name}' → DESCRIPTIVE (conservative default)")
-
-
 # Legacy function for backward compatibility
 def classify_brand_name_type(brand_name: str, decomposition: dict) -> str:
     """
@@ -1403,171 +1085,6 @@ def classify_brand_name_type(brand_name: str, decomposition: dict) -> str:
     }
 
 
-def classify_brand_with_linguistic_override(
-    brand_name: str, 
-    industry: str, 
-    linguistic_analysis: dict = None
-) -> dict:
-    """
-    ENHANCED MASTER CLASSIFICATION FUNCTION
-    
-    Runs standard classification FIRST, then OVERRIDES based on linguistic analysis.
-    
-    Override Rules:
-    - If linguistic says "has_meaning=True" + "name_type=Mythological" → Cannot be FANCIFUL
-    - If linguistic says "has_meaning=True" + "name_type=Foreign-Language" → Check alignment
-    - If meaning aligns with business → SUGGESTIVE (hints at product via foreign meaning)
-    - If meaning unrelated to business → ARBITRARY (real word in unrelated context)
-    - If no meaning found → Trust original classification
-    
-    Args:
-        brand_name: The brand name to classify
-        industry: The industry/category
-        linguistic_analysis: Results from analyze_brand_linguistics()
-        
-    Returns:
-        dict with classification results (potentially overridden)
-    """
-    # Step 1: Run standard English-based classification
-    base_result = classify_brand_with_industry(brand_name, industry)
-    
-    # Step 2: Check if we have linguistic analysis with meaning
-    if not linguistic_analysis:
-        logging.info(f"🏷️ CLASSIFICATION (NO LINGUISTIC DATA): '{brand_name}' → {base_result['category']}")
-        return base_result
-    
-    has_meaning = linguistic_analysis.get("has_linguistic_meaning", False)
-    confidence = linguistic_analysis.get("confidence_assessment", {}).get("overall_confidence", "Low")
-    meaning_certainty = linguistic_analysis.get("confidence_assessment", {}).get("meaning_certainty", "None")
-    
-    # Only override if we have HIGH/MEDIUM confidence
-    if not has_meaning or confidence == "Low" or meaning_certainty in ["None", "Speculative"]:
-        logging.info(f"🏷️ CLASSIFICATION (LOW CONFIDENCE): '{brand_name}' → {base_result['category']} (linguistic: {has_meaning}, confidence: {confidence})")
-        # Still attach linguistic data for reference
-        base_result["linguistic_override"] = False
-        base_result["linguistic_data"] = {
-            "has_meaning": has_meaning,
-            "confidence": confidence
-        }
-        return base_result
-    
-    # Step 3: Extract linguistic classification
-    name_type = linguistic_analysis.get("classification", {}).get("name_type", "Unknown")
-    alignment_score = linguistic_analysis.get("business_alignment", {}).get("alignment_score", 5)
-    languages = linguistic_analysis.get("linguistic_analysis", {}).get("languages_detected", [])
-    combined_meaning = linguistic_analysis.get("linguistic_analysis", {}).get("decomposition", {}).get("combined_meaning", "")
-    cultural_ref = linguistic_analysis.get("cultural_significance", {}).get("has_cultural_reference", False)
-    
-    # Step 4: Determine override
-    original_category = base_result["category"]
-    new_category = original_category  # Default: no change
-    override_reason = None
-    
-    # RULE 1: Mythological/Heritage names → SUGGESTIVE (always)
-    # These suggest qualities through cultural/mythological association
-    if name_type in ["Mythological", "Heritage"]:
-        if original_category == "FANCIFUL":
-            new_category = "SUGGESTIVE"
-            override_reason = f"Name has {name_type} origin ({', '.join(languages)}): '{combined_meaning}'. Cannot be FANCIFUL."
-    
-    # RULE 2: Foreign-Language names → Check business alignment
-    elif name_type == "Foreign-Language":
-        if alignment_score >= 7:
-            # High alignment = meaning describes/relates to business → SUGGESTIVE
-            if original_category == "FANCIFUL":
-                new_category = "SUGGESTIVE"
-                override_reason = f"Foreign word meaning '{combined_meaning}' aligns with business (score: {alignment_score}/10)"
-        else:
-            # Low alignment = meaning unrelated to business → ARBITRARY
-            if original_category == "FANCIFUL":
-                new_category = "ARBITRARY"
-                override_reason = f"Foreign word meaning '{combined_meaning}' is unrelated to business (score: {alignment_score}/10)"
-    
-    # RULE 3: Compound/Portmanteau with meaning → SUGGESTIVE
-    elif name_type in ["Compound", "Portmanteau"]:
-        if original_category == "FANCIFUL":
-            new_category = "SUGGESTIVE"
-            override_reason = f"Compound name with meaningful parts: '{combined_meaning}'"
-    
-    # RULE 4: Evocative names → SUGGESTIVE
-    elif name_type == "Evocative":
-        if original_category in ["FANCIFUL", "ARBITRARY"]:
-            new_category = "SUGGESTIVE"
-            override_reason = f"Name evokes qualities: '{combined_meaning}'"
-    
-    # RULE 5: True-Coined → Keep FANCIFUL
-    elif name_type == "True-Coined":
-        # Linguistic analysis confirms it's truly invented
-        pass  # Keep original
-    
-    # RULE 6: CATCH-ALL - ANY name with verified meaning cannot be FANCIFUL
-    # This handles cases where name_type is "Descriptive", "Phonetic-Adaptation", "Unknown", etc.
-    # If has_meaning=True and we reached this point, the name has meaning in some language
-    if original_category == "FANCIFUL" and new_category == "FANCIFUL" and has_meaning and combined_meaning:
-        # If we still have FANCIFUL after all rules, but meaning exists - override based on alignment
-        if alignment_score >= 6:
-            new_category = "SUGGESTIVE"
-            override_reason = f"Name has clear linguistic meaning ({', '.join(languages) if languages else 'detected languages'}): '{combined_meaning}'. High business alignment ({alignment_score}/10) suggests product/service."
-        else:
-            new_category = "ARBITRARY"
-            override_reason = f"Name has linguistic meaning ({', '.join(languages) if languages else 'detected languages'}): '{combined_meaning}'. Used in unrelated business context."
-        logging.info(f"🏷️ CATCH-ALL OVERRIDE: '{brand_name}' has meaning but no specific rule matched → {new_category}")
-    
-    # Step 5: Apply override if needed
-    if new_category != original_category:
-        logging.info(f"🏷️ CLASSIFICATION OVERRIDE: '{brand_name}' → {original_category} → {new_category}")
-        logging.info(f"   Reason: {override_reason}")
-        
-        # Update result
-        base_result["category"] = new_category
-        base_result["linguistic_override"] = True
-        base_result["original_category"] = original_category
-        base_result["override_reason"] = override_reason
-        
-        # Update distinctiveness and protectability based on new category
-        category_attributes = {
-            "GENERIC": ("NONE", "UNPROTECTABLE"),
-            "DESCRIPTIVE": ("LOW", "WEAK"),
-            "SUGGESTIVE": ("MODERATE", "MODERATE"),
-            "ARBITRARY": ("HIGH", "STRONG"),
-            "FANCIFUL": ("HIGHEST", "STRONGEST")
-        }
-        
-        if new_category in category_attributes:
-            base_result["distinctiveness"], base_result["protectability"] = category_attributes[new_category]
-        
-        # Update reasoning
-        base_result["reasoning"] = f"'{brand_name}' was linguistically analyzed and found to have meaning in {', '.join(languages)}: '{combined_meaning}'. {override_reason}. Classification changed from {original_category} to {new_category}."
-        
-        # Add warning for SUGGESTIVE
-        if new_category == "SUGGESTIVE":
-            base_result["warning"] = "Suggestive marks (names that hint at the product through foreign/cultural meaning) are protectable but may face challenges from similar marks."
-    else:
-        base_result["linguistic_override"] = False
-        base_result["linguistic_data"] = {
-            "has_meaning": has_meaning,
-            "name_type": name_type,
-            "languages": languages,
-            "alignment_score": alignment_score
-        }
-        logging.info(f"🏷️ CLASSIFICATION (NO OVERRIDE NEEDED): '{brand_name}' → {original_category}")
-    
-    # Always attach linguistic insights for downstream use
-    base_result["linguistic_insights"] = {
-        "has_meaning": has_meaning,
-        "name_type": name_type,
-        "languages": languages,
-        "combined_meaning": combined_meaning,
-        "alignment_score": alignment_score,
-        "cultural_reference": cultural_ref,
-        "confidence": confidence
-    }
-    
-    return base_result
-    
-    return category_map.get(result["category"], "Descriptive/Composite")
-
-
 # ============ GATE 2: CATEGORY MISMATCH CHECK ============
 # Detect when brand name semantics don't match the industry category
 
@@ -1725,20 +1242,13 @@ def check_sacred_royal_names(brand_name: str, countries: list) -> dict:
     
     for country in countries:
         country_name = country.get('name') if isinstance(country, dict) else str(country)
-        sacred_data = SACRED_ROYAL_NAMES.get(country_name, SACRED_ROYAL_NAMES.get("default", {}))
-        
-        # Check all term categories for this country
-        all_terms = []
-        for key, value in sacred_data.items():
-            if key != "warning" and isinstance(value, list):
-                all_terms.extend(value)
+        sacred_key = country_name if country_name in SACRED_ROYAL_NAMES else "default"
+        sacred_data = SACRED_ROYAL_NAMES[sacred_key]
         
-        # Check if brand name contains any sacred/royal terms
-        matched_terms = []
-        for term in all_terms:
-            # Check for whole word or as part of compound word
-            if term in brand_lower or re.search(rf'\b{re.escape(term)}\b', brand_lower, re.IGNORECASE):
-                matched_terms.append(term)
+        # Check if brand name contains any sacred/royal terms (whole word or
+        # part of a compound word) across all term categories for this country
+        matcher = SACRED_ROYAL_MATCHERS[sacred_key]
+        matched_terms = [matcher.patterns[term_id] for term_id in matcher.find(brand_lower)]
         
         if matched_terms and sacred_data.get("warning"):
             warnings.append({
@@ -2383,10 +1893,7 @@ async def generate_llm_market_insights(
     Falls back to hardcoded data if LLM fails.
     """
     try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage
-        
-        EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
-        if not EMERGENT_KEY:
+        if not LlmChat or not EMERGENT_KEY:
             return None
         
         prompt = f"""You are a McKinsey market strategist. Analyze the market opportunity for a NEW brand.
@@ -2660,8 +2167,6 @@ async def llm_calculate_cultural_score(
     2. Run the actual math
     3. Show the calculation
     """
-    EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
-    
     if not LlmChat or not EMERGENT_KEY:
         logging.warning(f"🌐 LLM not available for cultural scoring - using fallback for {country}")
         return calculate_fallback_cultural_score(brand_name, category, country)
@@ -4172,8 +3677,6 @@ async def generate_llm_legal_precedents(
     Returns country-wise precedents instead of hardcoded US-only cases.
     Falls back to basic structure if LLM unavailable.
     """
-    EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
-    
     # Format countries for prompt
     country_names = []
     for country in countries:
@@ -8010,543 +7513,19 @@ def generate_realistic_registration_timeline(countries: list, num_classes: int =
     }
 
 
-# ============================================================================
-# 🆕 FEATURE 3: DUPONT 13-FACTOR LIKELIHOOD OF CONFUSION TEST
-# ============================================================================
-# Legal standard from In re E.I. DuPont de Nemours & Co., 476 F.2d 1357 (CCPA 1973)
-
-def calculate_dupont_score(
-    brand_name: str,
-    conflict_name: str,
-    same_category: bool,
-    conflict_data: dict = None
-) -> dict:
-    """
-    Calculate DuPont 13-Factor likelihood of confusion score.
-    
-    Returns weighted score (0-10) with legal verdict:
-    - 9.0-10.0 = REJECT (>90% confusion likelihood)
-    - 7.0-8.9 = REJECT (High confusion - likely USPTO refusal)
-    - 5.0-6.9 = NO-GO (Moderate confusion - risky)
-    - 3.0-4.9 = CONDITIONAL GO (Low-moderate confusion)
-    - 0.0-2.9 = GO (Minimal confusion)
-    """
-    from difflib import SequenceMatcher
-    import jellyfish
-    
-    # Helper functions
-    def visual_similarity(a: str, b: str) -> float:
-        """Visual/spelling similarity (0-10)"""
-        ratio = SequenceMatcher(None, a.lower(), b.lower()).ratio()
-        return ratio * 10
-    
-    def phonetic_similarity(a: str, b: str) -> float:
-        """Phonetic similarity using Soundex/Metaphone (0-10)"""
-        try:
-            # Soundex comparison
-            soundex_a = jellyfish.soundex(a)
-            soundex_b = jellyfish.soundex(b)
-            soundex_match = 10 if soundex_a == soundex_b else 5 if soundex_a[:2] == soundex_b[:2] else 2
-            
-            # Metaphone comparison
-            meta_a = jellyfish.metaphone(a)
-            meta_b = jellyfish.metaphone(b)
-            meta_ratio = SequenceMatcher(None, meta_a, meta_b).ratio()
-            
-            return (soundex_match + (meta_ratio * 10)) / 2
-        except:
-            return visual_similarity(a, b)
-    
-    # Factor calculations
-    factors = {}
-    
-    # Factor 1: Similarity of Marks (HIGH WEIGHT)
-    visual = visual_similarity(brand_name, conflict_name)
-    phonetic = phonetic_similarity(brand_name, conflict_name)
-    factors["factor_1_mark_similarity"] = {
-        "score": round((visual + phonetic) / 2, 1),
-        "weight": "HIGH",
-        "analysis": f"Visual similarity: {visual:.1f}/10, Phonetic similarity: {phonetic:.1f}/10"
-    }
-    
-    # Factor 2: Similarity of Goods/Services (HIGH WEIGHT)
-    # Get class info for better analysis
-    conflict_class = conflict_data.get("conflict_class") if conflict_data else None
-    user_class = conflict_data.get("user_class") if conflict_data else None
-    
-    if same_category:
-        goods_score = 9  # Same category = high similarity
-        class_analysis = f"Same NICE class ({user_class}). Direct competition likely."
-    elif conflict_data and conflict_data.get("related_category"):
-        goods_score = 6  # Related category
-        class_analysis = f"Related categories (User: Class {user_class}, Conflict: Class {conflict_class}). Some overlap possible."
-    else:
-        goods_score = 2  # Different category
-        class_analysis = f"Different NICE classes (User: Class {user_class}, Conflict: Class {conflict_class}). Different market segments - LOW confusion risk."
-    
-    factors["factor_2_goods_similarity"] = {
-        "score": goods_score,
-        "weight": "HIGH",
-        "analysis": class_analysis
-    }
-    
-    # Factor 3: Trade Channel Overlap (MEDIUM WEIGHT)
-    channel_score = 7 if same_category else 3
-    factors["factor_3_trade_channels"] = {
-        "score": channel_score,
-        "weight": "MEDIUM",
-        "analysis": f"Trade channels {'likely overlap (same industry)' if same_category else 'unlikely to overlap (different industries)'}"
-    }
-    
-    # Factor 4: Purchaser Sophistication (MEDIUM WEIGHT)
-    # Default to moderate sophistication; can be adjusted based on category
-    sophistication_score = 5  # Moderate sophistication
-    factors["factor_4_purchaser_sophistication"] = {
-        "score": sophistication_score,
-        "weight": "MEDIUM",
-        "analysis": "Moderate purchaser sophistication assumed for consumer goods"
-    }
-    
-    # Factor 5: Prior Mark Fame (MEDIUM WEIGHT)
-    fame_score = conflict_data.get("fame_score", 5) if conflict_data else 5
-    factors["factor_5_prior_mark_fame"] = {
-        "score": fame_score,
-        "weight": "MEDIUM",
-        "analysis": f"Prior mark fame level: {'High' if fame_score >= 7 else 'Moderate' if fame_score >= 4 else 'Low'}"
-    }
-    
-    # Factor 6: Number of Similar Marks (LOW WEIGHT)
-    similar_count = conflict_data.get("similar_marks_count", 3) if conflict_data else 3
-    crowded_score = 3 if similar_count > 10 else 6 if similar_count > 5 else 8
-    factors["factor_6_number_similar_marks"] = {
-        "score": crowded_score,
-        "weight": "LOW",
-        "analysis": f"{'Crowded' if similar_count > 10 else 'Moderately crowded' if similar_count > 5 else 'Relatively unique'} namespace with {similar_count} similar marks"
-    }
-    
-    # Factor 7: Actual Confusion Evidence (HIGH WEIGHT)
-    # Default to no evidence unless provided
-    confusion_evidence = conflict_data.get("actual_confusion", False) if conflict_data else False
-    factors["factor_7_actual_confusion"] = {
-        "score": 8 if confusion_evidence else 2,
-        "weight": "HIGH",
-        "analysis": f"Actual confusion evidence: {'Found' if confusion_evidence else 'Not found'}"
-    }
-    
-    # Factor 8: Length of Concurrent Use (LOW WEIGHT)
-    factors["factor_8_concurrent_use_length"] = {
-        "score": 5,
-        "weight": "LOW",
-        "analysis": "No concurrent use history (new application)"
-    }
-    
-    # Factor 9: Variety of Goods (LOW WEIGHT)
-    factors["factor_9_variety_of_goods"] = {
-        "score": 5,
-        "weight": "LOW",
-        "analysis": "Standard product line assumed"
-    }
-    
-    # Factor 10: Market Interface (MEDIUM WEIGHT)
-    interface_score = 8 if same_category else 3
-    factors["factor_10_market_interface"] = {
-        "score": interface_score,
-        "weight": "MEDIUM",
-        "analysis": f"{'Direct market interface' if same_category else 'Minimal market interface'}"
-    }
-    
-    # Factor 11: Junior User's Intent (MEDIUM WEIGHT)
-    factors["factor_11_intent"] = {
-        "score": 3,  # Assume good faith unless evidence suggests otherwise
-        "weight": "MEDIUM",
-        "analysis": "No evidence of intentional copying"
-    }
-    
-    # Factor 12: Bad Faith Registration (MEDIUM WEIGHT)
-    factors["factor_12_bad_faith"] = {
-        "score": 2,
-        "weight": "MEDIUM",
-        "analysis": "No indicators of bad faith registration"
-    }
-    
-    # Factor 13: Extent of Exclusive Rights (LOW WEIGHT)
-    factors["factor_13_extent_exclusive_rights"] = {
-        "score": 5,
-        "weight": "LOW",
-        "analysis": "Standard trademark scope"
-    }
-    
-    # Calculate weighted score
-    weights = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
-    total_weighted = 0
-    total_weights = 0
-    
-    for factor_key, factor_data in factors.items():
-        weight_value = weights[factor_data["weight"]]
-        total_weighted += factor_data["score"] * weight_value
-        total_weights += weight_value
-    
-    weighted_score = round(total_weighted / total_weights, 2)
-    
-    # Determine verdict
-    if weighted_score >= 9.0:
-        verdict = "REJECT"
-        conclusion = "CRITICAL - >90% likelihood of confusion. Litigation certain."
-    elif weighted_score >= 7.0:
-        verdict = "REJECT"
-        conclusion = "HIGH - Likely USPTO refusal or opposition. Strong conflict."
-    elif weighted_score >= 5.0:
-        verdict = "NO-GO"
-        conclusion = "MODERATE - Risky, expensive to defend. Consider alternatives."
-    elif weighted_score >= 3.0:
-        verdict = "CONDITIONAL GO"
-        conclusion = "LOW-MODERATE - Monitor closely. Proceed with caution."
-    else:
-        verdict = "GO"
-        conclusion = "MINIMAL - Safe to proceed. Low confusion risk."
-    
-    return {
-        "brand_name": brand_name,
-        "conflict_name": conflict_name,
-        "dupont_factors": factors,
-        "weighted_likelihood_score": weighted_score,
-        "legal_conclusion": conclusion,
-        "verdict_impact": verdict
-    }
-
-
-def apply_dupont_analysis_to_conflicts(brand_name: str, category: str, conflicts: list) -> dict:
-    """
-    Apply DuPont 13-factor analysis to all conflicts found.
-    Returns the highest-risk conflict with full analysis.
-    """
-    if not conflicts:
-        return {
-            "has_analysis": False,
-            "highest_risk_conflict": None,
-            "overall_dupont_verdict": "GO",
-            "analysis_summary": "No conflicts found requiring DuPont analysis"
-        }
-    
-    highest_score = 0
-    highest_risk_analysis = None
-    all_analyses = []
-    
-    for conflict in conflicts:
-        conflict_name = conflict.get("name", conflict.get("matched_brand", "Unknown"))
-        same_category = conflict.get("same_class_conflict", False) or conflict.get("category") == category
-        
-        # Calculate DuPont score
-        analysis = calculate_dupont_score(
-            brand_name=brand_name,
-            conflict_name=conflict_name,
-            same_category=same_category,
-            conflict_data=conflict
-        )
-        all_analyses.append(analysis)
-        
-        if analysis["weighted_likelihood_score"] > highest_score:
-            highest_score = analysis["weighted_likelihood_score"]
-            highest_risk_analysis = analysis
-    
-    # Determine overall verdict based on highest risk
-    if highest_score >= 7.0:
-        overall_verdict = "REJECT"
-    elif highest_score >= 5.0:
-        overall_verdict = "NO-GO"
-    elif highest_score >= 3.0:
-        overall_verdict = "CONDITIONAL GO"
-    else:
-        overall_verdict = "GO"
-    
-    return {
-        "has_analysis": True,
-        "highest_risk_conflict": highest_risk_analysis,
-        "overall_dupont_verdict": overall_verdict,
-        "all_conflict_analyses": all_analyses,
-        "analysis_summary": f"Analyzed {len(conflicts)} conflict(s). Highest risk score: {highest_score}/10 ({overall_verdict})"
-    }
-
-
 # ============================================================================
 # 🆕 FEATURE 4: ENHANCED SOCIAL MEDIA ACTIVITY ANALYSIS
 # ============================================================================
 # Goes beyond Available/Taken to check verification, activity, engagement
+# (page analysis helpers live in social_service.py alongside the cached probe)
 
 async def check_social_handle_with_activity(platform: str, handle: str) -> dict:
     """
     Enhanced social handle check that includes activity analysis.
     Returns availability + activity status for taken handles.
+    Served from the shared social probe cache (same fetch as the basic social scan).
     """
-    import aiohttp
-    
-    platform_urls = {
-        "instagram": f"https://www.instagram.com/{handle}/",
-        "twitter": f"https://twitter.com/{handle}",
-        "x": f"https://x.com/{handle}",
-        "facebook": f"https://www.facebook.com/{handle}",
-        "linkedin": f"https://www.linkedin.com/company/{handle}",
-        "youtube": f"https://www.youtube.com/@{handle}",
-        "tiktok": f"https://www.tiktok.com/@{handle}",
-        "threads": f"https://www.threads.net/@{handle}",
-        "pinterest": f"https://www.pinterest.com/{handle}/"
-    }
-    
-    url = platform_urls.get(platform.lower())
-    if not url:
-        return {"platform": platform, "handle": handle, "status": "UNSUPPORTED", "available": None}
-    
-    try:
-        timeout = aiohttp.ClientTimeout(total=8)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            async with session.get(url, headers=headers, allow_redirects=True) as response:
-                if response.status == 404:
-                    return {
-                        "platform": platform,
-                        "handle": handle,
-                        "status": "AVAILABLE",
-                        "available": True,
-                        "url": url,
-                        "account_details": None,
-                        "risk_level": "NONE",
-                        "acquisition_viability": {"can_acquire": True, "cost": "$0", "approach": "Direct registration"}
-                    }
-                elif response.status == 200:
-                    content = await response.text()
-                    content_lower = content.lower()
-                    
-                    # Check for "not found" patterns
-                    not_found_patterns = [
-                        "page isn't available", "page not found", "sorry, this page",
-                        "user not found", "account suspended", "doesn't exist",
-                        "this account doesn't exist", "no results found"
-                    ]
-                    
-                    for pattern in not_found_patterns:
-                        if pattern in content_lower:
-                            return {
-                                "platform": platform,
-                                "handle": handle,
-                                "status": "LIKELY AVAILABLE",
-                                "available": True,
-                                "url": url,
-                                "account_details": None,
-                                "risk_level": "NONE",
-                                "acquisition_viability": {"can_acquire": True, "cost": "$0", "approach": "Direct registration"}
-                            }
-                    
-                    # Handle is TAKEN - analyze activity
-                    account_details = analyze_social_account_activity(platform, content)
-                    risk_level = calculate_social_risk_level(account_details)
-                    acquisition = calculate_acquisition_viability(platform, account_details, risk_level)
-                    
-                    return {
-                        "platform": platform,
-                        "handle": handle,
-                        "status": "TAKEN",
-                        "available": False,
-                        "url": url,
-                        "account_details": account_details,
-                        "risk_level": risk_level,
-                        "acquisition_viability": acquisition
-                    }
-                else:
-                    return {
-                        "platform": platform,
-                        "handle": handle,
-                        "status": "TAKEN",
-                        "available": False,
-                        "url": url,
-                        "account_details": {"analysis_available": False},
-                        "risk_level": "UNKNOWN",
-                        "acquisition_viability": {"can_acquire": "UNKNOWN", "approach": "Manual verification needed"}
-                    }
-    except asyncio.TimeoutError:
-        return {"platform": platform, "handle": handle, "status": "TIMEOUT", "available": None, "risk_level": "UNKNOWN"}
-    except Exception as e:
-        logging.warning(f"Enhanced social check error for {platform}/{handle}: {e}")
-        return {"platform": platform, "handle": handle, "status": "ERROR", "available": None, "risk_level": "UNKNOWN"}
-
-
-def analyze_social_account_activity(platform: str, content: str) -> dict:
-    """
-    Analyze social account activity from page content.
-    Extracts follower count, verification status, activity level.
-    """
-    import re
-    
-    details = {
-        "is_verified": False,
-        "is_business_account": False,
-        "follower_count": None,
-        "posting_frequency": "UNKNOWN",
-        "engagement_estimate": "UNKNOWN",
-        "account_type": "UNKNOWN",
-        "analysis_available": True
-    }
-    
-    content_lower = content.lower()
-    
-    # Check for verification badges
-    verification_indicators = [
-        'verified', 'verification badge', 'blue check', 'verified account',
-        '"isVerified":true', '"verified":true', 'aria-label="verified"'
-    ]
-    for indicator in verification_indicators:
-        if indicator in content_lower:
-            details["is_verified"] = True
-            break
-    
-    # Check for business account indicators
-    business_indicators = [
-        'business account', 'professional account', 'creator account',
-        'shop now', 'contact us', 'website:', 'email:', 'category:'
-    ]
-    for indicator in business_indicators:
-        if indicator in content_lower:
-            details["is_business_account"] = True
-            break
-    
-    # Try to extract follower count (platform-specific patterns)
-    follower_patterns = [
-        r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|m|b)?\s*(?:followers|following)',
-        r'"edge_followed_by":\s*{\s*"count":\s*(\d+)',  # Instagram
-        r'"followers_count":\s*(\d+)',  # Twitter
-        r'(\d+(?:,\d+)*)\s*Followers',
-        r'Followers["\s:]+(\d+(?:,\d+)*)',
-    ]
-    
-    for pattern in follower_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            count_str = match.group(1).replace(',', '')
-            try:
-                count = float(count_str)
-                # Handle K, M, B suffixes
-                suffix_match = re.search(r'(\d+(?:\.\d+)?)\s*([kmb])', match.group(0).lower())
-                if suffix_match:
-                    multipliers = {'k': 1000, 'm': 1000000, 'b': 1000000000}
-                    count = float(suffix_match.group(1)) * multipliers.get(suffix_match.group(2), 1)
-                details["follower_count"] = int(count)
-                break
-            except:
-                pass
-    
-    # Estimate activity level based on content cues
-    if 'posted' in content_lower or 'hours ago' in content_lower or 'minutes ago' in content_lower:
-        details["posting_frequency"] = "ACTIVE"
-    elif 'days ago' in content_lower or 'yesterday' in content_lower:
-        details["posting_frequency"] = "RECENT"
-    elif 'weeks ago' in content_lower or 'months ago' in content_lower:
-        details["posting_frequency"] = "SPORADIC"
-    elif 'years ago' in content_lower or 'year ago' in content_lower:
-        details["posting_frequency"] = "ABANDONED"
-    
-    return details
-
-
-def calculate_social_risk_level(account_details: dict) -> str:
-    """
-    Calculate risk level based on account activity.
-    
-    FATAL: Verified account with large following - cannot acquire
-    HIGH: Active business with moderate following
-    MEDIUM: Active personal account or small business
-    LOW: Abandoned or minimal activity account
-    NONE: Available
-    """
-    if not account_details or not account_details.get("analysis_available"):
-        return "UNKNOWN"
-    
-    is_verified = account_details.get("is_verified", False)
-    is_business = account_details.get("is_business_account", False)
-    followers = account_details.get("follower_count") or 0
-    activity = account_details.get("posting_frequency", "UNKNOWN")
-    
-    # FATAL: Verified with large following
-    if is_verified and followers > 100000:
-        return "FATAL"
-    
-    # FATAL: Any verified account
-    if is_verified:
-        return "FATAL"
-    
-    # HIGH: Large following or active business
-    if followers > 50000:
-        return "HIGH"
-    if is_business and followers > 10000:
-        return "HIGH"
-    
-    # MEDIUM: Active account with moderate following
-    if activity in ["ACTIVE", "RECENT"] and followers > 1000:
-        return "MEDIUM"
-    if is_business and activity in ["ACTIVE", "RECENT"]:
-        return "MEDIUM"
-    
-    # LOW: Abandoned or minimal activity
-    if activity in ["ABANDONED", "SPORADIC"] or followers < 100:
-        return "LOW"
-    
-    return "MEDIUM"
-
-
-def calculate_acquisition_viability(platform: str, account_details: dict, risk_level: str) -> dict:
-    """
-    Calculate acquisition viability and estimated costs.
-    """
-    if risk_level == "FATAL":
-        return {
-            "can_acquire": False,
-            "reason": "Verified/high-profile account - not acquirable",
-            "estimated_cost": "N/A",
-            "approach": "Choose alternative handle or brand name"
-        }
-    
-    if risk_level == "HIGH":
-        followers = account_details.get("follower_count") or 0
-        cost_estimate = "$5,000-$25,000" if followers > 50000 else "$2,000-$10,000"
-        return {
-            "can_acquire": "MAYBE",
-            "reason": "Active account with significant following",
-            "estimated_cost": cost_estimate,
-            "approach": "Negotiate via broker (hide buyer identity)",
-            "success_probability": "30%"
-        }
-    
-    if risk_level == "MEDIUM":
-        return {
-            "can_acquire": "LIKELY",
-            "reason": "Moderate activity - negotiation possible",
-            "estimated_cost": "$500-$3,000",
-            "approach": "Direct outreach or platform inactive username request",
-            "success_probability": "50%"
-        }
-    
-    if risk_level == "LOW":
-        activity = account_details.get("posting_frequency", "UNKNOWN")
-        if activity == "ABANDONED":
-            return {
-                "can_acquire": True,
-                "reason": "Abandoned account (5+ years inactive)",
-                "estimated_cost": "$0-$500",
-                "approach": "Request inactive username release via platform support",
-                "success_probability": "70%"
-            }
-        return {
-            "can_acquire": True,
-            "reason": "Minimal activity account",
-            "estimated_cost": "$200-$1,000",
-            "approach": "Direct negotiation",
-            "success_probability": "60%"
-        }
-    
-    return {
-        "can_acquire": "UNKNOWN",
-        "approach": "Manual verification needed"
-    }
+    return await social_service.probe(platform, handle)
 
 
 async def check_social_availability_enhanced(brand_name: str, countries: list) -> dict:
@@ -9280,20 +8259,17 @@ def fix_llm_response_types(data: dict) -> dict:
     
     return data
 
-def check_domain_availability(brand_name: str) -> str:
+async def check_domain_availability(brand_name: str) -> str:
     domain = f"{brand_name.lower().replace(' ', '')}.com"
-    try:
-        w = whois.whois(domain)
-        if w.domain_name or w.creation_date:
-            return f"{domain}: TAKEN (Registered). Use this FACT. Do not say it might be available."
-        else:
-            return f"{domain}: LIKELY AVAILABLE (No whois record found)."
-    except Exception as e:
-        error_str = str(e).lower()
-        if "no match for" in error_str or "not found" in error_str:
-            return f"{domain}: AVAILABLE (No whois record found). Use this FACT."
-        else:
-            return f"{domain}: CHECK FAILED (Error: {str(e)}). Assume TAKEN to be safe."
+    # Shared cached lookup - availability.check_multi_domain_availability reuses this .com result
+    result = await domain_service.check(domain)
+    status = result.get("status")
+    if status == "TAKEN":
+        return f"{domain}: TAKEN (Registered). Use this FACT. Do not say it might be available."
+    elif status == "AVAILABLE":
+        return f"{domain}: AVAILABLE (No whois record found). Use this FACT."
+    else:
+        return f"{domain}: CHECK FAILED (Error: {result.get('error', status)}). Assume TAKEN to be safe."
 
 def clean_json_string(s):
     """
@@ -9649,6 +8625,32 @@ FAMOUS_BRANDS = {
     "smart bazaar", "smartbazaar", "vishal mega mart", "vishal megamart", "v-mart", "vmart"
 }
 
+# Phonetic bucket index over every brand corpus (similarity.py's + FAMOUS_BRANDS)
+BRAND_PHONETIC_INDEX = PHONETIC_INDEX.with_corpus("famous_brands", sorted(FAMOUS_BRANDS))
+
+# (famous, spaces removed, sound-substituted) - precomputed for check_famous_brand's Jaro-Winkler pass
+FAMOUS_BRAND_SPELLINGS = tuple(
+    (famous, famous.replace(" ", ""), phonetic_normalize(famous.replace(" ", ""))) for famous in FAMOUS_BRANDS
+)
+
+# Normalized forms of each famous brand, indexed for check_famous_brand's exact
+# and containment passes (dict / trigram lookups instead of a scan per call)
+def _famous_brand_forms(famous: str) -> tuple:
+    clean = famous.replace(" ", "").replace("-", "")
+    dedupe = re.sub(r'(.)\1+', r'\1', clean)
+    singular = clean.rstrip('s') if len(clean) > 3 else clean
+    return famous, clean, dedupe, singular
+
+FAMOUS_BRAND_FORMS = tuple(_famous_brand_forms(famous) for famous in sorted(FAMOUS_BRANDS))
+FAMOUS_BY_CLEAN = {}
+FAMOUS_BY_DEDUPE = {}
+FAMOUS_BY_SINGULAR = {}
+for _famous, _clean, _dedupe, _singular in FAMOUS_BRAND_FORMS:
+    FAMOUS_BY_CLEAN.setdefault(_clean, _famous)
+    FAMOUS_BY_DEDUPE.setdefault(_dedupe, _famous)
+    FAMOUS_BY_SINGULAR.setdefault(_singular, _famous)
+FAMOUS_CLEAN_INDEX = TrigramIndex(clean for _, clean, _, _ in FAMOUS_BRAND_FORMS)
+
 # INAPPROPRIATE/OFFENSIVE WORDS - Brand names that sound like or contain these should be REJECTED
 INAPPROPRIATE_PATTERNS = [
     # Sexual/Vulgar terms and phonetic variants
@@ -9672,6 +8674,7 @@ INAPPROPRIATE_PATTERNS = [
     # Violence
     "rape",
 ]
+INAPPROPRIATE_MATCHER = PatternMatcher(INAPPROPRIATE_PATTERNS)
 
 def check_inappropriate_name(brand_name: str) -> dict:
     """
@@ -9680,255 +8683,42 @@ def check_inappropriate_name(brand_name: str) -> dict:
     """
     normalized = brand_name.lower().strip().replace(" ", "").replace("-", "").replace("_", "")
     
-    # Check for inappropriate patterns - EXACT MATCH ONLY
-    for pattern in INAPPROPRIATE_PATTERNS:
-        if pattern in normalized:
-            return {
-                "is_inappropriate": True,
-                "matched_pattern": pattern,
-                "reason": f"'{brand_name}' contains inappropriate/offensive content. This brand name cannot be used commercially."
-            }
+    # Check for inappropriate patterns - EXACT MATCH ONLY (first in table order)
+    pattern_id = INAPPROPRIATE_MATCHER.first(normalized)
+    if pattern_id is not None:
+        return {
+            "is_inappropriate": True,
+            "matched_pattern": INAPPROPRIATE_PATTERNS[pattern_id],
+            "reason": f"'{brand_name}' contains inappropriate/offensive content. This brand name cannot be used commercially."
+        }
     
     return {"is_inappropriate": False}
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# PRONOUNCEABILITY CHECK - Early Gate for Gibberish Detection
-# ═══════════════════════════════════════════════════════════════════════════════
-# This check runs BEFORE expensive LLM calls to catch unpronounceable names
-# like "rcnvkjznvvjajf" that should not receive high scores.
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def check_pronounceability(brand_name: str) -> dict:
+async def google_search(query: str, num_results: int = 10) -> dict:
     """
-    Check if a brand name is pronounceable and readable.
-    
-    This catches gibberish/random character strings that:
-    - Have too few vowels
-    - Have long consonant clusters
-    - Cannot be broken into syllables
-    - Are essentially unpronounceable
-    
-    Returns:
-        dict with:
-        - is_pronounceable: bool
-        - score: 0-100 pronounceability score
-        - issues: list of specific problems
-        - verdict: PASS, CAUTION, or FAIL
-        - score_cap: maximum score this name should receive (if failing)
-    """
-    if not brand_name or len(brand_name) < 2:
-        return {
-            "is_pronounceable": False,
-            "score": 0,
-            "issues": ["Brand name too short"],
-            "verdict": "FAIL",
-            "score_cap": 10
-        }
-    
-    name_lower = brand_name.lower().strip()
-    
-    # Remove spaces, hyphens for analysis of core pronounceability
-    clean_name = ''.join(c for c in name_lower if c.isalpha())
-    
-    if len(clean_name) < 2:
-        return {
-            "is_pronounceable": False,
-            "score": 0,
-            "issues": ["No alphabetic characters"],
-            "verdict": "FAIL",
-            "score_cap": 10
-        }
-    
-    issues = []
-    score = 100  # Start with perfect score and deduct
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 1: VOWEL RATIO (Should be 25-55% for pronounceability)
-    # ═══════════════════════════════════════════════════════════════════════════
-    vowels = set('aeiou')
-    vowel_count = sum(1 for c in clean_name if c in vowels)
-    vowel_ratio = vowel_count / len(clean_name)
-    
-    if vowel_ratio < 0.10:  # Less than 10% vowels = gibberish
-        penalty = 60
-        score -= penalty
-        issues.append(f"CRITICAL: Only {vowel_ratio:.0%} vowels ({vowel_count}/{len(clean_name)}) - virtually unpronounceable")
-    elif vowel_ratio < 0.20:  # Less than 20% vowels = very hard
-        penalty = 40
-        score -= penalty
-        issues.append(f"SEVERE: Only {vowel_ratio:.0%} vowels ({vowel_count}/{len(clean_name)}) - extremely difficult to pronounce")
-    elif vowel_ratio < 0.25:  # Less than 25% vowels = hard
-        penalty = 25
-        score -= penalty
-        issues.append(f"LOW: Only {vowel_ratio:.0%} vowels - hard to pronounce")
-    elif vowel_ratio > 0.70:  # More than 70% vowels = odd sounding
-        penalty = 15
-        score -= penalty
-        issues.append(f"HIGH: {vowel_ratio:.0%} vowels - may sound odd")
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 2: CONSONANT CLUSTERS (More than 3 consecutive = hard to say)
-    # ═══════════════════════════════════════════════════════════════════════════
-    import re
-    consonants = 'bcdfghjklmnpqrstvwxyz'
-    
-    # Find all consonant clusters
-    consonant_pattern = f'[{consonants}]+'
-    clusters = re.findall(consonant_pattern, clean_name)
-    
-    max_cluster_length = max(len(c) for c in clusters) if clusters else 0
-    long_clusters = [c for c in clusters if len(c) >= 4]
-    very_long_clusters = [c for c in clusters if len(c) >= 6]
-    
-    if very_long_clusters:  # 6+ consonants in a row = gibberish
-        penalty = 50
-        score -= penalty
-        issues.append(f"CRITICAL: Consonant cluster '{very_long_clusters[0]}' ({len(very_long_clusters[0])} consonants) - unpronounceable")
-    elif long_clusters:  # 4-5 consonants in a row = difficult
-        penalty = 25
-        score -= penalty
-        issues.append(f"DIFFICULT: Consonant cluster '{long_clusters[0]}' ({len(long_clusters[0])} consonants)")
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 3: SYLLABLE STRUCTURE (Need vowels to form syllables)
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Estimate syllables by counting vowel groups
-    vowel_groups = re.findall(f'[{vowels}]+', clean_name)
-    estimated_syllables = len(vowel_groups)
-    
-    if estimated_syllables == 0:  # No syllables possible
-        penalty = 50
-        score -= penalty
-        issues.append("CRITICAL: No syllables can be formed - no vowel groups")
-    elif estimated_syllables == 1 and len(clean_name) > 8:  # Long name with only 1 syllable
-        penalty = 20
-        score -= penalty
-        issues.append(f"UNBALANCED: {len(clean_name)} characters but only ~1 syllable")
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 4: REPEATED CHARACTERS (Signs of keyboard mashing)
-    # ═══════════════════════════════════════════════════════════════════════════
-    repeated_pattern = r'(.)\1{2,}'  # Same character 3+ times
-    repeated = re.findall(repeated_pattern, clean_name)
-    if repeated:
-        penalty = 20
-        score -= penalty
-        issues.append(f"REPETITION: Character '{repeated[0]}' repeated excessively")
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 5: COMMON LETTER PATTERNS (Real words have common bigrams)
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Common English bigrams that appear in real words
-    common_bigrams = {'th', 'he', 'in', 'er', 'an', 'on', 'at', 'en', 'es', 'ed', 
-                      'or', 'te', 'of', 'to', 're', 'it', 'is', 'al', 'ar', 'st',
-                      'le', 'se', 'ea', 'ou', 'io', 'co', 'ca', 'ma', 'me', 'mo',
-                      'ta', 'ti', 'tr', 'pr', 'sp', 'ch', 'sh', 'wh', 'qu', 'br',
-                      'bl', 'cl', 'cr', 'dr', 'fl', 'fr', 'gl', 'gr', 'pl', 'sc',
-                      'sk', 'sl', 'sm', 'sn', 'sw', 'tw', 'wr', 'ai', 'au', 'aw',
-                      'ay', 'ee', 'ei', 'ey', 'ie', 'oa', 'oo', 'ow', 'oy', 'ue'}
-    
-    # Count how many bigrams in the name are common
-    name_bigrams = [clean_name[i:i+2] for i in range(len(clean_name)-1)]
-    common_count = sum(1 for bg in name_bigrams if bg in common_bigrams)
-    
-    if len(name_bigrams) > 0:
-        common_ratio = common_count / len(name_bigrams)
-        if common_ratio < 0.1 and len(clean_name) > 5:  # Less than 10% common bigrams
-            penalty = 30
-            score -= penalty
-            issues.append(f"UNUSUAL: Only {common_ratio:.0%} common letter patterns - looks like random characters")
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # CHECK 6: LENGTH vs COMPLEXITY
-    # ═══════════════════════════════════════════════════════════════════════════
-    if len(clean_name) > 12 and estimated_syllables <= 2:
-        penalty = 15
-        score -= penalty
-        issues.append(f"IMBALANCED: {len(clean_name)} characters with only ~{estimated_syllables} syllables")
-    
-    # Ensure score stays within bounds
-    score = max(0, min(100, score))
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # DETERMINE VERDICT AND SCORE CAP
-    # ═══════════════════════════════════════════════════════════════════════════
-    if score >= 70:
-        verdict = "PASS"
-        score_cap = None  # No cap for pronounceable names
-        is_pronounceable = True
-    elif score >= 40:
-        verdict = "CAUTION"
-        score_cap = 50  # Cap at 50 for difficult names
-        is_pronounceable = True
-    elif score >= 20:
-        verdict = "POOR"
-        score_cap = 35  # Cap at 35 for poor names
-        is_pronounceable = False
-    else:
-        verdict = "FAIL"
-        score_cap = 25  # Cap at 25 for gibberish
-        is_pronounceable = False
-    
-    return {
-        "is_pronounceable": is_pronounceable,
-        "score": score,
-        "vowel_ratio": vowel_ratio,
-        "max_consonant_cluster": max_cluster_length,
-        "estimated_syllables": estimated_syllables,
-        "issues": issues,
-        "verdict": verdict,
-        "score_cap": score_cap,
-        "analysis": {
-            "vowel_count": vowel_count,
-            "consonant_count": len(clean_name) - vowel_count,
-            "total_length": len(clean_name),
-            "vowel_percentage": f"{vowel_ratio:.0%}",
-            "syllable_estimate": estimated_syllables,
-            "longest_consonant_cluster": max_cluster_length
-        }
-    }
-
-
-async def google_search(query: str, num_results: int = 10) -> dict:
-    """
-    Search using Google Custom Search API.
-    Returns structured results with title, link, snippet.
-    Falls back to empty results on error.
+    Search using Google Custom Search API (via the shared search service cache).
+    Returns structured results with title, link, snippet.
+    Falls back to empty results on error.
     """
     if not GOOGLE_API_KEY or not GOOGLE_SEARCH_ENGINE_ID:
         logging.warning("Google Search API not configured")
         return {"items": [], "totalResults": "0", "error": "Not configured"}
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params={
-                    "q": query,
-                    "cx": GOOGLE_SEARCH_ENGINE_ID,
-                    "key": GOOGLE_API_KEY,
-                    "num": min(num_results, 10)  # Google limits to 10 per request
-                },
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    total = data.get('searchInformation', {}).get('totalResults', '0')
-                    items = data.get('items', [])
-                    logging.info(f"🔍 Google Search '{query}': {len(items)} results, {total} total")
-                    return {
-                        "items": items,
-                        "totalResults": total,
-                        "error": None
-                    }
-                else:
-                    error_text = await response.text()
-                    logging.error(f"Google Search API error: {response.status} - {error_text[:200]}")
-                    return {"items": [], "totalResults": "0", "error": f"API error: {response.status}"}
-    except Exception as e:
-        logging.error(f"Google Search failed: {e}")
-        return {"items": [], "totalResults": "0", "error": str(e)}
+    response = await search_service.search(query, num_results=min(num_results, 10), providers=["google"])
+    items = [
+        {"title": r["title"], "link": r["url"], "snippet": r["snippet"], "displayLink": r["display_link"]}
+        for r in response["results"]
+    ]
+    error = response["errors"].get("google")
+    if error:
+        logging.error(f"Google Search API error: {error}")
+    logging.info(f"🔍 Google Search '{query}': {len(items)} results, {response['total_results']} total")
+    return {
+        "items": items,
+        "totalResults": str(response["total_results"] or 0),
+        "error": error
+    }
 
 
 async def check_brand_exists_google(brand_name: str, category: str = "") -> dict:
@@ -10014,17 +8804,16 @@ async def check_brand_exists_google(brand_name: str, category: str = "") -> dict
 async def dynamic_brand_search(brand_name: str, category: str = "") -> dict:
     """
     ENHANCED BRAND CONFLICT DETECTION using Google Search API + LLM verification
-    
+
     1. First use Google Search API to check if brand exists (most reliable)
     2. Fall back to Bing scraping if Google fails
     3. Use LLM to verify and analyze conflicts
     """
     import re
-    import aiohttp
-    
+
     print(f"🔍 BRAND CHECK: '{brand_name}' in category '{category}'", flush=True)
     logging.info(f"🔍 BRAND CHECK: '{brand_name}' in category '{category}'")
-    
+
     result = {
         "exists": False,
         "confidence": "LOW",
@@ -10032,32 +8821,32 @@ async def dynamic_brand_search(brand_name: str, category: str = "") -> dict:
         "evidence": [],
         "reason": ""
     }
-    
+
     # ========== STEP 1: GOOGLE SEARCH API (Primary - Most Reliable) ==========
     google_result = None
     google_evidence = []
     if GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID:
         print(f"🔍 Using Google Search API for '{brand_name}'...", flush=True)
         google_result = await check_brand_exists_google(brand_name, category)
-        
+
         if google_result["exists"] and google_result["confidence"] in ["HIGH", "MEDIUM"]:
             print(f"✅ Google found '{brand_name}' with {google_result['confidence']} confidence - will check NICE class via LLM", flush=True)
             google_evidence = google_result.get("evidence", [])
             # NOTE: Do NOT return here - we need to check NICE class via LLM
             # The brand might exist in a DIFFERENT class which is NOT a conflict
-    
+
     # ========== STEP 2: BING FALLBACK (If Google not available or inconclusive) ==========
     web_evidence = []
     brand_found_online = False
     web_confidence = "LOW"
-    
+
     try:
         brand_lower = brand_name.lower().replace(" ", "")
         brand_with_space = brand_name.lower()
-        
+
         # ENHANCED: Search with category context for better detection
         category_terms = category.lower() if category else ""
-        
+
         # Multiple search queries for comprehensive detection
         search_queries = [
             f'"{brand_name}"',  # Basic exact match
@@ -10066,108 +8855,101 @@ async def dynamic_brand_search(brand_name: str, category: str = "") -> dict:
             f'"{brand_name}" products' if category_terms else None,  # Brand products
         ]
         search_queries = [q for q in search_queries if q]
-        
+
         combined_mentions = 0
         combined_signals = []
-        
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            
-            # Run multiple search queries for better detection
-            for search_query in search_queries[:2]:  # Limit to 2 queries to avoid rate limiting
-                try:
-                    search_url = f"https://www.bing.com/search?q={search_query.replace(' ', '+')}"
-                    async with session.get(search_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            html_lower = html.lower()
-                            
-                            # Count exact brand mentions
-                            brand_pattern = re.escape(brand_with_space)
-                            mentions = len(re.findall(brand_pattern, html_lower))
-                            combined_mentions += mentions
-                            
-                            # Check for strong signals (platform presence)
-                            if any(f"{brand_lower}.{ext}" in html_lower for ext in ["com", "in", "co.in", "co"]):
-                                if "domain" not in combined_signals:
-                                    combined_signals.append("domain")
-                            if "zomato" in html_lower and mentions >= 1:
-                                if "zomato" not in combined_signals:
-                                    combined_signals.append("zomato")
-                            if "swiggy" in html_lower and mentions >= 1:
-                                if "swiggy" not in combined_signals:
-                                    combined_signals.append("swiggy")
-                            if "justdial" in html_lower and mentions >= 1:
-                                if "justdial" not in combined_signals:
-                                    combined_signals.append("justdial")
-                            # E-commerce platforms - only count if brand appears in URL or result title
-                            # Avoid false positives from generic platform mentions on search results pages
-                            # Check for brand name in Amazon/Flipkart product URLs or result snippets
-                            brand_with_platform_patterns = [
-                                f"amazon.in/.*{brand_lower}",
-                                f"amazon.com/.*{brand_lower}",
-                                f"{brand_lower}.*amazon",
-                                f"flipkart.com/.*{brand_lower}",
-                                f"{brand_lower}.*flipkart",
-                                f"jiomart.com/.*{brand_lower}",
-                                f"{brand_lower}.*jiomart",
-                                f"bigbasket.com/.*{brand_lower}",
-                                f"{brand_lower}.*bigbasket",
-                            ]
-                            
-                            for pattern in brand_with_platform_patterns:
-                                if re.search(pattern, html_lower):
-                                    if "ecommerce" not in combined_signals:
-                                        combined_signals.append("ecommerce")
-                                    break
-                                    
-                            print(f"🔎 WEB QUERY '{search_query}': '{brand_name}' mentions={mentions}", flush=True)
-                except Exception as e:
-                    logging.warning(f"Search query failed: {search_query}, error: {e}")
-            
-            print(f"🔎 WEB TOTAL: '{brand_name}' total_mentions={combined_mentions}, signals={combined_signals}", flush=True)
-            logging.warning(f"🔎 WEB: '{brand_name}' mentions={combined_mentions}, strong={combined_signals}")
-            
-            # ENHANCED DETECTION RULES:
-            # Rule 1: Platform presence (domain, ecommerce, food platforms) = HIGH confidence
-            if len(combined_signals) >= 1:
-                brand_found_online = True
-                web_confidence = "HIGH"
-                web_evidence = [f"mentions:{combined_mentions}"] + combined_signals
-                logging.warning(f"🌐 WEB HIGH: '{brand_name}' found on business platform!")
-            
-            # Rule 2: Multiple mentions = MEDIUM confidence
-            elif combined_mentions >= 3:
-                brand_found_online = True
-                web_confidence = "MEDIUM"
-                web_evidence = [f"mentions:{combined_mentions}"]
-                logging.warning(f"🌐 WEB MEDIUM: '{brand_name}' has {combined_mentions} search mentions")
-            
-            # Rule 3: Some mentions = LOW confidence
-            elif combined_mentions >= 1:
-                brand_found_online = True
-                web_confidence = "LOW"
-                web_evidence = [f"mentions:{combined_mentions}"]
-                logging.warning(f"🌐 WEB LOW: '{brand_name}' has {combined_mentions} mentions")
-                        
+
+        # Run multiple search queries for better detection
+        for search_query in search_queries[:2]:  # Limit to 2 queries to avoid rate limiting
+            try:
+                html = await search_service.search_html(search_query)
+                if html:
+                    html_lower = html.lower()
+
+                    # Count exact brand mentions
+                    brand_pattern = re.escape(brand_with_space)
+                    mentions = len(re.findall(brand_pattern, html_lower))
+                    combined_mentions += mentions
+
+                    # Check for strong signals (platform presence)
+                    if any(f"{brand_lower}.{ext}" in html_lower for ext in ["com", "in", "co.in", "co"]):
+                        if "domain" not in combined_signals:
+                            combined_signals.append("domain")
+                    if "zomato" in html_lower and mentions >= 1:
+                        if "zomato" not in combined_signals:
+                            combined_signals.append("zomato")
+                    if "swiggy" in html_lower and mentions >= 1:
+                        if "swiggy" not in combined_signals:
+                            combined_signals.append("swiggy")
+                    if "justdial" in html_lower and mentions >= 1:
+                        if "justdial" not in combined_signals:
+                            combined_signals.append("justdial")
+                    # E-commerce platforms - only count if brand appears in URL or result title
+                    # Avoid false positives from generic platform mentions on search results pages
+                    # Check for brand name in Amazon/Flipkart product URLs or result snippets
+                    brand_with_platform_patterns = [
+                        f"amazon.in/.*{brand_lower}",
+                        f"amazon.com/.*{brand_lower}",
+                        f"{brand_lower}.*amazon",
+                        f"flipkart.com/.*{brand_lower}",
+                        f"{brand_lower}.*flipkart",
+                        f"jiomart.com/.*{brand_lower}",
+                        f"{brand_lower}.*jiomart",
+                        f"bigbasket.com/.*{brand_lower}",
+                        f"{brand_lower}.*bigbasket",
+                    ]
+
+                    for pattern in brand_with_platform_patterns:
+                        if re.search(pattern, html_lower):
+                            if "ecommerce" not in combined_signals:
+                                combined_signals.append("ecommerce")
+                            break
+
+                    print(f"🔎 WEB QUERY '{search_query}': '{brand_name}' mentions={mentions}", flush=True)
+            except Exception as e:
+                logging.warning(f"Search query failed: {search_query}, error: {e}")
+
+        print(f"🔎 WEB TOTAL: '{brand_name}' total_mentions={combined_mentions}, signals={combined_signals}", flush=True)
+        logging.warning(f"🔎 WEB: '{brand_name}' mentions={combined_mentions}, strong={combined_signals}")
+
+        # ENHANCED DETECTION RULES:
+        # Rule 1: Platform presence (domain, ecommerce, food platforms) = HIGH confidence
+        if len(combined_signals) >= 1:
+            brand_found_online = True
+            web_confidence = "HIGH"
+            web_evidence = [f"mentions:{combined_mentions}"] + combined_signals
+            logging.warning(f"🌐 WEB HIGH: '{brand_name}' found on business platform!")
+
+        # Rule 2: Multiple mentions = MEDIUM confidence
+        elif combined_mentions >= 3:
+            brand_found_online = True
+            web_confidence = "MEDIUM"
+            web_evidence = [f"mentions:{combined_mentions}"]
+            logging.warning(f"🌐 WEB MEDIUM: '{brand_name}' has {combined_mentions} search mentions")
+
+        # Rule 3: Some mentions = LOW confidence
+        elif combined_mentions >= 1:
+            brand_found_online = True
+            web_confidence = "LOW"
+            web_evidence = [f"mentions:{combined_mentions}"]
+            logging.warning(f"🌐 WEB LOW: '{brand_name}' has {combined_mentions} mentions")
+
     except Exception as e:
         logging.error(f"Web search failed for {brand_name}: {e}")
-    
+
     # ========== STEP 2: LLM CHECK ==========
     # Use LLM to check for brand conflicts
     # Get user's NICE class for comparison
     user_nice_class = get_nice_classification(category)
     user_class_number = user_nice_class.get("class_number", 35)
-    
+
     try:
         if not LlmChat or not EMERGENT_KEY:
             logging.warning("LLM not available, skipping brand check")
             return result
-        
+
         llm = LlmChat(EMERGENT_KEY, "openai", "gpt-4o-mini")  # Most reliable model
-        
+
         prompt = f"""You are a trademark and brand expert. Analyze this brand name for conflicts.
 
 BRAND NAME: {brand_name}
@@ -10230,9 +9012,9 @@ Return ONLY the JSON, no other text."""
         # send_message is async and expects UserMessage object
         user_msg = UserMessage(text=prompt)
         response = await llm.send_message(user_msg)
-        
+
         print(f"📝 LLM Response for '{brand_name}': {response[:200]}...", flush=True)
-        
+
         # Parse LLM response
         import json
         try:
@@ -10241,24 +9023,24 @@ Return ONLY the JSON, no other text."""
             if clean_response.startswith("```"):
                 clean_response = re.sub(r'^```json?\n?', '', clean_response)
                 clean_response = re.sub(r'\n?```$', '', clean_response)
-            
+
             llm_result = json.loads(clean_response)
-            
+
             print(f"📊 Parsed LLM result for '{brand_name}': conflict={llm_result.get('has_conflict')}, confidence={llm_result.get('confidence')}", flush=True)
-            
+
             # Check if LLM says brand already exists OR has conflict
             brand_exists = llm_result.get("brand_already_exists", False)
             has_conflict = llm_result.get("has_conflict", False)
             same_class_conflict = llm_result.get("same_class_conflict", True)  # Default to True for safety
             conflicting_brand_class = llm_result.get("conflicting_brand_nice_class")
             conflicting_brand_industry = llm_result.get("conflicting_brand_industry", "Unknown")
-            
+
             # ============ NICE CLASS FILTER ============
             # If LLM detected a brand but it's in a DIFFERENT NICE class, it's NOT a real conflict
             if (has_conflict or brand_exists) and not same_class_conflict:
                 print(f"✅ CROSS-CLASS FALSE POSITIVE: '{brand_name}' exists as {conflicting_brand_industry} (Class {conflicting_brand_class}), but user wants Class {user_class_number}. ALLOWING.", flush=True)
                 logging.info(f"✅ CROSS-CLASS FALSE POSITIVE: '{brand_name}' - Existing brand in Class {conflicting_brand_class}, User wants Class {user_class_number}. DIFFERENT CLASSES = NO CONFLICT")
-                
+
                 result["exists"] = False
                 result["confidence"] = "LOW"
                 result["matched_brand"] = None
@@ -10270,13 +9052,13 @@ Return ONLY the JSON, no other text."""
                     "nice_class": conflicting_brand_class
                 }
                 return result
-            
+
             if (has_conflict or brand_exists) and llm_result.get("confidence") in ["HIGH", "MEDIUM"] and same_class_conflict:
                 # ============ VERIFICATION LAYER ============
                 # LLM flagged a SAME-CLASS conflict - now VERIFY with real evidence
                 print(f"⚠️ LLM flagged '{brand_name}' (SAME CLASS {conflicting_brand_class}) - Running verification layer...", flush=True)
                 logging.info(f"⚠️ LLM flagged '{brand_name}' (SAME CLASS conflict) - Running verification layer...")
-                
+
                 verification = await verify_brand_conflict(
                     brand_name=brand_name,
                     industry=category,
@@ -10284,7 +9066,7 @@ Return ONLY the JSON, no other text."""
                     country="India",  # Default to India, can be passed from request
                     matched_brand=llm_result.get("conflicting_brand")
                 )
-                
+
                 if verification["verified"]:
                     # CONFIRMED: Real evidence found - REJECT
                     result["exists"] = True
@@ -10298,7 +9080,7 @@ Return ONLY the JSON, no other text."""
                     result["conflicting_brand_class"] = conflicting_brand_class
                     if brand_exists:
                         result["reason"] = f"VERIFIED EXISTING BRAND (SAME CLASS {conflicting_brand_class}): {result['reason']}"
-                    
+
                     print(f"🚨 VERIFIED SAME-CLASS CONFLICT: '{brand_name}' - Evidence Score: {verification['evidence_score']}", flush=True)
                     logging.warning(f"🚨 VERIFIED SAME-CLASS CONFLICT: '{brand_name}' - Evidence: {verification['evidence_found'][:3]}")
                 else:
@@ -10309,20 +9091,20 @@ Return ONLY the JSON, no other text."""
                     result["evidence"] = []
                     result["reason"] = f"AI initially flagged but verification found NO evidence of existing brand"
                     result["false_positive_avoided"] = True
-                    
+
                     print(f"✅ FALSE POSITIVE AVOIDED: '{brand_name}' - LLM flagged but no real evidence found (score: {verification['evidence_score']})", flush=True)
                     logging.info(f"✅ FALSE POSITIVE AVOIDED: '{brand_name}' - Verification score: {verification['evidence_score']} (below threshold)")
-            
+
             # If LLM says no conflict but web search found evidence, check confidence
             elif brand_found_online and not has_conflict:
                 # ONLY override LLM when web has HIGH confidence WITH STRONG signals (domain or ecommerce)
                 # IMPORTANT: domain signal alone could be misleading, require verification
                 strong_signals = [s for s in web_evidence if s in ["domain", "ecommerce", "zomato", "swiggy"]]
-                
+
                 if web_confidence == "HIGH" and len(strong_signals) >= 1:
                     # Even for HIGH confidence, run verification to avoid false positives
                     print(f"⚠️ WEB FOUND '{brand_name}' with signals {strong_signals} - Running verification...", flush=True)
-                    
+
                     verification = await verify_brand_conflict(
                         brand_name=brand_name,
                         industry=category,
@@ -10330,7 +9112,7 @@ Return ONLY the JSON, no other text."""
                         country="India",
                         matched_brand=brand_name
                     )
-                    
+
                     if verification["verified"]:
                         print(f"⚠️ WEB OVERRIDE VERIFIED: '{brand_name}' exists - Evidence Score: {verification['evidence_score']}", flush=True)
                         logging.warning(f"⚠️ WEB OVERRIDE: LLM missed '{brand_name}' - verified on platform")
@@ -10350,11 +9132,11 @@ Return ONLY the JSON, no other text."""
             else:
                 print(f"✅ LLM: '{brand_name}' appears unique", flush=True)
                 logging.info(f"✅ LLM: '{brand_name}' appears unique")
-                
+
         except json.JSONDecodeError as e:
             logging.warning(f"Failed to parse LLM response: {e}")
             logging.warning(f"Response was: {response[:200]}")
-            
+
             # If LLM failed but web search found the brand, still flag it
             if brand_found_online:
                 result["exists"] = True
@@ -10362,10 +9144,10 @@ Return ONLY the JSON, no other text."""
                 result["matched_brand"] = brand_name
                 result["evidence"] = [f"Web: {e}" for e in web_evidence]
                 result["reason"] = f"Brand '{brand_name}' found via web search"
-    
+
     except Exception as e:
         logging.error(f"LLM brand check failed: {e}")
-        
+
         # If LLM failed but web search found the brand, still flag it
         if brand_found_online:
             result["exists"] = True
@@ -10373,7 +9155,7 @@ Return ONLY the JSON, no other text."""
             result["matched_brand"] = brand_name
             result["evidence"] = [f"Web: {e}" for e in web_evidence]
             result["reason"] = f"Brand '{brand_name}' found via web search"
-    
+
     return result
 
 
@@ -10382,21 +9164,20 @@ async def verify_brand_conflict(brand_name: str, industry: str = "", category: s
                                  country: str = "India", matched_brand: str = None) -> dict:
     """
     VERIFICATION LAYER: When LLM flags a potential conflict, verify with real evidence.
-    
+
     Runs multiple targeted searches to find REAL proof:
     - Official website
     - LinkedIn company page
     - Trademark records
     - Business registrations
     - News articles
-    
+
     Returns verified=True only if real evidence is found.
     """
-    import aiohttp
     import re
-    
+
     logging.info(f"🔍 VERIFICATION: Starting evidence search for '{brand_name}'")
-    
+
     result = {
         "verified": False,
         "evidence_score": 0,
@@ -10405,37 +9186,37 @@ async def verify_brand_conflict(brand_name: str, industry: str = "", category: s
         "searches_performed": [],
         "recommendation": "ALLOW"
     }
-    
+
     # Generate verification search queries
     brand_clean = brand_name.strip()
     brand_lower = brand_clean.lower()
-    
+
     verification_queries = [
         # Direct brand searches
         f'"{brand_clean}"',
         f'"{brand_clean}" {country}' if country else f'"{brand_clean}"',
         f'"{brand_clean}" {industry}' if industry else None,
         f'"{brand_clean}" {category}' if category else None,
-        
+
         # Business verification
         f'"{brand_clean}" company official website',
         f'"{brand_clean}" brand founded',
-        
+
         # Trademark verification
         f'"{brand_clean}" trademark registered',
         f'"{brand_clean}" trademark {country}' if country else None,
-        
+
         # Platform verification
         f'site:linkedin.com/company "{brand_clean}"',
         f'"{brand_clean}" crunchbase OR angellist',
-        
+
         # Domain verification
         f'{brand_lower}.com',
     ]
-    
+
     # Remove None values
     verification_queries = [q for q in verification_queries if q]
-    
+
     # Evidence scoring weights
     EVIDENCE_WEIGHTS = {
         "official_website": 50,
@@ -10448,102 +9229,93 @@ async def verify_brand_conflict(brand_name: str, industry: str = "", category: s
         "multiple_results": 15,
         "exact_match_results": 25,
     }
-    
+
     REJECTION_THRESHOLD = 50  # Need at least 50 points to confirm rejection
-    
+
     evidence_score = 0
     evidence_found = []
     evidence_details = []
-    
+
     async def search_and_analyze(query: str) -> dict:
         """Run a single search and analyze results for evidence"""
         try:
-            search_url = f"https://www.bing.com/search?q={query.replace(' ', '+')}"
-            
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            html = await search_service.search_html(query)
+            if html:
+                html_lower = html.lower()
+
+                findings = {
+                    "query": query,
+                    "found": [],
+                    "score": 0
                 }
-                
-                async with session.get(search_url, headers=headers, 
-                                       timeout=aiohttp.ClientTimeout(total=8)) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        html_lower = html.lower()
-                        
-                        findings = {
-                            "query": query,
-                            "found": [],
-                            "score": 0
-                        }
-                        
-                        # Check for official website
-                        domain_patterns = [f"{brand_lower}.com", f"{brand_lower}.in", 
-                                          f"{brand_lower}.co", f"www.{brand_lower}"]
-                        for domain in domain_patterns:
-                            if domain in html_lower:
-                                findings["found"].append(f"Domain: {domain}")
-                                findings["score"] += EVIDENCE_WEIGHTS["official_website"]
-                                break
-                        
-                        # Check for LinkedIn company page
-                        if "linkedin.com/company" in html_lower and brand_lower in html_lower:
-                            findings["found"].append("LinkedIn company page found")
-                            findings["score"] += EVIDENCE_WEIGHTS["linkedin_company"]
-                        
-                        # Check for Crunchbase/AngelList
-                        if ("crunchbase.com" in html_lower or "angellist.com" in html_lower) and brand_lower in html_lower:
-                            findings["found"].append("Crunchbase/AngelList profile found")
-                            findings["score"] += EVIDENCE_WEIGHTS["crunchbase"]
-                        
-                        # Check for trademark mentions
-                        trademark_signals = ["trademark", "®", "™", "registered", "USPTO", "IP India", "WIPO"]
-                        for signal in trademark_signals:
-                            if signal.lower() in html_lower and brand_lower in html_lower:
-                                findings["found"].append(f"Trademark signal: {signal}")
-                                findings["score"] += EVIDENCE_WEIGHTS["trademark_record"]
-                                break
-                        
-                        # Check for news coverage
-                        news_sites = ["news", "press release", "announced", "launches", "funding"]
-                        for signal in news_sites:
-                            if signal in html_lower and brand_lower in html_lower:
-                                findings["found"].append("News/press coverage found")
-                                findings["score"] += EVIDENCE_WEIGHTS["news_coverage"]
-                                break
-                        
-                        # Check for social media presence
-                        social_sites = ["instagram.com", "facebook.com", "twitter.com", "x.com"]
-                        for site in social_sites:
-                            if site in html_lower and brand_lower in html_lower:
-                                findings["found"].append(f"Social media: {site}")
-                                findings["score"] += EVIDENCE_WEIGHTS["social_media"]
-                                break
-                        
-                        # Count exact brand mentions (strong signal if many)
-                        exact_mentions = html_lower.count(brand_lower)
-                        if exact_mentions >= 10:
-                            findings["found"].append(f"High mention count: {exact_mentions}")
-                            findings["score"] += EVIDENCE_WEIGHTS["exact_match_results"]
-                        elif exact_mentions >= 5:
-                            findings["found"].append(f"Multiple mentions: {exact_mentions}")
-                            findings["score"] += EVIDENCE_WEIGHTS["multiple_results"]
-                        
-                        return findings
-                        
+
+                # Check for official website
+                domain_patterns = [f"{brand_lower}.com", f"{brand_lower}.in", 
+                                  f"{brand_lower}.co", f"www.{brand_lower}"]
+                for domain in domain_patterns:
+                    if domain in html_lower:
+                        findings["found"].append(f"Domain: {domain}")
+                        findings["score"] += EVIDENCE_WEIGHTS["official_website"]
+                        break
+
+                # Check for LinkedIn company page
+                if "linkedin.com/company" in html_lower and brand_lower in html_lower:
+                    findings["found"].append("LinkedIn company page found")
+                    findings["score"] += EVIDENCE_WEIGHTS["linkedin_company"]
+
+                # Check for Crunchbase/AngelList
+                if ("crunchbase.com" in html_lower or "angellist.com" in html_lower) and brand_lower in html_lower:
+                    findings["found"].append("Crunchbase/AngelList profile found")
+                    findings["score"] += EVIDENCE_WEIGHTS["crunchbase"]
+
+                # Check for trademark mentions
+                trademark_signals = ["trademark", "®", "™", "registered", "USPTO", "IP India", "WIPO"]
+                for signal in trademark_signals:
+                    if signal.lower() in html_lower and brand_lower in html_lower:
+                        findings["found"].append(f"Trademark signal: {signal}")
+                        findings["score"] += EVIDENCE_WEIGHTS["trademark_record"]
+                        break
+
+                # Check for news coverage
+                news_sites = ["news", "press release", "announced", "launches", "funding"]
+                for signal in news_sites:
+                    if signal in html_lower and brand_lower in html_lower:
+                        findings["found"].append("News/press coverage found")
+                        findings["score"] += EVIDENCE_WEIGHTS["news_coverage"]
+                        break
+
+                # Check for social media presence
+                social_sites = ["instagram.com", "facebook.com", "twitter.com", "x.com"]
+                for site in social_sites:
+                    if site in html_lower and brand_lower in html_lower:
+                        findings["found"].append(f"Social media: {site}")
+                        findings["score"] += EVIDENCE_WEIGHTS["social_media"]
+                        break
+
+                # Count exact brand mentions (strong signal if many)
+                exact_mentions = html_lower.count(brand_lower)
+                if exact_mentions >= 10:
+                    findings["found"].append(f"High mention count: {exact_mentions}")
+                    findings["score"] += EVIDENCE_WEIGHTS["exact_match_results"]
+                elif exact_mentions >= 5:
+                    findings["found"].append(f"Multiple mentions: {exact_mentions}")
+                    findings["score"] += EVIDENCE_WEIGHTS["multiple_results"]
+
+                return findings
+
         except asyncio.TimeoutError:
             logging.warning(f"Verification search timeout: {query}")
         except Exception as e:
             logging.warning(f"Verification search error for '{query}': {e}")
-        
+
         return {"query": query, "found": [], "score": 0}
-    
+
     # Run verification searches (limit to 6 most important for speed)
     priority_queries = verification_queries[:6]
-    
+
     tasks = [search_and_analyze(q) for q in priority_queries]
     search_results = await asyncio.gather(*tasks, return_exceptions=True)
-    
+
     # Aggregate evidence
     for res in search_results:
         if isinstance(res, dict) and res.get("found"):
@@ -10555,15 +9327,15 @@ async def verify_brand_conflict(brand_name: str, industry: str = "", category: s
                 "score": res["score"]
             })
             result["searches_performed"].append(res["query"])
-    
+
     # Remove duplicates from evidence
     evidence_found = list(set(evidence_found))
-    
+
     # Make decision
     result["evidence_score"] = evidence_score
     result["evidence_found"] = evidence_found
     result["evidence_details"] = evidence_details
-    
+
     if evidence_score >= REJECTION_THRESHOLD:
         result["verified"] = True
         result["recommendation"] = "REJECT"
@@ -10572,7 +9344,7 @@ async def verify_brand_conflict(brand_name: str, industry: str = "", category: s
         result["verified"] = False
         result["recommendation"] = "ALLOW"
         logging.info(f"✅ FALSE POSITIVE: '{brand_name}' - Score: {evidence_score} (below threshold {REJECTION_THRESHOLD})")
-    
+
     return result
 
 
@@ -10599,113 +9371,85 @@ def check_famous_brand(brand_name: str) -> dict:
     # Remove doubled letters (e.g., "kingg" -> "king")
     normalized_dedupe = re.sub(r'(.)\1+', r'\1', normalized_clean)
     
-    # Phonetic normalization: replace similar-sounding letters
-    def phonetic_normalize(text):
-        """Convert text to phonetic representation for matching similar sounds"""
-        text = text.lower()
-        # Common sound substitutions
-        replacements = [
-            ('q', 'k'),      # q sounds like k
-            ('ck', 'k'),     # ck sounds like k
-            ('ph', 'f'),     # ph sounds like f
-            ('gh', 'g'),     # gh often sounds like g
-            ('wh', 'w'),     # wh sounds like w
-            ('wr', 'r'),     # wr sounds like r
-            ('kn', 'n'),     # kn sounds like n
-            ('gn', 'n'),     # gn sounds like n
-            ('mb', 'm'),     # mb at end sounds like m
-            ('mn', 'n'),     # mn sounds like n
-            ('sc', 's'),     # sc can sound like s
-            ('ce', 'se'),    # ce sounds like se
-            ('ci', 'si'),    # ci sounds like si
-            ('cy', 'sy'),    # cy sounds like sy
-            ('ee', 'i'),     # ee sounds like i
-            ('ea', 'i'),     # ea can sound like i
-            ('oo', 'u'),     # oo sounds like u
-            ('ou', 'u'),     # ou can sound like u
-            ('x', 'ks'),     # x sounds like ks
-            ('z', 's'),      # z sounds like s
-            ('v', 'w'),      # v can sound like w in some accents
-            ('y', 'i'),      # y often sounds like i
-        ]
-        for old, new in replacements:
-            text = text.replace(old, new)
-        # Remove vowels for consonant skeleton comparison
-        return text
-    
+    # Phonetic normalization: replace similar-sounding letters (brand_index.SOUND_SUBSTITUTIONS)
     phonetic_input = phonetic_normalize(normalized_clean)
     
     # IMPROVEMENT: Also create de-pluralized version (remove trailing 's')
     normalized_singular = normalized_clean.rstrip('s') if len(normalized_clean) > 3 else normalized_clean
     normalized_dedupe_singular = normalized_dedupe.rstrip('s') if len(normalized_dedupe) > 3 else normalized_dedupe
     
-    for famous in FAMOUS_BRANDS:
-        famous_clean = famous.replace(" ", "").replace("-", "")
-        famous_dedupe = re.sub(r'(.)\1+', r'\1', famous_clean)
-        famous_phonetic = phonetic_normalize(famous_clean)
-        famous_singular = famous_clean.rstrip('s') if len(famous_clean) > 3 else famous_clean
-        
-        # Direct match after normalization
-        if normalized_clean == famous_clean:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' matches the famous brand '{famous.title()}'. This name is legally protected."
-            }
-        
-        # PLURALIZATION CHECK: "moneycontrols" matches "moneycontrol"
-        if normalized_singular == famous_clean or normalized_clean == famous_singular:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' is a plural/singular variation of the famous brand '{famous.title()}'. This name will cause trademark conflicts."
-            }
-        
-        # Match after removing doubled letters (ludokingg -> ludoking)
-        if normalized_dedupe == famous_dedupe:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' is a variation of the famous brand '{famous.title()}' (letter doubling detected). This name will cause trademark conflicts."
-            }
-        
-        # PLURALIZATION + DEDUPE CHECK
-        if normalized_dedupe_singular == famous_dedupe or normalized_dedupe == famous_singular:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' is a variation of the famous brand '{famous.title()}'. This name will cause trademark conflicts."
-            }
-        
-        # PHONETIC MATCH - key fix for mobiqwik vs mobikwik
-        if phonetic_input == famous_phonetic:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' sounds identical to the famous brand '{famous.title()}'. This name will cause trademark conflicts due to phonetic similarity."
-            }
-        
-        # Check if input contains the famous brand name
-        if len(famous_clean) >= 5 and famous_clean in normalized_clean:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' contains the famous brand '{famous.title()}'. This name will cause trademark conflicts."
-            }
-        
-        # Check if famous brand contains the input (for short distinctive names)
-        if len(normalized_clean) >= 5 and normalized_clean in famous_clean:
-            return {
-                "is_famous": True,
-                "matched_brand": famous.title(),
-                "reason": f"'{brand_name}' is contained within the famous brand '{famous.title()}'. This may cause trademark conflicts."
-            }
+    # Direct match after normalization
+    famous = FAMOUS_BY_CLEAN.get(normalized_clean)
+    if famous is not None:
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' matches the famous brand '{famous.title()}'. This name is legally protected."
+        }
+    
+    # PLURALIZATION CHECK: "moneycontrols" matches "moneycontrol"
+    famous = FAMOUS_BY_CLEAN.get(normalized_singular) or FAMOUS_BY_SINGULAR.get(normalized_clean)
+    if famous is not None:
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' is a plural/singular variation of the famous brand '{famous.title()}'. This name will cause trademark conflicts."
+        }
+    
+    # Match after removing doubled letters (ludokingg -> ludoking)
+    famous = FAMOUS_BY_DEDUPE.get(normalized_dedupe)
+    if famous is not None:
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' is a variation of the famous brand '{famous.title()}' (letter doubling detected). This name will cause trademark conflicts."
+        }
+    
+    # PLURALIZATION + DEDUPE CHECK
+    famous = FAMOUS_BY_DEDUPE.get(normalized_dedupe_singular) or FAMOUS_BY_SINGULAR.get(normalized_dedupe)
+    if famous is not None:
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' is a variation of the famous brand '{famous.title()}'. This name will cause trademark conflicts."
+        }
+    
+    # Check if input contains the famous brand name
+    contained = FAMOUS_CLEAN_INDEX.substrings_of(normalized_clean, min_length=5)
+    if contained:
+        famous = FAMOUS_BRAND_FORMS[contained[0]][0]
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' contains the famous brand '{famous.title()}'. This name will cause trademark conflicts."
+        }
+    
+    # Check if famous brand contains the input (for short distinctive names)
+    containing = FAMOUS_CLEAN_INDEX.superstrings_of(normalized_clean) if len(normalized_clean) >= 5 else []
+    if containing:
+        famous = FAMOUS_BRAND_FORMS[containing[0]][0]
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' is contained within the famous brand '{famous.title()}'. This may cause trademark conflicts."
+        }
+    
+    # PHONETIC MATCH - key fix for mobiqwik vs mobikwik (bucket lookup, no scan)
+    for entry in BRAND_PHONETIC_INDEX.lookup_keys({"spelling": phonetic_input}, corpus="famous_brands"):
+        famous = next((spelling for spelling in entry.spellings if spelling in FAMOUS_BRANDS
+                       and phonetic_normalize(spelling.replace(" ", "").replace("-", "")) == phonetic_input), None)
+        if famous is None:
+            continue
+        return {
+            "is_famous": True,
+            "matched_brand": famous.title(),
+            "reason": f"'{brand_name}' sounds identical to the famous brand '{famous.title()}'. This name will cause trademark conflicts due to phonetic similarity."
+        }
     
     # Jaro-Winkler similarity check using jellyfish
     try:
         import jellyfish
-        for famous in FAMOUS_BRANDS:
-            famous_clean = famous.replace(" ", "")
+        for famous, famous_clean, famous_phonetic in FAMOUS_BRAND_SPELLINGS:
             # Jaro-Winkler similarity (0-1, higher = more similar)
             similarity = jellyfish.jaro_winkler_similarity(normalized_clean, famous_clean)
             if similarity >= 0.88:  # 88% similar (lowered threshold)
@@ -10716,7 +9460,7 @@ def check_famous_brand(brand_name: str) -> dict:
                 }
             
             # Also check phonetic versions
-            phonetic_similarity = jellyfish.jaro_winkler_similarity(phonetic_input, phonetic_normalize(famous_clean))
+            phonetic_similarity = jellyfish.jaro_winkler_similarity(phonetic_input, famous_phonetic)
             if phonetic_similarity >= 0.90:
                 return {
                     "is_famous": True,
@@ -10940,8 +9684,8 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     pronounceability_results = {}
     pronounceability_caps = {}  # Store score caps for later use
     
-    for brand in request.brand_names:
-        pronounce_check = check_pronounceability(brand)
+    pronounce_checks = await map_cpu(check_pronounceability, [(brand,) for brand in request.brand_names])
+    for brand, pronounce_check in zip(request.brand_names, pronounce_checks):
         pronounceability_results[brand] = pronounce_check
         
         if pronounce_check["verdict"] == "FAIL":
@@ -11041,33 +9785,36 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     deep_trace_rejections = {}
     deep_trace_results = {}  # Store all results for later use
     
-    for brand in request.brand_names:
-        if brand not in all_rejections:  # Skip if already rejected by dynamic search
-            try:
-                # Run Deep-Trace Analysis
-                trace_result = await asyncio.to_thread(
-                    deep_trace_analysis, 
-                    brand, 
-                    request.industry or "", 
-                    request.category
-                )
-                deep_trace_results[brand] = trace_result
-                
-                # Log the report
-                logging.info(format_deep_trace_report(trace_result))
+    # Skip names already rejected by dynamic search; the rest are traced as one batch
+    trace_brands = [brand for brand in request.brand_names if brand not in all_rejections]
+    trace_outcomes = await map_cpu(
+        deep_trace_analysis,
+        [(brand, request.industry or "", request.category) for brand in trace_brands],
+        return_exceptions=True
+    )
+    
+    for brand, trace_result in zip(trace_brands, trace_outcomes):
+        if isinstance(trace_result, Exception):
+            logging.error(f"Deep-Trace Analysis failed for {brand}: {trace_result}")
+            # Don't block on failure - continue with other checks
+            continue
+        try:
+            deep_trace_results[brand] = trace_result
+            
+            # Log the report
+            logging.info(format_deep_trace_report(trace_result))
+            
+            # Check if should be rejected (score <= 40 = HIGH RISK)
+            if trace_result["should_reject"]:
+                deep_trace_rejections[brand] = trace_result
+                logging.warning(f"🛡️ DEEP-TRACE REJECTION: {brand} → Score {trace_result['score']}/100 ({trace_result['verdict']})")
+                if trace_result["critical_conflict"]:
+                    logging.warning(f"   CATEGORY KING CONFLICT: {trace_result['critical_conflict']}")
+            else:
+                logging.info(f"✅ DEEP-TRACE PASSED: {brand} → Score {trace_result['score']}/100 ({trace_result['verdict']})")
                 
-                # Check if should be rejected (score <= 40 = HIGH RISK)
-                if trace_result["should_reject"]:
-                    deep_trace_rejections[brand] = trace_result
-                    logging.warning(f"🛡️ DEEP-TRACE REJECTION: {brand} → Score {trace_result['score']}/100 ({trace_result['verdict']})")
-                    if trace_result["critical_conflict"]:
-                        logging.warning(f"   CATEGORY KING CONFLICT: {trace_result['critical_conflict']}")
-                else:
-                    logging.info(f"✅ DEEP-TRACE PASSED: {brand} → Score {trace_result['score']}/100 ({trace_result['verdict']})")
-                    
-            except Exception as e:
-                logging.error(f"Deep-Trace Analysis failed for {brand}: {e}")
-                # Don't block on failure - continue with other checks
+        except Exception as e:
+            logging.error(f"Deep-Trace Analysis failed for {brand}: {e}")
     
     # Merge Deep-Trace rejections into all_rejections
     for brand, trace_result in deep_trace_rejections.items():
@@ -11171,7 +9918,8 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     brand_understandings = {}
     for brand in request.brand_names:
         try:
-            understanding = await generate_brand_understanding(
+            # Served from the persistent understanding store when available
+            understanding = await get_brand_understanding(
                 brand_name=brand,
                 category=request.category,
                 positioning=request.positioning,
@@ -11215,8 +9963,7 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     async def gather_domain_data(brand):
         """Check primary domain availability - wrapped for async"""
         try:
-            # Run synchronous whois check in thread pool
-            return await asyncio.to_thread(check_domain_availability, brand)
+            return await check_domain_availability(brand)
         except Exception as e:
             logging.error(f"Domain check failed for {brand}: {e}")
             return f"{brand}.com: CHECK FAILED (Error: {str(e)})"
@@ -11224,10 +9971,8 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     async def gather_similarity_data(brand):
         """Run similarity checks - wrapped for async"""
         try:
-            # Run synchronous check in thread pool
-            sim_result = await asyncio.to_thread(
-                check_brand_similarity, brand, request.industry or "", request.category
-            )
+            # Static scan runs in a worker thread, suffix detection (cached LLM) on the loop
+            sim_result = await check_brand_similarity_async(brand, request.industry or "", request.category)
             return {
                 "report": format_similarity_report(sim_result),
                 "should_reject": sim_result.get('should_reject', False),
@@ -11276,9 +10021,8 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
     async def gather_visibility_data(brand):
         """Run visibility checks with improved error handling - wrapped for async"""
         try:
-            # Run synchronous check_visibility in a thread pool to avoid blocking
-            vis = await asyncio.to_thread(
-                check_visibility,
+            # Async visibility engine - web + Play Store + iOS fan out concurrently
+            vis = await check_visibility_async(
                 brand, 
                 request.category, 
                 request.industry or "",
@@ -11414,7 +10158,8 @@ async def evaluate_brands_internal(request: BrandEvaluationRequest, job_id: str
             logging.info(f"🧠 USING UNDERSTANDING CLASSIFICATION for '{brand}': {classification_category}")
         else:
             # Fall back to old classification with linguistic override
-            brand_classification = classify_brand_with_linguistic_override(
+            brand_classification = await run_cpu(
+                classify_brand_with_linguistic_override,
                 brand, 
                 request.category or "Business",
                 linguistic_analysis  # Pass linguistic data for potential override
@@ -13581,7 +12326,8 @@ TOTAL: {weighted_sum:.2f} × 10 = {namescore}/100
             
             # Apply DuPont analysis if conflicts exist
             if all_conflicts:
-                dupont_result = apply_dupont_analysis_to_conflicts(
+                dupont_result = await run_cpu(
+                    apply_dupont_analysis_to_conflicts,
                     brand_name=brand_name_for_matrix,
                     category=request.category,
                     conflicts=all_conflicts
@@ -13925,6 +12671,67 @@ async def get_status_checks(limit: int = 100, skip: int = 0):
             check['timestamp'] = datetime.fromisoformat(check['timestamp'])
     return status_checks
 
+# ==================== BULK DOMAIN CHECK ====================
+
+def resolve_bulk_domain_tlds(request: BulkDomainCheckRequest) -> List[str]:
+    """Explicit TLDs + category/country TLDs from both server.py and availability.py maps"""
+    tlds = [".com"] if request.include_com else []
+    tlds.extend(request.tlds or [])
+    if request.category:
+        tlds.extend(get_category_tlds(request.category))
+        tlds.extend(get_availability_category_tlds(request.category))
+    if request.countries:
+        tlds.extend(t["tld"] for t in get_country_tlds(request.countries))
+        tlds.extend(get_availability_country_tlds(request.countries))
+    normalized = []
+    for tld in tlds:
+        tld = tld.strip().lower()
+        if tld:
+            normalized.append(tld if tld.startswith(".") else "." + tld)
+    return list(dict.fromkeys(normalized))
+
+
+@api_router.post("/domains/bulk-check")
+async def bulk_check_domains(request: BulkDomainCheckRequest):
+    """
+    Check many candidate names x TLDs through the cached domain service.
+    Streams NDJSON: one line per domain as it resolves, then a summary line.
+    """
+    tlds = resolve_bulk_domain_tlds(request)
+    domains = build_candidate_domains(request.names, tlds)
+    if not domains:
+        raise HTTPException(status_code=400, detail="No valid names/TLDs to check")
+    if len(domains) > DOMAIN_BULK_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many combinations ({len(domains)}); limit is {DOMAIN_BULK_MAX}"
+        )
+
+    concurrency = request.concurrency or DOMAIN_BULK_CONCURRENCY
+    logging.info(f"🌐 Bulk domain check: {len(request.names)} names x {len(tlds)} TLDs = {len(domains)} domains (concurrency {concurrency})")
+
+    async def stream():
+        start = datetime.now(timezone.utc)
+        counts = {"available": 0, "taken": 0, "unknown": 0}
+        async for result in domain_service.check_stream(domains, concurrency):
+            if result.get("available") is True:
+                counts["available"] += 1
+            elif result.get("available") is False:
+                counts["taken"] += 1
+            else:
+                counts["unknown"] += 1
+            yield json.dumps({"type": "result", **result}) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "total": len(domains),
+            "tlds": tlds,
+            **counts,
+            "elapsed_seconds": round((datetime.now(timezone.utc) - start).total_seconds(), 2),
+            "cache_stats": domain_service.get_stats(),
+        }) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 # ==================== AUTH ENDPOINTS ====================
 
 class UserResponse(BaseModel):
@@ -14057,8 +12864,6 @@ async def login_email(request: EmailLoginRequest, response: Response):
 
 async def perform_web_search(query: str) -> str:
     """Perform web search using Claude with web search capability (via Emergent)"""
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    
     results_text = ""
     
     try:
@@ -14100,67 +12905,28 @@ Be specific and factual. Do not make assumptions."""
     except Exception as e:
         logging.warning(f"Claude search failed: {e}")
     
-    # Fallback to DuckDuckGo
+    # Fallback to the shared search service (cached, provider fallback chain)
     try:
-        from duckduckgo_search import DDGS
-        with DDGS() as ddgs:
-            ddg_results = list(ddgs.text(query, max_results=5))
-            if ddg_results:
-                formatted = []
-                for r in ddg_results:
-                    formatted.append(f"{r.get('title', '')}: {r.get('body', '')}")
-                results_text = "\n".join(formatted)
-                return f"Query: {query}\n\nSearch Results:\n{results_text}"
-    except Exception as ddg_error:
-        logging.warning(f"DuckDuckGo fallback failed: {ddg_error}")
+        search_results = await search_service.results(query, num_results=5)
+        if search_results:
+            formatted = []
+            for r in search_results:
+                formatted.append(f"{r.get('title', '')}: {r.get('snippet', '')}")
+            results_text = "\n".join(formatted)
+            return f"Query: {query}\n\nSearch Results:\n{results_text}"
+    except Exception as search_error:
+        logging.warning(f"Search fallback failed: {search_error}")
     
     return f"Query: {query}\n\nNo search results found"
 
 
 async def crawl_website_page(url: str) -> str:
-    """Crawl a specific website page and extract text content"""
-    import aiohttp
-    from bs4 import BeautifulSoup
-    
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Remove script and style elements
-                    for script in soup(["script", "style", "nav", "footer", "header"]):
-                        script.decompose()
-                    
-                    # Get text content
-                    text = soup.get_text(separator='\n', strip=True)
-                    
-                    # Clean up excessive whitespace
-                    lines = [line.strip() for line in text.splitlines() if line.strip()]
-                    text = '\n'.join(lines)
-                    
-                    # Limit length
-                    if len(text) > 5000:
-                        text = text[:5000] + "... [truncated]"
-                    
-                    logging.info(f"Successfully crawled {url} - {len(text)} chars")
-                    return text
-                else:
-                    logging.warning(f"Failed to crawl {url} - Status {response.status}")
-                    return ""
-    except Exception as e:
-        logging.warning(f"Error crawling {url}: {e}")
-        return ""
+    """Crawl a specific website page and extract text content (cached, see web_crawler.py)"""
+    return await website_crawler.fetch_text(url)
 
 
 async def crawl_brand_website(brand_website: str, brand_name: str) -> str:
     """Crawl brand website for About Us, Our Story, and homepage content"""
-    import aiohttp
-    
     # Normalize URL
     if not brand_website.startswith(('http://', 'https://')):
         brand_website = 'https://' + brand_website
@@ -14183,30 +12949,71 @@ async def crawl_brand_website(brand_website: str, brand_name: str) -> str:
     all_content.append(f"=== WEBSITE CONTENT FOR {brand_name.upper()} ===\n")
     all_content.append(f"Website: {brand_website}\n")
     
-    crawled_count = 0
     max_pages = 4  # Limit to avoid timeout
     
-    for url, page_name in pages_to_crawl:
-        if crawled_count >= max_pages:
-            break
-            
-        logging.info(f"Brand Audit: Crawling {page_name}: {url}")
-        content = await crawl_website_page(url)
-        
-        if content and len(content) > 100:
-            all_content.append(f"\n--- {page_name.upper()} ({url}) ---\n")
-            all_content.append(content)
-            crawled_count += 1
+    # All candidates are fetched concurrently; stops once max_pages good pages arrive
+    crawled_pages = await website_crawler.crawl_pages(pages_to_crawl, max_pages=max_pages)
+    
+    for url, page_name, content in crawled_pages:
+        all_content.append(f"\n--- {page_name.upper()} ({url}) ---\n")
+        all_content.append(content)
     
-    if crawled_count == 0:
+    if not crawled_pages:
         all_content.append("\n[Unable to crawl website - may be blocked or unavailable]\n")
     
     return "\n".join(all_content)
 
 
+# Shared deadline (seconds) for the brand audit crawl + research queries, which run concurrently
+BRAND_AUDIT_RESEARCH_DEADLINE = float(os.environ.get("BRAND_AUDIT_RESEARCH_DEADLINE", 45))
+
+
+async def run_research_tasks(jobs: dict, deadline: float) -> tuple:
+    """
+    Run named coroutines concurrently under one shared deadline.
+    
+    Returns (results, timings): results only holds jobs that finished in time
+    (timed-out / failed jobs are simply absent), timings has one entry per job
+    with status "ok" | "error" | "timeout" and elapsed seconds.
+    """
+    import time as time_module
+    started = time_module.perf_counter()
+    results = {}
+    timings = {}
+    
+    async def timed(name, coro):
+        job_start = time_module.perf_counter()
+        try:
+            results[name] = await coro
+            timings[name] = {"status": "ok"}
+        except Exception as e:
+            logging.warning(f"Research job '{name}' failed: {e}")
+            timings[name] = {"status": "error", "error": str(e)[:200]}
+        timings[name]["elapsed_seconds"] = round(time_module.perf_counter() - job_start, 2)
+    
+    tasks = [asyncio.create_task(timed(name, coro)) for name, coro in jobs.items()]
+    _, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    
+    elapsed = round(time_module.perf_counter() - started, 2)
+    for name in jobs:
+        if name not in timings:
+            timings[name] = {"status": "timeout", "elapsed_seconds": elapsed}
+    return results, timings
+
+
 async def gather_brand_audit_research(brand_name: str, brand_website: str, competitor_1: str, 
-                                       competitor_2: str, category: str, geography: str) -> dict:
-    """Execute comprehensive research workflow for brand audit with website crawling"""
+                                       competitor_2: str, category: str, geography: str,
+                                       refresh: bool = False, max_research_age_hours: Optional[float] = None) -> dict:
+    """
+    Execute comprehensive research workflow for brand audit with website crawling.
+    
+    refresh=True reuses cached crawl/search results younger than
+    max_research_age_hours (see brand_audit_cache.py) and only fetches stale sources.
+    """
     
     research_data = {}
     all_queries = []
@@ -14221,19 +13028,10 @@ async def gather_brand_audit_research(brand_name: str, brand_website: str, compe
     year_range = "2023 2024 2025"
     
     # ========================================================================
-    # PHASE 0: CRAWL BRAND WEBSITE (PRIMARY SOURCE - Most Accurate!)
-    # ========================================================================
-    logging.info(f"Brand Audit: PHASE 0 - Crawling brand website: {brand_website}")
-    
-    website_content = await crawl_brand_website(brand_website, brand_name)
-    
-    logging.info(f"Brand Audit: Website crawl complete - {len(website_content)} chars")
-    
-    # ========================================================================
-    # PHASE 1: WEB SEARCH FOR ADDITIONAL DATA
+    # PHASE 0 + PHASE 1: WEBSITE CRAWL AND WEB SEARCH (run concurrently)
     # ========================================================================
-    logging.info(f"Brand Audit: PHASE 1 - Starting web search research for {brand_name}")
-    
+    # Website crawl is the PRIMARY source (most accurate); web search adds
+    # ratings, market data and competitive context.
     all_queries = [
         # Query 1: Core brand info (founding, stores, locations)
         f"{brand_name} {category} {geography} founding year total stores outlets locations states presence 2024",
@@ -14251,11 +13049,45 @@ async def gather_brand_audit_research(brand_name: str, brand_website: str, compe
         f"{category} {geography} market size CAGR trends 2024 2025"
     ]
     
-    research_results = []
+    logging.info(f"Brand Audit: Crawling {brand_website} + {len(all_queries)} searches concurrently "
+                 f"(deadline {BRAND_AUDIT_RESEARCH_DEADLINE:.0f}s)")
+    
+    homepage_url = brand_website if brand_website.startswith(('http://', 'https://')) else 'https://' + brand_website
+    homepage_url = homepage_url.rstrip('/')
+    
+    jobs = {"website_crawl": brand_audit_cache.crawl(
+        brand_website,
+        crawl=lambda: crawl_brand_website(brand_website, brand_name),
+        fetch_homepage=lambda: crawl_website_page(homepage_url),
+        refresh=refresh, max_age_hours=max_research_age_hours
+    )}
+    job_targets = {"website_crawl": brand_website}
     for i, q in enumerate(all_queries, 1):
-        logging.info(f"Brand Audit: Search {i}/5 - {q[:50]}...")
-        result = await perform_web_search(q)
-        research_results.append(result)
+        jobs[f"search_{i}"] = brand_audit_cache.search(
+            q, fetch=lambda q=q: perform_web_search(q),
+            refresh=refresh, max_age_hours=max_research_age_hours
+        )
+        job_targets[f"search_{i}"] = q
+    
+    results, timings = await run_research_tasks(jobs, BRAND_AUDIT_RESEARCH_DEADLINE)
+    
+    reused = {name for name, (_, was_reused) in results.items() if was_reused}
+    results = {name: content for name, (content, _) in results.items()}
+    if refresh:
+        logging.info(f"Brand Audit: Refresh reused {len(reused)}/{len(jobs)} cached research sources")
+    
+    website_content = results.get("website_crawl")
+    if website_content is None:
+        website_content = (
+            f"=== WEBSITE CONTENT FOR {brand_name.upper()} ===\n\nWebsite: {brand_website}\n\n"
+            "[Unable to crawl website - may be blocked or unavailable]\n"
+        )
+    logging.info(f"Brand Audit: Website crawl complete - {len(website_content)} chars")
+    
+    # Partial results are fine - timed-out queries are left out of the prompt
+    research_results = [results[f"search_{i}"] for i in range(1, len(all_queries) + 1) if f"search_{i}" in results]
+    completed = sum(1 for t in timings.values() if t["status"] == "ok")
+    logging.info(f"Brand Audit: Research complete - {completed}/{len(jobs)} jobs finished in time")
     
     # Combine web search results
     web_search_data = "\n\n" + "="*80 + "\n\n".join(research_results)
@@ -14287,6 +13119,9 @@ Use web search for additional context, ratings, market data, and competitive inf
     research_data['all_queries'] = ["Website crawl: " + brand_website] + all_queries
     research_data['rating_platforms'] = ["Google Maps", "Justdial", "Zomato", "Swiggy"]
     research_data['website_crawled'] = bool(website_content and len(website_content) > 200)
+    research_data['research_timings'] = [
+        {"job": name, "target": job_targets[name], "reused": name in reused, **timings[name]} for name in jobs
+    ]
     
     return research_data
 
@@ -14308,7 +13143,9 @@ async def brand_audit(request: BrandAuditRequest):
         competitor_1=request.competitor_1,
         competitor_2=request.competitor_2,
         category=request.category,
-        geography=request.geography
+        geography=request.geography,
+        refresh=request.refresh,
+        max_research_age_hours=request.max_research_age_hours
     )
     
     logging.info(f"Research completed. Executing LLM analysis...")
@@ -14651,6 +13488,7 @@ async def brand_audit(request: BrandAuditRequest):
     # Save to database
     doc = response_data.model_dump()
     doc['request'] = request.model_dump()
+    doc['research_timings'] = research_data.get('research_timings', [])
     await db.brand_audits.insert_one(doc)
     
     logging.info(f"Brand Audit completed in {time_module.time() - start_time:.2f}s")
@@ -15075,6 +13913,21 @@ app.include_router(google_oauth_router)  # Google OAuth routes
 # Initialize payment routes with database
 set_payment_db(db)
 
+# Set database for domain availability cache
+set_domain_cache_db(db)
+
+# Set database for app store search cache
+set_app_store_cache_db(db)
+
+# Set database for brand audit research cache (refresh mode)
+set_brand_audit_cache_db(db)
+
+# Set database for persistent brand understanding store
+set_understanding_store_db(db)
+
+# Memory-mapped trademark corpus for similarity checks (BRAND_CORPUS_DIR, optional)
+set_brand_corpus(open_brand_corpus())
+
 # Initialize Google OAuth with database
 set_google_oauth_db(db)
 
@@ -4,25 +4,27 @@ Uses Levenshtein Distance + Jaro-Winkler + LLM-First Detection for comprehensive
 """
 
 import jellyfish
-from rapidfuzz import fuzz
-from rapidfuzz.distance import Levenshtein
-from typing import List, Dict, Tuple, Optional
+import numpy as np
+from brand_index import PatternMatcher, PhoneticIndex, alternate_phonetic_key, phonetic_normalize
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import JaroWinkler, Levenshtein
+from typing import List, Dict, Tuple, Optional, Mapping, NamedTuple
+from functools import lru_cache
+from types import MappingProxyType
 import re
 import os
+import copy
 import json
 import asyncio
 import logging
 
-# Try to import LLM capabilities
-try:
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    EMERGENT_KEY = os.environ.get('EMERGENT_LLM_KEY')
-    LLM_AVAILABLE = bool(EMERGENT_KEY)
-except ImportError:
-    LlmChat = None
-    UserMessage = None
-    EMERGENT_KEY = None
-    LLM_AVAILABLE = False
+from cachetools import TLRUCache
+
+from cpu_lane import run_cpu
+
+# LLM capabilities (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
+LLM_AVAILABLE = bool(LlmChat and EMERGENT_KEY)
 
 logger = logging.getLogger(__name__)
 
@@ -252,6 +254,15 @@ TIER2_INDUSTRY_SUFFIXES = {
     },
 }
 
+# One automaton per tier, ids in table order (TIER2 flattened industry by industry)
+TIER1_SUFFIX_MATCHER = PatternMatcher(TIER1_MEGA_BRAND_SUFFIXES)
+TIER2_SUFFIX_ENTRIES = [
+    (industry_key, suffix, data)
+    for industry_key, suffixes in TIER2_INDUSTRY_SUFFIXES.items()
+    for suffix, data in suffixes.items()
+]
+TIER2_SUFFIX_MATCHER = PatternMatcher(suffix for _, suffix, _ in TIER2_SUFFIX_ENTRIES)
+
 # Legacy map for backward compatibility
 SUFFIX_BRAND_MAP = {
     "kind": ["Mankind"],
@@ -387,6 +398,16 @@ IMPORTANT RULES:
 Return ONLY valid JSON, no explanations outside the JSON."""
 
 
+# LLM suffix detection: timeout, and a per-process cache keyed by (name, category)
+SUFFIX_LLM_TIMEOUT = float(os.environ.get("SUFFIX_LLM_TIMEOUT", 15))
+SUFFIX_LLM_CACHE_TTL = int(os.environ.get("SUFFIX_LLM_CACHE_TTL", 24 * 3600))
+SUFFIX_LLM_CACHE_MAXSIZE = int(os.environ.get("SUFFIX_LLM_CACHE_MAXSIZE", 5000))
+
+_suffix_llm_cache = TLRUCache(maxsize=SUFFIX_LLM_CACHE_MAXSIZE, ttu=lambda key, value, now: now + SUFFIX_LLM_CACHE_TTL)
+_suffix_llm_inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+suffix_llm_stats = {"hits": 0, "calls": 0, "deduplicated": 0, "skipped_tier1": 0}
+
+
 async def llm_detect_suffix_conflicts(brand_name: str, category: str) -> Dict:
     """
     Use LLM to dynamically detect suffix conflicts with famous brands.
@@ -394,7 +415,7 @@ async def llm_detect_suffix_conflicts(brand_name: str, category: str) -> Dict:
     
     Returns structured conflict analysis.
     """
-    if not LLM_AVAILABLE or not LlmChat:
+    if not LLM_AVAILABLE or not LlmChat or not UserMessage:
         logger.warning("LLM not available for suffix detection, using static fallback only")
         return None
     
@@ -407,11 +428,10 @@ async def llm_detect_suffix_conflicts(brand_name: str, category: str) -> Dict:
         # Correct LlmChat initialization: (api_key, provider, model)
         chat = LlmChat(EMERGENT_KEY, "openai", "gpt-4o-mini")
         
-        # Use synchronous send_message (run in executor for async context)
-        loop = asyncio.get_event_loop()
+        # send_message is a coroutine - await it directly on the caller's loop
         response = await asyncio.wait_for(
-            loop.run_in_executor(None, chat.send_message, prompt),
-            timeout=15  # Quick timeout for responsiveness
+            chat.send_message(UserMessage(prompt)),
+            timeout=SUFFIX_LLM_TIMEOUT  # Quick timeout for responsiveness
         )
         
         # Parse JSON response
@@ -436,150 +456,132 @@ async def llm_detect_suffix_conflicts(brand_name: str, category: str) -> Dict:
         return None
 
 
-def llm_detect_suffix_conflicts_sync(brand_name: str, category: str) -> Dict:
+async def llm_detect_suffix_conflicts_cached(brand_name: str, category: str) -> Dict:
     """
-    Synchronous LLM suffix detection - directly calls LLM without async complexity.
+    llm_detect_suffix_conflicts() cached by (normalized name, category).
+    Concurrent calls for the same key share one LLM request; failures are not cached.
     """
-    if not LLM_AVAILABLE or not LlmChat or not UserMessage:
-        logger.warning("LLM not available for suffix detection")
-        return None
+    key = (normalize_name(brand_name), " ".join((category or "").lower().split()))
+    cached = _suffix_llm_cache.get(key)
+    if cached is not None:
+        suffix_llm_stats["hits"] += 1
+        return copy.deepcopy(cached)
+    
+    loop = asyncio.get_running_loop()
+    task = _suffix_llm_inflight.get(key)
+    if task is not None and task.get_loop() is loop and not task.done():
+        suffix_llm_stats["deduplicated"] += 1
+    else:
+        suffix_llm_stats["calls"] += 1
+        task = loop.create_task(llm_detect_suffix_conflicts(brand_name, category))
+        _suffix_llm_inflight[key] = task
+        task.add_done_callback(lambda t, k=key: _suffix_llm_inflight.pop(k, None) if _suffix_llm_inflight.get(k) is t else None)
     
-    try:
-        prompt = LLM_SUFFIX_DETECTION_PROMPT.format(
-            brand_name=brand_name,
-            category=category
-        )
-        
-        # Correct LlmChat initialization: (api_key, provider, model)
-        chat = LlmChat(EMERGENT_KEY, "openai", "gpt-4o-mini")
-        
-        # Create UserMessage object
-        user_msg = UserMessage(prompt)
-        
-        # Helper function to run async send_message
-        async def _send_message():
-            return await chat.send_message(user_msg)
-        
-        # Run the coroutine synchronously
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        
-        if loop and loop.is_running():
-            # We're in an async context, need to use run_in_executor
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, _send_message())
-                response = future.result(timeout=20)
-        else:
-            # Not in async context, can run directly
-            response = asyncio.run(_send_message())
-        
-        # Parse JSON response
-        response_text = response.strip()
-        if response_text.startswith("```"):
-            response_text = re.sub(r'^```json?\s*', '', response_text)
-            response_text = re.sub(r'\s*```$', '', response_text)
-        
-        result = json.loads(response_text)
-        logger.info(f"🤖 LLM Suffix Detection for '{brand_name}': {result.get('recommendation', 'UNKNOWN')} - {result.get('summary', 'No summary')}")
-        
-        return result
-        
-    except Exception as e:
-        logger.warning(f"LLM suffix detection failed: {e}")
-        return None
+    result = await asyncio.shield(task)
+    if result is not None:
+        _suffix_llm_cache[key] = result
+    return copy.deepcopy(result)
 
 
-def check_suffix_conflict_with_llm(input_name: str, industry: str, category: str, use_llm: bool = True) -> Dict:
+def merge_suffix_results(static_result: Dict, llm_result: Optional[Dict],
+                         detection_method: str = "STATIC_ONLY") -> Dict:
     """
-    HYBRID SUFFIX CONFLICT DETECTION
-    
-    Combines:
-    1. LLM-first detection (dynamic, catches new patterns)
-    2. Static list fallback (reliable safety net)
-    
-    Returns the MORE CONSERVATIVE result (if either says REJECT, reject)
+    HYBRID SUFFIX CONFLICT DETECTION - combine the static two-tier check with
+    the LLM analysis (if any). Returns the MORE CONSERVATIVE result (if either
+    says REJECT, reject).
     """
     result = {
-        "has_suffix_conflict": False,
-        "tier1_conflicts": [],
-        "tier2_conflicts": [],
-        "tier2_warnings": [],
-        "conflicts": [],
-        "should_reject": False,
-        "rejection_reason": None,
+        "has_suffix_conflict": static_result.get("has_suffix_conflict", False),
+        "tier1_conflicts": list(static_result.get("tier1_conflicts", [])),
+        "tier2_conflicts": list(static_result.get("tier2_conflicts", [])),
+        "tier2_warnings": list(static_result.get("tier2_warnings", [])),
+        "conflicts": list(static_result.get("conflicts", [])),
+        "should_reject": static_result.get("should_reject", False),
+        "rejection_reason": static_result.get("rejection_reason"),
         "llm_analysis": None,
-        "detection_method": "STATIC_ONLY"
+        "detection_method": detection_method
     }
     
-    # Step 1: Run static check first (fast, reliable)
-    static_result = check_suffix_conflict(input_name, industry, category)
-    
-    # Copy static results
-    result["tier1_conflicts"] = static_result.get("tier1_conflicts", [])
-    result["tier2_conflicts"] = static_result.get("tier2_conflicts", [])
-    result["tier2_warnings"] = static_result.get("tier2_warnings", [])
-    result["conflicts"] = static_result.get("conflicts", [])
-    result["has_suffix_conflict"] = static_result.get("has_suffix_conflict", False)
-    result["should_reject"] = static_result.get("should_reject", False)
-    result["rejection_reason"] = static_result.get("rejection_reason")
-    
-    # Step 2: Run LLM detection (if enabled and static didn't already reject)
-    if use_llm and LLM_AVAILABLE:
-        try:
-            llm_result = llm_detect_suffix_conflicts_sync(input_name, category)
-            
-            if llm_result:
-                result["llm_analysis"] = llm_result
-                result["detection_method"] = "LLM_ENHANCED"
+    if llm_result:
+        result["llm_analysis"] = llm_result
+        result["detection_method"] = "LLM_ENHANCED"
+        
+        # If LLM found conflicts that static missed
+        if llm_result.get("has_conflict") and llm_result.get("conflicts"):
+            for conflict in llm_result["conflicts"]:
+                # Check if this conflict is already in our static results
+                pattern = conflict.get("detected_pattern", "").lower().replace("-", "")
+                already_found = any(
+                    c.get("suffix", "").lower() == pattern 
+                    for c in result["conflicts"]
+                )
                 
-                # If LLM found conflicts that static missed
-                if llm_result.get("has_conflict") and llm_result.get("conflicts"):
-                    for conflict in llm_result["conflicts"]:
-                        # Check if this conflict is already in our static results
-                        pattern = conflict.get("detected_pattern", "").lower().replace("-", "")
-                        already_found = any(
-                            c.get("suffix", "").lower() == pattern 
-                            for c in result["conflicts"]
-                        )
-                        
-                        if not already_found:
-                            # New conflict found by LLM!
-                            new_conflict = {
-                                "brand": conflict.get("conflicting_brand", "Unknown"),
-                                "suffix": conflict.get("detected_pattern", ""),
-                                "match_type": f"LLM_DETECTED_TIER{conflict.get('tier', 1)}",
-                                "tier": conflict.get("tier", 1),
-                                "severity": "FATAL" if conflict.get("risk_level") in ["CRITICAL", "HIGH"] else "WARNING",
-                                "explanation": f"🤖 LLM Detection: {conflict.get('explanation', 'Potential conflict detected')}",
-                                "lawsuit_probability": conflict.get("lawsuit_probability", "UNKNOWN")
-                            }
-                            
-                            if conflict.get("tier") == 1 or (conflict.get("tier") == 2 and conflict.get("same_industry")):
-                                result["conflicts"].append(new_conflict)
-                                result["has_suffix_conflict"] = True
-                                
-                                if conflict.get("tier") == 1:
-                                    result["tier1_conflicts"].append(new_conflict)
-                                else:
-                                    result["tier2_conflicts"].append(new_conflict)
-                            else:
-                                result["tier2_warnings"].append(new_conflict)
+                if not already_found:
+                    # New conflict found by LLM!
+                    new_conflict = {
+                        "brand": conflict.get("conflicting_brand", "Unknown"),
+                        "suffix": conflict.get("detected_pattern", ""),
+                        "match_type": f"LLM_DETECTED_TIER{conflict.get('tier', 1)}",
+                        "tier": conflict.get("tier", 1),
+                        "severity": "FATAL" if conflict.get("risk_level") in ["CRITICAL", "HIGH"] else "WARNING",
+                        "explanation": f"🤖 LLM Detection: {conflict.get('explanation', 'Potential conflict detected')}",
+                        "lawsuit_probability": conflict.get("lawsuit_probability", "UNKNOWN")
+                    }
                     
-                    # Update rejection status based on LLM recommendation
-                    if llm_result.get("recommendation") == "REJECT" and not result["should_reject"]:
-                        result["should_reject"] = True
-                        result["rejection_reason"] = f"🤖 LLM DETECTED: {llm_result.get('summary', 'Suffix conflict with major brand')}"
+                    if conflict.get("tier") == 1 or (conflict.get("tier") == 2 and conflict.get("same_industry")):
+                        result["conflicts"].append(new_conflict)
+                        result["has_suffix_conflict"] = True
                         
-        except Exception as e:
-            logger.warning(f"LLM suffix detection failed, using static only: {e}")
-            result["detection_method"] = "STATIC_ONLY_LLM_FAILED"
+                        if conflict.get("tier") == 1:
+                            result["tier1_conflicts"].append(new_conflict)
+                        else:
+                            result["tier2_conflicts"].append(new_conflict)
+                    else:
+                        result["tier2_warnings"].append(new_conflict)
+            
+            # Update rejection status based on LLM recommendation
+            if llm_result.get("recommendation") == "REJECT" and not result["should_reject"]:
+                result["should_reject"] = True
+                result["rejection_reason"] = f"🤖 LLM DETECTED: {llm_result.get('summary', 'Suffix conflict with major brand')}"
     
     return result
 
 
+async def check_suffix_conflict_async(input_name: str, industry: str, category: str, use_llm: bool = True) -> Dict:
+    """
+    Static suffix check, then (unless tier 1 already rejected the name) the
+    cached LLM suffix detection, merged by merge_suffix_results().
+    """
+    # Step 1: Run static check first (fast, reliable)
+    static_result = check_suffix_conflict(input_name, industry, category)
+    
+    if not (use_llm and LLM_AVAILABLE):
+        return merge_suffix_results(static_result, None)
+    
+    # Step 2: Tier 1 mega-brand conflicts are already fatal - the LLM can't change the outcome
+    if static_result.get("tier1_conflicts"):
+        suffix_llm_stats["skipped_tier1"] += 1
+        return merge_suffix_results(static_result, None, "STATIC_TIER1")
+    
+    llm_result = await llm_detect_suffix_conflicts_cached(input_name, category)
+    if llm_result is None:
+        return merge_suffix_results(static_result, None, "STATIC_ONLY_LLM_FAILED")
+    return merge_suffix_results(static_result, llm_result)
+
+
+def check_suffix_conflict_with_llm(input_name: str, industry: str, category: str, use_llm: bool = True) -> Dict:
+    """
+    Synchronous check_suffix_conflict_async() for callers outside an event loop.
+    Inside a running loop use check_suffix_conflict_async(); this falls back to static only there.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(check_suffix_conflict_async(input_name, industry, category, use_llm))
+    logger.debug("check_suffix_conflict_with_llm called inside an event loop - static suffix check only")
+    return merge_suffix_results(check_suffix_conflict(input_name, industry, category), None)
+
+
 def normalize_name(name: str) -> str:
     """Normalize brand name for comparison"""
     # Convert to lowercase
@@ -599,7 +601,11 @@ def calculate_levenshtein_similarity(name1: str, name2: str) -> float:
     Calculate Levenshtein-based similarity (0-100)
     Lower edit distance = higher similarity
     """
-    n1, n2 = normalize_name(name1), normalize_name(name2)
+    return _levenshtein_similarity(normalize_name(name1), normalize_name(name2))
+
+
+def _levenshtein_similarity(n1: str, n2: str) -> float:
+    """calculate_levenshtein_similarity() on already-normalized names"""
     if not n1 or not n2:
         return 0.0
     
@@ -620,7 +626,11 @@ def calculate_jaro_winkler_similarity(name1: str, name2: str) -> float:
     Calculate Jaro-Winkler similarity (0-100)
     Gives more weight to prefix matches (good for brand names)
     """
-    n1, n2 = normalize_name(name1), normalize_name(name2)
+    return _jaro_winkler_similarity(normalize_name(name1), normalize_name(name2))
+
+
+def _jaro_winkler_similarity(n1: str, n2: str) -> float:
+    """calculate_jaro_winkler_similarity() on already-normalized names"""
     if not n1 or not n2:
         return 0.0
     
@@ -634,7 +644,11 @@ def calculate_fuzzy_ratio(name1: str, name2: str) -> float:
     Calculate fuzzy ratio using RapidFuzz (0-100)
     Good for partial matches and typos
     """
-    n1, n2 = normalize_name(name1), normalize_name(name2)
+    return _fuzzy_ratio(normalize_name(name1), normalize_name(name2))
+
+
+def _fuzzy_ratio(n1: str, n2: str) -> float:
+    """calculate_fuzzy_ratio() on already-normalized names"""
     if not n1 or not n2:
         return 0.0
     
@@ -650,20 +664,23 @@ def calculate_phonetic_similarity(name1: str, name2: str) -> Tuple[bool, str]:
     to avoid false positives like HeadBook matching HDFC
     """
     n1, n2 = normalize_name(name1), normalize_name(name2)
-    
+    return _phonetic_match(n1, *phonetic_codes(n1), n2, *phonetic_codes(n2))
+
+
+def phonetic_codes(normalized: str) -> Tuple[str, str]:
+    """(Soundex, Metaphone) of a normalized name, spaces removed"""
+    compact = normalized.replace(" ", "")
+    return jellyfish.soundex(compact), jellyfish.metaphone(compact)
+
+
+def _phonetic_match(n1: str, soundex1: str, metaphone1: str,
+                    n2: str, soundex2: str, metaphone2: str) -> Tuple[bool, str]:
+    """calculate_phonetic_similarity() on normalized names with precomputed codes"""
     # Length check - avoid matching very different length names
     len_ratio = min(len(n1), len(n2)) / max(len(n1), len(n2)) if max(len(n1), len(n2)) > 0 else 0
     if len_ratio < 0.5:  # Names are too different in length
         return False, f"Length mismatch - not a phonetic conflict"
     
-    # Soundex comparison
-    soundex1 = jellyfish.soundex(n1.replace(" ", ""))
-    soundex2 = jellyfish.soundex(n2.replace(" ", ""))
-    
-    # Metaphone comparison
-    metaphone1 = jellyfish.metaphone(n1.replace(" ", ""))
-    metaphone2 = jellyfish.metaphone(n2.replace(" ", ""))
-    
     soundex_match = soundex1 == soundex2
     metaphone_match = metaphone1 == metaphone2
     
@@ -681,6 +698,230 @@ def calculate_phonetic_similarity(name1: str, name2: str) -> Tuple[bool, str]:
     return False, f"No phonetic match"
 
 
+# ============ EXTERNAL BRAND CORPUS ============
+# Optional memory-mapped trademark corpus (brand_corpus.BrandCorpus) whose
+# exact and sound-alike marks are checked alongside the built-in brands.
+
+# Set from main server.py (None = not loaded)
+brand_corpus = None
+
+
+def set_brand_corpus(corpus):
+    """Set external brand corpus reference from main server"""
+    global brand_corpus
+    brand_corpus = corpus
+
+
+def _corpus_mark_details(mark) -> Dict:
+    return {
+        "source": "brand_corpus",
+        "application_number": mark.serial,
+        "owner": mark.owner,
+        "classes": list(mark.classes),
+        "status": mark.status
+    }
+
+
+# ============ KNOWN-BRAND INDEX ============
+# Built once at import time: normalized form, phonetic codes and category
+# membership of every known brand, so check_brand_similarity() only does
+# input-side work per call. All structures are read-only.
+
+class KnownBrand(NamedTuple):
+    name: str
+    normalized: str
+    soundex: str
+    metaphone: str
+    is_global_famous: bool
+
+
+def _build_known_brand_index() -> Mapping[str, KnownBrand]:
+    global_famous = set(GLOBAL_FAMOUS_BRANDS)
+    index = {}
+    for brand in [b for brands in KNOWN_BRANDS.values() for b in brands] + GLOBAL_FAMOUS_BRANDS:
+        if brand not in index:
+            normalized = normalize_name(brand)
+            index[brand] = KnownBrand(brand, normalized, *phonetic_codes(normalized), brand in global_famous)
+    return MappingProxyType(index)
+
+
+KNOWN_BRAND_INDEX = _build_known_brand_index()
+
+# KNOWN_BRANDS category -> (lowercased key, key words, brand names)
+KNOWN_BRAND_CATEGORIES = tuple(
+    (key.lower(), tuple(key.lower().replace("&", " ").split()), tuple(brands))
+    for key, brands in KNOWN_BRANDS.items()
+)
+
+# Checked for every input regardless of category
+ALWAYS_CHECKED_BRANDS = tuple(dict.fromkeys(KNOWN_BRANDS.get("General", []) + GLOBAL_FAMOUS_BRANDS))
+
+
+@lru_cache(maxsize=512)
+def select_known_brands(industry_lower: str, category_lower: str) -> "KnownBrandSet":
+    """Index entries to compare against for an (industry, category) pair (memoized)."""
+    brands_to_check = {}  # ordered set
+    
+    # Add industry-specific brands - FIX: Check if category keywords appear in the key OR key keywords appear in category
+    category_words = category_lower.replace("&", " ").split()
+    industry_words = industry_lower.replace("&", " ").split()
+    for key_lower, key_words, brands in KNOWN_BRAND_CATEGORIES:
+        # Match if: "food" in "food & beverage" OR "beverage" in "food & beverage" OR "food & beverage" in "food"
+        if any(word in key_lower for word in category_words) or \
+           any(word in key_lower for word in industry_words) or \
+           any(word in category_lower for word in key_words) or \
+           any(word in industry_lower for word in key_words):
+            brands_to_check.update(dict.fromkeys(brands))
+    
+    # Special handling for food/beverage/water
+    if any(word in category_lower for word in ["food", "beverage", "water", "drink", "juice"]):
+        brands_to_check.update(dict.fromkeys(KNOWN_BRANDS.get("Food & Beverage", [])))
+    
+    # Special handling for social media
+    if "social" in category_lower or "media" in category_lower or "platform" in category_lower:
+        brands_to_check.update(dict.fromkeys(KNOWN_BRANDS.get("Social Media & Platforms", [])))
+    
+    # Special handling for tech
+    if any(word in category_lower for word in ["tech", "software", "app", "saas", "digital"]):
+        brands_to_check.update(dict.fromkeys(KNOWN_BRANDS.get("Technology & Software", [])))
+    
+    # Add general/famous brands - ALWAYS CHECK THESE
+    brands_to_check.update(dict.fromkeys(ALWAYS_CHECKED_BRANDS))
+    
+    return KnownBrandSet(KNOWN_BRAND_INDEX[brand] for brand in brands_to_check)
+
+
+# ============ BATCH SCORING ============
+# Levenshtein / Jaro-Winkler / ratio for many inputs x many candidates in one
+# rapidfuzz.process.cdist call each (C++, optionally multi-threaded) instead of
+# three Python-level calls per pair. rapidfuzz's JaroWinkler matches
+# jellyfish's to two decimals, the precision calculate_* round to, so the
+# rounded scores are identical to the pairwise calculate_* functions.
+
+# Above this many (input x candidate) pairs cdist runs on all cores
+CDIST_PARALLEL_MIN_PAIRS = int(os.environ.get("CDIST_PARALLEL_MIN_PAIRS", 200_000))
+
+
+class KnownBrandSet:
+    """Ordered candidate set with column arrays for vectorized scoring."""
+    
+    __slots__ = ("entries", "normalized", "_normalized_array", "_indexed_columns", "_phonetic_buckets")
+    
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+        self.normalized = [entry.normalized for entry in self.entries]
+        self._normalized_array = np.array(self.normalized, dtype=object)
+        # Brands in PHONETIC_INDEX get their sound-alike candidates from it (brand ID -> columns);
+        # the rest (external corpus marks, ad-hoc lists) are bucketed here by
+        # ("soundex" | "metaphone", code) -> columns
+        self._indexed_columns = {}
+        self._phonetic_buckets = {}
+        for col, entry in enumerate(self.entries):
+            if entry.name in PHONETIC_INDEX:
+                self._indexed_columns.setdefault(brand_identity(entry.name), []).append(col)
+            else:
+                self._phonetic_buckets.setdefault(("soundex", entry.soundex), []).append(col)
+                self._phonetic_buckets.setdefault(("metaphone", entry.metaphone), []).append(col)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __iter__(self):
+        return iter(self.entries)
+    
+    def phonetic_candidates(self, normalized: str, soundex: str, metaphone: str) -> List[int]:
+        """
+        Columns that pass _phonetic_match()'s checks for this input. Candidates come
+        from Soundex/Metaphone key lookups in PHONETIC_INDEX (and the local buckets
+        for unindexed brands), not a scan over the set.
+        """
+        if len(normalized) < 2:
+            return []
+        columns = set()
+        for indexed in PHONETIC_INDEX.lookup_keys({"soundex": soundex, "metaphone": metaphone}):
+            columns.update(self._indexed_columns.get(indexed.identity, ()))
+        columns.update(self._phonetic_buckets.get(("soundex", soundex), ()))
+        columns.update(self._phonetic_buckets.get(("metaphone", metaphone), ()))
+        matches = []
+        for col in sorted(columns):
+            entry = self.entries[col]
+            longer = max(len(entry.normalized), len(normalized))
+            shorter = min(len(entry.normalized), len(normalized))
+            if shorter >= 0.5 * longer and entry.normalized[:2] == normalized[:2]:
+                matches.append(col)
+        return matches
+    
+    def exact_matches(self, normalized: str) -> np.ndarray:
+        return self._normalized_array == normalized
+
+
+def build_known_brand_set(brand_names: List[str]) -> KnownBrandSet:
+    """KnownBrandSet for an arbitrary brand list (index entries reused where available)."""
+    global_famous = set(GLOBAL_FAMOUS_BRANDS)
+    entries = {}
+    for brand in brand_names:
+        if brand in entries:
+            continue
+        entry = KNOWN_BRAND_INDEX.get(brand)
+        if entry is None:
+            normalized = normalize_name(brand)
+            entry = KnownBrand(brand, normalized, *phonetic_codes(normalized), brand in global_famous)
+        entries[brand] = entry
+    return KnownBrandSet(entries.values())
+
+
+def score_similarity_matrix(inputs: List[str], candidates: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (levenshtein, jaro_winkler, fuzzy_ratio) matrices of shape (len(inputs), len(candidates))
+    on a 0-100 scale, for already-normalized names. Empty names score 0, like the pairwise functions.
+    """
+    workers = -1 if len(inputs) * len(candidates) >= CDIST_PARALLEL_MIN_PAIRS else 1
+    common = dict(processor=None, dtype=np.float64, workers=workers)
+    lev = process.cdist(inputs, candidates, scorer=Levenshtein.normalized_similarity, **common) * 100
+    jw = process.cdist(inputs, candidates, scorer=JaroWinkler.normalized_similarity, **common) * 100
+    ratio = process.cdist(inputs, candidates, scorer=fuzz.ratio, **common)
+    
+    empty_rows = np.array([not name for name in inputs], dtype=bool)
+    empty_cols = np.array([not name for name in candidates], dtype=bool)
+    for matrix in (lev, jw, ratio):
+        matrix[empty_rows, :] = 0.0
+        matrix[:, empty_cols] = 0.0
+    return lev, jw, ratio
+
+
+def batch_similarity_scores(input_names: List[str], brand_set: KnownBrandSet,
+                            threshold_medium: float = 65.0) -> List[List[Tuple[KnownBrand, float, float, float]]]:
+    """
+    Score every input against every brand in brand_set with one cdist call per metric.
+    
+    Returns, per input, (entry, levenshtein, jaro_winkler, fuzzy_ratio) for the
+    brands that can matter to check_brand_similarity(): exact matches, phonetic
+    candidates, and brands at or above threshold_medium. Values are rounded to 2
+    decimals exactly like the pairwise calculate_* functions.
+    """
+    normalized_inputs = [normalize_name(name) for name in input_names]
+    if not brand_set or not normalized_inputs:
+        return [[] for _ in normalized_inputs]
+    
+    lev, jw, ratio = score_similarity_matrix(normalized_inputs, brand_set.normalized)
+    average = (lev + jw + ratio) / 3
+    
+    scored = []
+    for row, normalized in enumerate(normalized_inputs):
+        # Small slack: the mask uses unrounded scores, callers re-check thresholds on rounded ones
+        mask = (average[row] >= threshold_medium - 0.02) | brand_set.exact_matches(normalized)
+        if normalized:
+            mask[brand_set.phonetic_candidates(normalized, *phonetic_codes(normalized))] = True
+        scored.append([
+            (brand_set.entries[col],
+             round(float(lev[row, col]), 2),
+             round(float(jw[row, col]), 2),
+             round(float(ratio[row, col]), 2))
+            for col in np.flatnonzero(mask)
+        ])
+    return scored
+
+
 def check_suffix_conflict(input_name: str, industry: str, category: str) -> Dict:
     """
     TWO-TIER SUFFIX CONFLICT DETECTION
@@ -707,23 +948,24 @@ def check_suffix_conflict(input_name: str, industry: str, category: str) -> Dict
     }
     
     # ============ TIER 1: MEGA-BRAND SUFFIXES (ALWAYS REJECT) ============
-    for suffix, data in TIER1_MEGA_BRAND_SUFFIXES.items():
-        if input_lower.endswith(suffix) or suffix in input_lower:
-            conflict = {
-                "brand": data["brand"],
-                "suffix": suffix,
-                "match_type": "TIER1_MEGA_BRAND",
-                "tier": 1,
-                "severity": "FATAL",
-                "explanation": f"⛔ TIER 1 CONFLICT: '{input_name}' contains '-{suffix}' which infringes on {data['brand']}. {data['reason']}",
-                "examples": data.get("examples", [])
-            }
-            result["tier1_conflicts"].append(conflict)
-            result["conflicts"].append(conflict)
-            result["has_suffix_conflict"] = True
-            result["should_reject"] = True
-            result["rejection_reason"] = f"FATAL: '{input_name}' infringes on {data['brand']} (-{suffix} suffix). This is a TIER 1 mega-brand that will sue regardless of your industry."
-    
+    for suffix_id in TIER1_SUFFIX_MATCHER.find(input_lower):
+        suffix = TIER1_SUFFIX_MATCHER.patterns[suffix_id]
+        data = TIER1_MEGA_BRAND_SUFFIXES[suffix]
+        conflict = {
+            "brand": data["brand"],
+            "suffix": suffix,
+            "match_type": "TIER1_MEGA_BRAND",
+            "tier": 1,
+            "severity": "FATAL",
+            "explanation": f"⛔ TIER 1 CONFLICT: '{input_name}' contains '-{suffix}' which infringes on {data['brand']}. {data['reason']}",
+            "examples": data.get("examples", [])
+        }
+        result["tier1_conflicts"].append(conflict)
+        result["conflicts"].append(conflict)
+        result["has_suffix_conflict"] = True
+        result["should_reject"] = True
+        result["rejection_reason"] = f"FATAL: '{input_name}' infringes on {data['brand']} (-{suffix} suffix). This is a TIER 1 mega-brand that will sue regardless of your industry."
+
     # If TIER 1 conflict found, return immediately (no need to check TIER 2)
     if result["tier1_conflicts"]:
         return result
@@ -747,34 +989,34 @@ def check_suffix_conflict(input_name: str, industry: str, category: str) -> Dict
             user_industry_keys.append(industry_key)
     
     # Check TIER 2 suffixes
-    for industry_key, suffixes in TIER2_INDUSTRY_SUFFIXES.items():
-        for suffix, data in suffixes.items():
-            if input_lower.endswith(suffix) or (len(suffix) >= 4 and suffix in input_lower):
-                is_same_industry = industry_key in user_industry_keys
-                
-                conflict = {
-                    "brand": data["brand"],
-                    "suffix": suffix,
-                    "match_type": "TIER2_INDUSTRY_SPECIFIC",
-                    "tier": 2,
-                    "industry": industry_key,
-                    "same_industry": is_same_industry,
-                    "severity": "FATAL" if is_same_industry else "WARNING",
-                    "explanation": f"{'⛔ TIER 2 CONFLICT' if is_same_industry else '⚠️ TIER 2 WARNING'}: '{input_name}' contains '-{suffix}' ({data['brand']}). {data['reason']}",
-                }
-                
-                if is_same_industry:
-                    # SAME INDUSTRY = FATAL
-                    result["tier2_conflicts"].append(conflict)
-                    result["conflicts"].append(conflict)
-                    result["has_suffix_conflict"] = True
-                    result["should_reject"] = True
-                    result["rejection_reason"] = f"FATAL: '{input_name}' uses '-{suffix}' suffix in {industry_key} industry, directly conflicting with {data['brand']}."
-                else:
-                    # DIFFERENT INDUSTRY = WARNING ONLY
-                    result["tier2_warnings"].append(conflict)
-                    # Don't add to conflicts or set should_reject for warnings
-    
+    for entry_id in TIER2_SUFFIX_MATCHER.find(input_lower):
+        industry_key, suffix, data = TIER2_SUFFIX_ENTRIES[entry_id]
+        if input_lower.endswith(suffix) or len(suffix) >= 4:
+            is_same_industry = industry_key in user_industry_keys
+            
+            conflict = {
+                "brand": data["brand"],
+                "suffix": suffix,
+                "match_type": "TIER2_INDUSTRY_SPECIFIC",
+                "tier": 2,
+                "industry": industry_key,
+                "same_industry": is_same_industry,
+                "severity": "FATAL" if is_same_industry else "WARNING",
+                "explanation": f"{'⛔ TIER 2 CONFLICT' if is_same_industry else '⚠️ TIER 2 WARNING'}: '{input_name}' contains '-{suffix}' ({data['brand']}). {data['reason']}",
+            }
+            
+            if is_same_industry:
+                # SAME INDUSTRY = FATAL
+                result["tier2_conflicts"].append(conflict)
+                result["conflicts"].append(conflict)
+                result["has_suffix_conflict"] = True
+                result["should_reject"] = True
+                result["rejection_reason"] = f"FATAL: '{input_name}' uses '-{suffix}' suffix in {industry_key} industry, directly conflicting with {data['brand']}."
+            else:
+                # DIFFERENT INDUSTRY = WARNING ONLY
+                result["tier2_warnings"].append(conflict)
+                # Don't add to conflicts or set should_reject for warnings
+
     return result
 
 
@@ -788,7 +1030,48 @@ def check_brand_similarity(
     """
     Main function to check brand name against known brands
     Returns detailed similarity analysis
+    
+    Synchronous version; from async code use check_brand_similarity_async().
+    """
+    results, brands_checked = scan_brand_similarity(input_name, industry, category, threshold_high, threshold_medium)
+    suffix_result = check_suffix_conflict_with_llm(input_name, industry, category, use_llm=LLM_AVAILABLE)
+    return finalize_brand_similarity(results, suffix_result, input_name, category, brands_checked)
+
+
+async def check_brand_similarity_async(
+    input_name: str,
+    industry: str,
+    category: str,
+    threshold_high: float = 80.0,
+    threshold_medium: float = 65.0
+) -> Dict:
     """
+    check_brand_similarity() with the suffix-conflict stage (static + cached
+    LLM) running on the event loop concurrently with the CPU-bound similarity
+    scan in a worker thread (or a CPU lane process when cpu_lane is enabled).
+    """
+    suffix_task = asyncio.ensure_future(
+        check_suffix_conflict_async(input_name, industry, category, use_llm=LLM_AVAILABLE)
+    )
+    try:
+        results, brands_checked = await run_cpu(
+            scan_brand_similarity, input_name, industry, category, threshold_high, threshold_medium
+        )
+    except BaseException:
+        suffix_task.cancel()
+        raise
+    suffix_result = await suffix_task
+    return finalize_brand_similarity(results, suffix_result, input_name, category, brands_checked)
+
+
+def scan_brand_similarity(
+    input_name: str,
+    industry: str,
+    category: str,
+    threshold_high: float = 80.0,
+    threshold_medium: float = 65.0
+) -> Tuple[Dict, int]:
+    """Static similarity scan against known brands -> (partial results, number of brands checked)"""
     results = {
         "input_name": input_name,
         "normalized_name": normalize_name(input_name),
@@ -801,70 +1084,59 @@ def check_brand_similarity(
         "rejection_reason": None
     }
     
-    # Get brands to check against
-    brands_to_check = set()
-    
-    # Normalize inputs for matching
+    # Get brands to check against (precomputed index entries)
     industry_lower = industry.lower() if industry else ""
     category_lower = category.lower() if category else ""
-    
-    # Add industry-specific brands - FIX: Check if category keywords appear in the key OR key keywords appear in category
-    for key, brands in KNOWN_BRANDS.items():
-        key_lower = key.lower()
-        # Match if: "food" in "food & beverage" OR "beverage" in "food & beverage" OR "food & beverage" in "food"
-        key_words = key_lower.replace("&", " ").split()
-        category_words = category_lower.replace("&", " ").split()
-        industry_words = industry_lower.replace("&", " ").split()
-        
-        # Check for any word overlap
-        if any(word in key_lower for word in category_words) or \
-           any(word in key_lower for word in industry_words) or \
-           any(word in category_lower for word in key_words) or \
-           any(word in industry_lower for word in key_words):
-            brands_to_check.update(brands)
-    
-    # Special handling for food/beverage/water
-    if any(word in category_lower for word in ["food", "beverage", "water", "drink", "juice"]):
-        brands_to_check.update(KNOWN_BRANDS.get("Food & Beverage", []))
-    
-    # Special handling for social media
-    if "social" in category_lower or "media" in category_lower or "platform" in category_lower:
-        brands_to_check.update(KNOWN_BRANDS.get("Social Media & Platforms", []))
-    
-    # Special handling for tech
-    if any(word in category_lower for word in ["tech", "software", "app", "saas", "digital"]):
-        brands_to_check.update(KNOWN_BRANDS.get("Technology & Software", []))
-    
-    # Add general/famous brands - ALWAYS CHECK THESE
-    brands_to_check.update(KNOWN_BRANDS.get("General", []))
-    brands_to_check.update(GLOBAL_FAMOUS_BRANDS)
-    
-    # Check against each brand
-    for known_brand in brands_to_check:
-        if normalize_name(input_name) == normalize_name(known_brand):
+    brands_to_check = select_known_brands(industry_lower, category_lower)
+    
+    # Input-side work happens once; all brands are scored in one vectorized pass
+    input_normalized = results["normalized_name"]
+    input_soundex, input_metaphone = phonetic_codes(input_normalized)
+    
+    # Live exact / sound-alike marks from the external trademark corpus (if loaded);
+    # a phonetic match also needs the same first two letters, so others are skipped
+    corpus_marks = {}
+    if brand_corpus is not None and input_normalized:
+        checked = {entry.name for entry in brands_to_check.entries}
+        for record in brand_corpus.candidates(input_normalized, input_soundex, input_metaphone):
+            if record.name not in checked and record.normalized[:2] == input_normalized[:2]:
+                corpus_marks.setdefault(record.name, record)
+        if corpus_marks:
+            brands_to_check = KnownBrandSet(brands_to_check.entries + tuple(
+                KnownBrand(record.name, record.normalized, record.soundex, record.metaphone, False)
+                for record in corpus_marks.values()
+            ))
+    
+    candidates = batch_similarity_scores([input_name], brands_to_check, threshold_medium)[0]
+    
+    # Check against each (possibly matching) brand
+    for entry, lev_sim, jw_sim, fuzzy_sim in candidates:
+        known_brand = entry.name
+        if input_normalized == entry.normalized:
             # Exact match (after normalization)
-            results["fatal_conflicts"].append({
+            exact_match = {
                 "brand": known_brand,
                 "match_type": "EXACT_MATCH",
                 "levenshtein": 100.0,
                 "jaro_winkler": 100.0,
                 "fuzzy_ratio": 100.0,
                 "explanation": f"'{input_name}' is identical to existing brand '{known_brand}'"
-            })
+            }
+            if known_brand in corpus_marks:
+                exact_match["trademark"] = _corpus_mark_details(corpus_marks[known_brand])
+            results["fatal_conflicts"].append(exact_match)
             results["should_reject"] = True
             results["rejection_reason"] = f"FATAL: Exact match with established brand '{known_brand}'"
             continue
         
-        # Calculate similarities
-        lev_sim = calculate_levenshtein_similarity(input_name, known_brand)
-        jw_sim = calculate_jaro_winkler_similarity(input_name, known_brand)
-        fuzzy_sim = calculate_fuzzy_ratio(input_name, known_brand)
-        
         # Average similarity
         avg_sim = (lev_sim + jw_sim + fuzzy_sim) / 3
         
         # Check phonetic similarity
-        phonetic_match, phonetic_explanation = calculate_phonetic_similarity(input_name, known_brand)
+        phonetic_match, phonetic_explanation = _phonetic_match(
+            input_normalized, input_soundex, input_metaphone,
+            entry.normalized, entry.soundex, entry.metaphone
+        )
         
         match_data = {
             "brand": known_brand,
@@ -875,6 +1147,8 @@ def check_brand_similarity(
             "phonetic_match": phonetic_match,
             "phonetic_explanation": phonetic_explanation
         }
+        if known_brand in corpus_marks:
+            match_data["trademark"] = _corpus_mark_details(corpus_marks[known_brand])
         
         # Categorize by risk level
         if avg_sim >= threshold_high or phonetic_match:
@@ -888,7 +1162,7 @@ def check_brand_similarity(
             results["high_risk_matches"].append(match_data)
             
             # Auto-reject for very high similarity to famous brands
-            if avg_sim >= 85 or (phonetic_match and known_brand in GLOBAL_FAMOUS_BRANDS):
+            if avg_sim >= 85 or (phonetic_match and entry.is_global_famous):
                 results["fatal_conflicts"].append(match_data)
                 results["should_reject"] = True
                 results["rejection_reason"] = f"FATAL: High similarity ({avg_sim:.1f}%) to established brand '{known_brand}'"
@@ -902,9 +1176,14 @@ def check_brand_similarity(
     results["high_risk_matches"].sort(key=lambda x: x["average_similarity"], reverse=True)
     results["medium_risk_matches"].sort(key=lambda x: x["average_similarity"], reverse=True)
     
+    return results, len(brands_to_check)
+
+
+def finalize_brand_similarity(results: Dict, suffix_result: Dict, input_name: str, category: str,
+                              brands_checked: int) -> Dict:
+    """Merge the suffix-conflict stage into scan_brand_similarity() results and write the summary"""
     # ============ HYBRID SUFFIX CONFLICT CHECK (LLM + Static) ============
     # Uses LLM-first detection enhanced with static fallback
-    suffix_result = check_suffix_conflict_with_llm(input_name, industry, category, use_llm=LLM_AVAILABLE)
     results["suffix_detection_method"] = suffix_result.get("detection_method", "STATIC_ONLY")
     results["llm_suffix_analysis"] = suffix_result.get("llm_analysis")
     
@@ -950,7 +1229,7 @@ def check_brand_similarity(
         top_match = results["medium_risk_matches"][0]
         results["summary"] = f"🟡 MEDIUM RISK: '{input_name}' has some similarity to '{top_match['brand']}' ({top_match['average_similarity']:.1f}%). Consider alternatives."
     else:
-        results["summary"] = f"🟢 LOW RISK: No significant similarity found for '{input_name}' against {len(brands_to_check)} known brands."
+        results["summary"] = f"🟢 LOW RISK: No significant similarity found for '{input_name}' against {brands_checked} known brands."
     
     return results
 
@@ -1668,6 +1947,106 @@ CATEGORY_KINGS = {
 }
 
 
+# ============ PHONETIC BUCKET INDEX ============
+# Soundex / Metaphone / alternate-key / spelling buckets over every brand corpus
+# in this module (server.py extends it with FAMOUS_BRANDS via with_corpus()).
+# Sound-alike candidates are dict lookups instead of full scans: the similarity
+# scan (KnownBrandSet.phonetic_candidates) queries the Soundex / Metaphone
+# buckets, check_famous_brand the spelling buckets.
+
+def brand_identity(name: str) -> str:
+    """Corpus-independent identity of a brand: normalized name without spaces"""
+    return normalize_name(name).replace(" ", "")
+
+
+def brand_phonetic_keys(name: str) -> Dict[str, str]:
+    normalized = normalize_name(name)
+    soundex, metaphone = phonetic_codes(normalized)
+    return {
+        "soundex": soundex,
+        "metaphone": metaphone,
+        "alternate": alternate_phonetic_key(normalized.replace(" ", "")),
+        # Exact sound-substituted spelling (check_famous_brand's phonetic check)
+        "spelling": phonetic_normalize(name.lower().strip().replace(" ", "").replace("-", "").replace("_", "")),
+    }
+
+
+BRAND_CORPORA = {
+    "known_brands": [brand for brands in KNOWN_BRANDS.values() for brand in brands],
+    "global_famous_brands": GLOBAL_FAMOUS_BRANDS,
+    "category_kings": [king_data["king"] for king_data in CATEGORY_KINGS.values()],
+}
+
+PHONETIC_INDEX = PhoneticIndex(BRAND_CORPORA, encoder=brand_phonetic_keys, identity=brand_identity)
+
+
+# ============ CATEGORY KING INDEXES ============
+# Root ids follow CATEGORY_KINGS dict order, so lookups return the same king
+# the old linear scan did.
+
+CATEGORY_KING_ROOTS = tuple(CATEGORY_KINGS)
+CATEGORY_KING_INDUSTRIES = tuple(frozenset(CATEGORY_KINGS[root]["industries"]) for root in CATEGORY_KING_ROOTS)
+
+# A partial root match is a containment within edit distance 2, i.e. one root
+# is the other with at most 2 characters trimmed from its ends (prefix and
+# suffix cases alike). Index every root under those trims so both directions
+# are dict lookups.
+MAX_PARTIAL_ROOT_TRIM = 2
+
+
+def end_trims(text: str, max_trim: int = MAX_PARTIAL_ROOT_TRIM):
+    """(trimmed, chars removed) for text minus 1..max_trim characters taken from its ends."""
+    for removed in range(1, max_trim + 1):
+        for head in range(removed + 1):
+            trimmed = text[head:len(text) - (removed - head)]
+            if trimmed:
+                yield trimmed, removed
+
+
+_king_trims: Dict[str, Dict[int, int]] = {}
+for _root_id, _root in enumerate(CATEGORY_KING_ROOTS):
+    for _trimmed, _removed in end_trims(_root):
+        _king_trims.setdefault(_trimmed, {}).setdefault(_root_id, _removed)
+# trimmed form -> ((root id, chars removed), ...)
+CATEGORY_KING_TRIM_INDEX: Mapping[str, Tuple[Tuple[int, int], ...]] = MappingProxyType(
+    {trimmed: tuple(sorted(ids.items())) for trimmed, ids in _king_trims.items()}
+)
+CATEGORY_KING_ROOT_IDS = MappingProxyType({root: root_id for root_id, root in enumerate(CATEGORY_KING_ROOTS)})
+
+# Industry keywords of every king, matched against the request context in one pass
+CATEGORY_KING_INDUSTRY_MATCHER = PatternMatcher(sorted(set().union(*CATEGORY_KING_INDUSTRIES)))
+
+
+@lru_cache(maxsize=1024)
+def context_industry_keywords(combined_context: str) -> frozenset:
+    """King industry keywords occurring in the "industry category" context string"""
+    matcher = CATEGORY_KING_INDUSTRY_MATCHER
+    return frozenset(matcher.patterns[keyword_id] for keyword_id in matcher.find(combined_context))
+
+
+def near_category_king_roots(root_lower: str) -> List[Tuple[int, int]]:
+    """
+    (root id, edit distance) for every other king root that contains root_lower
+    or is contained in it within edit distance 2, by root id.
+    """
+    near = {}
+    # King roots inside root_lower
+    for trimmed, removed in end_trims(root_lower):
+        root_id = CATEGORY_KING_ROOT_IDS.get(trimmed)
+        if root_id is not None:
+            near.setdefault(root_id, removed)
+    # King roots containing root_lower
+    for root_id, removed in CATEGORY_KING_TRIM_INDEX.get(root_lower, ()):
+        near.setdefault(root_id, removed)
+    return sorted(near.items())
+
+
+@lru_cache(maxsize=4096)
+def encode_phonetic(text: str) -> Tuple[str, str]:
+    """(Soundex, Metaphone) of raw lowercased text, memoized for repeat competitors"""
+    return jellyfish.soundex(text), jellyfish.metaphone(text)
+
+
 def extract_root_morpheme(brand_name: str) -> Dict:
     """
     THREAD 1 - DECONSTRUCTION: Extract the root morpheme from a brand name.
@@ -1722,21 +2101,24 @@ def find_category_king(root: str, industry: str, category: str) -> Optional[Dict
     category_lower = category.lower() if category else ""
     combined_context = f"{industry_lower} {category_lower}"
     
+    context_keywords = context_industry_keywords(combined_context)
+    
     # Direct root match
-    if root_lower in CATEGORY_KINGS:
+    root_id = CATEGORY_KING_ROOT_IDS.get(root_lower)
+    if root_id is not None:
         king_data = CATEGORY_KINGS[root_lower]
         # Check if any industry keywords match
-        for king_industry in king_data["industries"]:
-            if king_industry in combined_context or combined_context in king_industry:
-                return {
-                    "matched_root": root_lower,
-                    "king": king_data["king"],
-                    "valuation": king_data["valuation"],
-                    "market": king_data["market"],
-                    "description": king_data["description"],
-                    "match_type": "DIRECT_ROOT_MATCH",
-                    "industry_match": True
-                }
+        industries = CATEGORY_KING_INDUSTRIES[root_id]
+        if not industries.isdisjoint(context_keywords) or any(combined_context in king_industry for king_industry in industries):
+            return {
+                "matched_root": root_lower,
+                "king": king_data["king"],
+                "valuation": king_data["valuation"],
+                "market": king_data["market"],
+                "description": king_data["description"],
+                "match_type": "DIRECT_ROOT_MATCH",
+                "industry_match": True
+            }
         
         # Even if industry doesn't match exactly, still a concern for famous roots
         return {
@@ -1749,23 +2131,24 @@ def find_category_king(root: str, industry: str, category: str) -> Optional[Dict
             "industry_match": False
         }
     
-    # Partial root match (root is contained in a king's root)
-    for king_root, king_data in CATEGORY_KINGS.items():
-        if len(root_lower) >= 4 and (root_lower in king_root or king_root in root_lower):
-            lev_distance = Levenshtein.distance(root_lower, king_root)
-            if lev_distance <= 2:  # Very close match
-                for king_industry in king_data["industries"]:
-                    if king_industry in combined_context:
-                        return {
-                            "matched_root": king_root,
-                            "king": king_data["king"],
-                            "valuation": king_data["valuation"],
-                            "market": king_data["market"],
-                            "description": king_data["description"],
-                            "match_type": "PARTIAL_ROOT_MATCH",
-                            "industry_match": True,
-                            "levenshtein_distance": lev_distance
-                        }
+    # Partial root match (root is contained in a king's root, or vice versa)
+    # Only roots within edit distance 2 can match - fetch them from the trim index
+    near_roots = near_category_king_roots(root_lower) if len(root_lower) >= 4 else []
+    for root_id, lev_distance in near_roots:
+        if CATEGORY_KING_INDUSTRIES[root_id].isdisjoint(context_keywords):
+            continue
+        king_root = CATEGORY_KING_ROOTS[root_id]
+        king_data = CATEGORY_KINGS[king_root]
+        return {
+            "matched_root": king_root,
+            "king": king_data["king"],
+            "valuation": king_data["valuation"],
+            "market": king_data["market"],
+            "description": king_data["description"],
+            "match_type": "PARTIAL_ROOT_MATCH",
+            "industry_match": True,
+            "levenshtein_distance": lev_distance
+        }
     
     return None
 
@@ -1787,12 +2170,9 @@ def calculate_algorithmic_scores(brand_name: str, competitor_name: str) -> Dict:
     lev_risk = lev_distance < 3
     
     # 2. Soundex/Phonetic codes
-    brand_soundex = jellyfish.soundex(brand_lower)
-    competitor_soundex = jellyfish.soundex(competitor_lower)
+    brand_soundex, brand_metaphone = encode_phonetic(brand_lower)
+    competitor_soundex, competitor_metaphone = encode_phonetic(competitor_lower)
     soundex_match = brand_soundex == competitor_soundex
-    
-    brand_metaphone = jellyfish.metaphone(brand_lower)
-    competitor_metaphone = jellyfish.metaphone(competitor_lower)
     metaphone_match = brand_metaphone == competitor_metaphone
     
     phonetic_risk = soundex_match or metaphone_match
@@ -0,0 +1,370 @@
+"""
+Social Handle Probe Service
+===========================
+One fetch per (platform, handle) feeds both social scans:
+- availability.check_social_handle (basic AVAILABLE / TAKEN)
+- server.check_social_handle_with_activity (activity, risk level, acquisition)
+
+Previously each evaluation fetched the same profile pages twice. The probe
+keeps the full enhanced result in a TTL cache; the basic result is derived
+from it with basic_social_result(). Concurrent probes of the same handle
+share one in-flight request.
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import re
+from typing import Dict, List
+
+import aiohttp
+from cachetools import TLRUCache
+
+from http_client import pooled_session
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+SOCIAL_CACHE_TTL_TAKEN = int(os.environ.get("SOCIAL_CACHE_TTL_TAKEN", 6 * 3600))         # 6 hours
+SOCIAL_CACHE_TTL_AVAILABLE = int(os.environ.get("SOCIAL_CACHE_TTL_AVAILABLE", 3600))      # 1 hour
+SOCIAL_CACHE_TTL_ERROR = int(os.environ.get("SOCIAL_CACHE_TTL_ERROR", 120))               # 2 minutes
+SOCIAL_CACHE_MAXSIZE = int(os.environ.get("SOCIAL_CACHE_MAXSIZE", 5000))
+SOCIAL_PROBE_TIMEOUT = float(os.environ.get("SOCIAL_PROBE_TIMEOUT", 8))
+
+SOCIAL_PROFILE_URLS = {
+    "instagram": "https://www.instagram.com/{handle}/",
+    "twitter": "https://twitter.com/{handle}",
+    "x": "https://x.com/{handle}",
+    "facebook": "https://www.facebook.com/{handle}",
+    "linkedin": "https://www.linkedin.com/company/{handle}",
+    "youtube": "https://www.youtube.com/@{handle}",
+    "tiktok": "https://www.tiktok.com/@{handle}",
+    "threads": "https://www.threads.net/@{handle}",
+    "pinterest": "https://www.pinterest.com/{handle}/",
+}
+
+NOT_FOUND_PATTERNS = [
+    "page isn't available", "page not found", "sorry, this page",
+    "user not found", "account suspended", "doesn't exist",
+    "this account doesn't exist", "no results found"
+]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+BASIC_FIELDS = ("platform", "handle", "status", "available", "url")
+
+
+# ============ ACTIVITY ANALYSIS ============
+
+def analyze_social_account_activity(platform: str, content: str) -> dict:
+    """
+    Analyze social account activity from page content.
+    Extracts follower count, verification status, activity level.
+    """
+    details = {
+        "is_verified": False,
+        "is_business_account": False,
+        "follower_count": None,
+        "posting_frequency": "UNKNOWN",
+        "engagement_estimate": "UNKNOWN",
+        "account_type": "UNKNOWN",
+        "analysis_available": True
+    }
+    
+    content_lower = content.lower()
+    
+    # Check for verification badges
+    verification_indicators = [
+        'verified', 'verification badge', 'blue check', 'verified account',
+        '"isVerified":true', '"verified":true', 'aria-label="verified"'
+    ]
+    for indicator in verification_indicators:
+        if indicator in content_lower:
+            details["is_verified"] = True
+            break
+    
+    # Check for business account indicators
+    business_indicators = [
+        'business account', 'professional account', 'creator account',
+        'shop now', 'contact us', 'website:', 'email:', 'category:'
+    ]
+    for indicator in business_indicators:
+        if indicator in content_lower:
+            details["is_business_account"] = True
+            break
+    
+    # Try to extract follower count (platform-specific patterns)
+    follower_patterns = [
+        r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(?:k|m|b)?\s*(?:followers|following)',
+        r'"edge_followed_by":\s*{\s*"count":\s*(\d+)',  # Instagram
+        r'"followers_count":\s*(\d+)',  # Twitter
+        r'(\d+(?:,\d+)*)\s*Followers',
+        r'Followers["\s:]+(\d+(?:,\d+)*)',
+    ]
+    
+    for pattern in follower_patterns:
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            count_str = match.group(1).replace(',', '')
+            try:
+                count = float(count_str)
+                # Handle K, M, B suffixes
+                suffix_match = re.search(r'(\d+(?:\.\d+)?)\s*([kmb])', match.group(0).lower())
+                if suffix_match:
+                    multipliers = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+                    count = float(suffix_match.group(1)) * multipliers.get(suffix_match.group(2), 1)
+                details["follower_count"] = int(count)
+                break
+            except:
+                pass
+    
+    # Estimate activity level based on content cues
+    if 'posted' in content_lower or 'hours ago' in content_lower or 'minutes ago' in content_lower:
+        details["posting_frequency"] = "ACTIVE"
+    elif 'days ago' in content_lower or 'yesterday' in content_lower:
+        details["posting_frequency"] = "RECENT"
+    elif 'weeks ago' in content_lower or 'months ago' in content_lower:
+        details["posting_frequency"] = "SPORADIC"
+    elif 'years ago' in content_lower or 'year ago' in content_lower:
+        details["posting_frequency"] = "ABANDONED"
+    
+    return details
+
+
+def calculate_social_risk_level(account_details: dict) -> str:
+    """
+    Calculate risk level based on account activity.
+    
+    FATAL: Verified account with large following - cannot acquire
+    HIGH: Active business with moderate following
+    MEDIUM: Active personal account or small business
+    LOW: Abandoned or minimal activity account
+    NONE: Available
+    """
+    if not account_details or not account_details.get("analysis_available"):
+        return "UNKNOWN"
+    
+    is_verified = account_details.get("is_verified", False)
+    is_business = account_details.get("is_business_account", False)
+    followers = account_details.get("follower_count") or 0
+    activity = account_details.get("posting_frequency", "UNKNOWN")
+    
+    # FATAL: Verified with large following
+    if is_verified and followers > 100000:
+        return "FATAL"
+    
+    # FATAL: Any verified account
+    if is_verified:
+        return "FATAL"
+    
+    # HIGH: Large following or active business
+    if followers > 50000:
+        return "HIGH"
+    if is_business and followers > 10000:
+        return "HIGH"
+    
+    # MEDIUM: Active account with moderate following
+    if activity in ["ACTIVE", "RECENT"] and followers > 1000:
+        return "MEDIUM"
+    if is_business and activity in ["ACTIVE", "RECENT"]:
+        return "MEDIUM"
+    
+    # LOW: Abandoned or minimal activity
+    if activity in ["ABANDONED", "SPORADIC"] or followers < 100:
+        return "LOW"
+    
+    return "MEDIUM"
+
+
+def calculate_acquisition_viability(platform: str, account_details: dict, risk_level: str) -> dict:
+    """
+    Calculate acquisition viability and estimated costs.
+    """
+    if risk_level == "FATAL":
+        return {
+            "can_acquire": False,
+            "reason": "Verified/high-profile account - not acquirable",
+            "estimated_cost": "N/A",
+            "approach": "Choose alternative handle or brand name"
+        }
+    
+    if risk_level == "HIGH":
+        followers = account_details.get("follower_count") or 0
+        cost_estimate = "$5,000-$25,000" if followers > 50000 else "$2,000-$10,000"
+        return {
+            "can_acquire": "MAYBE",
+            "reason": "Active account with significant following",
+            "estimated_cost": cost_estimate,
+            "approach": "Negotiate via broker (hide buyer identity)",
+            "success_probability": "30%"
+        }
+    
+    if risk_level == "MEDIUM":
+        return {
+            "can_acquire": "LIKELY",
+            "reason": "Moderate activity - negotiation possible",
+            "estimated_cost": "$500-$3,000",
+            "approach": "Direct outreach or platform inactive username request",
+            "success_probability": "50%"
+        }
+    
+    if risk_level == "LOW":
+        activity = account_details.get("posting_frequency", "UNKNOWN")
+        if activity == "ABANDONED":
+            return {
+                "can_acquire": True,
+                "reason": "Abandoned account (5+ years inactive)",
+                "estimated_cost": "$0-$500",
+                "approach": "Request inactive username release via platform support",
+                "success_probability": "70%"
+            }
+        return {
+            "can_acquire": True,
+            "reason": "Minimal activity account",
+            "estimated_cost": "$200-$1,000",
+            "approach": "Direct negotiation",
+            "success_probability": "60%"
+        }
+    
+    return {
+        "can_acquire": "UNKNOWN",
+        "approach": "Manual verification needed"
+    }
+
+
+# ============ PROBE ============
+
+def _available_result(platform: str, handle: str, url: str, status: str) -> Dict:
+    return {
+        "platform": platform,
+        "handle": handle,
+        "status": status,
+        "available": True,
+        "url": url,
+        "account_details": None,
+        "risk_level": "NONE",
+        "acquisition_viability": {"can_acquire": True, "cost": "$0", "approach": "Direct registration"}
+    }
+
+
+async def fetch_social_profile(platform: str, handle: str) -> Dict:
+    """
+    Fetch the profile page once and derive availability + activity analysis.
+    Returns the enhanced result shape (account_details / risk_level / acquisition_viability).
+    """
+    url_pattern = SOCIAL_PROFILE_URLS.get(platform.lower())
+    if not url_pattern:
+        return {"platform": platform, "handle": handle, "status": "UNSUPPORTED", "available": None}
+    url = url_pattern.format(handle=handle)
+
+    try:
+        timeout = aiohttp.ClientTimeout(total=SOCIAL_PROBE_TIMEOUT)
+        async with pooled_session() as session:
+            async with session.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True) as response:
+                if response.status == 404:
+                    return _available_result(platform, handle, url, "AVAILABLE")
+                elif response.status == 200:
+                    content = await response.text()
+                    content_lower = content.lower()
+
+                    for pattern in NOT_FOUND_PATTERNS:
+                        if pattern in content_lower:
+                            return _available_result(platform, handle, url, "LIKELY AVAILABLE")
+
+                    # Handle is TAKEN - analyze activity from the same response
+                    account_details = analyze_social_account_activity(platform, content)
+                    risk_level = calculate_social_risk_level(account_details)
+                    acquisition = calculate_acquisition_viability(platform, account_details, risk_level)
+
+                    return {
+                        "platform": platform,
+                        "handle": handle,
+                        "status": "TAKEN",
+                        "available": False,
+                        "url": url,
+                        "account_details": account_details,
+                        "risk_level": risk_level,
+                        "acquisition_viability": acquisition
+                    }
+                else:
+                    return {
+                        "platform": platform,
+                        "handle": handle,
+                        "status": "TAKEN",
+                        "available": False,
+                        "url": url,
+                        "account_details": {"analysis_available": False},
+                        "risk_level": "UNKNOWN",
+                        "acquisition_viability": {"can_acquire": "UNKNOWN", "approach": "Manual verification needed"}
+                    }
+    except asyncio.TimeoutError:
+        return {"platform": platform, "handle": handle, "status": "TIMEOUT", "available": None, "risk_level": "UNKNOWN"}
+    except Exception as e:
+        logger.warning(f"Social probe error for {platform}/{handle}: {e}")
+        return {"platform": platform, "handle": handle, "status": "ERROR", "available": None, "risk_level": "UNKNOWN"}
+
+
+def basic_social_result(result: Dict) -> Dict:
+    """Reduce an enhanced probe result to the availability.check_social_handle shape."""
+    return {k: result[k] for k in BASIC_FIELDS if k in result}
+
+
+def get_social_ttl(result: Dict) -> int:
+    if result.get("available") is True:
+        return SOCIAL_CACHE_TTL_AVAILABLE
+    if result.get("available") is False:
+        return SOCIAL_CACHE_TTL_TAKEN
+    return SOCIAL_CACHE_TTL_ERROR
+
+
+class SocialProbeService:
+    """TTL-cached, deduplicated social profile probes."""
+
+    def __init__(self, fetch=fetch_social_profile, maxsize: int = SOCIAL_CACHE_MAXSIZE):
+        self._fetch = fetch
+        self._memory = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self.stats = {"hits": 0, "fetches": 0, "deduplicated": 0}
+
+    async def probe(self, platform: str, handle: str) -> Dict:
+        """Enhanced result for one (platform, handle); each page is fetched at most once per TTL."""
+        key = (platform.lower(), handle.lower())
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return copy.deepcopy(entry["result"])
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._resolve(key, platform, handle))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._inflight.pop(k, None) if self._inflight.get(k) is t else None)
+
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def probe_basic(self, platform: str, handle: str) -> Dict:
+        return basic_social_result(await self.probe(platform, handle))
+
+    async def probe_many(self, platforms: List[str], handle: str) -> List[Dict]:
+        return list(await asyncio.gather(*[self.probe(p, handle) for p in platforms]))
+
+    def invalidate(self, platform: str, handle: str):
+        self._memory.pop((platform.lower(), handle.lower()), None)
+
+    async def _resolve(self, key: tuple, platform: str, handle: str) -> Dict:
+        self.stats["fetches"] += 1
+        result = await self._fetch(platform, handle)
+        self._memory[key] = {"result": result, "ttl": get_social_ttl(result)}
+        return result
+
+
+# Process-wide instance shared by availability.py and server.py
+social_service = SocialProbeService()
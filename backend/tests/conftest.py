@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+# Backend modules use flat imports (from similarity import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _matches(doc, query):
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            if "$gt" in condition and not (value is not None and value > condition["$gt"]):
+                return False
+            if "$ne" in condition and value == condition["$ne"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeResult:
+    def __init__(self, deleted_count=0):
+        self.deleted_count = deleted_count
+
+
+class FakeCollection:
+    """The subset of Motor's collection API the cache modules use, in memory."""
+
+    def __init__(self):
+        self.docs = []
+
+    async def create_index(self, keys, **kwargs):
+        return str(keys)
+
+    async def find_one(self, query, projection=None):
+        for doc in self.docs:
+            if _matches(doc, query):
+                doc = dict(doc)
+                if projection:
+                    wanted = [field for field, on in projection.items() if on]
+                    if wanted:
+                        doc = {field: doc[field] for field in wanted if field in doc}
+                return doc
+        return None
+
+    async def update_one(self, query, update, upsert=False):
+        for doc in self.docs:
+            if _matches(doc, query):
+                doc.update(update["$set"])
+                return
+        if upsert:
+            self.docs.append({**query, **update["$set"]})
+
+    async def delete_many(self, query):
+        kept = [doc for doc in self.docs if not _matches(doc, query)]
+        deleted, self.docs = len(self.docs) - len(kept), kept
+        return FakeResult(deleted)
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs if _matches(doc, query))
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        collection = self[name] = FakeCollection()
+        return collection
+
+
+@pytest.fixture
+def fake_db():
+    return FakeDatabase()
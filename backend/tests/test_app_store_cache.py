@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+import app_store_cache
+from app_store_cache import APP_STORE_CACHE_TTL_EMPTY, AppStoreSearchCache
+
+
+@pytest.fixture(autouse=True)
+def mongo(fake_db, monkeypatch):
+    monkeypatch.setattr(app_store_cache, "db", fake_db)
+    return fake_db
+
+
+def counting_fetch(results, calls):
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [dict(app) for app in results]
+    return fetch
+
+
+def test_misses_share_one_fetch_and_hits_are_copies():
+    cache = AppStoreSearchCache()
+    calls = []
+    fetch = counting_fetch([{"title": "Zenvita Tea"}], calls)
+
+    async def main():
+        first = await asyncio.gather(*(cache.get_or_fetch("play", "IN", q, fetch)
+                                       for q in ["tea shop", "Tea  Shop", "tea shop "]))
+        first[0][0]["match_type"] = "EXACT"
+        return first, await cache.get_or_fetch("play", "in", "tea shop", fetch)
+
+    first, again = asyncio.run(main())
+    assert calls == [1]
+    assert again == [{"title": "Zenvita Tea"}]
+    assert first[1] == again
+    assert cache.get_stats()["deduplicated"] == 2
+
+
+def test_mongo_tier_is_shared_between_workers(mongo):
+    calls = []
+    fetch = counting_fetch([{"title": "Zenvita Tea"}], calls)
+    assert asyncio.run(AppStoreSearchCache().get_or_fetch("ios", "us", "tea shop", fetch)) == [{"title": "Zenvita Tea"}]
+
+    other_worker = AppStoreSearchCache()
+    assert asyncio.run(other_worker.get_or_fetch("ios", "us", "tea shop", fetch)) == [{"title": "Zenvita Tea"}]
+    assert calls == [1]
+    assert other_worker.get_stats()["mongo_hits"] == 1
+    assert asyncio.run(other_worker.get_or_fetch("play", "us", "tea shop", fetch)) and calls == [1, 1]
+
+
+def test_empty_results_expire_sooner(mongo):
+    calls = []
+    asyncio.run(AppStoreSearchCache().get_or_fetch("play", "in", "zzqx", counting_fetch([], calls)))
+    doc = mongo[app_store_cache.CACHE_COLLECTION].docs[0]
+    assert (doc["expires_at"] - doc["cached_at"]).total_seconds() == APP_STORE_CACHE_TTL_EMPTY
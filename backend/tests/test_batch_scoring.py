@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from similarity import (GLOBAL_FAMOUS_BRANDS, KNOWN_BRAND_INDEX, batch_similarity_scores, build_known_brand_set,
+                        calculate_fuzzy_ratio, calculate_jaro_winkler_similarity, calculate_levenshtein_similarity,
+                        calculate_phonetic_similarity, normalize_name, select_known_brands)
+
+THRESHOLD_MEDIUM = 65.0
+
+
+def variants(name, rng):
+    """A few misspellings of name: dropped, doubled, swapped and substituted letters plus affixes."""
+    name = normalize_name(name)
+    if len(name) < 3:
+        return [name]
+    i = rng.randrange(len(name) - 1)
+    return [
+        name[:i] + name[i + 1:],
+        name[:i] + name[i] + name[i:],
+        name[:i] + name[i + 1] + name[i] + name[i + 2:],
+        name[:i] + rng.choice("aeioukqsz") + name[i + 1:],
+        "my" + name,
+        name + "ly",
+    ]
+
+
+def sample_inputs(count=20, seed=3):
+    rng = random.Random(seed)
+    brands = sorted(KNOWN_BRAND_INDEX)
+    inputs = ["", "x", "Zentrova", "Café Nimbus Pvt Ltd", "HeadBook", "Mobiqwik", "Googel", "Amazzon"]
+    for brand in rng.sample(brands, count):
+        inputs.append(brand)
+        inputs.extend(variants(brand, rng))
+    return inputs
+
+
+def pairwise_scores(input_name, brand):
+    return (calculate_levenshtein_similarity(input_name, brand),
+            calculate_jaro_winkler_similarity(input_name, brand),
+            calculate_fuzzy_ratio(input_name, brand))
+
+
+@pytest.mark.parametrize("brand_set", [
+    select_known_brands("technology", "saas app"),
+    select_known_brands("food", "beverage"),
+    build_known_brand_set(GLOBAL_FAMOUS_BRANDS + ["Zentrovia", "Nimbus Foods", "Q"]),
+], ids=["tech", "food", "adhoc"])
+def test_batch_scores_match_pairwise(brand_set):
+    inputs = sample_inputs()
+    batch = batch_similarity_scores(inputs, brand_set, THRESHOLD_MEDIUM)
+    assert len(batch) == len(inputs)
+    for input_name, candidates in zip(inputs, batch):
+        returned = {entry.name: scores for entry, *scores in candidates}
+        for entry, *scores in candidates:
+            assert tuple(scores) == pairwise_scores(input_name, entry.name), (input_name, entry.name)
+
+        # Nothing check_brand_similarity() would flag may be dropped by the mask
+        input_normalized = normalize_name(input_name)
+        for entry in brand_set:
+            scores = pairwise_scores(input_name, entry.name)
+            if (sum(scores) / 3 >= THRESHOLD_MEDIUM or input_normalized == entry.normalized
+                    or calculate_phonetic_similarity(input_name, entry.name)[0]):
+                assert entry.name in returned, (input_name, entry.name)
+
+
+def test_batch_scores_empty_inputs():
+    brand_set = select_known_brands("", "")
+    assert batch_similarity_scores([], brand_set) == []
+    assert batch_similarity_scores(["nova"], build_known_brand_set([])) == [[]]
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import brand_audit_cache
+from brand_audit_cache import BrandAuditResearchCache, crawl_key, is_fresh, search_key
+
+
+@pytest.fixture(autouse=True)
+def mongo(fake_db, monkeypatch):
+    monkeypatch.setattr(brand_audit_cache, "db", fake_db)
+    return fake_db
+
+
+class Source:
+    """Async callable returning `text`, counting calls."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.text
+
+
+def age_entry(mongo, key, hours):
+    for doc in mongo[brand_audit_cache.CACHE_COLLECTION].docs:
+        if doc["key"] == key:
+            doc["fetched_at"] = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+
+def test_keys_and_freshness():
+    assert crawl_key("https://www.Zenvita.com/about") == crawl_key("zenvita.com") == "crawl:zenvita.com"
+    assert search_key("Zenvita  Tea ") == search_key("zenvita tea")
+    assert is_fresh({"fetched_at": datetime.now(timezone.utc).replace(tzinfo=None)}, 1)
+    assert not is_fresh({"fetched_at": datetime.now(timezone.utc) - timedelta(hours=2)}, 1)
+    assert not is_fresh({}, 1)
+
+
+def test_search_reuses_results_only_in_refresh_mode(mongo):
+    cache = BrandAuditResearchCache()
+    fetch = Source("Zenvita tea reviews ...")
+
+    assert asyncio.run(cache.search("Zenvita tea", fetch)) == ("Zenvita tea reviews ...", False)
+    assert asyncio.run(cache.search("Zenvita tea", fetch)) == ("Zenvita tea reviews ...", False)
+    assert asyncio.run(cache.search("zenvita TEA", fetch, refresh=True)) == ("Zenvita tea reviews ...", True)
+    assert fetch.calls == 2
+
+    age_entry(mongo, search_key("Zenvita tea"), hours=1000)
+    assert asyncio.run(cache.search("Zenvita tea", fetch, refresh=True))[1] is False
+    assert fetch.calls == 3
+
+    empty = Source("Query: x\nNo search results found")
+    asyncio.run(cache.search("nothing here", empty))
+    assert asyncio.run(cache.search("nothing here", empty, refresh=True))[1] is False
+
+
+def test_crawl_refresh_rechecks_only_the_homepage(mongo):
+    cache = BrandAuditResearchCache()
+    crawl = Source("HOME + ABOUT + PRODUCTS")
+    homepage = Source("Zenvita home v1")
+    key = crawl_key("zenvita.com")
+
+    assert asyncio.run(cache.crawl("zenvita.com", crawl, homepage)) == ("HOME + ABOUT + PRODUCTS", False)
+    assert asyncio.run(cache.crawl("zenvita.com", crawl, homepage, refresh=True))[1] is True
+    assert (crawl.calls, homepage.calls) == (1, 1)
+
+    # Stale but unchanged homepage: reuse and re-stamp, no full crawl
+    age_entry(mongo, key, hours=1000)
+    assert asyncio.run(cache.crawl("zenvita.com", crawl, homepage, refresh=True))[1] is True
+    assert (crawl.calls, homepage.calls) == (1, 2)
+    assert cache.get_stats()["unchanged_recrawls_avoided"] == 1
+    assert asyncio.run(cache.get_fresh(key, 1)) is not None
+
+    # Stale and changed: full re-crawl
+    age_entry(mongo, key, hours=1000)
+    homepage.text = "Zenvita home v2"
+    crawl.text = "NEW CONTENT"
+    assert asyncio.run(cache.crawl("zenvita.com", crawl, homepage, refresh=True)) == ("NEW CONTENT", False)
+    assert crawl.calls == 2
+
+
+def test_uncrawlable_sites_are_not_stored(mongo):
+    cache = BrandAuditResearchCache()
+    crawl = Source("[Unable to crawl website zenvita.com]")
+    asyncio.run(cache.crawl("zenvita.com", crawl, Source("Zenvita home")))
+    assert asyncio.run(cache.get(crawl_key("zenvita.com"))) is None
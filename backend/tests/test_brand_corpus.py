@@ -0,0 +1,135 @@
+import csv
+import os
+import threading
+
+from brand_corpus import (BrandCorpus, CorpusSegment, append_records, build_corpus, compact, make_record,
+                          segment_paths, write_segment)
+from similarity import phonetic_codes
+
+RECORDS = [
+    make_record("Luminara", serial="100", owner="Lumi Labs", classes="3, 5", status="Registered"),
+    make_record("Lumnara", serial="101", owner="Other Co", classes=[3], status="Pending"),
+    make_record("Vextrona", serial="102", classes="9", status="Abandoned"),
+    make_record("Zenvita", owner="Zen Foods", classes="29 30", status=""),
+    make_record("Café Zenvita", serial="103", classes="43", status="Objected"),
+]
+
+
+def write_csv(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["mark", "application_number", "applicant", "class", "status"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_make_record_skips_unusable_names():
+    assert make_record("") is None
+    assert make_record("  !!  ") is None
+
+
+def test_segment_round_trip(tmp_path):
+    path = str(tmp_path / "segment-000001.brc")
+    write_segment(path, RECORDS, source="test")
+    segment = CorpusSegment(path)
+    try:
+        assert len(segment) == len(RECORDS)
+        assert sorted(segment.records()) == sorted(RECORDS)
+        for record in RECORDS:
+            found = [segment.record(i) for i in segment.exact(record.normalized)]
+            assert found == [record]
+            assert record in [segment.record(i) for i in segment.phonetic(record.soundex, record.metaphone)]
+            assert segment.has_key(record.key)
+        assert segment.exact("nosuchmark") == []
+        assert not segment.has_key("nosuchkey")
+    finally:
+        segment.close()
+
+
+def test_append_supersedes_older_records(tmp_path):
+    directory = str(tmp_path)
+    append_records(directory, RECORDS, source="first")
+    updated = make_record("Luminara", serial="100", owner="Lumi Labs", classes="3", status="Cancelled")
+    renamed = make_record("Lumenara", serial="101", owner="Other Co", classes="3", status="Registered")
+    append_records(directory, [updated, renamed], source="update")
+    assert len(segment_paths(directory)) == 2
+
+    corpus = BrandCorpus(directory, refresh_seconds=float("inf"))
+    try:
+        assert corpus.exact("luminara") == [updated]
+        # Serial 101 was renamed: the old "Lumnara" copy is superseded although the new one doesn't match it
+        assert corpus.exact("lumnara") == []
+        assert corpus.exact("lumenara") == [renamed]
+        lookup = corpus.lookup("Luminara")
+        assert updated in lookup and renamed in lookup and RECORDS[1] not in lookup
+        normalized = updated.normalized
+        assert updated not in corpus.candidates(normalized, *phonetic_codes(normalized))
+        assert sorted(record.key for record in corpus.records()) == sorted(record.key for record in RECORDS)
+        assert updated in corpus.records() and RECORDS[0] not in corpus.records()
+    finally:
+        corpus.close()
+
+    merged = compact(directory)
+    assert segment_paths(directory) == [merged]
+    corpus = BrandCorpus(directory, refresh_seconds=float("inf"))
+    try:
+        assert corpus.exact("luminara") == [updated]
+        assert corpus.exact("lumnara") == []
+    finally:
+        corpus.close()
+
+
+def test_build_corpus_replaces_segments(tmp_path):
+    directory = str(tmp_path / "corpus")
+    append_records(directory, RECORDS, source="old")
+    dump = str(tmp_path / "marks.csv")
+    write_csv(dump, [{"mark": "Orbitra", "application_number": "7", "applicant": "Orbit Inc",
+                      "class": "9", "status": "REGISTERED"}])
+    path = build_corpus(directory, iter([dump]))
+    assert segment_paths(directory) == [path]
+    corpus = BrandCorpus(directory, refresh_seconds=float("inf"))
+    try:
+        assert [record.name for record in corpus.records()] == ["Orbitra"]
+    finally:
+        corpus.close()
+
+
+def test_build_corpus_keeps_segments_for_empty_dump(tmp_path):
+    directory = str(tmp_path / "corpus")
+    existing = append_records(directory, RECORDS, source="old")
+    dump = str(tmp_path / "empty.csv")
+    write_csv(dump, [{"mark": "", "application_number": "8"}])
+    assert build_corpus(directory, [dump]) is None
+    assert segment_paths(directory) == [existing]
+    assert os.path.getsize(existing) > 0
+
+
+def test_lookups_survive_concurrent_compaction(tmp_path):
+    directory = str(tmp_path)
+    append_records(directory, RECORDS, source="first")
+    corpus = BrandCorpus(directory, refresh_seconds=0)
+    errors = []
+    stop = threading.Event()
+
+    def look_up():
+        while not stop.is_set():
+            try:
+                assert [record.serial for record in corpus.exact("luminara")] == ["100"]
+                list(corpus.records())
+            except Exception as e:
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=look_up) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for round_number in range(20):
+            append_records(directory, [make_record(f"Orbitra {round_number}", serial=f"9{round_number}")])
+            compact(directory)
+            corpus.refresh()
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    corpus.close()
+    assert errors == []
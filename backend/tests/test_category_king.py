@@ -0,0 +1,52 @@
+import random
+
+import pytest
+from rapidfuzz.distance import Levenshtein
+
+from similarity import CATEGORY_KINGS, find_category_king
+
+
+def scan_category_king(root, industry, category):
+    """The original linear scan over CATEGORY_KINGS that find_category_king() replaces."""
+    root_lower = root.lower().strip()
+    combined_context = f"{(industry or '').lower()} {(category or '').lower()}"
+
+    def king(king_root, match_type, industry_match, **extra):
+        data = CATEGORY_KINGS[king_root]
+        return {"matched_root": king_root, "king": data["king"], "valuation": data["valuation"],
+                "market": data["market"], "description": data["description"], "match_type": match_type,
+                "industry_match": industry_match, **extra}
+
+    if root_lower in CATEGORY_KINGS:
+        for king_industry in CATEGORY_KINGS[root_lower]["industries"]:
+            if king_industry in combined_context or combined_context in king_industry:
+                return king(root_lower, "DIRECT_ROOT_MATCH", True)
+        return king(root_lower, "ROOT_MATCH_DIFFERENT_INDUSTRY", False)
+
+    for king_root, data in CATEGORY_KINGS.items():
+        if len(root_lower) >= 4 and (root_lower in king_root or king_root in root_lower):
+            distance = Levenshtein.distance(root_lower, king_root)
+            if distance <= 2 and any(king_industry in combined_context for king_industry in data["industries"]):
+                return king(king_root, "PARTIAL_ROOT_MATCH", True, levenshtein_distance=distance)
+    return None
+
+
+def sample_roots(seed=5):
+    rng = random.Random(seed)
+    roots = ["", "a", "abc", "zzzz", "  Uber ", "RAPID", "superuber", "uberx", "ubr"]
+    for king_root in CATEGORY_KINGS:
+        roots += [king_root, king_root[:-1], king_root[1:], king_root + "s", king_root + "ify",
+                  "go" + king_root, king_root[:2] + rng.choice("aeiou") + king_root[2:]]
+    return roots
+
+
+def sample_contexts():
+    industries = sorted({i for data in CATEGORY_KINGS.values() for i in data["industries"]})
+    return [("", ""), ("Technology", ""), ("", "Food Delivery"), ("Pet Care", "grooming"),
+            ("Fintech", "payments app"), ("a", ""), ("", "e")] + [(i, "") for i in industries[::9]]
+
+
+@pytest.mark.parametrize("industry, category", sample_contexts())
+def test_find_category_king_matches_scan(industry, category):
+    for root in sample_roots():
+        assert find_category_king(root, industry, category) == scan_category_king(root, industry, category), root
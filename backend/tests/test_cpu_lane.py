@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+import cpu_lane
+import similarity
+from brand_corpus import BrandCorpus, append_records, make_record
+from similarity import calculate_levenshtein_similarity, check_brand_similarity
+
+
+def test_thread_path_maps_in_order_and_collects_errors():
+    async def main():
+        assert await cpu_lane.map_cpu(divmod, []) == []
+        assert await cpu_lane.map_cpu(divmod, [(7, 2), (9, 3)]) == [(3, 1), (3, 0)]
+        results = await cpu_lane.map_cpu(divmod, [(1, 1), (1, 0)], return_exceptions=True)
+        assert results[0] == (1, 0) and isinstance(results[1], ZeroDivisionError)
+        with pytest.raises(ZeroDivisionError):
+            await cpu_lane.map_cpu(divmod, [(1, 0)])
+        return await cpu_lane.run_cpu(calculate_levenshtein_similarity, "Zenvita", "Zenvitta")
+
+    assert not cpu_lane.cpu_lane_enabled()
+    assert asyncio.run(main()) == calculate_levenshtein_similarity("Zenvita", "Zenvitta")
+
+
+def test_lane_workers_score_like_the_thread_path(tmp_path, monkeypatch):
+    directory = str(tmp_path / "corpus")
+    append_records(directory, [make_record("Zenvitaa", serial="900", classes="30", status="Registered")])
+    # Workers open the corpus themselves from the inherited environment
+    monkeypatch.setenv("BRAND_CORPUS_DIR", directory)
+    monkeypatch.setattr(cpu_lane, "CPU_LANE_WORKERS", 2)
+    monkeypatch.setattr(similarity, "brand_corpus", BrandCorpus(directory))
+
+    calls = [("Zenvita", "Food", "Tea"), ("Gooogle", "Technology", "Search"), ("Quillory", "", "")]
+
+    async def main():
+        await cpu_lane.start_cpu_lane([(calculate_levenshtein_similarity, ("warm", "up"))])
+        try:
+            assert cpu_lane.cpu_lane_enabled()
+            return await cpu_lane.map_cpu(check_brand_similarity, calls)
+        finally:
+            cpu_lane.stop_cpu_lane()
+
+    lane_results = asyncio.run(main())
+    assert lane_results == [check_brand_similarity(*args) for args in calls]
+    assert any(match["brand"] == "Zenvitaa" for match in lane_results[0]["fatal_conflicts"] +
+               lane_results[0]["high_risk_matches"] + lane_results[0]["phonetic_matches"])
+    assert cpu_lane.get_stats()["pool_calls"] >= 2
@@ -0,0 +1,117 @@
+import asyncio
+
+import dns.resolver
+import pytest
+
+import domain_service
+from domain_service import (DEFAULT_TTLS, DnsFirstLookup, DomainAvailabilityService, build_candidate_domains,
+                            get_tld, get_ttl)
+
+
+class FakeLookup:
+    """WHOIS stand-in: names starting with "taken" are registered, "boom" raises."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, domain):
+        self.calls.append(domain)
+        await asyncio.sleep(self.delay)
+        if domain.startswith("boom"):
+            raise RuntimeError("whois server unreachable")
+        taken = domain.startswith("taken")
+        return {"domain": domain, "status": "TAKEN" if taken else "AVAILABLE", "available": not taken}
+
+
+class FakeAnswer(list):
+    def __init__(self, rows, name=""):
+        super().__init__(rows)
+        self.rrset = type("RRset", (), {"name": name})()
+
+
+class FakeResolver:
+    """Delegated zones answer NS; "sub.example.com" only has an apex SOA; everything else is NXDOMAIN."""
+
+    def __init__(self, delegated=(), soa_only=()):
+        self.delegated = set(delegated)
+        self.soa_only = set(soa_only)
+        self.queries = []
+
+    async def resolve(self, name, rdtype, lifetime=None):
+        self.queries.append((name, rdtype))
+        if name in self.delegated and rdtype == "NS":
+            return FakeAnswer(["ns1.example.net."])
+        if name in self.soa_only:
+            if rdtype == "NS":
+                raise dns.resolver.NoAnswer()
+            return FakeAnswer(["soa"], name=name + ".")
+        raise dns.resolver.NXDOMAIN()
+
+
+@pytest.fixture(autouse=True)
+def no_mongo(monkeypatch):
+    monkeypatch.setattr(domain_service, "db", None)
+
+
+def test_candidate_domains_and_ttls():
+    assert build_candidate_domains(["Zen Vita", "zenvita", "--", "Tea-Co!"], ["com", ".IN", ""]) == \
+        ["zenvita.com", "zenvita.in", "tea-co.com", "tea-co.in"]
+    assert get_tld("shop.example.CO.IN.") == ".co.in"
+    assert get_tld("zenvita.com") == ".com"
+    assert get_ttl("zenvita.com", {"status": "TAKEN"}) == DEFAULT_TTLS["TAKEN"]
+    assert get_ttl("zenvita.com", {"status": "TIMEOUT"}) == DEFAULT_TTLS["ERROR"]
+    assert get_ttl("zenvita.in", {"status": "UNKNOWN"}) == 1800
+
+
+def test_check_caches_and_shares_lookups():
+    lookup = FakeLookup(delay=0.01)
+    service = DomainAvailabilityService(lookup)
+
+    async def main():
+        first = await asyncio.gather(*(service.check(d) for d in ["Zenvita.com", "zenvita.com.", " zenvita.com"]))
+        again = await service.check("ZENVITA.COM")
+        return first, again
+
+    first, again = asyncio.run(main())
+    assert lookup.calls == ["zenvita.com"]
+    assert first == [again] * 3 and again["status"] == "AVAILABLE"
+    assert service.get_stats()["deduplicated"] == 2
+
+    # Callers get copies of the cached result
+    again["status"] = "EDITED"
+    assert asyncio.run(service.check("zenvita.com"))["status"] == "AVAILABLE"
+
+
+def test_check_stream_serves_cached_domains_without_waiting_for_a_slot():
+    lookup = FakeLookup(delay=0.05)
+    service = DomainAvailabilityService(lookup)
+
+    async def main():
+        await service.check("cached.com")
+        order = []
+        async for result in service.check_stream(["taken.com", "slow.io", "cached.com", "boom.in", "Taken.com"],
+                                                 concurrency=1):
+            order.append((result["domain"], result["status"]))
+        return order
+
+    order = asyncio.run(main())
+    assert order[0] == ("cached.com", "AVAILABLE")
+    assert sorted(order[1:]) == [("boom.in", "UNKNOWN"), ("slow.io", "AVAILABLE"), ("taken.com", "TAKEN")]
+    assert sorted(lookup.calls) == ["boom.in", "cached.com", "slow.io", "taken.com"]
+
+
+def test_dns_first_lookup_only_falls_back_to_whois_when_dns_is_inconclusive():
+    resolver = FakeResolver(delegated={"zenvita.com"}, soa_only={"sub.example.com"})
+    whois_calls = FakeLookup()
+    lookup = DnsFirstLookup(resolver=resolver, fallback=whois_calls)
+
+    async def main():
+        return [await lookup(d) for d in ["zenvita.com", "sub.example.com", "free-name.com"]]
+
+    delegated, soa, nxdomain = asyncio.run(main())
+    assert (delegated["status"], delegated["method"]) == ("TAKEN", "dns")
+    assert (soa["status"], soa["method"]) == ("TAKEN", "dns")
+    assert (nxdomain["status"], nxdomain["method"]) == ("AVAILABLE", "whois")
+    assert whois_calls.calls == ["free-name.com"]
+    assert lookup.stats == {"dns_taken": 2, "whois_calls": 1, "whois_avoided": 2}
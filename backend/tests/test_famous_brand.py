@@ -0,0 +1,78 @@
+import random
+import re
+
+import pytest
+
+jellyfish = pytest.importorskip("jellyfish")
+server = pytest.importorskip("server", exc_type=ImportError)
+
+# check_famous_brand's original sound substitutions, applied in order
+SOUND_SUBSTITUTIONS = [
+    ("q", "k"), ("ck", "k"), ("ph", "f"), ("gh", "g"), ("wh", "w"), ("wr", "r"), ("kn", "n"), ("gn", "n"),
+    ("mb", "m"), ("mn", "n"), ("sc", "s"), ("ce", "se"), ("ci", "si"), ("cy", "sy"), ("ee", "i"), ("ea", "i"),
+    ("oo", "u"), ("ou", "u"), ("x", "ks"), ("z", "s"), ("v", "w"), ("y", "i"),
+]
+
+
+def sound_normalize(text):
+    text = text.lower()
+    for old, new in SOUND_SUBSTITUTIONS:
+        text = text.replace(old, new)
+    return text
+
+
+def scan_match_stage(brand_name):
+    """
+    Which stage of the original per-call scan over FAMOUS_BRANDS flags brand_name:
+    "match" (exact, variant, sound-alike or containment), "similar" (Jaro-Winkler) or None.
+    """
+    normalized = brand_name.lower().strip()
+    if normalized in server.FAMOUS_BRANDS:
+        return "match"
+    clean = normalized.replace(" ", "").replace("-", "").replace("_", "")
+    dedupe = re.sub(r'(.)\1+', r'\1', clean)
+    phonetic = sound_normalize(clean)
+    singular = clean.rstrip('s') if len(clean) > 3 else clean
+    dedupe_singular = dedupe.rstrip('s') if len(dedupe) > 3 else dedupe
+    for famous in server.FAMOUS_BRANDS:
+        famous_clean = famous.replace(" ", "").replace("-", "")
+        famous_dedupe = re.sub(r'(.)\1+', r'\1', famous_clean)
+        famous_singular = famous_clean.rstrip('s') if len(famous_clean) > 3 else famous_clean
+        if (clean == famous_clean or singular == famous_clean or clean == famous_singular
+                or dedupe == famous_dedupe or dedupe_singular == famous_dedupe or dedupe == famous_singular
+                or phonetic == sound_normalize(famous_clean)
+                or (len(famous_clean) >= 5 and famous_clean in clean)
+                or (len(clean) >= 5 and clean in famous_clean)):
+            return "match"
+    for famous in server.FAMOUS_BRANDS:
+        famous_clean = famous.replace(" ", "")
+        if (jellyfish.jaro_winkler_similarity(clean, famous_clean) >= 0.88
+                or jellyfish.jaro_winkler_similarity(phonetic, sound_normalize(famous_clean)) >= 0.90):
+            return "similar"
+    return None
+
+
+def sample_names(seed=13):
+    rng = random.Random(seed)
+    famous = sorted(server.FAMOUS_BRANDS)
+    names = ["", "a", "Zentrova", "Mobiqwik", "ludokingg", "moneycontrols", "  Swiggy  ", "face-book", "hdfc_bank"]
+    for brand in rng.sample(famous, min(len(famous), 150)):
+        i = rng.randrange(max(len(brand) - 1, 1))
+        names += [brand, brand.upper(), brand + "s", brand[:i] + brand[i:i + 1] * 2 + brand[i + 1:],
+                  brand[:i] + rng.choice("qkzvxy") + brand[i + 1:], "my" + brand, brand[:max(len(brand) - 2, 1)]]
+    names += ["".join(rng.choice("abcdefghiklmnoprstuvz") for _ in range(rng.randint(3, 10))) for _ in range(300)]
+    return names
+
+
+def match_stage(result):
+    if not result["is_famous"]:
+        return None
+    return "similar" if "very similar" in result["reason"] else "match"
+
+
+def test_check_famous_brand_matches_scan():
+    # matched_brand may differ where several famous brands qualify (the scan followed set order)
+    for name in sample_names():
+        result = server.check_famous_brand(name)
+        assert match_stage(result) == scan_match_stage(name), name
+        assert (result["matched_brand"] is not None) == result["is_famous"], name
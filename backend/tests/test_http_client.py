@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+import http_client
+from http_client import close_http_session, get_session
+
+
+async def _session():
+    return get_session()
+
+
+def test_one_session_per_loop_and_finished_loops_are_dropped():
+    async def main():
+        session = get_session()
+        assert get_session() is session
+        await close_http_session()
+        return session
+
+    first = asyncio.run(_session())
+    second = asyncio.run(main())
+    assert first is not second
+    assert second.closed
+    assert not http_client._sessions
+
+
+def test_close_reaches_sessions_on_other_running_loops():
+    worker_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=worker_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        worker = asyncio.run_coroutine_threadsafe(_session(), worker_loop).result(timeout=5)
+
+        async def main():
+            own = get_session()
+            assert own is not worker
+            await close_http_session()
+            return own
+
+        own = asyncio.run(main())
+        assert own.closed
+        assert worker.closed
+        assert not http_client._sessions
+    finally:
+        worker_loop.call_soon_threadsafe(worker_loop.stop)
+        thread.join(timeout=5)
+        worker_loop.close()
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+import visibility
+from visibility import IosLookupBatcher
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Stub the iTunes lookup endpoint; returns the list of (ids, country) requests it saw."""
+    requests = []
+
+    async def lookup(app_ids, country):
+        requests.append((sorted(app_ids), country))
+        if "boom" in app_ids:
+            raise RuntimeError("iTunes lookup returned 503")
+        return {app_id: {"trackId": app_id, "trackName": f"App {app_id}"} for app_id in app_ids if app_id != "404"}
+
+    monkeypatch.setattr(visibility, "_itunes_lookup", lookup)
+    return requests
+
+
+def test_concurrent_queries_share_one_lookup_and_details_are_cached(lookups):
+    batcher = IosLookupBatcher(window=0.01)
+
+    async def main():
+        first, second = await asyncio.gather(batcher.get(["1", "2", "404"], "us"), batcher.get(["2", "3"], "us"))
+        again = await batcher.get(["1", "3"], "us")
+        other_country = await batcher.get(["1"], "in")
+        return first, second, again, other_country
+
+    first, second, again, other_country = asyncio.run(main())
+    assert sorted(first) == ["1", "2"] and sorted(second) == ["2", "3"]
+    assert again["3"]["trackName"] == "App 3"
+    assert other_country["1"]["trackId"] == "1"
+    assert lookups == [(["1", "2", "3", "404"], "us"), (["1"], "in")]
+    assert batcher.stats["hits"] == 2
+
+
+def test_large_batches_are_chunked_and_failures_are_not_cached(lookups, monkeypatch):
+    monkeypatch.setattr(visibility, "IOS_LOOKUP_MAX_IDS", 2)
+    batcher = IosLookupBatcher(window=0.01)
+
+    found = asyncio.run(batcher.get(["1", "2", "3", "boom"], "us"))
+    assert sorted(found) == ["1", "2"]
+    assert lookups == [(["1", "2"], "us"), (["3", "boom"], "us")]
+
+    found = asyncio.run(batcher.get(["3"], "us"))
+    assert sorted(found) == ["3"]
+    assert lookups[-1] == (["3"], "us")
+
+
+def test_batches_are_per_event_loop(lookups):
+    batcher = IosLookupBatcher(window=0.05)
+    results = {}
+
+    def worker(name):
+        results[name] = asyncio.run(batcher.get(["1", "2"], "us"))
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert sorted(results["a"]) == sorted(results["b"]) == ["1", "2"]
+
+
+@pytest.mark.parametrize("cancel_after", [0.0, 0.05])
+def test_cancelled_flush_releases_waiters(monkeypatch, cancel_after):
+    async def slow_lookup(app_ids, country):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(visibility, "_itunes_lookup", slow_lookup)
+    batcher = IosLookupBatcher(window=0.01)
+
+    async def main():
+        waiter = asyncio.ensure_future(batcher.get(["1"], "us"))
+        await asyncio.sleep(0)
+        flush = batcher._flush_tasks[(asyncio.get_running_loop(), "us")]
+        # Before the window closes the batch is still pending; after it, the lookup is in flight
+        await asyncio.sleep(cancel_after)
+        flush.cancel()
+        return await asyncio.wait_for(waiter, 1)
+
+    assert asyncio.run(main()) == {}
+    assert not batcher._pending and not batcher._flush_tasks
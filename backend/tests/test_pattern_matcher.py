@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from brand_index import PatternMatcher
+
+
+def random_names(count, seed=7):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abnor ") for _ in range(rng.randint(0, 8))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("patterns", [
+    ["he", "she", "his", "hers"],
+    ["a", "aa", "aaa", "ab", "b"],
+    ["tech", "technology", "bio", "biotech", "care", "health", "healthcare"],
+])
+def test_pattern_matcher_find_matches_in(patterns):
+    matcher = PatternMatcher(patterns)
+    texts = ["ushers", "aaab", "biotechnology healthcare", "nothing here", "", "ahishers"]
+    texts += random_names(100, seed=3)
+    for text in texts:
+        assert matcher.find(text) == [i for i, pattern in enumerate(patterns) if pattern in text], text
+        first = matcher.first(text)
+        assert (first is None) == (not matcher.find(text))
+
+
+def test_pattern_matcher_iter_matches_positions():
+    patterns = ["he", "she", "hers"]
+    text = "ushers"
+    matches = sorted(PatternMatcher(patterns).iter_matches(text))
+    expected = sorted((start, i) for i, pattern in enumerate(patterns)
+                      for start in range(len(text)) if text.startswith(pattern, start))
+    assert matches == expected
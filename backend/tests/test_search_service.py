@@ -0,0 +1,94 @@
+import asyncio
+
+from search_service import SearchProvider, SearchService, StubProvider, normalize_result
+
+
+class CountingProvider(SearchProvider):
+    """Returns `results` results (or raises `error`) and counts calls."""
+
+    def __init__(self, name, results=2, error=None, supports_sync=False, delay=0.0):
+        self.name = name
+        self.supports_sync = supports_sync
+        self._results = results
+        self._error = error
+        self._delay = delay
+        self.calls = 0
+
+    def search_blocking(self, query, num_results):
+        self.calls += 1
+        if self._error:
+            raise self._error
+        results = [normalize_result(f"{query} {i}", f"https://{self.name}.test/{i}", "", self.name)
+                   for i in range(min(self._results, num_results))]
+        return results, len(results)
+
+    async def search(self, query, num_results):
+        await asyncio.sleep(self._delay)
+        return self.search_blocking(query, num_results)
+
+
+class FakeBing(CountingProvider):
+    async def fetch_html(self, query):
+        self.calls += 1
+        return f"<html>{query}</html>"
+
+
+def test_falls_back_through_the_provider_order():
+    broken = CountingProvider("google", error=RuntimeError("quota exceeded"))
+    empty = CountingProvider("bing", results=0)
+    ddg = CountingProvider("ddg")
+    service = SearchService({"google": broken, "bing": empty, "ddg": ddg}, order=["google", "bing", "ddg"])
+
+    response = asyncio.run(service.search("Zenvita tea"))
+    assert response["provider"] == "ddg"
+    assert [r["source"] for r in response["results"]] == ["ddg", "ddg"]
+    assert response["errors"] == {"google": "quota exceeded"}
+    assert (broken.calls, empty.calls, ddg.calls) == (1, 1, 1)
+    assert service.get_stats()["provider_errors"] == 1
+
+
+def test_cached_and_concurrent_queries_reach_the_provider_once():
+    slow = CountingProvider("ddg", delay=0.05)
+    service = SearchService({"ddg": slow}, order=["ddg"])
+
+    async def main():
+        responses = await asyncio.gather(*(service.search(q) for q in ["Zenvita tea", "zenvita  TEA", "Zenvita tea"]))
+        again = await service.search(" zenvita tea ")
+        return responses, again
+
+    responses, again = asyncio.run(main())
+    assert slow.calls == 1
+    assert all(r["results"] == again["results"] for r in responses)
+    assert again["cached"] is True
+    assert service.get_stats()["deduplicated"] == 2
+
+    # Callers get copies - editing one does not touch the cache
+    again["results"].clear()
+    assert asyncio.run(service.search("Zenvita tea"))["results"]
+
+
+def test_search_sync_uses_only_sync_providers():
+    async_only = CountingProvider("google")
+    stub = StubProvider()
+    service = SearchService({"google": async_only, "stub": stub}, order=["google", "stub"])
+
+    results = service.search_sync("Zenvita tea", num_results=3)
+    assert [r["source"] for r in results] == ["stub"] * 3
+    assert async_only.calls == 0
+    assert service.search_sync("Zenvita tea", num_results=3) == results
+    assert service.get_stats()["hits"] == 1
+
+
+def test_search_html_has_its_own_cache():
+    bing = FakeBing("bing")
+    service = SearchService({"bing": bing}, order=["bing"], maxsize=10, html_maxsize=2)
+
+    async def main():
+        pages = [await service.search_html(q) for q in ["a", "A ", "b", "c", "a"]]
+        return pages
+
+    assert asyncio.run(main()) == ["<html>a</html>", "<html>a</html>", "<html>b</html>", "<html>c</html>",
+                                   "<html>a</html>"]
+    # "a" was evicted by "b" and "c" from the two-entry page cache
+    assert bing.calls == 4
+    assert len(service._memory) == 0
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from cachetools import TLRUCache
+
+import similarity
+from similarity import (check_brand_similarity, check_brand_similarity_async, check_suffix_conflict_async,
+                        llm_detect_suffix_conflicts_cached)
+
+LLM_REJECT = {
+    "has_conflict": True,
+    "recommendation": "REJECT",
+    "summary": "-lytics pattern",
+    "conflicts": [{"detected_pattern": "lytics", "conflicting_brand": "Google Analytics", "tier": 1,
+                   "risk_level": "HIGH"}],
+}
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    """Stub the LLM call with a fresh cache; returns the names it was called with ("Failing" gets no answer)."""
+    calls = []
+
+    async def detect(brand_name, category):
+        calls.append(brand_name)
+        await asyncio.sleep(0.01)
+        return None if brand_name == "Failing" else dict(LLM_REJECT)
+
+    monkeypatch.setattr(similarity, "LLM_AVAILABLE", True)
+    monkeypatch.setattr(similarity, "llm_detect_suffix_conflicts", detect)
+    monkeypatch.setattr(similarity, "_suffix_llm_cache", TLRUCache(maxsize=100, ttu=lambda key, value, now: now + 60))
+    monkeypatch.setattr(similarity, "_suffix_llm_inflight", {})
+    return calls
+
+
+def test_llm_results_are_cached_and_shared(llm_calls):
+    async def main():
+        first = await asyncio.gather(*(llm_detect_suffix_conflicts_cached(name, "Retail")
+                                       for name in ["Brewlytics", "brewlytics", " BREWLYTICS"]))
+        again = await llm_detect_suffix_conflicts_cached("Brewlytics", "retail ")
+        failed = [await llm_detect_suffix_conflicts_cached("Failing", "Retail") for _ in range(2)]
+        return first, again, failed
+
+    first, again, failed = asyncio.run(main())
+    assert first == [LLM_REJECT] * 3 and again == LLM_REJECT
+    assert failed == [None, None]
+    assert llm_calls == ["Brewlytics", "Failing", "Failing"]
+
+
+def test_suffix_stage_merges_llm_verdict_and_skips_it_after_tier1(llm_calls):
+    tier1 = asyncio.run(check_suffix_conflict_async("HeadBook", "Hospitality", "Hotels"))
+    assert tier1["detection_method"] == "STATIC_TIER1" and tier1["should_reject"]
+    assert llm_calls == []
+
+    merged = asyncio.run(check_suffix_conflict_async("Brewlytics", "Retail", "Online store"))
+    assert llm_calls == ["Brewlytics"]
+    assert merged["detection_method"] == "LLM_ENHANCED"
+    assert merged["should_reject"] and merged["rejection_reason"].endswith("-lytics pattern")
+    assert [c["brand"] for c in merged["tier1_conflicts"]] == ["Google Analytics"]
+
+    failed = asyncio.run(check_suffix_conflict_async("Failing", "Retail", "Online store"))
+    assert failed["detection_method"] == "STATIC_ONLY_LLM_FAILED"
+
+
+@pytest.mark.parametrize("name, industry, category", [
+    ("HeadBook", "Hospitality", "Hotels"),
+    ("Zenvita", "Food", "Tea"),
+    ("Gooogle", "Technology", "Search"),
+])
+def test_async_similarity_matches_sync_without_llm(monkeypatch, name, industry, category):
+    monkeypatch.setattr(similarity, "LLM_AVAILABLE", False)
+    assert asyncio.run(check_brand_similarity_async(name, industry, category)) == \
+        check_brand_similarity(name, industry, category)
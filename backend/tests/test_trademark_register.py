@@ -0,0 +1,113 @@
+import json
+import sqlite3
+
+import pytest
+
+from trademark_register import TrademarkRegister, load_dump, normalize_country
+
+
+def write_jsonl(path, rows):
+    with open(path, "w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+
+
+INDIA_ROWS = [
+    {"trademark": "Luminara", "application_number": "IN-1", "applicant": "Lumi Labs",
+     "nice_class": "3", "status": "Registered"},
+    {"trademark": "Lumnara", "application_number": "IN-2", "applicant": "Other Co",
+     "nice_class": "32", "status": "Objected"},
+    {"trademark": "Luminara Elixir Wellness Drinks", "application_number": "IN-3",
+     "nice_class": "32", "status": "Pending"},
+    {"trademark": "Lumin", "application_number": "IN-4", "nice_class": "3", "status": "Abandoned"},
+    {"trademark": "Lumayaa Wooo", "application_number": "IN-5", "nice_class": "3", "status": "Registered"},
+]
+USA_ROWS = [
+    {"mark": "Luminara", "serial_number": "97000001", "owner": "Lumi US", "classes": "3", "status": "LIVE"},
+]
+
+
+@pytest.fixture
+def register(tmp_path):
+    path = str(tmp_path / "register.db")
+    india, usa = str(tmp_path / "india.jsonl"), str(tmp_path / "usa.jsonl")
+    write_jsonl(india, INDIA_ROWS)
+    write_jsonl(usa, USA_ROWS)
+    assert load_dump(path, [india], "India") == len(INDIA_ROWS)
+    assert load_dump(path, [usa], "United States") == len(USA_ROWS)
+    return path, india
+
+
+def count_marks(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM marks").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_normalize_country():
+    assert normalize_country(" united states ") == "USA"
+    assert normalize_country("India") == "INDIA"
+
+
+def test_jurisdictions_are_normalized(register):
+    path, _ = register
+    assert TrademarkRegister(path).jurisdictions() == frozenset({"INDIA", "USA"})
+
+
+def test_reload_upserts_in_place(register, tmp_path):
+    path, _ = register
+    before = count_marks(path)
+    update = str(tmp_path / "india_update.jsonl")
+    write_jsonl(update, [{**INDIA_ROWS[0], "status": "Cancelled", "nice_class": "3,5"}])
+    assert load_dump(path, [update], "india") == 1
+    assert count_marks(path) == before
+
+    marks = TrademarkRegister(path).search("Luminara", include_dead=True, jurisdictions=["India"])
+    exact = [mark for mark in marks if mark.application_number == "IN-1"]
+    assert len(exact) == 1
+    assert exact[0].status == "cancelled" and exact[0].classes == (3, 5)
+    # Dead marks are dropped by default
+    live = TrademarkRegister(path).search("Luminara", jurisdictions=["India"])
+    assert "IN-1" not in [mark.application_number for mark in live]
+
+
+def test_class_filter(register):
+    path, _ = register
+    register = TrademarkRegister(path)
+    marks = {mark.application_number: mark for mark in register.search("Luminara", nice_classes=[3])}
+    # Exact matches ignore the class filter; other match types keep only class 3
+    assert marks["IN-1"].match_type == "exact" and marks["IN-1"].same_class is True
+    assert "IN-2" not in marks and "IN-3" not in marks
+
+    marks = {mark.application_number: mark for mark in register.search("Luminara", nice_classes=[32])}
+    assert marks["IN-1"].same_class is False
+    assert marks["IN-2"].match_type == "phonetic"
+    assert marks["IN-3"].match_type in ("prefix", "fulltext")
+
+
+def test_jurisdiction_filter(register):
+    path, _ = register
+    register = TrademarkRegister(path)
+    jurisdictions = {mark.jurisdiction for mark in register.search("Luminara")}
+    assert jurisdictions == {"INDIA", "USA"}
+    assert {mark.jurisdiction for mark in register.search("Luminara", jurisdictions=["US"])} == {"USA"}
+    assert {mark.jurisdiction for mark in register.search("Luminara", jurisdictions=["india"])} == {"INDIA"}
+
+
+def test_phonetic_length_guard(register):
+    path, _ = register
+    register = TrademarkRegister(path)
+    marks = {mark.application_number: mark for mark in register.search("Luminara", jurisdictions=["India"])}
+    assert marks["IN-2"].match_type == "phonetic"
+    # "Lum" and "Lumayaa Wooo" share Soundex L500 and the first letters, but the
+    # mark is over twice as long: only the prefix query may return it
+    marks = {mark.application_number: mark for mark in register.search("Lum", jurisdictions=["India"])}
+    assert marks["IN-5"].match_type == "prefix"
+
+
+def test_missing_register_is_unavailable(tmp_path):
+    register = TrademarkRegister(str(tmp_path / "missing.db"))
+    assert not register.available()
+    assert register.search("Luminara") == []
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import pytest
+
+import trademark_research
+from trademark_research import generate_search_queries, run_search_queries, select_extra_queries
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """Stub the web search: "slow" queries sleep past the budget, "boom" raises; returns the peak concurrency seen."""
+    state = {"running": 0, "peak": 0}
+
+    async def search(query, timeout=15):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            await asyncio.sleep(5 if query.startswith("slow") else 0.05)
+            if query.startswith("boom"):
+                raise RuntimeError("search backend down")
+            return [{"title": f"{query} result"}]
+        finally:
+            state["running"] -= 1
+
+    monkeypatch.setattr(trademark_research, "execute_web_search", search)
+    return state
+
+
+def make_queries(*names):
+    return [{"query": name, "purpose": f"purpose {name}"} for name in names]
+
+
+def test_queries_run_concurrently_and_keep_query_order(searches):
+    started = time.perf_counter()
+    results = asyncio.run(run_search_queries(make_queries("a", "b", "boom", "c"), concurrency=2, budget=2))
+    assert time.perf_counter() - started < 0.5
+    assert searches["peak"] == 2
+    assert [r["title"] for r in results] == ["a result", "b result", "c result"]
+    assert results[0]["query_purpose"] == "purpose a"
+
+
+def test_budget_keeps_finished_queries_and_cancels_the_rest(searches):
+    started = time.perf_counter()
+    results = asyncio.run(run_search_queries(make_queries("slow", "a", "b"), concurrency=5, budget=0.3))
+    assert time.perf_counter() - started < 1
+    assert [r["title"] for r in results] == ["a result", "b result"]
+
+
+def test_extra_batches_select_by_purpose():
+    queries = generate_search_queries("Zenvita", "Beverages", "Tea", ["India", "USA"])
+    assert select_extra_queries(queries, []) == []
+    assert select_extra_queries(queries, ["unknown"]) == []
+    phonetic = select_extra_queries(queries, ["phonetic"])
+    assert phonetic and all(q["purpose"].startswith("Find phonetically similar") for q in phonetic)
+    country = select_extra_queries(queries, ["country"])
+    assert [q["purpose"] for q in country] == [q["purpose"] for q in queries[3:] if q["purpose"].startswith("Find trademarks in ")]
+    assert all(q not in queries[:3] for q in select_extra_queries(queries, ["registry", "phonetic", "country"]))
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from brand_index import TrigramIndex
+
+NAMES = ["nova", "novara", "nivea", "zara", "zarah", "apple", "apples", "pineapple", "app",
+         "luminara", "lumina", "luminar", "vextrona", "vextron", "a", "ab", "", "nova nova"]
+
+
+def levenshtein_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def random_names(count, seed=7):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abnor ") for _ in range(rng.randint(0, 8))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("names", [NAMES, random_names(300)])
+@pytest.mark.parametrize("k", [0, 1, 2, 3])
+def test_within_distance_matches_brute_force(names, k):
+    index = TrigramIndex(names)
+    for query in names[:40] + ["novra", "lumnara", "x", ""]:
+        expected = [(i, levenshtein_distance(query, name)) for i, name in enumerate(names)
+                    if levenshtein_distance(query, name) <= k]
+        assert index.within_distance(query, k) == expected, query
+
+
+@pytest.mark.parametrize("names", [NAMES, random_names(300, seed=11)])
+@pytest.mark.parametrize("min_length", [1, 3])
+def test_substrings_of_matches_brute_force(names, min_length):
+    index = TrigramIndex(names)
+    for query in names[:40] + ["pineapple juice", "supernova", ""]:
+        expected = [i for i, name in enumerate(names) if len(name) >= min_length and name in query]
+        assert index.substrings_of(query, min_length) == expected, query
+
+
+def test_superstrings_of_matches_brute_force():
+    index = TrigramIndex(NAMES)
+    for query in ["app", "nov", "ara", "lumin", "a", "zz"]:
+        assert index.superstrings_of(query) == [i for i, name in enumerate(NAMES) if query in name], query
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+import understanding_store
+from understanding_store import get_brand_understanding, get_store_stats, invalidate_understandings, understanding_key
+
+
+@pytest.fixture
+def generated(fake_db, monkeypatch):
+    """Route the store to fake_db and stub the LLM call; returns the list of generated brand names."""
+    calls = []
+
+    async def generate(brand_name, category, positioning, countries):
+        calls.append(brand_name)
+        model = "fallback" if brand_name == "Offline" else "gpt-4o"
+        return {"brand": brand_name, "meta": {"model_used": model}}
+
+    monkeypatch.setattr(understanding_store, "db", fake_db)
+    monkeypatch.setattr(understanding_store, "_indexes_ready", False)
+    monkeypatch.setattr(understanding_store, "UNDERSTANDING_STORE_ENABLED", True)
+    monkeypatch.setattr(understanding_store, "generate_brand_understanding", generate)
+    return calls
+
+
+def understand(name, category="Tea", countries=("India", "USA")):
+    return asyncio.run(get_brand_understanding(name, category, "Premium", list(countries)))
+
+
+def test_key_normalizes_inputs_and_ignores_country_order():
+    assert understanding_key("Zenvita ", "Tea  Shop", "Premium", ["USA", "india"]) == \
+        understanding_key("zenvita", "tea shop", "PREMIUM", ["India", "usa"])
+    assert understanding_key("Zenvita", "Tea", "Premium", ["India"]).startswith(f"{understanding_store.LLM_PROVIDER}|")
+
+
+def test_repeat_evaluations_are_served_from_the_store(generated):
+    first = understand("Zenvita")
+    again = understand("zenvita", countries=("usa", "india"))
+    assert generated == ["Zenvita"]
+    assert "served_from_store" not in first["meta"]
+    assert again == {"brand": "Zenvita", "meta": {"model_used": "gpt-4o", "served_from_store": True}}
+
+    understand("Zenvita", category="Coffee")
+    assert generated == ["Zenvita", "Zenvita"]
+
+
+def test_fallback_understandings_are_not_stored(generated):
+    understand("Offline")
+    understand("Offline")
+    assert generated == ["Offline", "Offline"]
+
+
+def test_prompt_change_and_invalidation_force_regeneration(generated, monkeypatch):
+    understand("Zenvita")
+    understand("Nimbus")
+    monkeypatch.setattr(understanding_store, "PROMPT_VERSION", "edited-prompt")
+    understand("Zenvita")
+    assert generated == ["Zenvita", "Nimbus", "Zenvita"]
+    summary = asyncio.run(get_store_stats())
+    assert (summary["entries"], summary["stale_version_entries"]) == (1, 2)
+
+    assert asyncio.run(invalidate_understandings(brand_name="ZENVITA")) == 2
+    understand("Zenvita")
+    assert generated[-1] == "Zenvita" and len(generated) == 4
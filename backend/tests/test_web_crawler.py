@@ -0,0 +1,94 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from http_client import close_http_session
+from web_crawler import WebsiteCrawler, extract_text
+
+XML_PAGE = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<html><body><p>Café Zenvita</p><script>var x = 1;</script></body></html>')
+BODY = "<p>" + "Zenvita makes small-batch teas. " * 10 + "</p>"
+XML_BODY = XML_PAGE.replace("</body>", BODY + "</body>")
+
+
+def test_extract_text_handles_xml_declarations():
+    assert extract_text(XML_PAGE) == "Café Zenvita"
+    assert extract_text(XML_PAGE.encode("utf-8")) == "Café Zenvita"
+
+
+def test_extract_text_uses_the_response_charset():
+    page = "<html><body><h1>Café</h1><nav>Menu</nav><!-- c --><p>Bäckerei</p></body></html>"
+    assert extract_text(page.encode("latin-1"), encoding="ISO-8859-1") == "Café\nBäckerei"
+    assert extract_text(page.encode("latin-1"), encoding="latin-1") == "Café\nBäckerei"
+    assert extract_text(page.encode("euc_jp"), encoding="euc_jp") == "Café\nBäckerei"
+    assert extract_text(page.encode("utf-8"), encoding="no-such-codec") == "Café\nBäckerei"
+
+
+def test_extract_text_limits_and_empty_pages():
+    assert extract_text("") == ""
+    assert extract_text(b"   ") == ""
+    assert extract_text("<p>abcdefghij</p>", limit=4) == "abcd... [truncated]"
+
+
+def run_with_site(scenario):
+    """Run scenario(crawler, base_url, hits) against a small local site."""
+    hits = {}
+
+    async def page(request):
+        name = request.match_info["name"]
+        hits[name] = hits.get(name, 0) + 1
+        if name == "missing":
+            raise web.HTTPNotFound()
+        if name == "short":
+            return web.Response(text="<p>Too short</p>", content_type="text/html")
+        if name == "xml":
+            return web.Response(body=XML_BODY.encode("utf-8"), content_type="text/html")
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=BODY, content_type="text/html", headers={"ETag": '"v1"'})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{name}", page)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            await scenario(WebsiteCrawler(), str(server.make_url("")).rstrip("/"), hits)
+        finally:
+            await close_http_session()
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_fetch_text_caches_and_revalidates():
+    async def scenario(crawler, base, hits):
+        url = f"{base}/about"
+        first = await asyncio.gather(*(crawler.fetch_text(url) for _ in range(3)))
+        assert first == [extract_text(BODY)] * 3
+        assert hits["about"] == 1
+
+        assert await crawler.fetch_text(url) == first[0]
+        assert hits["about"] == 1
+
+        crawler._cache[url]["checked_at"] -= crawler._cache[url]["fresh_for"]
+        assert await crawler.fetch_text(url) == first[0]
+        assert hits["about"] == 2
+        assert crawler.get_stats()["revalidated"] == 1
+
+        assert await crawler.fetch_text(f"{base}/missing") == ""
+        assert await crawler.fetch_text(f"{base}/missing") == ""
+        assert hits["missing"] == 1
+
+    run_with_site(scenario)
+
+
+def test_crawl_pages_keeps_priority_order_and_skips_thin_pages():
+    async def scenario(crawler, base, hits):
+        pages = [(f"{base}/{name}", name) for name in ("missing", "short", "xml", "home", "about")]
+        crawled = await crawler.crawl_pages(pages, max_pages=4)
+        assert [name for _, name, _ in crawled] == ["xml", "home", "about"]
+        assert crawled[0][2].startswith("Café Zenvita\nZenvita makes")
+
+    run_with_site(scenario)
@@ -0,0 +1,431 @@
+"""
+Local Trademark Register
+========================
+Offline, searchable copy of trademark registers (IP India, USPTO, ...) in a
+SQLite database, loaded from bulk dumps. conduct_trademark_research() queries
+it before the web search; when the register covers every target country the
+trademark web queries are skipped (company-registry queries still run).
+
+Search modes (combined in search()):
+- exact     - same normalized name (any NICE class)
+- phonetic  - same Metaphone / alternate key, or same Soundex + first letters,
+              within 2x the name's length
+- prefix    - marks that start with the name ("zorvix" -> "Zorvix Pay")
+- fulltext  - FTS5 word-prefix match on the mark text ("luminara" -> "Luminara Elixir")
+Every mode except exact can be restricted to NICE classes; marks with no class
+on record are always kept.
+
+The database path comes from TRADEMARK_REGISTER_PATH. Load / update it with:
+
+    python trademark_register.py load ip_india.csv --jurisdiction India
+    python trademark_register.py load uspto.jsonl --jurisdiction USA --replace
+    python trademark_register.py search "Luminara" --class 3
+    python trademark_register.py stats
+
+Rows are upserted by (jurisdiction, application number), so re-loading a newer
+dump updates statuses in place. Dump columns are matched by name (see
+REGISTER_FIELD_ALIASES; same aliases as brand_corpus.py plus filing date / url).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from brand_corpus import DEAD_STATUSES, FIELD_ALIASES, parse_classes, read_rows, source_field, status_name
+from brand_index import alternate_phonetic_key
+from similarity import normalize_name, phonetic_codes
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+TRADEMARK_REGISTER_PATH = os.environ.get("TRADEMARK_REGISTER_PATH", "")
+TRADEMARK_REGISTER_LIMIT = int(os.environ.get("TRADEMARK_REGISTER_LIMIT", 25))
+TRADEMARK_REGISTER_BATCH = 5000
+
+# Common country name variations
+COUNTRY_NAME_MAP = {
+    "UNITED STATES": "USA",
+    "US": "USA",
+    "UNITED KINGDOM": "UK",
+    "BRITAIN": "UK",
+    "ENGLAND": "UK",
+    "UNITED ARAB EMIRATES": "UAE",
+    "EMIRATES": "UAE"
+}
+
+
+def normalize_country(country: str) -> str:
+    """Upper-case country name with common variations mapped (United States -> USA)"""
+    country_upper = country.upper().strip()
+    return COUNTRY_NAME_MAP.get(country_upper, country_upper)
+
+
+REGISTER_FIELD_ALIASES = {
+    **FIELD_ALIASES,
+    "filing_date": ("filing_date", "application_date", "date_of_application", "filed"),
+    "url": ("url", "link", "source_url"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS marks (
+    id INTEGER PRIMARY KEY,
+    mark_key TEXT NOT NULL UNIQUE,
+    jurisdiction TEXT NOT NULL,
+    name TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    compact TEXT NOT NULL,
+    serial TEXT,
+    owner TEXT,
+    status TEXT,
+    status_raw TEXT,
+    classes TEXT,
+    filing_date TEXT,
+    source TEXT,
+    url TEXT,
+    soundex TEXT,
+    metaphone TEXT,
+    alternate TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_marks_normalized ON marks(normalized);
+CREATE INDEX IF NOT EXISTS idx_marks_compact ON marks(compact);
+CREATE INDEX IF NOT EXISTS idx_marks_soundex ON marks(soundex);
+CREATE INDEX IF NOT EXISTS idx_marks_metaphone ON marks(metaphone);
+CREATE INDEX IF NOT EXISTS idx_marks_alternate ON marks(alternate);
+
+CREATE TABLE IF NOT EXISTS mark_classes (
+    nice_class INTEGER NOT NULL,
+    mark_id INTEGER NOT NULL,
+    PRIMARY KEY (nice_class, mark_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_mark_classes_mark ON mark_classes(mark_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS marks_fts USING fts5(
+    name, owner, content='marks', content_rowid='id', prefix='3'
+);
+CREATE TRIGGER IF NOT EXISTS marks_ai AFTER INSERT ON marks BEGIN
+    INSERT INTO marks_fts(rowid, name, owner) VALUES (new.id, new.name, new.owner);
+END;
+CREATE TRIGGER IF NOT EXISTS marks_ad AFTER DELETE ON marks BEGIN
+    INSERT INTO marks_fts(marks_fts, rowid, name, owner) VALUES ('delete', old.id, old.name, old.owner);
+    DELETE FROM mark_classes WHERE mark_id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS marks_au AFTER UPDATE ON marks BEGIN
+    INSERT INTO marks_fts(marks_fts, rowid, name, owner) VALUES ('delete', old.id, old.name, old.owner);
+    INSERT INTO marks_fts(rowid, name, owner) VALUES (new.id, new.name, new.owner);
+END;
+
+CREATE TABLE IF NOT EXISTS register_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+MARK_COLUMNS = ("id", "jurisdiction", "name", "normalized", "serial", "owner", "status", "status_raw",
+                "classes", "filing_date", "source", "url")
+
+
+@dataclass
+class RegisterMark:
+    """A mark found in the local register"""
+    name: str
+    jurisdiction: str
+    match_type: str  # "exact", "phonetic", "prefix", "fulltext"
+    application_number: Optional[str] = None
+    owner: Optional[str] = None
+    status: str = "unknown"  # brand_corpus.STATUSES
+    status_raw: Optional[str] = None
+    classes: Tuple[int, ...] = ()
+    same_class: Optional[bool] = None  # None when no NICE class filter was given
+    filing_date: Optional[str] = None
+    source: Optional[str] = None
+    url: Optional[str] = None
+
+    @property
+    def is_live(self) -> bool:
+        return self.status not in DEAD_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ============ LOADING ============
+
+def connect(path: str) -> sqlite3.Connection:
+    """Read-write connection with the schema in place (loader side)."""
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _mark_row(row: Dict, jurisdiction: str, source: str, now: str) -> Optional[Tuple]:
+    name = str(source_field(row, "name", REGISTER_FIELD_ALIASES) or "").strip()
+    normalized = normalize_name(name)
+    if not normalized:
+        return None
+    compact = normalized.replace(" ", "")
+    serial = str(source_field(row, "serial", REGISTER_FIELD_ALIASES) or "").strip()
+    owner = str(source_field(row, "owner", REGISTER_FIELD_ALIASES) or "").strip()
+    status_raw = str(source_field(row, "status", REGISTER_FIELD_ALIASES) or "").strip().upper()
+    classes = parse_classes(source_field(row, "classes", REGISTER_FIELD_ALIASES))
+    soundex, metaphone = phonetic_codes(normalized)
+    mark_key = f"{jurisdiction}#{serial}" if serial else f"{jurisdiction}|{normalized}|{owner.lower()}"
+    return (
+        mark_key, jurisdiction, name, normalized, compact, serial or None, owner or None,
+        status_name(status_raw), status_raw or None, ",".join(map(str, classes)),
+        source_field(row, "filing_date", REGISTER_FIELD_ALIASES), source,
+        source_field(row, "url", REGISTER_FIELD_ALIASES),
+        soundex, metaphone, alternate_phonetic_key(compact), now,
+    ), classes
+
+
+UPSERT_SQL = """
+INSERT INTO marks (mark_key, jurisdiction, name, normalized, compact, serial, owner, status, status_raw,
+                   classes, filing_date, source, url, soundex, metaphone, alternate, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(mark_key) DO UPDATE SET
+    name = excluded.name, normalized = excluded.normalized, compact = excluded.compact,
+    owner = excluded.owner, status = excluded.status, status_raw = excluded.status_raw,
+    classes = excluded.classes, filing_date = excluded.filing_date, source = excluded.source,
+    url = excluded.url, soundex = excluded.soundex, metaphone = excluded.metaphone,
+    alternate = excluded.alternate, updated_at = excluded.updated_at
+RETURNING id
+"""
+
+
+def load_dump(path: str, dump_paths: Iterable[str], jurisdiction: str,
+              source: Optional[str] = None, replace: bool = False) -> int:
+    """
+    Upsert marks from CSV / JSONL dumps into the register at path.
+    replace=True first drops this jurisdiction's existing marks. Returns rows loaded.
+    """
+    jurisdiction = normalize_country(jurisdiction)
+    connection = connect(path)
+    loaded = 0
+    now = datetime.now(timezone.utc).isoformat()
+    try:
+        if replace:
+            with connection:
+                connection.execute("DELETE FROM marks WHERE jurisdiction = ?", (jurisdiction,))
+        for dump_path in dump_paths:
+            dump_source = source or f"{jurisdiction.title()} register ({os.path.basename(dump_path)})"
+            batch = []
+            for row in read_rows(dump_path):
+                parsed = _mark_row(row, jurisdiction, dump_source, now)
+                if parsed is not None:
+                    batch.append(parsed)
+                if len(batch) >= TRADEMARK_REGISTER_BATCH:
+                    loaded += _write_batch(connection, batch)
+                    batch = []
+            loaded += _write_batch(connection, batch)
+            logger.info(f"Trademark register: loaded {dump_path} ({loaded} marks so far)")
+
+        with connection:
+            jurisdictions = [row[0] for row in connection.execute("SELECT DISTINCT jurisdiction FROM marks")]
+            connection.execute("INSERT OR REPLACE INTO register_meta VALUES ('jurisdictions', ?)",
+                               (json.dumps(sorted(jurisdictions)),))
+            connection.execute("INSERT OR REPLACE INTO register_meta VALUES ('updated_at', ?)", (now,))
+        connection.execute("INSERT INTO marks_fts(marks_fts) VALUES ('optimize')")
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+    return loaded
+
+
+def _write_batch(connection: sqlite3.Connection, batch: List[Tuple]) -> int:
+    if not batch:
+        return 0
+    with connection:
+        for values, classes in batch:
+            mark_id = connection.execute(UPSERT_SQL, values).fetchone()[0]
+            connection.execute("DELETE FROM mark_classes WHERE mark_id = ?", (mark_id,))
+            connection.executemany("INSERT OR IGNORE INTO mark_classes VALUES (?, ?)",
+                                   [(nice_class, mark_id) for nice_class in classes])
+    return len(batch)
+
+
+# ============ SEARCH ============
+
+def _fts_query(normalized: str) -> Optional[str]:
+    tokens = [token for token in normalized.split() if len(token) >= 3]
+    if not tokens:
+        return None
+    # Every word must appear (as a word prefix) - single generic words like "pay" match too much
+    return "name : (" + " AND ".join(f'"{token}"*' for token in tokens) + ")"
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class TrademarkRegister:
+    """Read-only access to the local register (one SQLite connection per thread)."""
+
+    def __init__(self, path: str = TRADEMARK_REGISTER_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._jurisdictions: Optional[frozenset] = None
+        self.stats = {"searches": 0, "marks_returned": 0}
+
+    def available(self) -> bool:
+        return bool(self.path) and os.path.exists(self.path)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            connection.execute("PRAGMA query_only = ON")
+            connection.execute("PRAGMA mmap_size = 268435456")
+            self._local.connection = connection
+        return connection
+
+    def jurisdictions(self) -> frozenset:
+        """Jurisdictions loaded into the register (upper-case, as given at load time)."""
+        if self._jurisdictions is None:
+            try:
+                row = self._connection().execute(
+                    "SELECT value FROM register_meta WHERE key = 'jurisdictions'").fetchone()
+                self._jurisdictions = frozenset(json.loads(row[0])) if row else frozenset()
+            except sqlite3.Error as e:
+                logger.warning(f"Trademark register: cannot read jurisdictions: {e}")
+                return frozenset()
+        return self._jurisdictions
+
+    def search(self, name: str, nice_classes: Optional[Iterable[int]] = None,
+               limit: int = TRADEMARK_REGISTER_LIMIT, include_dead: bool = False,
+               jurisdictions: Optional[Iterable[str]] = None) -> List[RegisterMark]:
+        """
+        Marks conflicting with name, strongest match type first. Exact matches
+        ignore nice_classes; other modes keep marks in those classes (or with
+        no class on record).
+        """
+        normalized = normalize_name(name or "")
+        if not normalized or not self.available():
+            return []
+        compact = normalized.replace(" ", "")
+        soundex, metaphone = phonetic_codes(normalized)
+        alternate = alternate_phonetic_key(compact)
+        classes = sorted({int(c) for c in nice_classes or () if str(c).isdigit()})
+
+        filters, filter_params = [], []
+        if not include_dead:
+            filters.append(f"status NOT IN ({','.join('?' * len(DEAD_STATUSES))})")
+            filter_params.extend(sorted(DEAD_STATUSES))
+        if jurisdictions:
+            wanted = sorted({normalize_country(j) for j in jurisdictions})
+            filters.append(f"jurisdiction IN ({','.join('?' * len(wanted))})")
+            filter_params.extend(wanted)
+        class_filter, class_params = "", []
+        if classes:
+            class_filter = (f" AND (classes = '' OR id IN (SELECT mark_id FROM mark_classes "
+                            f"WHERE nice_class IN ({','.join('?' * len(classes))})))")
+            class_params = classes
+        where = "".join(f" AND {f}" for f in filters)
+        select = f"SELECT {', '.join(MARK_COLUMNS)} FROM marks WHERE "
+
+        # Same length guard as similarity._phonetic_match: 4-char Soundex codes
+        # otherwise tie short names to any long mark starting the same way
+        length_guard = " AND length(normalized) * 2 >= ? AND length(normalized) <= ? * 2"
+        queries = [
+            ("exact", select + "(normalized = ? OR compact = ?)" + where,
+             [normalized, compact] + filter_params),
+            ("phonetic", select + "(metaphone = ? OR (alternate != '' AND alternate = ?) "
+             "OR (soundex = ? AND substr(compact, 1, 2) = ?))" + length_guard + where + class_filter,
+             [metaphone, alternate, soundex, compact[:2], len(normalized), len(normalized)]
+             + filter_params + class_params),
+            ("prefix", select + "compact >= ? AND compact < ?" + where + class_filter,
+             [compact, _prefix_upper_bound(compact)] + filter_params + class_params),
+        ]
+        fts_query = _fts_query(normalized)
+        if fts_query:
+            queries.append(("fulltext", select + "id IN (SELECT rowid FROM marks_fts WHERE marks_fts MATCH ? "
+                            "ORDER BY rank LIMIT ?)" + where + class_filter,
+                            [fts_query, limit * 4] + filter_params + class_params))
+
+        found: Dict[int, RegisterMark] = {}
+        try:
+            connection = self._connection()
+            for match_type, sql, params in queries:
+                for row in connection.execute(sql + " LIMIT ?", params + [limit]):
+                    if row[0] not in found:
+                        found[row[0]] = self._mark(row, match_type, classes)
+                if len(found) >= limit:
+                    break
+        except sqlite3.Error as e:
+            logger.warning(f"Trademark register search failed for '{name}': {e}")
+        marks = list(found.values())[:limit]
+        self.stats["searches"] += 1
+        self.stats["marks_returned"] += len(marks)
+        return marks
+
+    @staticmethod
+    def _mark(row: Tuple, match_type: str, classes: List[int]) -> RegisterMark:
+        record = dict(zip(MARK_COLUMNS, row))
+        mark_classes = tuple(int(c) for c in (record["classes"] or "").split(",") if c)
+        return RegisterMark(
+            name=record["name"],
+            jurisdiction=record["jurisdiction"],
+            match_type=match_type,
+            application_number=record["serial"],
+            owner=record["owner"],
+            status=record["status"] or "unknown",
+            status_raw=record["status_raw"],
+            classes=mark_classes,
+            same_class=(bool(set(mark_classes) & set(classes)) if mark_classes else None) if classes else None,
+            filing_date=record["filing_date"],
+            source=record["source"],
+            url=record["url"],
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        summary = {"path": self.path, "available": self.available(), **self.stats}
+        if self.available():
+            try:
+                connection = self._connection()
+                summary["marks"] = connection.execute("SELECT COUNT(*) FROM marks").fetchone()[0]
+                summary["jurisdictions"] = sorted(self.jurisdictions())
+                row = connection.execute("SELECT value FROM register_meta WHERE key = 'updated_at'").fetchone()
+                summary["updated_at"] = row[0] if row else None
+            except sqlite3.Error as e:
+                logger.warning(f"Trademark register stats failed: {e}")
+        return summary
+
+
+# Process-wide instance used by trademark_research.py
+trademark_register = TrademarkRegister()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Load and query the local trademark register")
+    parser.add_argument("command", choices=["load", "search", "stats"])
+    parser.add_argument("args", nargs="*", help="dump files (load) or a brand name (search)")
+    parser.add_argument("--db", default=TRADEMARK_REGISTER_PATH, required=not TRADEMARK_REGISTER_PATH,
+                        help="register database (default: $TRADEMARK_REGISTER_PATH)")
+    parser.add_argument("--jurisdiction", default="India")
+    parser.add_argument("--source")
+    parser.add_argument("--replace", action="store_true", help="drop the jurisdiction's marks first")
+    parser.add_argument("--class", dest="nice_class", type=int, action="append")
+    options = parser.parse_args()
+
+    register = TrademarkRegister(options.db)
+    if options.command == "load":
+        count = load_dump(options.db, options.args, options.jurisdiction, options.source, options.replace)
+        print(f"Loaded {count} marks")
+        print(json.dumps(register.get_stats(), indent=2))
+    elif options.command == "search":
+        for mark in register.search(" ".join(options.args), options.nice_class):
+            print(json.dumps(mark.to_dict()))
+    else:
+        print(json.dumps(register.get_stats(), indent=2))
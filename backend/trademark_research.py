@@ -13,6 +13,7 @@ Mimics Perplexity's approach:
 
 import logging
 import asyncio
+import os
 import re
 import json
 import httpx
@@ -20,10 +21,24 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+# Shared web search (cached, provider fallback chain)
+from search_service import search_service, SEARCH_SOURCE_NAMES
+
+# Local offline trademark register (SQLite, TRADEMARK_REGISTER_PATH)
+from trademark_register import trademark_register, RegisterMark, normalize_country
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Web search fan-out for conduct_trademark_research
+TRADEMARK_SEARCH_CONCURRENCY = int(os.environ.get("TRADEMARK_SEARCH_CONCURRENCY", 5))
+TRADEMARK_SEARCH_BUDGET = float(os.environ.get("TRADEMARK_SEARCH_BUDGET", 15))  # seconds, whole query set
+# Comma-separated: registry, phonetic, country (empty = original 3 queries only)
+TRADEMARK_EXTRA_QUERY_BATCHES = [b.strip() for b in os.environ.get("TRADEMARK_EXTRA_QUERY_BATCHES", "").split(",") if b.strip()]
+# "uncovered" = web search only when a target country isn't in the local register; "always" = always supplement
+TRADEMARK_REGISTER_WEB_SEARCH = os.environ.get("TRADEMARK_REGISTER_WEB_SEARCH", "uncovered").lower()
+
 
 @dataclass
 class TrademarkConflict:
@@ -789,42 +804,99 @@ def generate_phonetic_variants(brand_name: str) -> List[str]:
 async def execute_web_search(query: str, timeout: int = 15) -> List[Dict[str, Any]]:
     """
     Execute a web search query with timeout protection.
-    Uses DuckDuckGo search as a fallback-friendly option.
+    Goes through the shared search service (cached, provider fallback chain).
     """
     try:
-        from duckduckgo_search import DDGS
-        
-        # Run DuckDuckGo search in executor with timeout
-        loop = asyncio.get_event_loop()
-        
-        def _do_search():
-            results = []
-            with DDGS() as ddgs:
-                search_results = list(ddgs.text(query, max_results=10))
-                for r in search_results:
-                    results.append({
-                        "title": r.get("title", ""),
-                        "url": r.get("href", r.get("link", "")),
-                        "snippet": r.get("body", r.get("snippet", "")),
-                        "source": "DuckDuckGo"
-                    })
-            return results
-        
-        try:
-            results = await asyncio.wait_for(
-                loop.run_in_executor(None, _do_search),
-                timeout=float(timeout)
-            )
-            return results
-        except asyncio.TimeoutError:
-            logger.warning(f"Web search timeout for query '{query}'")
-            return []
-    
+        response = await asyncio.wait_for(
+            search_service.search(query, num_results=10),
+            timeout=float(timeout)
+        )
+        source = SEARCH_SOURCE_NAMES.get(response["provider"], response["provider"])
+        return [
+            {"title": r["title"], "url": r["url"], "snippet": r["snippet"], "source": source}
+            for r in response["results"]
+        ]
+    except asyncio.TimeoutError:
+        logger.warning(f"Web search timeout for query '{query}'")
+        return []
     except Exception as e:
         logger.warning(f"Web search failed for query '{query}': {str(e)}")
         return []
 
 
+
+# Extra generate_search_queries batches (matched on "purpose") that can be added on top of
+# the first 3 queries - they run concurrently, so they fit in the same latency budget.
+EXTRA_QUERY_BATCHES = {
+    "registry": ("Find registered companies", "Search Tofler company database", "Search Zauba Corp company database"),
+    "phonetic": ("Find phonetically similar trademarks",),
+    "country": ("Find trademarks in ",),
+}
+
+# generate_search_queries purposes covered by a local trademark register
+TRADEMARK_QUERY_PURPOSES = (
+    "Find registered trademarks", "Find pending trademark", "Find trademarks in",
+    "Find phonetically similar trademarks", "Search trademark aggregator", "Search IP India",
+)
+
+
+def select_extra_queries(queries: List[Dict[str, str]], batches: List[str]) -> List[Dict[str, str]]:
+    """Pick the queries belonging to the requested extra batches (registry, phonetic, country)"""
+    prefixes = tuple(p for b in batches for p in EXTRA_QUERY_BATCHES.get(b, ()))
+    if not prefixes:
+        return []
+    return [q for q in queries[3:] if q["purpose"].startswith(prefixes)]
+
+
+def is_trademark_query(query: Dict[str, str]) -> bool:
+    """Queries looking for trademark filings (the register answers these), as opposed to companies / usage"""
+    return query["purpose"].startswith(TRADEMARK_QUERY_PURPOSES)
+
+
+async def run_search_queries(
+    queries: List[Dict[str, str]],
+    concurrency: int = None,
+    budget: float = None
+) -> List[Dict[str, Any]]:
+    """
+    Run all queries concurrently (bounded by a semaphore) under one overall deadline.
+    Results are collected as each query finishes; whatever arrived before the
+    deadline is kept. Output order follows the input query order.
+    """
+    concurrency = concurrency or TRADEMARK_SEARCH_CONCURRENCY
+    budget = budget or TRADEMARK_SEARCH_BUDGET
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(index: int, q: Dict[str, str]):
+        async with semaphore:
+            search_results = await execute_web_search(q["query"], timeout=int(budget))
+        for r in search_results:
+            r["query_purpose"] = q["purpose"]
+        return index, search_results
+    
+    tasks = [asyncio.ensure_future(run_one(i, q)) for i, q in enumerate(queries)]
+    results_by_query = {}
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=budget):
+            try:
+                index, search_results = await next_done
+                results_by_query[index] = search_results
+            except asyncio.TimeoutError:
+                raise
+            except Exception as e:
+                logger.warning(f"Search failed: {str(e)}")
+    except asyncio.TimeoutError:
+        logger.warning(f"Trademark search budget ({budget}s) exceeded - kept {len(results_by_query)}/{len(queries)} queries")
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    
+    all_search_results = []
+    for index in sorted(results_by_query):
+        all_search_results.extend(results_by_query[index])
+    return all_search_results
+
 def get_known_data(brand_name: str) -> Dict[str, Any]:
     """Get known trademark/company data from cache"""
     brand_lower = brand_name.lower().strip()
@@ -1246,21 +1318,7 @@ DEFAULT_STATUTE = {
 
 def get_country_statute(country: str) -> Dict[str, str]:
     """Get country-specific trademark statute information."""
-    # Normalize country name
-    country_upper = country.upper().strip()
-    
-    # Handle common variations
-    country_map = {
-        "UNITED STATES": "USA",
-        "US": "USA",
-        "UNITED KINGDOM": "UK",
-        "BRITAIN": "UK",
-        "ENGLAND": "UK",
-        "UNITED ARAB EMIRATES": "UAE",
-        "EMIRATES": "UAE"
-    }
-    
-    normalized = country_map.get(country_upper, country_upper)
+    normalized = normalize_country(country)
     
     # Try exact match first
     if normalized in COUNTRY_TRADEMARK_STATUTES:
@@ -1741,6 +1799,36 @@ def calculate_risk_scores(
     }
 
 
+def register_mark_to_conflict(mark: RegisterMark) -> TrademarkConflict:
+    """TrademarkConflict for a mark found in the local trademark register"""
+    status = mark.status.upper() if mark.status != "unknown" else mark.status_raw
+    
+    # Same risk mapping as web-search conflicts; an exact name in an unrelated class is lower risk
+    risk_level = "MEDIUM"
+    if mark.status == "registered":
+        risk_level = "HIGH"
+    elif mark.status == "objected":
+        risk_level = "LOW"
+    if mark.same_class is False:
+        risk_level = "LOW"
+    
+    return TrademarkConflict(
+        name=mark.name,
+        source=mark.source or f"{mark.jurisdiction.title()} Trademark Register",
+        conflict_type="trademark_application",
+        application_number=mark.application_number,
+        status=status,
+        owner=mark.owner,
+        class_number=", ".join(str(c) for c in mark.classes) or None,
+        filing_date=mark.filing_date,
+        similarity_score="HIGH" if mark.match_type in ("exact", "phonetic") else "MEDIUM",
+        geographic_overlap=mark.jurisdiction,
+        risk_level=risk_level,
+        details=f"Local register {mark.match_type} match",
+        url=mark.url
+    )
+
+
 async def conduct_trademark_research(
     brand_name: str,
     industry: str,
@@ -1861,8 +1949,29 @@ async def conduct_trademark_research(
                     risk_level="HIGH"
                 ))
     
-    # Step 2: Quick web search (limited to 3 queries for speed)
-    queries = generate_search_queries(brand_name, industry, category, countries)[:3]  # Only first 3 queries
+    # Step 1b: Local trademark register (milliseconds, no network)
+    register_covers_countries = False
+    if trademark_register.available():
+        nice_class = (result.nice_classification or {}).get("class_number")
+        target_countries = {normalize_country(c) for c in (countries or ["India"])}
+        register_marks = await asyncio.to_thread(
+            trademark_register.search, brand_name, [nice_class] if nice_class else None,
+            jurisdictions=target_countries
+        )
+        existing_tm_names = {c.name.lower() for c in result.trademark_conflicts}
+        for mark in register_marks:
+            if mark.name.lower() not in existing_tm_names:
+                result.trademark_conflicts.append(register_mark_to_conflict(mark))
+                existing_tm_names.add(mark.name.lower())
+        register_covers_countries = target_countries <= {normalize_country(j) for j in trademark_register.jurisdictions()}
+        logger.info(f"Trademark register: {len(register_marks)} marks for '{brand_name}' "
+                    f"(covers {'all' if register_covers_countries else 'not all'} target countries)")
+    
+    # Step 2: Quick web search (first 3 queries + optional extra batches, run concurrently)
+    # With a local register covering every target country, the trademark queries are skipped
+    # unless configured as a supplement; company-registry and keyword queries always run
+    all_queries = generate_search_queries(brand_name, industry, category, countries)
+    queries = all_queries[:3] + select_extra_queries(all_queries, TRADEMARK_EXTRA_QUERY_BATCHES)
     
     # Improvement #3: Add keyword-enhanced searches
     if product_keywords:
@@ -1872,15 +1981,12 @@ async def conduct_trademark_research(
                 "purpose": f"keyword_search_{keyword}"
             })
     
-    all_search_results = []
-    for q in queries:
-        try:
-            search_results = await execute_web_search(q["query"])
-            for r in search_results:
-                r["query_purpose"] = q["purpose"]
-            all_search_results.extend(search_results)
-        except Exception as e:
-            logger.warning(f"Search failed: {str(e)}")
+    if register_covers_countries and TRADEMARK_REGISTER_WEB_SEARCH != "always":
+        logger.info("Trademark register covers target countries - skipping trademark web queries")
+        queries = [q for q in queries if not is_trademark_query(q)]
+        queued = {q["query"] for q in queries}
+        queries += [q for q in select_extra_queries(all_queries, ["registry"]) if q["query"] not in queued]
+    all_search_results = await run_search_queries(queries)
     
     # Step 3: Extract conflicts from search results
     search_tm_conflicts = extract_trademark_conflicts(all_search_results, brand_name)
@@ -13,7 +13,6 @@ Created: July 2025
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-import os
 import json
 import logging
 import asyncio
@@ -21,13 +20,8 @@ from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
-# Try to import LLM integration
-try:
-    from emergentintegrations.llm.chat import LlmChat
-    EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
-except ImportError:
-    LlmChat = None
-    EMERGENT_KEY = None
+# LLM integration (provider selected by LLM_PROVIDER - see llm_provider.py)
+from llm_provider import LlmChat, UserMessage, EMERGENT_KEY
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -626,8 +620,6 @@ async def generate_brand_understanding(
     
     # Try LLM first
     if LlmChat and EMERGENT_KEY:
-        from emergentintegrations.llm.chat import UserMessage
-        
         models_to_try = [
             ("openai", "gpt-4o-mini"),  # Fast and reliable for structured output
             ("openai", "gpt-4o"),        # Fallback
@@ -0,0 +1,180 @@
+"""
+Brand Understanding Store
+=========================
+Persists generate_brand_understanding() output in MongoDB
+(db.brand_understanding_store) so repeat and comparison evaluations of the
+same name in the same category skip the ~30s understanding LLM call.
+
+- Keyed by LLM_PROVIDER + brand name + category + positioning + target
+  countries (all normalized), i.e. exactly the inputs of UNDERSTANDING_PROMPT
+  and who answered it - fake-provider runs never serve real traffic
+- Versioned by a hash of UNDERSTANDING_PROMPT: editing the prompt makes every
+  stored understanding a miss, no manual flush needed
+- TTL index on expires_at (UNDERSTANDING_STORE_TTL_DAYS)
+- Only LLM-generated understandings are stored; fallback results are not
+- Admin can invalidate entries (all, or by brand / category) via
+  DELETE /api/admin/understanding-store
+
+Mongo-only on purpose: an in-process tier would keep serving entries that an
+admin invalidated on another uvicorn worker.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+
+from llm_provider import LLM_PROVIDER
+from understanding_module import UNDERSTANDING_PROMPT, generate_brand_understanding
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+UNDERSTANDING_STORE_ENABLED = os.environ.get("UNDERSTANDING_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+UNDERSTANDING_STORE_TTL_DAYS = int(os.environ.get("UNDERSTANDING_STORE_TTL_DAYS", 30))
+
+STORE_COLLECTION = "brand_understanding_store"
+
+PROMPT_VERSION = hashlib.sha256(UNDERSTANDING_PROMPT.encode("utf-8")).hexdigest()[:16]
+
+# MongoDB reference (set from main server.py)
+db = None
+
+stats = {"hits": 0, "misses": 0, "stored": 0}
+_indexes_ready = False
+
+
+def set_db(database):
+    """Set database reference from main server"""
+    global db
+    db = database
+
+
+def _normalize(value: str) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def understanding_key(brand_name: str, category: str, positioning: str, countries: List[str]) -> str:
+    country_part = ",".join(sorted(_normalize(str(c)) for c in countries or []))
+    return f"{LLM_PROVIDER}|{_normalize(brand_name)}|{_normalize(category)}|{_normalize(positioning)}|{country_part}"
+
+
+async def _ensure_indexes():
+    global _indexes_ready
+    if _indexes_ready or db is None:
+        return
+    try:
+        collection = db[STORE_COLLECTION]
+        await collection.create_index([("key", 1), ("prompt_version", 1)], unique=True)
+        await collection.create_index("expires_at", expireAfterSeconds=0)
+        await collection.create_index([("brand_name", 1), ("category", 1)])
+    except Exception as e:
+        logger.warning(f"Understanding store index creation failed: {e}")
+    _indexes_ready = True
+
+
+async def load_understanding(brand_name: str, category: str, positioning: str,
+                             countries: List[str]) -> Optional[Dict[str, Any]]:
+    """Stored understanding for the current prompt version, or None."""
+    if db is None:
+        return None
+    try:
+        await _ensure_indexes()
+        doc = await db[STORE_COLLECTION].find_one(
+            {
+                "key": understanding_key(brand_name, category, positioning, countries),
+                "prompt_version": PROMPT_VERSION,
+                "expires_at": {"$gt": datetime.now(timezone.utc)},
+            },
+            {"_id": 0, "understanding": 1}
+        )
+        return doc.get("understanding") if doc else None
+    except Exception as e:
+        logger.warning(f"Understanding store read failed for '{brand_name}': {e}")
+        return None
+
+
+async def save_understanding(brand_name: str, category: str, positioning: str,
+                             countries: List[str], understanding: Dict[str, Any]):
+    if db is None:
+        return
+    try:
+        await _ensure_indexes()
+        now = datetime.now(timezone.utc)
+        key = understanding_key(brand_name, category, positioning, countries)
+        await db[STORE_COLLECTION].update_one(
+            {"key": key, "prompt_version": PROMPT_VERSION},
+            {"$set": {
+                "key": key,
+                "prompt_version": PROMPT_VERSION,
+                "brand_name": _normalize(brand_name),
+                "category": _normalize(category),
+                "understanding": understanding,
+                "stored_at": now,
+                "expires_at": now + timedelta(days=UNDERSTANDING_STORE_TTL_DAYS),
+            }},
+            upsert=True
+        )
+        stats["stored"] += 1
+    except Exception as e:
+        logger.warning(f"Understanding store write failed for '{brand_name}': {e}")
+
+
+async def get_brand_understanding(brand_name: str, category: str, positioning: str,
+                                  countries: List[str]) -> Dict[str, Any]:
+    """
+    generate_brand_understanding() with a persistent store in front of it.
+    The returned dict's meta.served_from_store tells whether the LLM call was skipped.
+    """
+    if UNDERSTANDING_STORE_ENABLED:
+        stored = await load_understanding(brand_name, category, positioning, countries)
+        if stored is not None:
+            stats["hits"] += 1
+            logger.info(f"🧠 Understanding for '{brand_name}' served from store (prompt {PROMPT_VERSION})")
+            understanding = copy.deepcopy(stored)
+            understanding.setdefault("meta", {})["served_from_store"] = True
+            return understanding
+        stats["misses"] += 1
+
+    understanding = await generate_brand_understanding(
+        brand_name=brand_name,
+        category=category,
+        positioning=positioning,
+        countries=countries
+    )
+
+    if UNDERSTANDING_STORE_ENABLED and understanding.get("meta", {}).get("model_used") != "fallback":
+        await save_understanding(brand_name, category, positioning, countries, understanding)
+    return understanding
+
+
+async def invalidate_understandings(brand_name: Optional[str] = None, category: Optional[str] = None) -> int:
+    """Delete stored understandings (all, or filtered by brand / category). Returns count deleted."""
+    if db is None:
+        return 0
+    query = {}
+    if brand_name:
+        query["brand_name"] = _normalize(brand_name)
+    if category:
+        query["category"] = _normalize(category)
+    result = await db[STORE_COLLECTION].delete_many(query)
+    logger.info(f"Understanding store: invalidated {result.deleted_count} entries ({query or 'all'})")
+    return result.deleted_count
+
+
+async def get_store_stats() -> Dict[str, Any]:
+    """Hit/miss counters for this worker plus entry counts for the current prompt version."""
+    summary = {"prompt_version": PROMPT_VERSION, "enabled": UNDERSTANDING_STORE_ENABLED, **stats}
+    if db is not None:
+        try:
+            collection = db[STORE_COLLECTION]
+            summary["entries"] = await collection.count_documents({"prompt_version": PROMPT_VERSION})
+            summary["stale_version_entries"] = await collection.count_documents(
+                {"prompt_version": {"$ne": PROMPT_VERSION}}
+            )
+        except Exception as e:
+            logger.warning(f"Understanding store stats failed: {e}")
+    return summary
@@ -7,9 +7,13 @@ Performs comprehensive visibility checks including:
 - Multiple query strategies
 - Graceful error handling
 - BOTH Play Store AND iOS App Store searches
+
+The engine is async: web, Play Store and iOS searches for all variants and
+countries are fanned out concurrently (scraper calls run in worker threads)
+and paced by per-store token buckets. check_visibility() is a sync wrapper
+around check_visibility_async() for scripts.
 """
 
-from duckduckgo_search import DDGS
 from google_play_scraper import search as google_search
 # iOS App Store search
 try:
@@ -18,12 +22,31 @@ try:
 except ImportError:
     IOS_AVAILABLE = False
     
-import time
+import asyncio
+import os
 import logging
 import re
 
+import aiohttp
+from cachetools import TTLCache
+
+from http_client import pooled_session
+from app_store_cache import app_store_cache
+from search_service import search_service, TokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Token buckets for the store scrapers (requests/second, burst) - replaces fixed sleeps
+PLAY_STORE_BUCKET = TokenBucket(float(os.environ.get("VISIBILITY_PLAY_RATE", 3)), 5)
+IOS_STORE_BUCKET = TokenBucket(float(os.environ.get("VISIBILITY_IOS_RATE", 2)), 4)
+
+# Batched iOS detail lookups (one iTunes request for many app IDs) + per-ID cache
+ITUNES_LOOKUP_URL = "https://itunes.apple.com/lookup"
+IOS_LOOKUP_MAX_IDS = 150
+IOS_LOOKUP_WINDOW = float(os.environ.get("IOS_LOOKUP_WINDOW", 0.02))  # seconds to coalesce concurrent queries
+IOS_DETAILS_TTL = int(os.environ.get("IOS_DETAILS_TTL", 24 * 3600))
+IOS_DETAILS_CACHE_MAXSIZE = int(os.environ.get("IOS_DETAILS_CACHE_MAXSIZE", 20000))
+
 
 # Phonetic substitutions for generating variants
 PHONETIC_SUBSTITUTIONS = [
@@ -136,24 +159,53 @@ def generate_phonetic_variants(brand_name: str) -> list:
 
 def get_web_search_results(query, num_results=10):
     """
-    Scrapes Web Search Results using DuckDuckGo.
+    Web Search Results via the shared search service (DuckDuckGo, cached).
     Returns list of titles/snippets.
     """
     results = []
     try:
-        with DDGS() as ddgs:
-            ddg_gen = ddgs.text(query, max_results=num_results)
-            if ddg_gen:
-                for r in ddg_gen:
-                    results.append(f"{r['title']} ({r['href']})")
+        for r in search_service.search_sync(query, num_results=num_results):
+            results.append(f"{r['title']} ({r['url']})")
     except Exception as e:
         logger.warning(f"Web search failed for '{query}': {str(e)}")
-        pass
             
     return results
 
 
-def get_play_store_results(query, country='us', timeout=10):
+async def get_web_search_results_async(query, num_results=10):
+    """Async variant of get_web_search_results (shared search service, same string format)."""
+    results = []
+    try:
+        for r in await search_service.results(query, num_results=num_results):
+            results.append(f"{r['title']} ({r['url']})")
+    except Exception as e:
+        logger.warning(f"Web search failed for '{query}': {str(e)}")
+    return results
+
+
+def _play_store_search(query, country):
+    """Single Play Store search attempt (blocking - run in a worker thread)."""
+    results = []
+    res = google_search(
+        query,
+        lang='en',
+        country=country,
+        n_hits=5  # Reduced from 10 to avoid rate limiting
+    )
+    if res:
+        for app in res:
+            if app and isinstance(app, dict):
+                results.append({
+                    "title": app.get('title', 'Unknown'),
+                    "developer": app.get('developer', 'Unknown'),
+                    "appId": app.get('appId', ''),
+                    "score": app.get('score', 0),
+                    "installs": app.get('installs', '0'),
+                })
+    return results
+
+
+async def _fetch_play_store_results(query, country='us', timeout=10):
     """
     Searches Google Play Store with ROBUST error handling (Improvement #4).
     Returns list of app info dictionaries.
@@ -163,43 +215,23 @@ def get_play_store_results(query, country='us', timeout=10):
     - Multiple retry attempts
     - Graceful degradation on failure
     - Better error logging
+    - Token-bucket pacing instead of fixed sleeps
     """
-    results = []
     max_retries = 2
     
     for attempt in range(max_retries):
+        await PLAY_STORE_BUCKET.acquire()
         try:
-            res = google_search(
-                query,
-                lang='en',
-                country=country,
-                n_hits=5  # Reduced from 10 to avoid rate limiting
-            )
-            
-            if res:
-                for app in res:
-                    if app and isinstance(app, dict):
-                        results.append({
-                            "title": app.get('title', 'Unknown'),
-                            "developer": app.get('developer', 'Unknown'),
-                            "appId": app.get('appId', ''),
-                            "score": app.get('score', 0),
-                            "installs": app.get('installs', '0'),
-                        })
-            
-            # Success - break retry loop
-            break
+            return await asyncio.wait_for(asyncio.to_thread(_play_store_search, query, country), timeout=timeout)
                         
         except TypeError as e:
             # Handle NoneType errors from google_play_scraper (most common error)
             logger.warning(f"Play Store search type error for '{query}' (attempt {attempt+1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(0.5)  # Short delay before retry
-                continue
+            continue
         except ConnectionError as e:
             logger.warning(f"Play Store connection error for '{query}': {str(e)}")
             break  # Don't retry on connection errors
-        except TimeoutError as e:
+        except (TimeoutError, asyncio.TimeoutError) as e:
             logger.warning(f"Play Store timeout for '{query}': {str(e)}")
             break  # Don't retry on timeout
         except Exception as e:
@@ -209,17 +241,120 @@ def get_play_store_results(query, country='us', timeout=10):
                 logger.warning(f"Play Store rate limited for '{query}': {str(e)}")
                 break
             logger.warning(f"Play Store search failed for '{query}' (attempt {attempt+1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(0.5)
+            continue
+        
+    return []
+
+
+def _ios_search_ids(query, country, limit):
+    """Single iOS App Store ID search (blocking - run in a worker thread)."""
+    # app-store-scraper search method
+    from itunes_app_scraper.scraper import AppStoreScraper
+    scraper = AppStoreScraper()
+    return [str(app_id) for app_id in scraper.get_app_ids_for_query(query, country=country, limit=limit)[:limit]]
+
+
+async def _itunes_lookup(app_ids, country):
+    """One iTunes lookup request for many IDs -> {app_id: details}"""
+    async with pooled_session() as session:
+        async with session.get(
+            ITUNES_LOOKUP_URL,
+            params={"id": ",".join(app_ids), "country": country, "entity": "software"},
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"iTunes lookup returned {response.status}")
+            data = await response.json(content_type=None)
+    return {str(app.get("trackId")): app for app in data.get("results", []) if app.get("trackId")}
+
+
+class IosLookupBatcher:
+    """
+    Coalesces iOS app detail lookups into multi-ID iTunes requests.
+    Every ID requested within IOS_LOOKUP_WINDOW (across concurrent queries) for the
+    same country goes out in one request; details are cached by (country, app ID).
+    Pending lookups are per event loop (the sync check_visibility runs its own
+    loop via asyncio.run), so futures are only awaited on the loop that made them.
+    """
+
+    def __init__(self, window: float = None):
+        self.window = IOS_LOOKUP_WINDOW if window is None else window
+        self._cache = TTLCache(maxsize=IOS_DETAILS_CACHE_MAXSIZE, ttl=IOS_DETAILS_TTL)
+        self._pending = {}       # (loop, country) -> {app_id: Future}
+        self._flush_tasks = {}   # (loop, country) -> Task
+        self.stats = {"hits": 0, "requests": 0, "ids_requested": 0}
+
+    async def get(self, app_ids, country):
+        """Details for the given IDs (missing/unknown IDs are omitted)."""
+        found = {}
+        waiting = {}
+        loop = asyncio.get_running_loop()
+        key = (loop, country)
+        for app_id in app_ids:
+            cached = self._cache.get((country, app_id))
+            if cached is not None:
+                self.stats["hits"] += 1
+                found[app_id] = cached
                 continue
-    
-    # Add delay to avoid rate limiting (even on success)
-    time.sleep(0.3)
+            pending = self._pending.setdefault(key, {})
+            if app_id not in pending:
+                pending[app_id] = loop.create_future()
+            waiting[app_id] = pending[app_id]
         
-    return results
+        if waiting and key not in self._flush_tasks:
+            task = loop.create_task(self._flush(key))
+            task.add_done_callback(lambda t, k=key: self._flush_done(k, t))
+            self._flush_tasks[key] = task
+        
+        for app_id, future in waiting.items():
+            details = await asyncio.shield(future)
+            if details:
+                found[app_id] = details
+        return found
+
+    async def _flush(self, key):
+        _, country = key
+        await asyncio.sleep(self.window)
+        batch = self._pending.pop(key, {})
+        self._flush_tasks.pop(key, None)
+        app_ids = list(batch)
+        try:
+            for i in range(0, len(app_ids), IOS_LOOKUP_MAX_IDS):
+                chunk = app_ids[i:i + IOS_LOOKUP_MAX_IDS]
+                details = {}
+                try:
+                    await IOS_STORE_BUCKET.acquire()
+                    self.stats["requests"] += 1
+                    self.stats["ids_requested"] += len(chunk)
+                    details = await _itunes_lookup(chunk, country)
+                except Exception as e:
+                    logger.warning(f"iOS batch lookup failed for {len(chunk)} IDs ({country}): {e}")
+                for app_id in chunk:
+                    app = details.get(app_id)
+                    if app:
+                        self._cache[(country, app_id)] = app
+                    if not batch[app_id].done():
+                        batch[app_id].set_result(app)
+        finally:
+            # Cancelled mid-batch (e.g. its loop shutting down): don't leave waiters hanging
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(None)
+
+    def _flush_done(self, key, task):
+        """Flush task ended before claiming its batch (cancelled during the window)."""
+        if self._flush_tasks.get(key) is not task:
+            return
+        del self._flush_tasks[key]
+        for future in self._pending.pop(key, {}).values():
+            if not future.done():
+                future.set_result(None)
 
 
-def get_ios_app_store_results(query, country='us', limit=5):
+ios_lookup_batcher = IosLookupBatcher()
+
+
+async def _fetch_ios_app_store_results(query, country='us', limit=5):
     """
     Search iOS App Store for apps matching query.
     Uses app-store-scraper library.
@@ -230,91 +365,107 @@ def get_ios_app_store_results(query, country='us', limit=5):
         logger.warning("iOS App Store scraper not available")
         return []
     
-    results = []
     max_retries = 2
     
     for attempt in range(max_retries):
+        await IOS_STORE_BUCKET.acquire()
         try:
-            # app-store-scraper search method
-            from itunes_app_scraper.scraper import AppStoreScraper
-            scraper = AppStoreScraper()
-            search_results = scraper.get_app_ids_for_query(query, country=country, limit=limit)
-            
-            for app_id in search_results[:limit]:
-                try:
-                    app_details = scraper.get_app_details(app_id, country=country)
-                    if app_details:
-                        results.append({
-                            "title": app_details.get('trackName', 'Unknown'),
-                            "developer": app_details.get('artistName', 'Unknown'),
-                            "appId": str(app_id),
-                            "score": app_details.get('averageUserRating', 0),
-                            "source": "iOS App Store"
-                        })
-                except Exception as e:
-                    logger.warning(f"Failed to get iOS app details for {app_id}: {e}")
-            break
+            app_ids = await asyncio.to_thread(_ios_search_ids, query, country, limit)
+            details = await ios_lookup_batcher.get(app_ids, country)
+            return [
+                {
+                    "title": details[app_id].get('trackName', 'Unknown'),
+                    "developer": details[app_id].get('artistName', 'Unknown'),
+                    "appId": app_id,
+                    "score": details[app_id].get('averageUserRating', 0),
+                    "source": "iOS App Store"
+                }
+                for app_id in app_ids if app_id in details
+            ]
             
         except ImportError:
             # Try alternative method using web search
             logger.info(f"Using web search fallback for iOS apps: '{query}'")
             try:
-                web_results = get_web_search_results(f"{query} site:apps.apple.com")
+                web_results = await get_web_search_results_async(f"{query} site:apps.apple.com")
                 for res in web_results[:limit]:
                     if 'apps.apple.com' in res.lower():
-                        results.append({
+                        return [{
                             "title": query,
                             "developer": "Unknown (from web)",
                             "appId": "web_search",
                             "score": 0,
                             "source": "iOS App Store (web search)"
-                        })
-                        break
+                        }]
             except Exception:
                 pass
             break
             
         except Exception as e:
             logger.warning(f"iOS App Store search failed for '{query}' (attempt {attempt+1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(0.5)
-                continue
+            continue
     
-    time.sleep(0.2)  # Rate limiting
-    return results
+    return []
+
+
+async def get_play_store_results(query, country='us', timeout=10):
+    """Play Store search, served from the (store, country, query) cache when possible."""
+    return await app_store_cache.get_or_fetch(
+        "play", country, query, lambda: _fetch_play_store_results(query, country, timeout)
+    )
 
 
-def search_both_app_stores(query, countries=['us', 'in']):
+async def get_ios_app_store_results(query, country='us', limit=5):
+    """iOS App Store search, served from the (store, country, query) cache when possible."""
+    if not IOS_AVAILABLE:
+        logger.warning("iOS App Store scraper not available")
+        return []
+    return await app_store_cache.get_or_fetch(
+        f"ios{limit}", country, query, lambda: _fetch_ios_app_store_results(query, country, limit)
+    )
+
+
+async def search_both_app_stores(query, countries=['us', 'in']):
     """
-    Search BOTH Play Store AND iOS App Store.
+    Search BOTH Play Store AND iOS App Store (all stores/countries concurrently).
     Returns combined results.
     """
-    all_results = []
+    countries = countries[:2]  # Limit countries
     
-    # Play Store search
-    for country in countries[:2]:  # Limit countries
+    async def play(country):
         try:
-            play_results = get_play_store_results(query, country=country)
+            play_results = await get_play_store_results(query, country=country)
             for app in play_results:
                 app['source'] = f'Play Store ({country.upper()})'
-            all_results.extend(play_results)
+            return play_results
         except Exception as e:
             logger.warning(f"Play Store search failed for '{query}' in {country}: {e}")
+            return []
     
-    # iOS App Store search
-    for country in countries[:2]:
+    async def ios(country):
         try:
-            ios_results = get_ios_app_store_results(query, country=country)
-            all_results.extend(ios_results)
+            return await get_ios_app_store_results(query, country=country)
         except Exception as e:
             logger.warning(f"iOS App Store search failed for '{query}' in {country}: {e}")
+            return []
+    
+    batches = await asyncio.gather(*[play(c) for c in countries], *[ios(c) for c in countries])
     
+    # Same order as before: Play Store per country, then iOS per country
+    all_results = []
+    for batch in batches:
+        all_results.extend(batch)
     return all_results
 
 
-def search_app_stores_comprehensive(brand_name: str, category: str = "", industry: str = "") -> dict:
+async def _no_results():
+    return []
+
+
+async def search_app_stores_comprehensive(brand_name: str, category: str = "", industry: str = "") -> dict:
     """
-    Comprehensive app store search using multiple strategies:
+    Comprehensive app store search using multiple strategies
+    (all store queries are issued concurrently, then classified in this order):
     1. Exact brand name
     2. Brand + category keywords
     3. Phonetic variants
@@ -347,13 +498,27 @@ def search_app_stores_comprehensive(brand_name: str, category: str = "", industr
     phonetic_variants = generate_phonetic_variants(brand_name)
     logger.info(f"Phonetic variants for '{brand_name}': {phonetic_variants}")
     
+    # Plan every store query up front and fan them out concurrently
+    combined_queries = [f"{brand_name} {category_keywords[0]}"] if category_keywords else []
+    variant_queries = phonetic_variants[:2]  # Limit to top 2 variants
+    combo_query = None
+    if category_keywords and phonetic_variants:
+        # Only search first variant + first category keyword to reduce API calls
+        combo_query = f"{phonetic_variants[0]} {category_keywords[0]}"
+    category_query = " ".join(category_keywords[:2]) if category_keywords else None
+    
+    exact_results, combined_batches, variant_batches, combo_results, category_results = await asyncio.gather(
+        search_both_app_stores(brand_name, countries=['us', 'in']),
+        asyncio.gather(*[get_play_store_results(q, country='us') for q in combined_queries]),
+        asyncio.gather(*[get_play_store_results(v, country='us') for v in variant_queries]),
+        get_play_store_results(combo_query, country='in') if combo_query else _no_results(),  # India for salon apps
+        get_play_store_results(category_query, country='us') if category_query else _no_results(),
+    )
+    
     # Strategy 1: Exact brand name search (BOTH Play Store AND iOS App Store)
     logger.info(f"App search Strategy 1: Exact brand name '{brand_name}' on BOTH stores")
     results["search_queries_used"].append(f"Exact: {brand_name} (Play Store + iOS)")
     
-    # Search BOTH app stores
-    exact_results = search_both_app_stores(brand_name, countries=['us', 'in'])
-    
     for app in exact_results:
         app_id = app.get("appId", "")
         if app_id and app_id not in seen_app_ids:
@@ -404,15 +569,10 @@ def search_app_stores_comprehensive(brand_name: str, category: str = "", industr
     
     # Strategy 2: Brand + category combined search
     if category_keywords:
-        combined_queries = [
-            f"{brand_name} {category_keywords[0]}",
-        ]
-        
-        for query in combined_queries:
+        for query, combined_results in zip(combined_queries, combined_batches):
             logger.info(f"App search Strategy 2: Combined '{query}'")
             results["search_queries_used"].append(f"Combined: {query}")
             
-            combined_results = get_play_store_results(query, country='us')
             for app in combined_results:
                 app_id = app.get("appId", "")
                 if app_id and app_id not in seen_app_ids:
@@ -437,10 +597,9 @@ def search_app_stores_comprehensive(brand_name: str, category: str = "", industr
     # Strategy 3: Phonetic variants alone (only top 2)
     logger.info(f"App search Strategy 3: Phonetic variants {phonetic_variants[:2]}")
     
-    for variant in phonetic_variants[:2]:  # Limit to top 2 variants
+    for variant, variant_results in zip(variant_queries, variant_batches):
         results["search_queries_used"].append(f"Phonetic: {variant}")
         
-        variant_results = get_play_store_results(variant, country='us')
         for app in variant_results:
             app_id = app.get("appId", "")
             if app_id and app_id not in seen_app_ids:
@@ -462,15 +621,11 @@ def search_app_stores_comprehensive(brand_name: str, category: str = "", industr
     if category_keywords and phonetic_variants:
         logger.info(f"App search Strategy 4: Phonetic + Category")
         
-        # Only search first variant + first category keyword to reduce API calls
-        variant = phonetic_variants[0] if phonetic_variants else brand_name
-        keyword = category_keywords[0] if category_keywords else ""
+        variant = phonetic_variants[0]
         
-        if keyword:
-            combo_query = f"{variant} {keyword}"
+        if combo_query:
             results["search_queries_used"].append(f"Phonetic+Category: {combo_query}")
             
-            combo_results = get_play_store_results(combo_query, country='in')  # India for salon apps
             for app in combo_results:
                 app_id = app.get("appId", "")
                 if app_id and app_id not in seen_app_ids:
@@ -494,12 +649,10 @@ def search_app_stores_comprehensive(brand_name: str, category: str = "", industr
                         results["category_competitors"].append(app)
     
     # Strategy 5: Category-only search for market context
-    if category_keywords:
-        category_query = " ".join(category_keywords[:2])
+    if category_query:
         logger.info(f"App search Strategy 5: Category '{category_query}'")
         results["search_queries_used"].append(f"Category: {category_query}")
         
-        category_results = get_play_store_results(category_query, country='us')
         for app in category_results[:10]:  # Limit category results
             app_id = app.get("appId", "")
             if app_id and app_id not in seen_app_ids:
@@ -648,7 +801,7 @@ def format_app_results_for_llm(app_search_results: dict, brand_name: str) -> str
     return "\n".join(lines)
 
 
-def check_visibility(brand_name: str, category: str = "", industry: str = "", known_competitors: list = None, product_keywords: list = None):
+async def check_visibility_async(brand_name: str, category: str = "", industry: str = "", known_competitors: list = None, product_keywords: list = None):
     """
     Enhanced visibility check with category-aware searching.
     
@@ -668,28 +821,28 @@ def check_visibility(brand_name: str, category: str = "", industry: str = "", kn
     known_competitors = known_competitors or []
     product_keywords = product_keywords or []
     
-    # 1. Web Search (brand name + category for better context)
+    # 1 + 2. Web searches (brand + category, brand alone, product keywords) and the
+    # comprehensive app store search all run concurrently
     web_query = f"{brand_name} {category}" if category else brand_name
-    web_res = get_web_search_results(web_query)
+    web_queries = [web_query]
     
     # Also search just brand name
     if category:
-        web_res_brand = get_web_search_results(brand_name)
-        web_res = list(set(web_res + web_res_brand))[:10]
+        web_queries.append(brand_name)
     
     # Improvement #3: Also search with product keywords
-    if product_keywords:
-        for keyword in product_keywords[:2]:  # Limit to 2 keywords
-            try:
-                keyword_res = get_web_search_results(f"{brand_name} {keyword}")
-                web_res = list(set(web_res + keyword_res))[:15]
-            except Exception as e:
-                logger.warning(f"Keyword search failed for '{brand_name} {keyword}': {e}")
+    keyword_queries = [f"{brand_name} {keyword}" for keyword in product_keywords[:2]]  # Limit to 2 keywords
     
-    time.sleep(0.3)
+    web_batches, app_search_results = await asyncio.gather(
+        asyncio.gather(*[get_web_search_results_async(q) for q in web_queries + keyword_queries]),
+        search_app_stores_comprehensive(brand_name, category, industry)
+    )
     
-    # 2. Comprehensive App Store Search
-    app_search_results = search_app_stores_comprehensive(brand_name, category, industry)
+    web_res = web_batches[0]
+    if category:
+        web_res = list(set(web_res + web_batches[1]))[:10]
+    for keyword_res in web_batches[len(web_queries):]:
+        web_res = list(set(web_res + keyword_res))[:15]
     
     # Improvement #2: Check user-provided competitors for conflicts
     competitor_matches = []
@@ -772,3 +925,38 @@ def check_visibility(brand_name: str, category: str = "", industry: str = "", kn
         "known_competitors_checked": known_competitors,
         "competitor_matches_found": len(competitor_matches) if known_competitors else 0
     }
+
+
+APP_STORE_WARMUP = os.environ.get("APP_STORE_WARMUP", "true").lower() == "true"
+
+# Popular categories pre-warmed at startup (category-only searches are brand-independent)
+APP_STORE_WARMUP_CATEGORIES = [c.strip() for c in os.environ.get(
+    "APP_STORE_WARMUP_CATEGORIES",
+    "Salon Booking App,Food Delivery App,Fitness App,Finance App,Education App,Doctor Appointment App,E-commerce App,Travel Booking App"
+).split(",") if c.strip()]
+
+
+async def warm_app_store_cache(categories: list = None):
+    """
+    Pre-fetch the brand-independent category queries (Strategy 5) for popular
+    categories so the first evaluations in those categories hit the cache.
+    """
+    categories = APP_STORE_WARMUP_CATEGORIES if categories is None else categories
+    queries = []
+    for category in categories:
+        category_keywords = extract_category_keywords(category)
+        if category_keywords:
+            queries.append(" ".join(category_keywords[:2]))
+    queries = list(dict.fromkeys(queries))
+    
+    results = await asyncio.gather(
+        *[get_play_store_results(q, country='us') for q in queries], return_exceptions=True
+    )
+    warmed = sum(1 for r in results if isinstance(r, list) and r)
+    logger.info(f"App store cache warm-up: {warmed}/{len(queries)} category queries cached")
+    return warmed
+
+
+def check_visibility(brand_name: str, category: str = "", industry: str = "", known_competitors: list = None, product_keywords: list = None):
+    """Sync wrapper around check_visibility_async (scripts / callers without an event loop)."""
+    return asyncio.run(check_visibility_async(brand_name, category, industry, known_competitors, product_keywords))
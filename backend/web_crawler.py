@@ -0,0 +1,252 @@
+"""
+Website Crawler
+===============
+Fetches and extracts readable text from brand websites (brand audit PHASE 0).
+
+- Candidate pages are fetched concurrently over the shared pooled session
+  (http_client.py); crawl_pages() stops as soon as max_pages good pages arrive
+  and cancels the remaining fetches
+- Bodies are streamed with a byte cap, so a huge homepage can't stall a crawl
+- Text extraction uses lxml (C parser) instead of BeautifulSoup's html.parser
+- Extracted text is cached per URL. Fresh entries are served without a
+  request; stale ones are revalidated with If-None-Match / If-Modified-Since
+  and a 304 reuses the cached text
+
+Concurrent fetches of the same URL share one in-flight task. A cancelled
+caller only cancels that task when no other caller is still waiting on it.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import aiohttp
+from cachetools import TLRUCache
+from lxml import etree, html as lxml_html
+
+from http_client import pooled_session
+
+logger = logging.getLogger(__name__)
+
+# ============ CONFIG ============
+
+CRAWL_MAX_BYTES = int(os.environ.get("CRAWL_MAX_BYTES", 2 * 1024 * 1024))        # 2 MB per page
+CRAWL_TIMEOUT = float(os.environ.get("CRAWL_TIMEOUT", 15))
+CRAWL_CONCURRENCY = int(os.environ.get("CRAWL_CONCURRENCY", 8))
+CRAWL_TEXT_LIMIT = 5000
+CRAWL_MIN_CHARS = 100
+
+CRAWL_CACHE_FRESH = int(os.environ.get("CRAWL_CACHE_FRESH", 3600))              # served without a request
+CRAWL_CACHE_TTL = int(os.environ.get("CRAWL_CACHE_TTL", 24 * 3600))             # kept for revalidation
+CRAWL_CACHE_TTL_FAILED = int(os.environ.get("CRAWL_CACHE_TTL_FAILED", 600))     # 404s, timeouts, ...
+CRAWL_CACHE_MAXSIZE = int(os.environ.get("CRAWL_CACHE_MAXSIZE", 2000))
+
+# Boilerplate elements dropped before extracting text
+STRIP_TAGS = ("script", "style", "noscript", "nav", "footer", "header")
+
+
+# ============ EXTRACTION ============
+
+def extract_text(page: Union[bytes, str], limit: int = CRAWL_TEXT_LIMIT, encoding: Optional[str] = None) -> str:
+    """
+    Visible page text, one text block per line, truncated to `limit` chars.
+    page is the raw body (decoded as `encoding`, UTF-8 by default) or already
+    decoded text. lxml gets bytes either way: it rejects str input that starts
+    with an <?xml ... encoding="..."?> declaration.
+    """
+    if isinstance(page, str):
+        page, encoding = page.encode("utf-8"), "utf-8"
+    if not page or not page.strip():
+        return ""
+    encoding = encoding or "utf-8"
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # libxml2 misses some charset spellings Python knows ("latin-1", "euc_jp") - decode here
+        try:
+            page = page.decode(encoding, errors="replace").encode("utf-8")
+        except LookupError:
+            pass
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        root = lxml_html.document_fromstring(page, parser=parser)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"lxml could not parse page: {e}")
+        return ""
+
+    etree.strip_elements(root, *STRIP_TAGS, with_tail=False)
+    etree.strip_elements(root, etree.Comment, with_tail=False)
+
+    lines = []
+    for chunk in root.itertext():
+        for line in chunk.splitlines():
+            line = line.strip()
+            if line:
+                lines.append(line)
+    text = "\n".join(lines)
+
+    if len(text) > limit:
+        text = text[:limit] + "... [truncated]"
+    return text
+
+
+async def read_capped(response: aiohttp.ClientResponse, max_bytes: int = CRAWL_MAX_BYTES) -> bytes:
+    """Read at most max_bytes of the body (undecoded - see extract_text)."""
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            logger.info(f"Crawl byte cap reached for {response.url} ({max_bytes} bytes)")
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+# ============ CRAWLER ============
+
+class WebsiteCrawler:
+    """Cached, conditional page fetches with concurrent multi-page crawls."""
+
+    def __init__(self, maxsize: int = CRAWL_CACHE_MAXSIZE):
+        self._cache = TLRUCache(maxsize=maxsize, ttu=lambda key, value, now: now + value["ttl"])
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.stats = {"fresh_hits": 0, "revalidated": 0, "fetches": 0, "failures": 0, "deduplicated": 0}
+
+    async def fetch_text(self, url: str) -> str:
+        """Extracted text of one page ("" if it could not be crawled)."""
+        entry = self._cache.get(url)
+        if entry is not None and time.monotonic() - entry["checked_at"] < entry["fresh_for"]:
+            self.stats["fresh_hits"] += 1
+            return entry["text"]
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(url)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._fetch(url, entry))
+            self._inflight[url] = task
+            task.add_done_callback(lambda t, k=url: self._inflight.pop(k, None) if self._inflight.get(k) is t else None)
+
+        # Shield so one caller's cancellation doesn't fail the fetch for the others;
+        # the last caller to give up cancels it
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    async def crawl_pages(self, pages: List[Tuple[str, str]], max_pages: int = 4,
+                          min_chars: int = CRAWL_MIN_CHARS,
+                          concurrency: int = CRAWL_CONCURRENCY) -> List[Tuple[str, str, str]]:
+        """
+        Crawl (url, page_name) candidates concurrently and return up to max_pages
+        (url, page_name, text) tuples with at least min_chars of text, in the
+        candidates' priority order. Stops once max_pages good pages arrive.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def crawl(index: int, url: str, page_name: str):
+            async with semaphore:
+                logger.info(f"Crawling {page_name}: {url}")
+                return index, await self.fetch_text(url)
+
+        tasks = [asyncio.create_task(crawl(i, url, name)) for i, (url, name) in enumerate(pages)]
+        good: Dict[int, str] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, text = await next_done
+                if text and len(text) > min_chars:
+                    good[index] = text
+                    if len(good) >= max_pages:
+                        break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        return [(pages[i][0], pages[i][1], good[i]) for i in sorted(good)]
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    def invalidate(self, url: str):
+        self._cache.pop(url, None)
+
+    async def _fetch(self, url: str, entry: Optional[dict]) -> str:
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            async with pooled_session() as session:
+                async with session.get(url, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=CRAWL_TIMEOUT)) as response:
+                    if response.status == 304 and entry is not None:
+                        self.stats["revalidated"] += 1
+                        self._remember(url, entry["text"], entry.get("etag"), entry.get("last_modified"))
+                        return entry["text"]
+
+                    if response.status != 200:
+                        logger.warning(f"Failed to crawl {url} - Status {response.status}")
+                        self.stats["failures"] += 1
+                        self._remember_failure(url)
+                        return ""
+
+                    self.stats["fetches"] += 1
+                    page = await read_capped(response)
+                    charset = response.charset
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error crawling {url}: {e}")
+            self.stats["failures"] += 1
+            if entry is not None:
+                # Transient error - keep serving the last good copy until it expires
+                return entry["text"]
+            self._remember_failure(url)
+            return ""
+
+        text = extract_text(page, encoding=charset)
+        self._remember(url, text, etag, last_modified)
+        logger.info(f"Successfully crawled {url} - {len(text)} chars")
+        return text
+
+    def _remember(self, url: str, text: str, etag: Optional[str], last_modified: Optional[str]):
+        self._cache[url] = {
+            "text": text,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": time.monotonic(),
+            "fresh_for": CRAWL_CACHE_FRESH,
+            "ttl": CRAWL_CACHE_TTL,
+        }
+
+    def _remember_failure(self, url: str):
+        self._cache[url] = {
+            "text": "",
+            "etag": None,
+            "last_modified": None,
+            "checked_at": time.monotonic(),
+            "fresh_for": CRAWL_CACHE_TTL_FAILED,
+            "ttl": CRAWL_CACHE_TTL_FAILED,
+        }
+
+
+# Process-wide instance used by server.py
+website_crawler = WebsiteCrawler()
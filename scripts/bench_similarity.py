@@ -0,0 +1,100 @@
+"""
+Benchmark: pairwise vs vectorized (rapidfuzz cdist) brand similarity scoring.
+
+Scores input names against a synthetic corpus of 10k+ brands (the real known
+brands plus generated pronounceable names) two ways:
+  1. pairwise - calculate_levenshtein/jaro_winkler/fuzzy per (input, brand)
+  2. batch    - batch_similarity_scores(), one cdist call per metric
+
+Usage:
+    python scripts/bench_similarity.py [corpus_size] [num_inputs]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from similarity import (
+    KNOWN_BRAND_INDEX,
+    batch_similarity_scores,
+    build_known_brand_set,
+    calculate_fuzzy_ratio,
+    calculate_jaro_winkler_similarity,
+    calculate_levenshtein_similarity,
+)
+
+CONSONANTS = "bcdfghklmnprstvz"
+VOWELS = "aeiou"
+
+
+def make_name(rng: random.Random) -> str:
+    syllables = rng.randint(2, 4)
+    name = "".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables))
+    if rng.random() < 0.3:
+        name += rng.choice(CONSONANTS)
+    return name.capitalize()
+
+
+def build_corpus(size: int, rng: random.Random) -> list:
+    corpus = list(KNOWN_BRAND_INDEX)
+    seen = set(corpus)
+    while len(corpus) < size:
+        name = make_name(rng)
+        if name not in seen:
+            seen.add(name)
+            corpus.append(name)
+    return corpus
+
+
+def bench_pairwise(inputs: list, corpus: list) -> int:
+    hits = 0
+    for name in inputs:
+        for brand in corpus:
+            avg = (calculate_levenshtein_similarity(name, brand)
+                   + calculate_jaro_winkler_similarity(name, brand)
+                   + calculate_fuzzy_ratio(name, brand)) / 3
+            if avg >= 65.0:
+                hits += 1
+    return hits
+
+
+def main():
+    corpus_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    num_inputs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(42)
+
+    corpus = build_corpus(corpus_size, rng)
+    inputs = [make_name(rng) for _ in range(num_inputs)]
+
+    start = time.perf_counter()
+    brand_set = build_known_brand_set(corpus)
+    index_ms = (time.perf_counter() - start) * 1000
+    print(f"Corpus: {len(corpus)} brands (index built in {index_ms:.0f} ms), {num_inputs} input names\n")
+
+    # Pairwise is slow - time a subset and report per-name cost
+    pairwise_inputs = inputs[:5]
+    start = time.perf_counter()
+    bench_pairwise(pairwise_inputs, corpus)
+    pairwise_ms = (time.perf_counter() - start) * 1000 / len(pairwise_inputs)
+
+    start = time.perf_counter()
+    for name in inputs:
+        batch_similarity_scores([name], brand_set)
+    single_ms = (time.perf_counter() - start) * 1000 / len(inputs)
+
+    start = time.perf_counter()
+    batch_similarity_scores(inputs, brand_set)
+    batch_ms = (time.perf_counter() - start) * 1000 / len(inputs)
+
+    print(f"{'Method':<34}{'ms / name':>12}{'speedup':>10}")
+    print("-" * 56)
+    print(f"{'pairwise (3 calls per brand)':<34}{pairwise_ms:>12.2f}{1:>9.1f}x")
+    print(f"{'cdist, one name per call':<34}{single_ms:>12.2f}{pairwise_ms / single_ms:>9.1f}x")
+    print(f"{'cdist, all names in one call':<34}{batch_ms:>12.2f}{pairwise_ms / batch_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()